@@ -36,18 +36,35 @@ MPD_HOST = mpd.HOST
 MPD_PORT = mpd.PORT
 MPD_PASSWORD = mpd.PASSWORD
 MPD_TIMEOUT = mpd.TIMEOUT
+MPD_CLIENT_BACKEND = mpd.CLIENT_BACKEND
+MPD_CONNECTION_POOL_SIZE = mpd.CONNECTION_POOL_SIZE
+MPD_POOL_CHECKOUT_TIMEOUT = mpd.POOL_CHECKOUT_TIMEOUT
+MPD_KEEPALIVE_INTERVAL = mpd.KEEPALIVE_INTERVAL
 MPD_DEFAULT_VOLUME = mpd.DEFAULT_VOLUME
+MPD_PLAYLIST_CACHE_TTL = mpd.PLAYLIST_CACHE_TTL
+MPD_LIBRARY_CHECK_INTERVAL = mpd.LIBRARY_CHECK_INTERVAL
+MPD_LIBRARY_SEARCH_LIMIT = mpd.LIBRARY_SEARCH_LIMIT
+MPD_QUEUE_CACHE_SIZE = mpd.QUEUE_CACHE_SIZE
+MPD_QUEUE_PAGE_SIZE = mpd.QUEUE_PAGE_SIZE
 
 # Librespot (Spotify) Configuration
 LIBRESPOT_HOST = spotify.HOST
 LIBRESPOT_PORT = spotify.PORT
 LIBRESPOT_NAME = spotify.NAME
 LIBRESPOT_DEFAULT_VOLUME = spotify.DEFAULT_VOLUME
+LIBRESPOT_HTTP_POOL_SIZE = spotify.HTTP_POOL_SIZE
+LIBRESPOT_HTTP_CONNECT_TIMEOUT = spotify.HTTP_CONNECT_TIMEOUT
+LIBRESPOT_HTTP_READ_TIMEOUT = spotify.HTTP_READ_TIMEOUT
+LIBRESPOT_HTTP_COMMAND_TIMEOUT = spotify.HTTP_COMMAND_TIMEOUT
 
 # Bluetooth Configuration
 BLUETOOTH_DEVICE_NAME = bluetooth.DEVICE_NAME
 BLUETOOTH_PAIRING_TIMEOUT = bluetooth.PAIRING_TIMEOUT
 BLUETOOTH_AUTO_RECONNECT = bluetooth.AUTO_RECONNECT
+BLUETOOTH_RECONNECT_CANDIDATES = bluetooth.RECONNECT_CANDIDATES
+BLUETOOTH_CONNECT_TIMEOUT = bluetooth.CONNECT_TIMEOUT
+BLUETOOTH_CLIENT_BACKEND = bluetooth.CLIENT_BACKEND
+BLUETOOTH_BUS_ADDRESS = bluetooth.BUS_ADDRESS
 BLUETOOTH_DEFAULT_VOLUME = bluetooth.DEFAULT_VOLUME
 
 # Display Configuration
@@ -95,9 +112,15 @@ BUTTON_PIN_POWER = buttons.PIN_POWER
 
 # Monitor Configuration
 MONITOR_EXPECTED_VALUE_TIMEOUT = system.EXPECTED_VALUE_TIMEOUT
+VOLUME_SETTLE_TIME = system.VOLUME_SETTLE_TIME
 MPD_MONITOR_POLL_INTERVAL = mpd.MONITOR_POLL_INTERVAL
+MPD_MONITOR_STANDBY_POLL_INTERVAL = mpd.MONITOR_STANDBY_POLL_INTERVAL
+MPD_MONITOR_USE_IDLE = mpd.MONITOR_USE_IDLE
 LIBRESPOT_MONITOR_POLL_INTERVAL = spotify.MONITOR_POLL_INTERVAL
+LIBRESPOT_STATUS_RESYNC_INTERVAL = spotify.STATUS_RESYNC_INTERVAL
+LIBRESPOT_STATUS_STANDBY_RESYNC_INTERVAL = spotify.STATUS_STANDBY_RESYNC_INTERVAL
 BLUETOOTH_MONITOR_POLL_INTERVAL = bluetooth.MONITOR_POLL_INTERVAL
+BLUETOOTH_SIGNAL_COALESCE_WINDOW = bluetooth.SIGNAL_COALESCE_WINDOW
 BLUETOOTH_AVRCP_RETRY_ATTEMPTS = bluetooth.AVRCP_RETRY_ATTEMPTS
 BLUETOOTH_AVRCP_RETRY_DELAY = bluetooth.AVRCP_RETRY_DELAY
 
@@ -121,6 +144,15 @@ API_ENABLE = system.API_ENABLE
 THREAD_JOIN_TIMEOUT = system.THREAD_JOIN_TIMEOUT
 AUTO_RECONNECT_DELAY = system.AUTO_RECONNECT_DELAY
 MAX_RECONNECT_ATTEMPTS = system.MAX_RECONNECT_ATTEMPTS
+RECONNECT_MAX_DELAY = system.RECONNECT_MAX_DELAY
+RECONNECT_JITTER = system.RECONNECT_JITTER
+BACKEND_STARTUP_DEADLINE = system.BACKEND_STARTUP_DEADLINE
+EVENT_QUEUE_SIZE = system.EVENT_QUEUE_SIZE
+COMMAND_MAX_QUEUED = system.COMMAND_MAX_QUEUED
+COMMAND_TIMEOUT = system.COMMAND_TIMEOUT
+TRACE_ENABLED = system.TRACE_ENABLED
+TRACE_BUFFER_SIZE = system.TRACE_BUFFER_SIZE
+TRACE_LINGER = system.TRACE_LINGER
 AUDIO_FADE_DURATION = system.AUDIO_FADE_DURATION
 ENABLE_BLUETOOTH = system.ENABLE_BLUETOOTH
 ENABLE_SPOTIFY = system.ENABLE_SPOTIFY
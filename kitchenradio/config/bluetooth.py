@@ -7,7 +7,15 @@ Bluetooth Audio Configuration
 # =============================================================================
 DEVICE_NAME = 'KitchenRadio'
 PAIRING_TIMEOUT = 60  # seconds
-AUTO_RECONNECT = True
+AUTO_RECONNECT = True  # dial recently used devices when Bluetooth is selected
+RECONNECT_CANDIDATES = 2  # recently used devices dialled at once (first to connect wins)
+CONNECT_TIMEOUT = 10  # seconds - wait for a new device to connect and bring up A2DP
+
+# =============================================================================
+# Bluetooth D-Bus Settings
+# =============================================================================
+CLIENT_BACKEND = 'dbus-python'  # 'dbus-python' (dbus-python + GLib main loop) or 'asyncio' (dbus-next)
+BUS_ADDRESS = None  # asyncio backend only - D-Bus address to use instead of the system bus
 
 # =============================================================================
 # Bluetooth Audio Settings
@@ -18,6 +26,7 @@ DEFAULT_VOLUME = 50  # 0-100
 # Bluetooth Monitor Settings
 # =============================================================================
 MONITOR_POLL_INTERVAL = 1.0  # seconds - how often to poll Bluetooth for status updates
+SIGNAL_COALESCE_WINDOW = 0.15  # seconds - merge bursts of AVRCP Track/Status/Position signals
 
 # =============================================================================
 # Bluetooth AVRCP Settings
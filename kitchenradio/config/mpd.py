@@ -9,13 +9,40 @@ HOST = '192.168.1.4'
 PORT = 6600
 PASSWORD = None
 TIMEOUT = 10  # seconds
+CLIENT_BACKEND = 'threaded'  # 'threaded' (python-mpd2 + connection pool) or 'asyncio'
+
+# =============================================================================
+# MPD Connection Pool
+# =============================================================================
+CONNECTION_POOL_SIZE = 2  # Connections for interactive commands (monitor has its own)
+POOL_CHECKOUT_TIMEOUT = 2.0  # seconds - max wait for a free connection
+KEEPALIVE_INTERVAL = 30.0  # seconds - ping idle connections (MPD drops idle clients after 60s)
 
 # =============================================================================
 # MPD Audio Settings
 # =============================================================================
 DEFAULT_VOLUME = 50  # 0-100
 
+# =============================================================================
+# MPD Playlist Catalog
+# =============================================================================
+PLAYLIST_CACHE_TTL = 300.0  # seconds - refresh stored playlist list (also refreshed on MPD changes)
+
+# =============================================================================
+# MPD Library Index
+# =============================================================================
+LIBRARY_CHECK_INTERVAL = 60.0  # seconds - check for database updates when idle events aren't received
+LIBRARY_SEARCH_LIMIT = 50  # max results per search
+
+# =============================================================================
+# MPD Queue
+# =============================================================================
+QUEUE_CACHE_SIZE = 500  # queue entries kept in memory by the queue mirror
+QUEUE_PAGE_SIZE = 50  # default entries per queue page (web API)
+
 # =============================================================================
 # MPD Monitor Settings
 # =============================================================================
-MONITOR_POLL_INTERVAL = 1.0  # seconds - how often to poll MPD for status updates
+MONITOR_USE_IDLE = True  # Wait for MPD idle notifications instead of polling
+MONITOR_POLL_INTERVAL = 1.0  # seconds - how often to poll MPD for status updates (polling fallback)
+MONITOR_STANDBY_POLL_INTERVAL = 5.0  # seconds - poll interval while MPD is not the active source (monitor stays warm)
@@ -9,6 +9,14 @@ HOST = '192.168.1.4'
 PORT = 3678
 NAME = 'KitchenRadio'  # Display name for Spotify Connect
 
+# =============================================================================
+# Librespot HTTP Client
+# =============================================================================
+HTTP_POOL_SIZE = 4  # Max keep-alive connections to go-librespot
+HTTP_CONNECT_TIMEOUT = 2.0  # seconds - TCP connect timeout
+HTTP_READ_TIMEOUT = 5.0  # seconds - read timeout for status/info requests
+HTTP_COMMAND_TIMEOUT = 3.0  # seconds - read timeout for player commands
+
 # =============================================================================
 # Spotify Audio Settings
 # =============================================================================
@@ -18,3 +26,5 @@ DEFAULT_VOLUME = 50  # 0-100
 # Librespot Monitor Settings
 # =============================================================================
 MONITOR_POLL_INTERVAL = 0.5  # seconds - how often to poll Librespot for status updates
+STATUS_RESYNC_INTERVAL = 30.0  # seconds - safety /status resync (state normally comes from WebSocket events)
+STATUS_STANDBY_RESYNC_INTERVAL = 120.0  # seconds - safety resync while Spotify is not the active source
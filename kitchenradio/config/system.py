@@ -40,6 +40,23 @@ THREAD_JOIN_TIMEOUT = 5.0  # seconds - max time to wait for threads to stop
 # Reconnection
 AUTO_RECONNECT_DELAY = 5.0  # seconds - delay before attempting reconnection
 MAX_RECONNECT_ATTEMPTS = 10  # 0 = unlimited
+RECONNECT_MAX_DELAY = 60.0  # seconds - backoff cap (delay doubles from AUTO_RECONNECT_DELAY)
+RECONNECT_JITTER = 0.2  # fraction - random spread applied to each backoff delay
+
+# Events
+EVENT_QUEUE_SIZE = 64  # events - per-subscriber callback queue (state events merge, oldest dropped when full)
+
+# Commands
+COMMAND_MAX_QUEUED = 3  # commands - queued next/previous presses per kind (further presses coalesce)
+COMMAND_TIMEOUT = 30.0  # seconds - max time a blocking command call waits for its result
+
+# Tracing
+TRACE_ENABLED = False  # Record input-to-display latency traces (GET /api/stats/traces)
+TRACE_BUFFER_SIZE = 256  # traces - finished traces kept for the web endpoint
+TRACE_LINGER = 2.0  # seconds - how long a trace accepts follow-up monitor events before it is closed
+
+# Startup
+BACKEND_STARTUP_DEADLINE = 1.0  # seconds - backends not up by then keep connecting in the background
 
 # Audio
 AUDIO_FADE_DURATION = 0.5  # seconds - crossfade duration when switching sources
@@ -50,6 +67,10 @@ AUDIO_FADE_DURATION = 0.5  # seconds - crossfade duration when switching sources
 # Expected Value Timeout (for instant UI feedback)
 EXPECTED_VALUE_TIMEOUT = 2.0  # seconds - how long to use expected values before reverting to actual
 
+# Volume settle time - reported volumes that differ from our own target are
+# ignored for this long after the last volume write
+VOLUME_SETTLE_TIME = 1.0  # seconds
+
 # =============================================================================
 # Feature Flags
 # =============================================================================
@@ -8,6 +8,7 @@ Supports both hardware buttons and programmatic control.
 import logging
 import threading
 import time
+from concurrent.futures import Future
 from typing import Dict, Callable, Optional, Any, TYPE_CHECKING
 from enum import Enum
 
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
 # Import configuration
 from kitchenradio import config
 from kitchenradio.config import buttons as buttons_config
+from kitchenradio.sources.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -191,6 +193,7 @@ class ButtonController:
                 'long_press_fired': False,
                 'pending_state': None,
                 'pending_since': None,
+                'edge_at': None,  # time.monotonic() of the first edge of the accepted change (for tracing)
                 'last_state': True  # HIGH (not pressed) with pull-up
             }
         
@@ -363,6 +366,7 @@ class ButtonController:
                 (current_time - state['pending_since']) >= self.debounce_time):
                 # Accept the change
                 state['last_state'] = state['pending_state']
+                state['edge_at'] = time.monotonic() - (current_time - state['pending_since'])
                 state['pending_state'] = None
                 state['pending_since'] = None
                 
@@ -398,7 +402,7 @@ class ButtonController:
             self._start_long_press_detection(button_type)
         else:
             # Execute button action immediately for non-power buttons
-            self._execute_button_action(button_type)
+            self._execute_button_action(button_type, pressed_at=state['edge_at'])
     
     def _handle_button_release(self, button_type: ButtonType):
         """
@@ -419,7 +423,7 @@ class ButtonController:
             
             if not state['long_press_fired'] and press_duration < self.long_press_time:
                 logger.info(f"⚪ Power button SHORT PRESS detected ({press_duration:.2f}s < {self.long_press_time}s)")
-                self._execute_button_action(button_type)
+                self._execute_button_action(button_type, pressed_at=state['edge_at'])
             elif state['long_press_fired']:
                 logger.info(f"🔴 Power button released after LONG PRESS ({press_duration:.2f}s >= {self.long_press_time}s)")
             else:
@@ -504,12 +508,16 @@ class ButtonController:
         self.press_threads[button_type] = thread
         thread.start()
     
-    def _execute_button_action(self, button_type: ButtonType) -> bool:
+    def _execute_button_action(self, button_type: ButtonType, pressed_at: Optional[float] = None) -> bool:
         """
         Execute the KitchenRadio action for a button.
         
+        Starts a latency trace (when tracing is enabled) that follows the
+        action to the frame showing its result.
+        
         Args:
             button_type: The button that was pressed
+            pressed_at: time.monotonic() of the first edge (before debouncing)
             
         Returns:
             True if action was successful
@@ -520,9 +528,18 @@ class ButtonController:
                 self.display_controller.show_Notification_overlay("Oeps", f"Niet Toegewezen {button_type.value}", timeout=2 )
             return False
         
+        trace = tracer.start(f"button:{button_type.value}", started=pressed_at)
+        if pressed_at is not None:
+            tracer.mark(trace, 'debounce')
+        
         try:
             action_method = self.button_actions[button_type]
-            result = action_method()
+            with tracer.activate(trace):
+                result = action_method()
+            if isinstance(result, Future):
+                # Queued on the source controller - report the outcome when it has run
+                result.add_done_callback(lambda future: self._on_action_done(button_type, future))
+                return True
             logger.debug(f"Button action {button_type.value} result: {result}")
             if not result and self.display_controller:
                 self.display_controller.show_Notification_overlay("Oeps", f"Functie Niet Beschikbaar {button_type.value}", timeout=2)  
@@ -534,83 +551,95 @@ class ButtonController:
                 self.display_controller.show_Notification_overlay("Oeps Error", f"{e}", timeout=2) 
             return False
 
+    def _on_action_done(self, button_type: ButtonType, future: Future):
+        """
+        Show the outcome of a queued button action.
+        
+        Runs on the source controller's command thread. A cancelled action
+        was preempted by a power command and is not an error.
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        result = None if error else future.result()
+        logger.debug(f"Button action {button_type.value} result: {result}")
+        if not self.display_controller:
+            return
+        if error:
+            self.display_controller.show_Notification_overlay("Oeps Error", f"{error}", timeout=2)
+        elif result is None or result is False:
+            self.display_controller.show_Notification_overlay("Oeps", f"Functie Niet Beschikbaar {button_type.value}", timeout=2)
+
 
-    # KitchenRadio Action Methods - Direct calls to KitchenRadio
+    # KitchenRadio Action Methods - queued on the SourceController, never waited for
     
-    def _select_mpd(self) -> bool:
+    def _select_mpd(self) -> Future:
         """Switch to MPD source"""
         from kitchenradio.sources.source_controller import SourceType
         logger.info("Switching to MPD source")
-        return self.source_controller.set_source(SourceType.MPD)
+        return self.source_controller.submit('set_source', SourceType.MPD)
     
-    def _select_spotify(self) -> bool:
+    def _select_spotify(self) -> Future:
         """Switch to Spotify (librespot) source"""
         from kitchenradio.sources.source_controller import SourceType
         logger.info("Switching to Spotify source")
-        return self.source_controller.set_source(SourceType.LIBRESPOT)
+        return self.source_controller.submit('set_source', SourceType.LIBRESPOT)
     
-    def _select_bluetooth(self) -> bool:
+    def _select_bluetooth(self) -> Future:
         """Switch to Bluetooth source and enter pairing mode"""
         from kitchenradio.sources.source_controller import SourceType
         logger.info("Switching to Bluetooth source")
-        return self.source_controller.set_source(SourceType.BLUETOOTH)
+        return self.source_controller.submit('set_source', SourceType.BLUETOOTH)
     
-    def _play_pause(self) -> bool:
+    def _play_pause(self) -> Future:
         """Toggle play/pause"""
         logger.info("Toggle play/pause")
-        return self.source_controller.play_pause()
+        return self.source_controller.submit('play_pause')
     
     def _stop(self) -> bool:
         """Stop playback"""
         logger.info("Stop playback")
         return self.source_controller.stop_play()
     
-    def _next(self) -> bool:
+    def _next(self) -> Future:
         """Next track"""
         logger.info("Next track")
-        return self.source_controller.next()
+        return self.source_controller.submit('next')
     
-    def _previous(self) -> bool:
+    def _previous(self) -> Future:
         """Previous track"""
         logger.info("Previous track")
-        return self.source_controller.previous()
+        return self.source_controller.submit('previous')
     
     def _volume_up(self) -> bool:
         """Increase volume and show volume screen"""
         logger.debug("Volume up")
         
-        # Change the volume - controller calculates and returns new volume
+        # Change the volume - applied at once by the volume engine (not queued)
         new_volume = self.source_controller.volume_up(step=buttons_config.VOLUME_STEP)
-        
-        # Show volume screen - display will get volume from status (with expected values)
-        if new_volume is not None:
-            if self.display_controller:
-                try:
-                    self.display_controller.show_volume_overlay()
-                except Exception as e:
-                    logger.warning(f"Failed to show volume screen: {e}")
-        
-        return new_volume is not None
+        return self._show_volume_overlay(new_volume)
     
     def _volume_down(self) -> bool:
         """Decrease volume and show volume screen"""
         logger.debug("Volume down")
         
-        # Change the volume - controller calculates and returns new volume
+        # Change the volume - applied at once by the volume engine (not queued)
         new_volume = self.source_controller.volume_down(step=buttons_config.VOLUME_STEP)
-        
-        # Show volume screen - display will get volume from status (with expected values)
-        if new_volume is not None:
-            if self.display_controller:
-                try:
-                    self.display_controller.show_volume_overlay()
-                except Exception as e:
-                    logger.warning(f"Failed to show volume screen: {e}")
-        
-        return new_volume is not None
+        return self._show_volume_overlay(new_volume)
     
 
     
+    def _show_volume_overlay(self, new_volume: Optional[int]) -> bool:
+        """Show volume screen after a volume step - display will get volume from status"""
+        if new_volume is None:
+            return False
+        if self.display_controller:
+            try:
+                self.display_controller.show_volume_overlay()
+            except Exception as e:
+                logger.warning(f"Failed to show volume screen: {e}")
+        return True
+    
     def _menu_up(self) -> bool:
         """Menu up navigation"""
         logger.info("Menu up navigation")
@@ -771,10 +800,10 @@ class ButtonController:
             logger.warning("Display controller not available")
             return False
     
-    def _power(self) -> bool:
+    def _power(self) -> Future:
         """Power button short press - toggle power on/off"""
         logger.info("Power button short press - toggling power")
-        return self.source_controller.power()
+        return self.source_controller.submit('power')
     
     def _power_long_press(self) -> bool:
         """Power button long press - initiate system reboot"""
@@ -15,7 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING, Callable
 
 
 from typing import TYPE_CHECKING
-from kitchenradio.sources.source_model import SourceType, TrackInfo, SourceInfo, PlaybackState, PlaybackStatus
+from kitchenradio.sources.source_model import SourceType, TrackInfo, SourceInfo, PlaybackState, PlaybackStatus, RadioState, StateField
+from kitchenradio.sources.tracing import tracer
 
 from kitchenradio.kitchen_radio import KitchenRadio
 from kitchenradio.sources.source_controller import SourceController
@@ -68,6 +69,9 @@ class DisplayController:
 
         self._wake_event = threading.Event()
         
+        # Traces of inputs waiting for their frame (finished after the next render)
+        self._pending_traces = []
+        self._traces_lock = threading.Lock()
 
         # Use provided display interface or create new one
         if display_interface:
@@ -90,13 +94,8 @@ class DisplayController:
         self.refresh_rate = refresh_rate if refresh_rate is not None else display_config.REFRESH_RATE
         self._first_update = True  # Flag to force first display update after initialization
         
-        # Cache for event-driven updates
-        self.cached_playback_state = PlaybackState()
-        self.cached_track_info = None
-        self.cached_source_info = SourceInfo()
-        self.cached_powered_on = False
-        self.cached_available_sources = []
-        self.cached_current_source = 'none'
+        # State is read from the SourceController's state store (see _get_state)
+        self._empty_state = RadioState()
         
         # Display rendering state
         self.current_display_type = None
@@ -166,19 +165,6 @@ class DisplayController:
             # Trigger initial display update to show current status
             self._wake_event.set()
             
-            # Initialize cache with current state
-            if self.source_controller:
-                try:
-                    self.cached_playback_state = self.source_controller.get_playback_state()
-                    self.cached_track_info = self.source_controller.get_track_info()
-                    self.cached_source_info = self.source_controller.get_source_info()
-                    self.cached_powered_on = self.source_controller.powered_on
-                    self.cached_available_sources = [s.value for s in self.source_controller.get_available_sources()]
-                    current_source_enum = self.source_controller.get_current_source()
-                    self.cached_current_source = current_source_enum.value if current_source_enum else 'none'
-                except Exception as e:
-                    logger.warning(f"Could not initialize display cache: {e}")
-            
             # Register for callbacks from SourceController (if it has callback support)
             if hasattr(self.source_controller, 'add_callback'):
                 self.source_controller.add_callback('any', self._on_client_changed)
@@ -187,84 +173,41 @@ class DisplayController:
         logger.info("Simplified DisplayController initialized successfully")
         return True
     
+    def _get_state(self) -> RadioState:
+        """Current state snapshot - one lock-free read, all fields from the same version"""
+        store = getattr(self.source_controller, 'state_store', None)
+        return store.get_snapshot() if store else self._empty_state
+    
+    # Read-only views of the current snapshot (kept for existing callers)
+    cached_playback_state = property(lambda self: self._get_state().playback_state)
+    cached_track_info = property(lambda self: self._get_state().track_info)
+    cached_source_info = property(lambda self: self._get_state().source_info)
+    cached_powered_on = property(lambda self: self._get_state().powered_on)
+    cached_available_sources = property(lambda self: list(self._get_state().available_sources))
+    cached_current_source = property(lambda self: self._get_state().current_source)
+    
     def _on_client_changed(self, **kwargs):
+        """Wake the render loop - the new state is already in the state store"""
         # Don't process callbacks during shutdown
         if self._shutting_down:
             return
         
         # Debug: Log what we received
-        event_name = kwargs.get('event', 'unknown')
+        event_name = kwargs.get('sub_event', kwargs.get('event', 'unknown'))
         logger.debug(f"📺 DisplayController received callback: event={event_name}, kwargs_keys={list(kwargs.keys())}")
         
-        # Detect source change OR device change (within same source) - if changed, refresh display
-        source_changed = False
-        device_changed = False
-        pairing_mode_changed = False
-        
-        if 'source_info' in kwargs:
-            new_source_info = kwargs['source_info']
-            if self.cached_source_info:
-                # Check if source type changed
-                old_source = self.cached_source_info.source if hasattr(self.cached_source_info, 'source') else None
-                new_source = new_source_info.source if hasattr(new_source_info, 'source') else None
-                if old_source != new_source:
-                    source_changed = True
-                    logger.info(f"🔄 Source changed in display: {old_source.value if old_source else 'none'} → {new_source.value if new_source else 'none'}")
-                
-                # Check if device changed (within same source - important for Bluetooth)
-                old_device_mac = self.cached_source_info.device_mac if hasattr(self.cached_source_info, 'device_mac') else None
-                new_device_mac = new_source_info.device_mac if hasattr(new_source_info, 'device_mac') else None
-                if old_device_mac != new_device_mac:
-                    device_changed = True
-                    old_device_name = self.cached_source_info.device_name if hasattr(self.cached_source_info, 'device_name') else 'Unknown'
-                    new_device_name = new_source_info.device_name if hasattr(new_source_info, 'device_name') else 'Unknown'
-                    logger.info(f"🔵 Device changed in display: {old_device_name} (MAC:{old_device_mac or 'none'}) → {new_device_name} (MAC:{new_device_mac or 'none'})")
-                
-                # Check if pairing_mode changed (important for Bluetooth pairing screen)
-                old_pairing = self.cached_source_info.pairing_mode if hasattr(self.cached_source_info, 'pairing_mode') else False
-                new_pairing = new_source_info.pairing_mode if hasattr(new_source_info, 'pairing_mode') else False
-                if old_pairing != new_pairing:
-                    pairing_mode_changed = True
-                    logger.info(f"📡 Pairing mode changed in display: {old_pairing} → {new_pairing}")
-            
-            # Store the new source_info (monitor now returns copies, not references)
-            self.cached_source_info = new_source_info
+        if event_name == 'state_changed':
+            state, changed = kwargs['state'], kwargs['changed']
+            if changed & StateField.CURRENT_SOURCE:
+                logger.info(f"🔄 Source changed in display: {state.current_source} (v{state.version})")
+            if changed & StateField.TRACK:
+                logger.info(f"📀 Display track: {state.track_info.title if state.track_info else 'None'}")
         
-        # If source OR device OR pairing_mode changed, fetch fresh state from SourceController
-        if (source_changed or device_changed or pairing_mode_changed) and self.source_controller:
-            if source_changed:
-                logger.info("🔄 Refreshing display cache for new source...")
-            elif device_changed:
-                logger.info("🔵 Refreshing display cache for device change...")
-            elif pairing_mode_changed:
-                logger.info("📡 Refreshing display cache for pairing mode change...")
-            
-            try:
-                # Force fresh state query from monitors (not cached values with expected states)
-                self.cached_playback_state = self.source_controller.get_playback_state(force_refresh=True)
-                self.cached_track_info = self.source_controller.get_track_info()
-                self.cached_source_info = self.source_controller.get_source_info()
-                self.cached_powered_on = self.source_controller.powered_on
-                logger.info(f"✅ Display cache refreshed - Status: {self.cached_playback_state.status.value if self.cached_playback_state else 'unknown'}, Track: {self.cached_track_info.title if self.cached_track_info else 'None'}")
-            except Exception as e:
-                logger.error(f"Error refreshing cache for change: {e}")
-        else:
-            # Normal event-driven updates (no source change)
-            if 'playback_state' in kwargs:
-                self.cached_playback_state = kwargs['playback_state']
-                logger.debug(f"Display cache updated: playback_state = {kwargs['playback_state']}")
-            if 'track_info' in kwargs:
-                self.cached_track_info = kwargs['track_info']
-                track = kwargs['track_info']
-                logger.info(f"📀 Display cache updated: track_info = {track.title if track else 'None'}")
-        
-        # Always update these regardless of source change
-        if 'powered_on' in kwargs:
-            self.cached_powered_on = kwargs['powered_on']
-        if 'current_source' in kwargs:
-            self.cached_current_source = kwargs['current_source']
-        if 'available_sources' in kwargs:
-            self.cached_available_sources = kwargs['available_sources']
+        trace = tracer.current()
+        if trace is not None:
+            with self._traces_lock:
+                if trace not in self._pending_traces:
+                    self._pending_traces.append(trace)
             
         try:
             self._wake_event.set()
@@ -356,7 +299,7 @@ class DisplayController:
                     break
 
                 # Get power state before deciding update interval
-                powered_on = self.cached_powered_on
+                powered_on = self._get_state().powered_on
                 # if self.source_controller:
                 #     try:
                 #         powered_on = self.source_controller.powered_on
@@ -427,11 +370,12 @@ class DisplayController:
                     return
             
 
-            # Use cached values from events
-            playback_state = self.cached_playback_state
-            track_info = self.cached_track_info
-            source_info = self.cached_source_info
-            powered_on = self.cached_powered_on
+            # One snapshot per frame - never a new source with an old track
+            state = self._get_state()
+            playback_state = state.playback_state
+            track_info = state.track_info
+            source_info = state.source_info
+            powered_on = state.powered_on
             
             # Derive current source from source_info
             current_source = 'none'
@@ -678,6 +622,14 @@ class DisplayController:
 
         self._render_display_content('clock', clock_data)
 
+    def _take_pending_traces(self) -> list:
+        """Traces whose state change the next frame shows"""
+        if not self._pending_traces:
+            return []
+        with self._traces_lock:
+            traces, self._pending_traces = self._pending_traces, []
+        return traces
+
     def _render_display_content(self, display_type: str, display_data: Dict[str, Any]):
         """Generic method to render display content based on type"""
         try:
@@ -719,7 +671,14 @@ class DisplayController:
             
             # Render the display (render_frame returns None)
             logger.debug(f"Calling render_frame for {display_type}")
+            traces = self._take_pending_traces()
+            for trace in traces:
+                tracer.mark(trace, 'wake', display_type)
+            started = time.monotonic()
             self.display_interface.render_frame(draw_func)
+            for trace in traces:
+                tracer.record(trace, 'render', display_type, started, time.monotonic())
+                tracer.finish(trace)
             logger.debug(f"Successfully rendered {display_type}")
             
             # Update truncation info if available (only from track_info and status_message)
@@ -1218,7 +1177,7 @@ class DisplayController:
 
         # Get FRESH playback state (includes expected values from monitor)
         # playback_state = self.source_controller.get_playback_state()
-        playback_state = self.cached_playback_state
+        playback_state = self._get_state().playback_state
         
         if isinstance(playback_state, PlaybackState):
             display_volume = playback_state.volume
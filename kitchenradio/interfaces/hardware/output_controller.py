@@ -44,6 +44,8 @@ import logging
 import time
 from typing import Optional, TYPE_CHECKING
 
+from kitchenradio.sources.source_model import StateField
+
 if TYPE_CHECKING:
     from kitchenradio.sources.source_controller import SourceController
 
@@ -160,9 +162,10 @@ class OutputController:
         # Subscribe to power events from SourceController
         try:
             # Register callback for 'client_changed' events
-            # The callback will receive event='power_changed' and powered_on=True/False
+            # The callback will receive event='power_changed' with powered_on=True/False,
+            # and event='state_changed' with a StateField mask
             self.source_controller.add_callback('client_changed', self._on_power_changed)
-            logger.info("[OK] Subscribed to client_changed events (for power_changed)")
+            logger.info("[OK] Subscribed to client_changed events (for power state)")
         except Exception as e:
             logger.error(f"Failed to subscribe to power events: {e}")
             return False
@@ -195,20 +198,32 @@ class OutputController:
         self.initialized = False
         logger.info("[OK] OutputController cleanup complete")
     
-    def _on_power_changed(self, event: str = None, powered_on: bool = None, **kwargs):
+    def _on_power_changed(self, event: str = None, powered_on: bool = None,
+                          changed: StateField = StateField.NONE, **kwargs):
         """
         Callback for power state changes from SourceController.
         
+        Handles both 'power_changed' (with powered_on) and 'state_changed'
+        with POWER in its mask; the two report the same change, so the
+        second one finds the amplifier already switched.
+        
         Args:
-            event: Event name (should be 'power_changed')
-            powered_on: True if system powered on, False if powered off
+            event: Event name ('power_changed' or 'state_changed')
+            powered_on: True if system powered on, False if powered off (power_changed)
+            changed: Fields that changed (state_changed)
         """
-        # Only respond to power_changed events
-        if event != 'power_changed':
+        if event == 'power_changed':
+            if powered_on is None:
+                logger.warning("Received power_changed event without powered_on parameter")
+                return
+        elif event == 'state_changed' and changed & StateField.POWER:
+            # Read the latest snapshot rather than the event's - a newer change may already be stored
+            powered_on = self.source_controller.get_state_snapshot().powered_on
+        else:
             return
         
-        if powered_on is None:
-            logger.warning("Received power_changed event without powered_on parameter")
+        if self.initialized and powered_on == self.amplifier_enabled:
+            # Already switched by the other event for this change - skip the delay
             return
         
         logger.info(f"🔌 Power state changed: {'ON' if powered_on else 'OFF'}")
@@ -105,24 +105,24 @@ class KitchenRadioWeb:
         self.last_button_press = None
         self.api_start_time = None
         
-    def _get_status_dict(self):
-        """Helper to construct status dict from DisplayController cache"""
-        if not self.display_controller:
-            return {}
-            
-        # Use cached state from DisplayController to avoid direct SourceController access
-        playback_state = self.display_controller.cached_playback_state
-        track_info = self.display_controller.cached_track_info
-        source_info = self.display_controller.cached_source_info
-        current_source = self.display_controller.cached_current_source
-        powered_on = self.display_controller.cached_powered_on
-        available_sources = self.display_controller.cached_available_sources
+    def _get_status_dict(self, state=None):
+        """Helper to construct status dict from one state snapshot (lock-free read)"""
+        if state is None:
+            state = self.source_controller.get_state_snapshot()
+        
+        playback_state = state.playback_state
+        track_info = state.track_info
+        source_info = state.source_info
+        current_source = state.current_source
+        powered_on = state.powered_on
+        available_sources = list(state.available_sources)
         
         # Derive connection status from available sources
         mpd_connected = 'mpd' in available_sources
         librespot_connected = 'librespot' in available_sources
         
         return {
+            'version': state.version,
             'current_source': current_source,
             'powered_on': powered_on,
             'available_sources': available_sources,
@@ -289,8 +289,18 @@ class KitchenRadioWeb:
         
         @self.app.route('/api/status', methods=['GET'])
         def api_status():
-            """Get API status and SourceController status"""
-            kitchen_status = self._get_status_dict()
+            """
+            Get API status and SourceController status.
+            
+            With ?since=<version> the request waits (up to ?timeout=, max 30s)
+            until the state is newer than that version.
+            """
+            state = None
+            since = request.args.get('since', type=int)
+            if since is not None:
+                timeout = min(request.args.get('timeout', 10.0, type=float), 30.0)
+                state = self.source_controller.state_store.wait_for_version(since + 1, timeout=timeout)
+            kitchen_status = self._get_status_dict(state)
             
             return jsonify({
                 'api_running': self.running,
@@ -336,6 +346,118 @@ class KitchenRadioWeb:
                 logger.error(f"Error during backend reconnection: {e}")
                 return jsonify({'error': str(e)}), 500
         
+        @self.app.route('/api/stats/http', methods=['GET'])
+        def http_stats():
+            """Get per-endpoint HTTP latency counters of the backends"""
+            try:
+                return jsonify(self.source_controller.get_http_stats())
+            except Exception as e:
+                logger.error(f"Error getting HTTP stats: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/stats/connections', methods=['GET'])
+        def connection_stats():
+            """Get event connection metrics of the backends (reconnects, uptime, message rate)"""
+            try:
+                return jsonify(self.source_controller.get_connection_stats())
+            except Exception as e:
+                logger.error(f"Error getting connection stats: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/stats/events', methods=['GET'])
+        def event_stats():
+            """Get callback delivery metrics (queue depth, drops, merges, latency per subscriber)"""
+            try:
+                return jsonify(self.source_controller.get_event_stats())
+            except Exception as e:
+                logger.error(f"Error getting event stats: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/stats/commands', methods=['GET'])
+        def command_stats():
+            """Get command executor metrics (queue depth, superseded/coalesced commands, latency)"""
+            try:
+                return jsonify(self.source_controller.get_command_stats())
+            except Exception as e:
+                logger.error(f"Error getting command stats: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/stats/traces', methods=['GET'])
+        def trace_stats():
+            """Get input-to-display latency traces and per-stage histograms (?limit=20)"""
+            try:
+                limit = request.args.get('limit', 20, type=int)
+                return jsonify(self.source_controller.get_trace_stats(limit=limit))
+            except Exception as e:
+                logger.error(f"Error getting trace stats: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        # Music library endpoints (MPD)
+        @self.app.route('/api/library/search', methods=['GET'])
+        def library_search():
+            """Search the MPD library (?q=words&limit=50)"""
+            try:
+                query = request.args.get('q', '')
+                limit = request.args.get('limit', type=int)
+                return jsonify(self.source_controller.search_library(query, limit=limit))
+            except Exception as e:
+                logger.error(f"Error searching library: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/library/browse', methods=['GET'])
+        def library_browse():
+            """Browse the MPD library (?artist=...&album=...)"""
+            try:
+                artist = request.args.get('artist')
+                album = request.args.get('album')
+                return jsonify(self.source_controller.browse_library(artist=artist, album=album))
+            except Exception as e:
+                logger.error(f"Error browsing library: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/library/play', methods=['POST'])
+        def library_play():
+            """Play a library track ({"file": "..."})"""
+            try:
+                data = request.get_json() or {}
+                file = data.get('file')
+                if not file:
+                    return jsonify({'error': 'Missing file'}), 400
+                
+                # Queued on the command executor - respond without waiting for MPD
+                self.source_controller.submit('play_library_track', file)
+                return jsonify({
+                    'success': True,
+                    'queued': True,
+                    'file': file,
+                    'timestamp': time.time()
+                })
+            except Exception as e:
+                logger.error(f"Error playing library track: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/queue', methods=['GET'])
+        def queue_page():
+            """Get one page of the MPD queue (?start=0&count=50)"""
+            try:
+                start = request.args.get('start', 0, type=int)
+                count = request.args.get('count', type=int)
+                return jsonify(self.source_controller.get_queue(start, count))
+            except Exception as e:
+                logger.error(f"Error getting queue: {e}")
+                return jsonify({'error': str(e)}), 500
+        
+        @self.app.route('/api/queue/current', methods=['GET'])
+        def queue_around_current():
+            """Get the MPD queue around the current song (?before=2&after=10)"""
+            try:
+                before = request.args.get('before', 2, type=int)
+                after = request.args.get('after', 10, type=int)
+                return jsonify(self.source_controller.get_queue_around_current(before, after))
+            except Exception as e:
+                logger.error(f"Error getting queue around current song: {e}")
+                return jsonify({'error': str(e)}), 500
+        
         # Display API endpoints
         @self.app.route('/api/display/image', methods=['GET'])
         def get_display_image():
@@ -768,9 +890,20 @@ if __name__ == "__main__":
         print("    POST /api/display/update - Update display with status")
         print("    GET  /api/display/status - Get display status")
         print("  System:")
-        print("    GET  /api/status - Get API and radio status")
+        print("    GET  /api/status - Get API and radio status (?since=<version> waits for a change)")
         print("    GET  /api/health - Health check")
         print("    POST /api/reconnect - Reconnect backends")
+        print("    GET  /api/stats/http - Backend HTTP latency counters")
+        print("    GET  /api/stats/connections - Backend event connection metrics")
+        print("    GET  /api/stats/events - Callback delivery metrics")
+        print("    GET  /api/stats/commands - Command executor metrics")
+        print("    GET  /api/stats/traces - Input-to-display latency traces")
+        print("  Music Library:")
+        print("    GET  /api/library/search?q=... - Search MPD library")
+        print("    GET  /api/library/browse - Browse artists/albums/tracks")
+        print("    POST /api/library/play - Play a library track")
+        print("    GET  /api/queue?start=0&count=50 - Page through the MPD queue")
+        print("    GET  /api/queue/current - Queue around the current song")
         print("\nPress Ctrl+C to stop")
         print("="*60)
         
@@ -370,6 +370,15 @@ class KitchenRadio:
                 'message': f'Error executing action: {e}'
             }
                 
+    def reconnect_backends(self) -> Dict[str, str]:
+        """
+        Retry unavailable backends now (used by the web interface).
+
+        Returns:
+            Backend status per source ('connected', 'connecting', 'unavailable')
+        """
+        return self.source_controller.reconnect_backends()
+
     def stop(self):
         """Stop the KitchenRadio daemon and cleanup all resources."""
         self.logger.info("Stopping KitchenRadio daemon...")
@@ -409,10 +418,13 @@ class KitchenRadio:
                 except Exception as e:
                     self.logger.error(f"Error stopping output controller: {e}")
             
-            # SourceController cleanup
-            # Note: SourceController doesn't have stop_monitoring() or cleanup() methods
-            # The individual backend clients (MPD, Librespot) will be cleaned up automatically
-            # when the Python process exits
+            # SourceController cleanup (reconnect supervisor, Librespot event loop)
+            if self.source_controller:
+                try:
+                    self.logger.info("Stopping source controller...")
+                    self.source_controller.cleanup()
+                except Exception as e:
+                    self.logger.error(f"Error stopping source controller: {e}")
             
             self.logger.info("[OK] KitchenRadio daemon stopped")
             
@@ -0,0 +1,179 @@
+"""
+Backend Supervisor - Background reconnects for unavailable backends
+
+Backends that are not up after startup are handed to the supervisor, which
+retries them from a single thread with exponential backoff and jitter, so
+startup never waits for a slow NAS or a missing daemon.
+"""
+
+import time
+import random
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional, Callable, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _RetryState:
+    """Retry bookkeeping for one backend."""
+    name: str
+    connect_fn: Callable[[], bool]
+    on_connected: Optional[Callable[[], None]]
+    attempts: int = 0
+    next_attempt: float = 0.0
+
+
+class BackendSupervisor:
+    """
+    Retries backend connections until they succeed.
+
+    - One thread for all backends; attempts run one at a time
+    - Delay doubles after every failure (initial_delay .. max_delay),
+      randomized by +/- jitter so backends don't retry in lockstep
+    - on_connected is called from the supervisor thread after a success
+    """
+
+    def __init__(self,
+                 initial_delay: float = 5.0,
+                 max_delay: float = 60.0,
+                 jitter: float = 0.2,
+                 max_attempts: int = 0):
+        """
+        Initialize supervisor.
+
+        Args:
+            initial_delay: Seconds before the first retry
+            max_delay: Upper bound for the retry delay
+            jitter: Random fraction added to / removed from each delay
+            max_attempts: Give up after this many attempts (0 = unlimited)
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+
+        self._backends: Dict[str, _RetryState] = {}
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, name: str, connect_fn: Callable[[], bool],
+              on_connected: Optional[Callable[[], None]] = None):
+        """
+        Start retrying a backend (no-op if it is already watched).
+
+        Args:
+            name: Backend name
+            connect_fn: Connect attempt, returns True on success
+            on_connected: Called once the backend is up
+        """
+        with self._lock:
+            if name in self._backends:
+                return
+            state = _RetryState(name, connect_fn, on_connected)
+            state.next_attempt = time.monotonic() + self._delay(0)
+            self._backends[name] = state
+            logger.info(f"🔄 [{name}] Unavailable - retrying in background "
+                        f"(next attempt in {state.next_attempt - time.monotonic():.1f}s)")
+            self._ensure_thread()
+        self._wake_event.set()
+
+    def retry_now(self, name: Optional[str] = None):
+        """Attempt one (or all) watched backends immediately."""
+        with self._lock:
+            for state in self._backends.values():
+                if name is None or state.name == name:
+                    state.next_attempt = 0.0
+        self._wake_event.set()
+
+    def is_watching(self, name: str) -> bool:
+        """True while a backend is being retried."""
+        return name in self._backends
+
+    def get_status(self) -> Dict[str, Any]:
+        """Retry status per watched backend (for diagnostics)."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                state.name: {
+                    'attempts': state.attempts,
+                    'next_attempt_in': round(max(0.0, state.next_attempt - now), 1)
+                }
+                for state in self._backends.values()
+            }
+
+    def stop(self):
+        """Stop retrying and wait for the supervisor thread."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _delay(self, attempts: int) -> float:
+        """Backoff delay after a number of failed attempts, with jitter."""
+        delay = min(self.max_delay, self.initial_delay * (2 ** attempts))
+        return max(0.0, delay * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def _ensure_thread(self):
+        """Start the supervisor thread if needed (caller holds the lock)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="backend-supervisor")
+        self._thread.start()
+
+    def _run(self):
+        """Run due attempts; sleep until the next one is due."""
+        while not self._stop_event.is_set():
+            with self._lock:
+                if not self._backends:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                due = [state for state in self._backends.values() if state.next_attempt <= now]
+                wait = min(state.next_attempt for state in self._backends.values()) - now
+
+            if not due:
+                self._wake_event.wait(timeout=max(0.0, wait))
+                self._wake_event.clear()
+                continue
+
+            for state in due:
+                if self._stop_event.is_set():
+                    return
+                self._attempt(state)
+
+    def _attempt(self, state: _RetryState):
+        """Run one connect attempt and reschedule or drop the backend."""
+        state.attempts += 1
+        try:
+            connected = state.connect_fn()
+        except Exception as e:
+            logger.warning(f"🔄 [{state.name}] Reconnect attempt {state.attempts} failed: {e}")
+            connected = False
+
+        if connected:
+            with self._lock:
+                self._backends.pop(state.name, None)
+            logger.info(f"✅ [{state.name}] Backend available after {state.attempts} retries")
+            if state.on_connected:
+                try:
+                    state.on_connected()
+                except Exception as e:
+                    logger.error(f"Error in on_connected callback for {state.name}: {e}")
+            return
+
+        if self.max_attempts and state.attempts >= self.max_attempts:
+            with self._lock:
+                self._backends.pop(state.name, None)
+            logger.warning(f"[X] [{state.name}] Giving up after {state.attempts} reconnect attempts")
+            return
+
+        delay = self._delay(state.attempts)
+        state.next_attempt = time.monotonic() + delay
+        logger.debug(f"🔄 [{state.name}] Attempt {state.attempts} failed - next in {delay:.1f}s")
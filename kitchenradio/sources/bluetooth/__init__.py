@@ -5,7 +5,9 @@ Provides Bluetooth audio connectivity with auto-pairing support and AVRCP media
 """
 
 from .controller import BluetoothController
-from .bluez_client import BlueZClient
+from .async_bluez_client import AsyncBlueZClient
+from .object_tree import BlueZObjectTree
+from .reconnect import ReconnectManager
 from .monitor import (
     BluetoothMonitor,
     PlaybackState,
@@ -14,10 +16,19 @@ from .monitor import (
     SourceInfo
 )
 
+try:
+    from .bluez_client import BlueZClient
+except ImportError:
+    # dbus-python/PyGObject not installed - only the asyncio backend is usable
+    BlueZClient = None
+
 __all__ = [
     'BluetoothController',
     'BluetoothMonitor',
     'BlueZClient',
+    'AsyncBlueZClient',
+    'BlueZObjectTree',
+    'ReconnectManager',
     'PlaybackState',
     'PlaybackStatus',
     'TrackInfo',
@@ -0,0 +1,936 @@
+#!/usr/bin/env python3
+"""
+Async BlueZ Client - BlueZ D-Bus client on asyncio (dbus-next)
+
+Alternative to BlueZClient that needs neither dbus-python nor PyGObject:
+- D-Bus traffic runs on an asyncio loop in a daemon thread owned by the
+  client, so there is no GLib main loop to start and wait for
+- Same public API and callbacks as BlueZClient (on_properties_changed,
+  on_volume_changed, on_track_changed, on_status_changed), so
+  BluetoothController and BluetoothMonitor use it unchanged
+- The constructor returns once the bus is connected and the object tree is
+  seeded (or raises), instead of callers sleeping until it settles
+- bus_address connects to any bus, e.g. a private dbus-daemon with a
+  stand-in org.bluez service, so Bluetooth logic can run without BlueZ
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional, Callable, Dict, Any, List
+
+from .object_tree import BlueZObjectTree, device_path_of
+
+logger = logging.getLogger(__name__)
+
+try:
+    from dbus_next import BusType, Message, MessageType, Variant
+    from dbus_next.aio import MessageBus
+    from dbus_next.service import ServiceInterface, method
+    DBUS_NEXT_AVAILABLE = True
+except ImportError:
+    DBUS_NEXT_AVAILABLE = False
+
+# D-Bus type of writable BlueZ properties (Properties.Set takes a variant)
+PROPERTY_SIGNATURES = {
+    'Powered': 'b',
+    'Discoverable': 'b',
+    'Pairable': 'b',
+    'Trusted': 'b',
+    'Blocked': 'b',
+    'DiscoverableTimeout': 'u',
+    'PairableTimeout': 'u',
+    'Alias': 's',
+    'Volume': 'q',
+}
+
+
+class BlueZCallError(Exception):
+    """A BlueZ method call returned a D-Bus error."""
+
+    def __init__(self, name: str, message: str = ''):
+        super().__init__(f"{name}: {message}" if message else name)
+        self.name = name
+
+    def get_dbus_name(self) -> str:
+        """D-Bus error name (same accessor as dbus.exceptions.DBusException)."""
+        return self.name
+
+
+def _unwrap(value: Any) -> Any:
+    """Convert dbus-next values (Variants inside dicts/lists) to plain Python values."""
+    if DBUS_NEXT_AVAILABLE and isinstance(value, Variant):
+        return _unwrap(value.value)
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    return value
+
+
+if DBUS_NEXT_AVAILABLE:
+    class AsyncAutoPairAgent(ServiceInterface):
+        """Bluetooth pairing agent that auto-accepts all pairing requests"""
+
+        AGENT_INTERFACE = 'org.bluez.Agent1'
+        AGENT_PATH = '/org/bluez/kitchenradio_agent'
+
+        def __init__(self):
+            super().__init__(self.AGENT_INTERFACE)
+            logger.info("🤖 Auto-pair agent initialized")
+
+        @method()
+        def AuthorizeService(self, device: 'o', uuid: 's'):
+            """Auto-authorize all services"""
+            logger.info(f"✅ Auto-authorizing service {uuid} for {device}")
+
+        @method()
+        def RequestPasskey(self, device: 'o') -> 'u':
+            """Return passkey (for older pairing methods)"""
+            logger.info(f"🔑 Passkey requested for {device}, returning 0")
+            return 0
+
+        @method()
+        def DisplayPasskey(self, device: 'o', passkey: 'u', entered: 'q'):
+            """Display passkey (for confirmation)"""
+            logger.info(f"🔢 Display passkey {passkey:06d} for {device}")
+
+        @method()
+        def DisplayPinCode(self, device: 'o', pincode: 's'):
+            """Display PIN code"""
+            logger.info(f"🔢 Display PIN code {pincode} for {device}")
+
+        @method()
+        def RequestConfirmation(self, device: 'o', passkey: 'u'):
+            """Auto-confirm passkey"""
+            logger.info(f"✅ Auto-confirming passkey {passkey:06d} for {device}")
+
+        @method()
+        def RequestAuthorization(self, device: 'o'):
+            """Auto-authorize device"""
+            logger.info(f"✅ Auto-authorizing {device}")
+
+        @method()
+        def Cancel(self):
+            """Handle cancellation"""
+            logger.warning("[!] Pairing cancelled")
+
+
+class AsyncBlueZClient:
+    """
+    BlueZ D-Bus client on an asyncio event loop.
+
+    Drop-in replacement for BlueZClient. Blocking methods may be called
+    from any thread; callbacks, timers (call_later) and connect_device_async
+    replies run on the client's loop thread. Commands issued from that
+    thread (i.e. from a callback) are sent without waiting for the reply,
+    so signal handling never blocks the loop.
+    """
+
+    BLUEZ_SERVICE = 'org.bluez'
+    ADAPTER_INTERFACE = 'org.bluez.Adapter1'
+    DEVICE_INTERFACE = 'org.bluez.Device1'
+    MEDIA_PLAYER_INTERFACE = 'org.bluez.MediaPlayer1'
+    TRANSPORT_INTERFACE = 'org.bluez.MediaTransport1'
+    PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+    OBJECT_MANAGER_INTERFACE = 'org.freedesktop.DBus.ObjectManager'
+    AGENT_MANAGER_INTERFACE = 'org.bluez.AgentManager1'
+    AGENT_PATH = '/org/bluez/kitchenradio_agent'
+
+    # Pair/Connect wait for the remote device (dbus-python's default reply timeout is 25s)
+    LONG_CALL_TIMEOUT = 30.0
+
+    def __init__(self,
+                 adapter_path: str = '/org/bluez/hci0',
+                 coalesce_window: float = 0.15,
+                 bus_address: Optional[str] = None,
+                 call_timeout: float = 5.0,
+                 ready_timeout: float = 10.0):
+        """
+        Initialize BlueZ client and connect to D-Bus.
+
+        Args:
+            adapter_path: D-Bus path to Bluetooth adapter
+            coalesce_window: Seconds to merge bursts of MediaPlayer1 changes
+                             (Track/Status/Position) into one callback (0 = off)
+            bus_address: D-Bus address to connect to (None = system bus),
+                         e.g. a private bus with a stand-in org.bluez service
+            call_timeout: Seconds a blocking method waits for its reply
+            ready_timeout: Seconds to wait for the connection and object tree seed
+
+        Raises:
+            ImportError: dbus-next is not installed
+            Exception: D-Bus connection or object tree seed failed
+        """
+        if not DBUS_NEXT_AVAILABLE:
+            raise ImportError("AsyncBlueZClient requires dbus-next (pip install dbus-next)")
+
+        self.adapter_path = adapter_path
+        self.coalesce_window = coalesce_window
+        self.bus_address = bus_address
+        self.call_timeout = call_timeout
+        self.bus: Optional[MessageBus] = None
+        self.agent = None
+        self.active_player_path: Optional[str] = None
+
+        # Local mirror of the BlueZ object tree
+        self.objects = BlueZObjectTree()
+
+        # Targeted signal subscriptions (match rules, only touched on the loop thread)
+        self._watched_device: Optional[str] = None
+        self._media_matches: Dict[str, str] = {}  # object path -> match rule
+        self._adapter_match: Optional[str] = None
+
+        # Coalesced MediaPlayer1 changes (player path -> merged changed props)
+        self._pending_player_changes: Dict[str, Dict[str, Any]] = {}
+        self._flush_scheduled = False
+        self._last_track: Dict[str, Dict[str, Any]] = {}
+        self._last_status: Dict[str, str] = {}
+
+        # Callbacks
+        self.on_properties_changed: Optional[Callable[[str, Dict, List, str], None]] = None
+        self.on_volume_changed: Optional[Callable[[str, Dict, List, str], None]] = None
+        self.on_track_changed: Optional[Callable[[Dict], None]] = None
+        self.on_status_changed: Optional[Callable[[str], None]] = None
+
+        # Event loop thread
+        self._tasks = set()
+        self._closed = threading.Event()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True, name="bluez-asyncio")
+        self._thread.start()
+
+        # Initialize D-Bus (returns once ready)
+        try:
+            asyncio.run_coroutine_threadsafe(self._setup_dbus(), self.loop).result(timeout=ready_timeout)
+            logger.info("[OK] BlueZ D-Bus connection established (asyncio)")
+        except Exception as e:
+            logger.error(f"[X] Failed to setup BlueZ D-Bus: {e}")
+            self.quit_mainloop()
+            raise
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _setup_dbus(self):
+        """Connect, subscribe and seed the object tree"""
+        self.bus = await MessageBus(bus_address=self.bus_address, bus_type=BusType.SYSTEM).connect()
+        self.bus.add_message_handler(self._on_message)
+
+        # Keep the object tree in sync: subscribe first, then seed once
+        await self._add_match(self._match_rule(self.OBJECT_MANAGER_INTERFACE, 'InterfacesAdded', path='/'))
+        await self._add_match(self._match_rule(self.OBJECT_MANAGER_INTERFACE, 'InterfacesRemoved', path='/'))
+        managed_objects, = await self._call('/', self.OBJECT_MANAGER_INTERFACE, 'GetManagedObjects')
+        self.objects.seed(managed_objects)
+
+        # Device property changes (connect/pair) only - media objects are
+        # subscribed per path (watch_device), Adapter1 while pairing (watch_adapter)
+        await self._add_match(self._match_rule(self.PROPERTIES_INTERFACE, 'PropertiesChanged',
+                                               arg0=self.DEVICE_INTERFACE))
+
+    # ------------------------------------------------------------------
+    # Loop plumbing
+    # ------------------------------------------------------------------
+
+    def run_mainloop(self):
+        """Block until quit_mainloop() (signals are dispatched on the client's own thread)."""
+        self._closed.wait()
+
+    def quit_mainloop(self):
+        """Disconnect from D-Bus and stop the client's loop thread."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+
+        if self.loop.is_running():
+            if self.bus:
+                self.loop.call_soon_threadsafe(self.bus.disconnect)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+            if not self._thread.is_alive():
+                self.loop.close()
+
+    def call_later(self, delay: float, callback: Callable, *args):
+        """
+        Run callback(*args) on the client's loop thread after delay seconds.
+
+        Returns:
+            Handle for cancel_call()
+        """
+        if self._on_loop_thread():
+            return self.loop.call_later(delay, callback, *args)
+
+        async def schedule():
+            return self.loop.call_later(delay, callback, *args)
+        return asyncio.run_coroutine_threadsafe(schedule(), self.loop).result(timeout=self.call_timeout)
+
+    def cancel_call(self, handle):
+        """Cancel a call scheduled with call_later()."""
+        self._call_soon(handle.cancel)
+
+    def _on_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def _call_soon(self, callback: Callable, *args):
+        """Run callback on the loop thread (directly if already there)."""
+        if self._on_loop_thread():
+            callback(*args)
+        elif not self._closed.is_set():
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def _spawn(self, coro, action: str):
+        """Start a coroutine on the loop without waiting for it (caller is on the loop thread)."""
+        task = self.loop.create_task(coro)
+        self._tasks.add(task)
+
+        def done(task):
+            self._tasks.discard(task)
+            if not task.cancelled() and task.exception():
+                logger.error(f"Error {action}: {task.exception()}")
+        task.add_done_callback(done)
+
+    def _wait(self, coro, action: str, default: Any = None, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and wait for its result (default on failure)."""
+        if self._closed.is_set():
+            coro.close()
+            return default
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout=timeout or self.call_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            logger.error(f"Timed out {action}")
+        except Exception as e:
+            logger.error(f"Error {action}: {e}")
+        return default
+
+    def _command(self, coro, action: str, timeout: Optional[float] = None) -> bool:
+        """
+        Run a command coroutine.
+
+        From the loop thread it is sent without waiting (True = sent);
+        from other threads this waits for the reply.
+        """
+        if self._on_loop_thread():
+            self._spawn(coro, action)
+            return True
+        return bool(self._wait(coro, action, False, timeout))
+
+    def _query(self, coro, action: str, default: Any = None) -> Any:
+        """Run a query coroutine (not possible from the loop thread - returns default)."""
+        if self._on_loop_thread():
+            coro.close()
+            logger.debug(f"Not {action} from the D-Bus loop thread")
+            return default
+        return self._wait(coro, action, default)
+
+    # ------------------------------------------------------------------
+    # D-Bus primitives
+    # ------------------------------------------------------------------
+
+    async def _call(self, path: str, interface: str, member: str,
+                    signature: str = '', body: Optional[List[Any]] = None,
+                    destination: Optional[str] = None) -> List[Any]:
+        """
+        Call a method and return the reply body as plain Python values.
+
+        Raises:
+            BlueZCallError: The call returned a D-Bus error
+        """
+        reply = await self.bus.call(Message(
+            destination=destination or self.BLUEZ_SERVICE,
+            path=path,
+            interface=interface,
+            member=member,
+            signature=signature,
+            body=body or []
+        ))
+        if reply.message_type == MessageType.ERROR:
+            raise BlueZCallError(reply.error_name, str(reply.body[0]) if reply.body else '')
+        return _unwrap(reply.body)
+
+    async def _get_property(self, path: str, interface: str, name: str) -> Any:
+        value, = await self._call(path, self.PROPERTIES_INTERFACE, 'Get', 'ss', [interface, name])
+        return value
+
+    async def _set_property(self, path: str, interface: str, name: str, value: Any) -> bool:
+        signature = PROPERTY_SIGNATURES.get(name)
+        if signature is None:
+            raise ValueError(f"Unknown D-Bus type for property {name}")
+        if signature == 'b':
+            value = bool(value)
+        elif signature in ('u', 'q'):
+            value = int(value)
+        await self._call(path, self.PROPERTIES_INTERFACE, 'Set', 'ssv', [interface, name, Variant(signature, value)])
+        return True
+
+    async def _invoke(self, path: str, interface: str, member: str,
+                      signature: str = '', body: Optional[List[Any]] = None) -> bool:
+        await self._call(path, interface, member, signature, body)
+        return True
+
+    def _match_rule(self, interface: str, member: str,
+                    path: Optional[str] = None, arg0: Optional[str] = None) -> str:
+        rule = f"type='signal',sender='{self.BLUEZ_SERVICE}',interface='{interface}',member='{member}'"
+        if path:
+            rule += f",path='{path}'"
+        if arg0:
+            rule += f",arg0='{arg0}'"
+        return rule
+
+    async def _add_match(self, rule: str):
+        await self._call('/org/freedesktop/DBus', 'org.freedesktop.DBus', 'AddMatch', 's', [rule],
+                         destination='org.freedesktop.DBus')
+
+    async def _remove_match(self, rule: str):
+        await self._call('/org/freedesktop/DBus', 'org.freedesktop.DBus', 'RemoveMatch', 's', [rule],
+                         destination='org.freedesktop.DBus')
+
+    # ------------------------------------------------------------------
+    # Signals
+    # ------------------------------------------------------------------
+
+    def _on_message(self, message):
+        """Dispatch signals matched by our rules (runs on the loop thread)."""
+        if message.message_type != MessageType.SIGNAL:
+            return None
+        try:
+            if message.interface == self.OBJECT_MANAGER_INTERFACE:
+                if message.member == 'InterfacesAdded':
+                    self._on_interfaces_added(*_unwrap(message.body))
+                elif message.member == 'InterfacesRemoved':
+                    self._on_interfaces_removed(*_unwrap(message.body))
+            elif message.interface == self.PROPERTIES_INTERFACE and message.member == 'PropertiesChanged':
+                interface, changed, invalidated = _unwrap(message.body)
+                self._dispatch_properties_changed(interface, changed, invalidated, message.path)
+        except Exception as e:
+            logger.error(f"Error handling D-Bus signal {message.member} at {message.path}: {e}")
+        return None
+
+    def _dispatch_properties_changed(self, interface: str, changed: Dict, invalidated: List, path: str):
+        """Route PropertiesChanged to the handler of its subscription."""
+        if interface == self.DEVICE_INTERFACE:
+            self._on_properties_changed_internal(interface, changed, invalidated, path)
+        elif interface == self.ADAPTER_INTERFACE:
+            if self._adapter_match and path == self.adapter_path:
+                self._on_properties_changed_internal(interface, changed, invalidated, path)
+        elif path in self._media_matches:
+            if interface == self.MEDIA_PLAYER_INTERFACE:
+                self._on_media_player_properties_changed(interface, changed, invalidated, path)
+            elif interface == self.TRANSPORT_INTERFACE:
+                self._on_volume_changed_internal(interface, changed, invalidated, path)
+
+    def _on_interfaces_added(self, path, interfaces):
+        """Mirror new BlueZ objects/interfaces into the object tree"""
+        self.objects.interfaces_added(path, interfaces)
+
+        # Player/transport of the watched device appeared - subscribe to it
+        if self._watched_device and device_path_of(path) == self._watched_device:
+            if self.MEDIA_PLAYER_INTERFACE in interfaces or self.TRANSPORT_INTERFACE in interfaces:
+                self._subscribe_media_object(path)
+
+    def _on_interfaces_removed(self, path, interfaces):
+        """Drop removed BlueZ objects/interfaces from the tree"""
+        self.objects.interfaces_removed(path, interfaces)
+        if path in self._media_matches and not self.objects.has_object(path):
+            self._spawn(self._remove_match(self._media_matches.pop(path)), f"unsubscribing from {path}")
+
+    def _on_properties_changed_internal(self, interface, changed, invalidated, path):
+        """Internal handler for property changes - forwards to callback"""
+        # Keep the tree current before anyone reads it
+        self.objects.properties_changed(interface, changed, invalidated, path)
+
+        if self.on_properties_changed:
+            self.on_properties_changed(interface, dict(changed), list(invalidated), path)
+
+    def _on_volume_changed_internal(self, interface, changed, invalidated, path):
+        """Internal handler for transport changes - forwards to callback"""
+        self.objects.properties_changed(interface, changed, invalidated, path)
+        logger.debug(f"🔊 [DBus Event] Transport changed at {path}: {changed}")
+        if self.on_volume_changed:
+            self.on_volume_changed(interface, dict(changed), list(invalidated), path)
+        else:
+            logger.warning(f"🔊 Volume changed but no callback registered!")
+
+    def _on_media_player_properties_changed(self, interface, changed, invalidated, path):
+        """
+        Handle MediaPlayer1 property changes.
+
+        Phones send Track, Status and Position in bursts; changes within
+        coalesce_window are merged and handled once.
+        """
+        self.objects.properties_changed(interface, changed, invalidated, path)
+        logger.debug(f"🎵 [DBus Event] MediaPlayer1 properties changed at {path}: {list(changed.keys())}")
+
+        # If we have an active player, only process events for it
+        if self.active_player_path and path != self.active_player_path:
+            logger.debug(f"🎵 Ignoring event from non-active player: {path} (active: {self.active_player_path})")
+            return
+
+        # If we don't have an active player, auto-select this one
+        if not self.active_player_path:
+            logger.info(f"Auto-selecting active player: {path}")
+            self.active_player_path = path
+
+        self._pending_player_changes.setdefault(path, {}).update(changed)
+        if self.coalesce_window <= 0:
+            self._flush_player_changes()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.loop.call_later(self.coalesce_window, self._flush_player_changes)
+
+    def _flush_player_changes(self):
+        """Handle merged MediaPlayer1 changes."""
+        self._flush_scheduled = False
+        pending, self._pending_player_changes = self._pending_player_changes, {}
+
+        for path, changed in pending.items():
+            if 'Track' in changed:
+                track = self._convert_track(changed['Track'])
+                if self._last_track.get(path) != track:
+                    self._last_track[path] = track
+                    logger.info(f"🎵 Track changed: {track['title']} - {track['artist']}")
+                    if self.on_track_changed:
+                        self.on_track_changed(path, track)
+                    else:
+                        logger.warning(f"🎵 Track changed but no callback registered!")
+
+            if 'Status' in changed:
+                status_str = str(changed['Status'])
+                if self._last_status.get(path) != status_str:
+                    self._last_status[path] = status_str
+                    logger.debug(f"🎵 Status changed to: {status_str}")
+                    if self.on_status_changed:
+                        self.on_status_changed(path, status_str)
+                    else:
+                        logger.warning(f"🎵 Status changed but no callback registered!")
+
+    @staticmethod
+    def _convert_track(track_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'title': str(track_data.get('Title', 'Unknown')),
+            'artist': str(track_data.get('Artist', 'Unknown')),
+            'album': str(track_data.get('Album', '')),
+            'duration': int(track_data.get('Duration', 0))
+        }
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def watch_device(self, device_path: Optional[str]):
+        """
+        Receive MediaPlayer1/MediaTransport1 changes for one device only.
+
+        Args:
+            device_path: D-Bus path of the connected device (None to stop)
+        """
+        self._call_soon(self._watch_device, device_path)
+
+    def _watch_device(self, device_path: Optional[str]):
+        if device_path == self._watched_device:
+            return
+        self._unwatch_device()
+        if not device_path:
+            return
+
+        self._watched_device = device_path
+        for path in (self.objects.get_player(device_path), self.objects.get_transport(device_path)):
+            if path:
+                self._subscribe_media_object(path)
+        logger.debug(f"Watching media objects of {device_path}")
+
+    def unwatch_device(self):
+        """Drop the media subscriptions of the watched device."""
+        self._call_soon(self._unwatch_device)
+
+    def _unwatch_device(self):
+        for path, rule in self._media_matches.items():
+            self._spawn(self._remove_match(rule), f"unsubscribing from {path}")
+        self._media_matches.clear()
+        self._pending_player_changes.clear()
+        self._last_track.clear()
+        self._last_status.clear()
+        self._watched_device = None
+
+    def watch_adapter(self, enabled: bool):
+        """Receive Adapter1 property changes (only needed while pairing)."""
+        self._call_soon(self._watch_adapter, enabled)
+
+    def _watch_adapter(self, enabled: bool):
+        if enabled and self._adapter_match is None:
+            self._adapter_match = self._match_rule(self.PROPERTIES_INTERFACE, 'PropertiesChanged',
+                                                   path=self.adapter_path, arg0=self.ADAPTER_INTERFACE)
+            self._spawn(self._add_match(self._adapter_match), "subscribing to adapter changes")
+        elif not enabled and self._adapter_match is not None:
+            self._spawn(self._remove_match(self._adapter_match), "unsubscribing from adapter changes")
+            self._adapter_match = None
+
+    def _subscribe_media_object(self, path: str):
+        """Subscribe to PropertiesChanged of one player or transport object."""
+        if path in self._media_matches:
+            return
+        if self.objects.get_properties(path, self.MEDIA_PLAYER_INTERFACE) is not None:
+            interface = self.MEDIA_PLAYER_INTERFACE
+        elif self.objects.get_properties(path, self.TRANSPORT_INTERFACE) is not None:
+            interface = self.TRANSPORT_INTERFACE
+        else:
+            return
+
+        rule = self._match_rule(self.PROPERTIES_INTERFACE, 'PropertiesChanged', path=path, arg0=interface)
+        self._media_matches[path] = rule
+        self._spawn(self._add_match(rule), f"subscribing to {path}")
+        logger.debug(f"Subscribed to {interface} changes at {path}")
+
+    # ------------------------------------------------------------------
+    # Agent
+    # ------------------------------------------------------------------
+
+    def register_agent(self) -> bool:
+        """
+        Register auto-pairing agent with BlueZ.
+
+        Returns:
+            True if successful
+        """
+        if self._wait(self._register_agent(), "registering BlueZ agent", False):
+            logger.info("✅ BlueZ pairing agent registered")
+            return True
+        return False
+
+    async def _register_agent(self) -> bool:
+        self.agent = AsyncAutoPairAgent()
+        self.bus.export(self.AGENT_PATH, self.agent)
+        # Register with NoInputNoOutput capability (auto-accept)
+        await self._call('/org/bluez', self.AGENT_MANAGER_INTERFACE, 'RegisterAgent', 'os',
+                         [self.AGENT_PATH, 'NoInputNoOutput'])
+        await self._call('/org/bluez', self.AGENT_MANAGER_INTERFACE, 'RequestDefaultAgent', 'o',
+                         [self.AGENT_PATH])
+        return True
+
+    def unregister_agent(self) -> bool:
+        """
+        Unregister pairing agent.
+
+        Returns:
+            True if successful
+        """
+        if not self.agent or not self.bus:
+            return False
+        if self._wait(self._unregister_agent(), "unregistering agent", False):
+            logger.info("✅ BlueZ agent unregistered")
+            return True
+        return False
+
+    async def _unregister_agent(self) -> bool:
+        await self._call('/org/bluez', self.AGENT_MANAGER_INTERFACE, 'UnregisterAgent', 'o', [self.AGENT_PATH])
+        self.bus.unexport(self.AGENT_PATH)
+        self.agent = None
+        return True
+
+    # ------------------------------------------------------------------
+    # Adapter and devices
+    # ------------------------------------------------------------------
+
+    def set_adapter_property(self, property_name: str, value: Any) -> bool:
+        """
+        Set adapter property.
+
+        Args:
+            property_name: Property name (e.g., 'Powered', 'Discoverable')
+            value: Property value
+
+        Returns:
+            True if successful
+        """
+        return self._command(self._set_property(self.adapter_path, self.ADAPTER_INTERFACE, property_name, value),
+                             f"setting adapter property {property_name}")
+
+    def get_adapter_property(self, property_name: str) -> Optional[Any]:
+        """
+        Get adapter property.
+
+        From the loop thread the object tree value is returned.
+
+        Args:
+            property_name: Property name
+
+        Returns:
+            Property value or None
+        """
+        if self._on_loop_thread():
+            return self.objects.get_property(self.adapter_path, self.ADAPTER_INTERFACE, property_name)
+        return self._query(self._get_property(self.adapter_path, self.ADAPTER_INTERFACE, property_name),
+                           f"getting adapter property {property_name}")
+
+    def get_managed_objects(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Get all managed objects from BlueZ.
+
+        Bypasses the object tree; use `objects` for lookups.
+
+        Returns:
+            Dictionary of objects with their interfaces and properties
+        """
+        reply = self._query(self._call('/', self.OBJECT_MANAGER_INTERFACE, 'GetManagedObjects'),
+                            "getting managed objects")
+        return reply[0] if reply else {}
+
+    def resync_objects(self) -> bool:
+        """
+        Re-seed the object tree from BlueZ (e.g. after bluetoothd restarted).
+
+        Returns:
+            True if successful
+        """
+        objects = self.get_managed_objects()
+        if not objects:
+            return False
+        self.objects.seed(objects)
+        return True
+
+    def get_device_properties(self, device_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get all properties for a device.
+
+        Served from the object tree; only devices BlueZ has not announced
+        yet fall back to a D-Bus GetAll.
+
+        Args:
+            device_path: D-Bus path to device
+
+        Returns:
+            Dictionary of device properties or None
+        """
+        props = self.objects.get_device(device_path)
+        if props is not None:
+            return props
+        reply = self._query(self._call(device_path, self.PROPERTIES_INTERFACE, 'GetAll', 's',
+                                       [self.DEVICE_INTERFACE]),
+                            f"getting device properties for {device_path}")
+        if not reply:
+            return None
+        self.objects.interfaces_added(device_path, {self.DEVICE_INTERFACE: reply[0]})
+        return dict(reply[0])
+
+    def set_device_property(self, device_path: str, property_name: str, value: Any) -> bool:
+        """
+        Set device property.
+
+        Args:
+            device_path: D-Bus path to device
+            property_name: Property name (e.g., 'Trusted')
+            value: Property value
+
+        Returns:
+            True if successful
+        """
+        return self._command(self._set_property(device_path, self.DEVICE_INTERFACE, property_name, value),
+                             f"setting device property {property_name}")
+
+    def connect_device(self, device_path: str) -> bool:
+        """
+        Connect to a device.
+
+        Args:
+            device_path: D-Bus path to device
+
+        Returns:
+            True if successful
+        """
+        return self._command(self._connect_device(device_path), "connecting device",
+                             timeout=self.LONG_CALL_TIMEOUT)
+
+    async def _connect_device(self, device_path: str) -> bool:
+        try:
+            await self._call(device_path, self.DEVICE_INTERFACE, 'Connect')
+        except BlueZCallError as e:
+            if "AlreadyConnected" not in e.get_dbus_name():
+                raise
+            logger.debug("Device already connected")
+        return True
+
+    def connect_device_async(self, device_path: str,
+                             on_success: Callable[[], None],
+                             on_error: Callable[[Exception], None],
+                             timeout: float = 30.0):
+        """
+        Connect to a device without waiting for the reply.
+
+        The reply is delivered on the client's loop thread.
+
+        Args:
+            device_path: D-Bus path to device
+            on_success: Called when Connect() returns
+            on_error: Called with the error if Connect() fails or times out
+            timeout: Reply timeout in seconds
+        """
+        async def connect():
+            try:
+                await asyncio.wait_for(self._call(device_path, self.DEVICE_INTERFACE, 'Connect'), timeout)
+            except Exception as e:
+                on_error(e)
+                return
+            on_success()
+
+        self._call_soon(self._spawn, connect(), "connecting device")
+
+    def disconnect_device(self, device_path: str) -> bool:
+        """
+        Disconnect a device.
+
+        Args:
+            device_path: D-Bus path to device
+
+        Returns:
+            True if successful
+        """
+        return self._command(self._invoke(device_path, self.DEVICE_INTERFACE, 'Disconnect'),
+                             "disconnecting device")
+
+    def pair_device(self, device_path: str) -> bool:
+        """
+        Pair with a device.
+
+        Args:
+            device_path: D-Bus path to device
+
+        Returns:
+            True if successful
+        """
+        return self._command(self._invoke(device_path, self.DEVICE_INTERFACE, 'Pair'), "pairing device",
+                             timeout=self.LONG_CALL_TIMEOUT)
+
+    def remove_device(self, device_path: str) -> bool:
+        """
+        Remove (unpair) a device.
+
+        Args:
+            device_path: D-Bus path to device
+
+        Returns:
+            True if successful
+        """
+        return self._command(self._invoke(self.adapter_path, self.ADAPTER_INTERFACE, 'RemoveDevice', 'o',
+                                          [device_path]),
+                             "removing device")
+
+    def start_discovery(self) -> bool:
+        """Start device discovery."""
+        return self._command(self._invoke(self.adapter_path, self.ADAPTER_INTERFACE, 'StartDiscovery'),
+                             "starting discovery")
+
+    def stop_discovery(self) -> bool:
+        """Stop device discovery."""
+        return self._command(self._invoke(self.adapter_path, self.ADAPTER_INTERFACE, 'StopDiscovery'),
+                             "stopping discovery")
+
+    # ------------------------------------------------------------------
+    # Media player (AVRCP)
+    # ------------------------------------------------------------------
+
+    def set_active_player(self, player_path: str):
+        """
+        Set the active media player path.
+
+        Args:
+            player_path: D-Bus path to media player
+        """
+        self.active_player_path = player_path
+        logger.info(f"Active player set to: {player_path}")
+
+    def _player_command(self, member: str) -> bool:
+        if not self.active_player_path:
+            logger.warning("No active player selected")
+            return False
+        return self._command(self._invoke(self.active_player_path, self.MEDIA_PLAYER_INTERFACE, member),
+                             f"sending {member}")
+
+    def play(self) -> bool:
+        """Send Play command"""
+        return self._player_command('Play')
+
+    def pause(self) -> bool:
+        """Send Pause command"""
+        return self._player_command('Pause')
+
+    def stop(self) -> bool:
+        """Send Stop command"""
+        return self._player_command('Stop')
+
+    def next(self) -> bool:
+        """Send Next command"""
+        return self._player_command('Next')
+
+    def previous(self) -> bool:
+        """Send Previous command"""
+        return self._player_command('Previous')
+
+    def get_player_status(self) -> str:
+        """Get current playback status"""
+        if not self.active_player_path:
+            return "unknown"
+
+        status_str = self.objects.get_property(self.active_player_path, self.MEDIA_PLAYER_INTERFACE, 'Status')
+        if status_str is None:
+            status_str = self._query(self._get_property(self.active_player_path, self.MEDIA_PLAYER_INTERFACE,
+                                                        'Status'),
+                                     "getting status")
+        return str(status_str) if status_str is not None else "unknown"
+
+    def get_track_info(self) -> Optional[Dict[str, Any]]:
+        """Get current track info"""
+        if not self.active_player_path:
+            return None
+
+        track_data = self.objects.get_property(self.active_player_path, self.MEDIA_PLAYER_INTERFACE, 'Track')
+        if track_data is None:
+            track_data = self._query(self._get_property(self.active_player_path, self.MEDIA_PLAYER_INTERFACE,
+                                                        'Track'),
+                                     "getting track info")
+        return self._convert_track(track_data) if track_data is not None else None
+
+    def get_volume(self) -> Optional[int]:
+        """
+        Get current volume from AVRCP MediaTransport.
+
+        Returns:
+            Volume level (0-127) or None if not available
+        """
+        if not self.active_player_path:
+            return None
+        return self.objects.get_transport_volume(device_path_of(self.active_player_path))
+
+    def set_volume(self, volume: int) -> bool:
+        """
+        Set volume via AVRCP MediaPlayer.
+
+        Args:
+            volume: Volume level (0-127)
+
+        Returns:
+            True if successful
+        """
+        if not self.active_player_path:
+            return False
+        volume = max(0, min(127, volume))
+        return self._command(self._set_property(self.active_player_path, self.MEDIA_PLAYER_INTERFACE,
+                                                'Volume', volume),
+                             "setting AVRCP volume")
+
+    def volume_up(self, step: int = 10) -> bool:
+        """Increase volume on the Bluetooth device via AVRCP."""
+        current = self.get_volume()
+        if current is not None:
+            return self.set_volume(min(127, current + step))
+        return False
+
+    def volume_down(self, step: int = 10) -> bool:
+        """Decrease volume on the Bluetooth device via AVRCP."""
+        current = self.get_volume()
+        if current is not None:
+            return self.set_volume(max(0, current - step))
+        return False
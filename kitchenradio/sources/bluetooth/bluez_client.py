@@ -5,7 +5,7 @@ BlueZ Client - Low-level D-Bus interface to BlueZ Bluetooth stack
 Handles all D-Bus communication with BlueZ for:
 - Adapter management (power, discovery, pairing)
 - Device management (pairing, connection, trust)
-- Property monitoring
+- Property monitoring (mirrored locally in a BlueZObjectTree)
 - Agent registration
 """
 
@@ -16,6 +16,8 @@ from gi.repository import GLib
 import logging
 from typing import Optional, Callable, Dict, Any, List
 
+from .object_tree import BlueZObjectTree, device_path_of
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
@@ -82,6 +84,9 @@ class BlueZClient:
     - Device operations (pair, connect, disconnect, trust)
     - Property monitoring
     - Agent management
+    
+    Object and property lookups are served from `objects`, a local mirror
+    of the BlueZ object tree, instead of D-Bus round trips.
     """
     
     BLUEZ_SERVICE = 'org.bluez'
@@ -93,21 +98,40 @@ class BlueZClient:
     OBJECT_MANAGER_INTERFACE = 'org.freedesktop.DBus.ObjectManager'
     AGENT_MANAGER_INTERFACE = 'org.bluez.AgentManager1'
     
-    def __init__(self, adapter_path: str = '/org/bluez/hci0'):
+    def __init__(self, adapter_path: str = '/org/bluez/hci0', coalesce_window: float = 0.15):
         """
         Initialize BlueZ client.
         
         Args:
             adapter_path: D-Bus path to Bluetooth adapter
+            coalesce_window: Seconds to merge bursts of MediaPlayer1 changes
+                             (Track/Status/Position) into one callback (0 = off)
         """
         self.adapter_path = adapter_path
+        self.coalesce_window = coalesce_window
         self.bus: Optional[dbus.SystemBus] = None
         self.adapter = None
         self.adapter_props = None
         self.obj_manager = None
         self.agent: Optional[AutoPairAgent] = None
+        self.mainloop: Optional[GLib.MainLoop] = None
         self.active_player_path: Optional[str] = None
         
+        # Local mirror of the BlueZ object tree and cached D-Bus proxies
+        self.objects = BlueZObjectTree()
+        self._proxies: Dict[tuple, dbus.Interface] = {}
+        
+        # Targeted signal subscriptions (media objects of the watched device, adapter while pairing)
+        self._watched_device: Optional[str] = None
+        self._media_matches: Dict[str, Any] = {}  # object path -> SignalMatch
+        self._adapter_match = None
+        
+        # Coalesced MediaPlayer1 changes (player path -> merged changed props)
+        self._pending_player_changes: Dict[str, Dict[str, Any]] = {}
+        self._flush_scheduled = False
+        self._last_track: Dict[str, Dict[str, Any]] = {}
+        self._last_status: Dict[str, str] = {}
+        
         # Callbacks
         self.on_properties_changed: Optional[Callable[[str, Dict, List, str], None]] = None
         self.on_volume_changed: Optional[Callable[[str, Dict, List, str], None]] = None
@@ -134,28 +158,34 @@ class BlueZClient:
                 self.OBJECT_MANAGER_INTERFACE
             )
             
-            # Subscribe to property changes
+            # Keep the object tree in sync: subscribe first, then seed once
             self.bus.add_signal_receiver(
-                self._on_properties_changed_internal,
-                signal_name='PropertiesChanged',
-                dbus_interface=self.PROPERTIES_INTERFACE,
-                path_keyword='path'
+                self._on_interfaces_added,
+                signal_name='InterfacesAdded',
+                dbus_interface=self.OBJECT_MANAGER_INTERFACE,
+                bus_name=self.BLUEZ_SERVICE,
+                path='/'
             )
-
             self.bus.add_signal_receiver(
-                self._on_volume_changed_internal,
-                signal_name='PropertiesChanged',
-                dbus_interface='org.freedesktop.DBus.Properties',
-                path_keyword='path',
-                arg0='org.bluez.MediaTransport1',
+                self._on_interfaces_removed,
+                signal_name='InterfacesRemoved',
+                dbus_interface=self.OBJECT_MANAGER_INTERFACE,
+                bus_name=self.BLUEZ_SERVICE,
+                path='/'
             )
-
+            self.objects.seed(self.obj_manager.GetManagedObjects())
+            
+            # Subscribe to device property changes (connect/pair) only.
+            # MediaPlayer1/MediaTransport1 changes are subscribed per object
+            # for the watched device (watch_device), Adapter1 changes only
+            # while pairing (watch_adapter).
             self.bus.add_signal_receiver(
-                self._on_media_player_properties_changed,
+                self._on_properties_changed_internal,
                 signal_name='PropertiesChanged',
                 dbus_interface=self.PROPERTIES_INTERFACE,
+                bus_name=self.BLUEZ_SERVICE,
                 path_keyword='path',
-                arg0=self.MEDIA_PLAYER_INTERFACE
+                arg0=self.DEVICE_INTERFACE
             )
             
             logger.info("[OK] BlueZ D-Bus connection established")
@@ -164,20 +194,140 @@ class BlueZClient:
             logger.error(f"[X] Failed to setup BlueZ D-Bus: {e}")
             raise
 
+    def run_mainloop(self):
+        """Run the GLib main loop that dispatches signals and timers (blocks until quit_mainloop())."""
+        self.mainloop = GLib.MainLoop()
+        self.mainloop.run()
+    
+    def quit_mainloop(self):
+        """Stop the GLib main loop."""
+        if self.mainloop:
+            self.mainloop.quit()
+    
+    def call_later(self, delay: float, callback: Callable, *args) -> int:
+        """
+        Run callback(*args) on the GLib main loop after delay seconds.
+        
+        The callback should return False (GLib reschedules on True).
+        
+        Returns:
+            GLib source id for cancel_call()
+        """
+        return GLib.timeout_add(max(1, int(delay * 1000)), callback, *args)
+    
+    def cancel_call(self, handle: int):
+        """Cancel a call scheduled with call_later()."""
+        GLib.source_remove(handle)
+
     def on_volume_changed_test(interface, changed, invalidated, path):
          logger.info(f"Volume change detected on {changed}")
 
+    def _on_interfaces_added(self, path, interfaces):
+        """Mirror new BlueZ objects/interfaces into the object tree"""
+        self.objects.interfaces_added(path, interfaces)
+        
+        # Player/transport of the watched device appeared - subscribe to it
+        path = str(path)
+        if self._watched_device and device_path_of(path) == self._watched_device:
+            if self.MEDIA_PLAYER_INTERFACE in interfaces or self.TRANSPORT_INTERFACE in interfaces:
+                self._subscribe_media_object(path)
+
+    def _on_interfaces_removed(self, path, interfaces):
+        """Drop removed BlueZ objects/interfaces from the tree and the proxy cache"""
+        self.objects.interfaces_removed(path, interfaces)
+        path = str(path)
+        for key in [key for key in self._proxies if key[0] == path]:
+            del self._proxies[key]
+        if path in self._media_matches and not self.objects.has_object(path):
+            self._media_matches.pop(path).remove()
+
+    def watch_device(self, device_path: Optional[str]):
+        """
+        Receive MediaPlayer1/MediaTransport1 changes for one device only.
+        
+        Subscribes to the device's known player and transport paths; ones
+        that appear later are picked up from InterfacesAdded.
+        
+        Args:
+            device_path: D-Bus path of the connected device (None to stop)
+        """
+        if device_path == self._watched_device:
+            return
+        self.unwatch_device()
+        if not device_path:
+            return
+        
+        self._watched_device = device_path
+        for path in (self.objects.get_player(device_path), self.objects.get_transport(device_path)):
+            if path:
+                self._subscribe_media_object(path)
+        logger.debug(f"Watching media objects of {device_path}")
+
+    def unwatch_device(self):
+        """Drop the media subscriptions of the watched device."""
+        for match in self._media_matches.values():
+            match.remove()
+        self._media_matches.clear()
+        self._pending_player_changes.clear()
+        self._last_track.clear()
+        self._last_status.clear()
+        self._watched_device = None
+
+    def watch_adapter(self, enabled: bool):
+        """
+        Receive Adapter1 property changes (Discoverable, Pairable, ...).
+        
+        Only needed while pairing, so the subscription is added and removed
+        with pairing mode.
+        """
+        if enabled and self._adapter_match is None:
+            self._adapter_match = self.bus.add_signal_receiver(
+                self._on_properties_changed_internal,
+                signal_name='PropertiesChanged',
+                dbus_interface=self.PROPERTIES_INTERFACE,
+                bus_name=self.BLUEZ_SERVICE,
+                path=self.adapter_path,
+                path_keyword='path',
+                arg0=self.ADAPTER_INTERFACE
+            )
+        elif not enabled and self._adapter_match is not None:
+            self._adapter_match.remove()
+            self._adapter_match = None
+
+    def _subscribe_media_object(self, path: str):
+        """Subscribe to PropertiesChanged of one player or transport object."""
+        if path in self._media_matches:
+            return
+        if self.objects.get_properties(path, self.MEDIA_PLAYER_INTERFACE) is not None:
+            handler, interface = self._on_media_player_properties_changed, self.MEDIA_PLAYER_INTERFACE
+        elif self.objects.get_properties(path, self.TRANSPORT_INTERFACE) is not None:
+            handler, interface = self._on_volume_changed_internal, self.TRANSPORT_INTERFACE
+        else:
+            return
+        
+        self._media_matches[path] = self.bus.add_signal_receiver(
+            handler,
+            signal_name='PropertiesChanged',
+            dbus_interface=self.PROPERTIES_INTERFACE,
+            bus_name=self.BLUEZ_SERVICE,
+            path=path,
+            path_keyword='path',
+            arg0=interface
+        )
+        logger.debug(f"Subscribed to {interface} changes at {path}")
+
     def _on_properties_changed_internal(self, interface, changed, invalidated, path):
         """Internal handler for property changes - forwards to callback"""
-        # Skip MediaTransport1 events - they're handled by _on_volume_changed_internal
-        if interface == 'org.bluez.MediaTransport1':
-            return
+        # Keep the tree current before anyone reads it
+        self.objects.properties_changed(interface, changed, invalidated, path)
+        
         if self.on_properties_changed:
             self.on_properties_changed(interface, dict(changed), list(invalidated), path)
 
     def _on_volume_changed_internal(self, interface, changed, invalidated, path):
         """Internal handler for property changes - forwards to callback"""
-        logger.info(f"🔊 [DBus Event] Volume changed on {interface} at {path}: {dict(changed)}")
+        self.objects.properties_changed(interface, changed, invalidated, path)
+        logger.debug(f"🔊 [DBus Event] Transport changed at {path}: {dict(changed)}")
         if self.on_volume_changed:
             self.on_volume_changed(interface, dict(changed), list(invalidated), path)
         else:
@@ -273,6 +423,9 @@ class BlueZClient:
         """
         Get all managed objects from BlueZ.
         
+        Bypasses the object tree; use `objects` for lookups. Useful to
+        re-seed the tree after BlueZ restarts.
+        
         Returns:
             Dictionary of objects with their interfaces and properties
         """
@@ -282,20 +435,59 @@ class BlueZClient:
             logger.error(f"Error getting managed objects: {e}")
             return {}
     
+    def resync_objects(self) -> bool:
+        """
+        Re-seed the object tree from BlueZ (e.g. after bluetoothd restarted).
+        
+        Returns:
+            True if successful
+        """
+        objects = self.get_managed_objects()
+        if not objects:
+            return False
+        self.objects.seed(objects)
+        self._proxies.clear()
+        return True
+    
+    def get_interface(self, path: str, interface: str) -> dbus.Interface:
+        """
+        Get a cached D-Bus interface proxy for an object.
+        
+        Args:
+            path: Object path
+            interface: Interface name (e.g. org.freedesktop.DBus.Properties)
+            
+        Returns:
+            dbus.Interface proxy
+        """
+        key = (str(path), interface)
+        proxy = self._proxies.get(key)
+        if proxy is None:
+            proxy = dbus.Interface(self.bus.get_object(self.BLUEZ_SERVICE, path), interface)
+            self._proxies[key] = proxy
+        return proxy
+    
     def get_device_properties(self, device_path: str) -> Optional[Dict[str, Any]]:
         """
         Get all properties for a device.
         
+        Served from the object tree; only devices BlueZ has not announced
+        yet fall back to a D-Bus GetAll.
+        
         Args:
             device_path: D-Bus path to device
             
         Returns:
             Dictionary of device properties or None
         """
+        props = self.objects.get_device(device_path)
+        if props is not None:
+            return props
         try:
-            device_obj = self.bus.get_object(self.BLUEZ_SERVICE, device_path)
-            device_props = dbus.Interface(device_obj, self.PROPERTIES_INTERFACE)
-            return device_props.GetAll(self.DEVICE_INTERFACE)
+            device_props = self.get_interface(device_path, self.PROPERTIES_INTERFACE)
+            props = device_props.GetAll(self.DEVICE_INTERFACE)
+            self.objects.interfaces_added(device_path, {self.DEVICE_INTERFACE: props})
+            return dict(props)
         except Exception as e:
             logger.debug(f"Could not get device properties for {device_path}: {e}")
             return None
@@ -313,8 +505,7 @@ class BlueZClient:
             True if successful
         """
         try:
-            device_obj = self.bus.get_object(self.BLUEZ_SERVICE, device_path)
-            device_props = dbus.Interface(device_obj, self.PROPERTIES_INTERFACE)
+            device_props = self.get_interface(device_path, self.PROPERTIES_INTERFACE)
             
             if property_name == 'Trusted':
                 value = dbus.Boolean(value)
@@ -336,8 +527,7 @@ class BlueZClient:
             True if successful
         """
         try:
-            device_obj = self.bus.get_object(self.BLUEZ_SERVICE, device_path)
-            device = dbus.Interface(device_obj, self.DEVICE_INTERFACE)
+            device = self.get_interface(device_path, self.DEVICE_INTERFACE)
             device.Connect()
             return True
         except dbus.exceptions.DBusException as e:
@@ -351,6 +541,29 @@ class BlueZClient:
             logger.error(f"Error connecting device: {e}")
             return False
     
+    def connect_device_async(self, device_path: str,
+                             on_success: Callable[[], None],
+                             on_error: Callable[[Exception], None],
+                             timeout: float = 30.0):
+        """
+        Connect to a device without waiting for the reply.
+        
+        The reply is delivered on the GLib main loop, so callers on that
+        loop never block while the device connects.
+        
+        Args:
+            device_path: D-Bus path to device
+            on_success: Called when Connect() returns
+            on_error: Called with the D-Bus error if Connect() fails
+            timeout: D-Bus reply timeout in seconds
+        """
+        try:
+            device = self.get_interface(device_path, self.DEVICE_INTERFACE)
+            device.Connect(reply_handler=on_success, error_handler=on_error, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Error connecting device: {e}")
+            on_error(e)
+    
     def disconnect_device(self, device_path: str) -> bool:
         """
         Disconnect a device.
@@ -362,8 +575,7 @@ class BlueZClient:
             True if successful
         """
         try:
-            device_obj = self.bus.get_object(self.BLUEZ_SERVICE, device_path)
-            device = dbus.Interface(device_obj, self.DEVICE_INTERFACE)
+            device = self.get_interface(device_path, self.DEVICE_INTERFACE)
             device.Disconnect()
             return True
         except Exception as e:
@@ -381,8 +593,7 @@ class BlueZClient:
             True if successful
         """
         try:
-            device_obj = self.bus.get_object(self.BLUEZ_SERVICE, device_path)
-            device = dbus.Interface(device_obj, self.DEVICE_INTERFACE)
+            device = self.get_interface(device_path, self.DEVICE_INTERFACE)
             device.Pair()
             return True
         except Exception as e:
@@ -438,13 +649,18 @@ class BlueZClient:
         """
         Handle MediaPlayer1 property changes.
         
+        Phones send Track, Status and Position in bursts; changes within
+        coalesce_window are merged and handled once.
+        
         Args:
             interface: Interface name
             changed: Dictionary of changed properties
             invalidated: List of invalidated properties
             path: Object path
         """
-        logger.info(f"🎵 [DBus Event] MediaPlayer1 properties changed at {path}: {dict(changed).keys()}")
+        self.objects.properties_changed(interface, changed, invalidated, path)
+        path = str(path)
+        logger.debug(f"🎵 [DBus Event] MediaPlayer1 properties changed at {path}: {list(changed.keys())}")
         
         # If we have an active player, only process events for it
         if self.active_player_path and path != self.active_player_path:
@@ -455,32 +671,50 @@ class BlueZClient:
         if not self.active_player_path:
             logger.info(f"Auto-selecting active player: {path}")
             self.active_player_path = path
+        
+        self._pending_player_changes.setdefault(path, {}).update(changed)
+        if self.coalesce_window <= 0:
+            self._flush_player_changes()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            GLib.timeout_add(max(1, int(self.coalesce_window * 1000)), self._flush_player_changes)
 
-        if 'Track' in changed:
-            track_data = changed['Track']
-            logger.info(f"🎵 [Raw DBus Track Data] {dict(track_data)}")
-            logger.info(f"🎵 [Raw DBus Track Keys] {list(track_data.keys())}")
-            
-            # Convert dbus types to python types
-            track = {
-                'title': str(track_data.get('Title', 'Unknown')),
-                'artist': str(track_data.get('Artist', 'Unknown')),
-                'album': str(track_data.get('Album', '')),
-                'duration': int(track_data.get('Duration', 0))
-            }
-            logger.info(f"🎵 Track changed: {track['title']} - {track['artist']}")
-            if self.on_track_changed:
-                self.on_track_changed(path, track)
-            else:
-                logger.warning(f"🎵 Track changed but no callback registered!")
-        
-        if 'Status' in changed:
-            status_str = str(changed['Status'])
-            logger.debug(f"🎵 Status changed to: {status_str}")
-            if self.on_status_changed:
-                self.on_status_changed(path, status_str)
-            else:
-                logger.warning(f"🎵 Status changed but no callback registered!")
+    def _flush_player_changes(self) -> bool:
+        """Handle merged MediaPlayer1 changes (GLib timeout callback)."""
+        self._flush_scheduled = False
+        pending, self._pending_player_changes = self._pending_player_changes, {}
+        
+        for path, changed in pending.items():
+            if 'Track' in changed:
+                track_data = changed['Track']
+                logger.debug(f"🎵 [Raw DBus Track Data] {dict(track_data)}")
+                
+                # Convert dbus types to python types
+                track = {
+                    'title': str(track_data.get('Title', 'Unknown')),
+                    'artist': str(track_data.get('Artist', 'Unknown')),
+                    'album': str(track_data.get('Album', '')),
+                    'duration': int(track_data.get('Duration', 0))
+                }
+                if self._last_track.get(path) != track:
+                    self._last_track[path] = track
+                    logger.info(f"🎵 Track changed: {track['title']} - {track['artist']}")
+                    if self.on_track_changed:
+                        self.on_track_changed(path, track)
+                    else:
+                        logger.warning(f"🎵 Track changed but no callback registered!")
+            
+            if 'Status' in changed:
+                status_str = str(changed['Status'])
+                if self._last_status.get(path) != status_str:
+                    self._last_status[path] = status_str
+                    logger.debug(f"🎵 Status changed to: {status_str}")
+                    if self.on_status_changed:
+                        self.on_status_changed(path, status_str)
+                    else:
+                        logger.warning(f"🎵 Status changed but no callback registered!")
+        
+        return False  # Don't reschedule
 
     def set_active_player(self, player_path: str):
         """
@@ -499,8 +733,7 @@ class BlueZClient:
             return None
             
         try:
-            player_obj = self.bus.get_object(self.BLUEZ_SERVICE, self.active_player_path)
-            return dbus.Interface(player_obj, self.MEDIA_PLAYER_INTERFACE)
+            return self.get_interface(self.active_player_path, self.MEDIA_PLAYER_INTERFACE)
         except Exception as e:
             logger.error(f"Error getting player interface: {e}")
             return None
@@ -564,10 +797,13 @@ class BlueZClient:
         """Get current playback status"""
         if not self.active_player_path:
             return "unknown"
+        
+        status_str = self.objects.get_property(self.active_player_path, self.MEDIA_PLAYER_INTERFACE, 'Status')
+        if status_str is not None:
+            return str(status_str)
             
         try:
-            player_obj = self.bus.get_object(self.BLUEZ_SERVICE, self.active_player_path)
-            props = dbus.Interface(player_obj, self.PROPERTIES_INTERFACE)
+            props = self.get_interface(self.active_player_path, self.PROPERTIES_INTERFACE)
             status_str = props.Get(self.MEDIA_PLAYER_INTERFACE, 'Status')
             return str(status_str)
         except Exception as e:
@@ -580,9 +816,10 @@ class BlueZClient:
             return None
             
         try:
-            player_obj = self.bus.get_object(self.BLUEZ_SERVICE, self.active_player_path)
-            props = dbus.Interface(player_obj, self.PROPERTIES_INTERFACE)
-            track_data = props.Get(self.MEDIA_PLAYER_INTERFACE, 'Track')
+            track_data = self.objects.get_property(self.active_player_path, self.MEDIA_PLAYER_INTERFACE, 'Track')
+            if track_data is None:
+                props = self.get_interface(self.active_player_path, self.PROPERTIES_INTERFACE)
+                track_data = props.Get(self.MEDIA_PLAYER_INTERFACE, 'Track')
             
             return {
                 'title': str(track_data.get('Title', 'Unknown')),
@@ -606,32 +843,8 @@ class BlueZClient:
         if not self.active_player_path:
             return None
         
-        try:
-            # Volume is on MediaTransport1, not MediaPlayer1
-            # Need to find the MediaTransport path for this device
-            objects = self.obj_manager.GetManagedObjects()
-            
-            # Extract device path from player path (e.g., /org/bluez/hci0/dev_XX_XX_XX_XX_XX_XX/player0)
-            device_path = '/'.join(self.active_player_path.split('/')[:-1])
-            
-            # Find MediaTransport1 interface for this device
-            for path, interfaces in objects.items():
-                if path.startswith(device_path) and 'org.bluez.MediaTransport1' in interfaces:
-                    # Found the transport, get volume
-                    transport_obj = self.bus.get_object(self.BLUEZ_SERVICE, path)
-                    props = dbus.Interface(transport_obj, self.PROPERTIES_INTERFACE)
-                    try:
-                        volume = props.Get('org.bluez.MediaTransport1', 'Volume')
-                        return int(volume)
-                    except dbus.exceptions.DBusException:
-                        return None
-            
-            # No MediaTransport1 found
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error getting AVRCP volume: {e}")
-            return None
+        # Volume is on the device's MediaTransport1 (kept current by PropertiesChanged)
+        return self.objects.get_transport_volume(device_path_of(self.active_player_path))
     
     def set_volume(self, volume: int) -> bool:
         """
@@ -650,8 +863,7 @@ class BlueZClient:
             # Clamp volume to valid range
             volume = max(0, min(127, volume))
             
-            player_obj = self.bus.get_object(self.BLUEZ_SERVICE, self.active_player_path)
-            props = dbus.Interface(player_obj, self.PROPERTIES_INTERFACE)
+            props = self.get_interface(self.active_player_path, self.PROPERTIES_INTERFACE)
             
             props.Set(self.MEDIA_PLAYER_INTERFACE, 'Volume', dbus.UInt16(volume))
             return True
@@ -10,19 +10,40 @@ High-level Bluetooth audio management:
 """
 
 from calendar import c
-from gi.repository import GLib
 import logging
 import threading
 import time
 import subprocess
 import re
+from dataclasses import dataclass
+from enum import Enum
 from typing import Optional, Callable, Set, Dict, Any
 
-from .bluez_client import BlueZClient
 from .monitor import BluetoothMonitor
+from .reconnect import ReconnectManager
 
 logger = logging.getLogger(__name__)
 
+
+class ConnectState(Enum):
+    """Steps of an outgoing device connection."""
+    CONNECTING = "connecting"   # Connect() sent, waiting for Connected
+    CONNECTED = "connected"     # Link up, waiting for the A2DP profile
+    READY = "ready"             # Audio profile established
+    FAILED = "failed"
+
+
+@dataclass
+class _ConnectAttempt:
+    """Bookkeeping for one device connection in progress."""
+    path: str
+    name: str
+    address: str
+    state: ConnectState = ConnectState.CONNECTING
+    started: float = 0.0
+    timer_id: Optional[Any] = None  # Handle from client.call_later()
+
+
 class BluetoothController:
     """
     High-level Bluetooth audio controller for KitchenRadio.
@@ -31,19 +52,51 @@ class BluetoothController:
     and PulseAudio integration for volume control.
     """
     
-    def __init__(self, adapter_path='/org/bluez/hci0'):
+    # A2DP service UUIDs that mean the audio profile is up
+    AUDIO_UUIDS = (
+        '0000110b-0000-1000-8000-00805f9b34fb',  # A2DP Sink
+        '0000110a-0000-1000-8000-00805f9b34fb',  # A2DP Source
+    )
+    
+    # Max seconds the constructor waits for the client setup to finish
+    SETUP_TIMEOUT = 10.0
+    
+    def __init__(self, adapter_path='/org/bluez/hci0', signal_coalesce_window: float = 0.15,
+                 connect_timeout: int = 10, backend: str = 'dbus-python',
+                 bus_address: Optional[str] = None, reconnect_candidates: int = 2):
         """
         Initialize Bluetooth controller.
         
         Args:
             adapter_path: Path to Bluetooth adapter (default: /org/bluez/hci0)
+            signal_coalesce_window: Seconds to merge bursts of AVRCP player changes
+            connect_timeout: Seconds to wait for a connection and its audio profile
+            backend: D-Bus client backend - 'dbus-python' (GLib main loop) or 'asyncio' (dbus-next)
+            bus_address: D-Bus address for the asyncio backend (None = system bus)
+            reconnect_candidates: Recently used devices dialled at once by reconnect_recent()
         """
-        self.client = BlueZClient(adapter_path)
+        self.connect_timeout = connect_timeout
+        
+        # Connections in progress (device path -> attempt), advanced by Device1 signals
+        self._connect_attempts: Dict[str, _ConnectAttempt] = {}
+        
+        # Recently used devices, reconnected when Bluetooth is selected
+        self.reconnect = ReconnectManager(self, max_candidates=reconnect_candidates)
+        
+        # Import only the selected backend, so the other one's dependencies are optional
+        if backend == 'asyncio':
+            from .async_bluez_client import AsyncBlueZClient
+            self.client = AsyncBlueZClient(adapter_path, coalesce_window=signal_coalesce_window,
+                                           bus_address=bus_address)
+        else:
+            from .bluez_client import BlueZClient
+            self.client = BlueZClient(adapter_path, coalesce_window=signal_coalesce_window)
         # Initialize monitor with controller reference for pairing_mode status
         self.monitor = BluetoothMonitor(self.client, controller=self)
         self.adapter_path = adapter_path
 
-        self.mainloop: Optional[GLib.MainLoop] = None
+        # Set once the client setup (agent, adapter, device scan) has finished
+        self._ready = threading.Event()
         self.mainloop_thread: Optional[threading.Thread] = None
         
         # State tracking
@@ -64,11 +117,11 @@ class BluetoothController:
         self._setup_client_threaded()
     
     def _setup_client_threaded(self):
-        """Setup BlueZ client in background thread with GLib main loop"""
+        """Setup BlueZ client in background thread, then run the client's main loop"""
         def setup_thread():
             try:
-                # Create BlueZ client
-                self.client = BlueZClient(self.adapter_path)
+                # The client (and its object tree) created in __init__ is shared
+                # with the monitor - one GetManagedObjects seed for both
 
                 # Register agent
                 self.client.register_agent()
@@ -86,25 +139,42 @@ class BluetoothController:
                 self.monitor.start_monitoring()
                 logger.info("✅ BluetoothController: Monitor started")
 
-                # Set up property change callback (controller still needs this for pairing)
+                # Set up property change callback (controller still needs this for pairing);
+                # the controller forwards device changes to the monitor
                 self.client.on_properties_changed = self._on_properties_changed
 
                 logger.info("✅ BluetoothController: Client initialized")
 
-                # Start GLib main loop
-                self.mainloop = GLib.MainLoop()
+                # Dispatch signals and timers (GLib main loop for dbus-python;
+                # the asyncio client dispatches on its own thread)
                 self.running = True
-                self.mainloop.run()
+                self._ready.set()
+                self.client.run_mainloop()
 
             except Exception as e:
                 logger.error(f"❌ BluetoothController: Failed to setup client: {e}")
                 self.running = False
+                self._ready.set()
         
         self.mainloop_thread = threading.Thread(target=setup_thread, daemon=True)
         self.mainloop_thread.start()
         
-        # Wait a bit for initialization
-        time.sleep(1)
+        # Wait for the setup to finish instead of a fixed delay
+        if not self.wait_ready(self.SETUP_TIMEOUT):
+            logger.warning(f"⚠️  BluetoothController: Client not ready after {self.SETUP_TIMEOUT}s")
+    
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the client setup to finish.
+        
+        Args:
+            timeout: Max seconds to wait (None = until done)
+            
+        Returns:
+            True if the setup completed and Bluetooth is running
+        """
+        self._ready.wait(timeout)
+        return self.running
     
     def _initialize_adapter(self):
         """Initialize Bluetooth adapter"""
@@ -133,40 +203,53 @@ class BluetoothController:
             return
         
         try:
-            objects = self.client.get_managed_objects()
-            
-            for path, interfaces in objects.items():
-                if 'org.bluez.Device1' in interfaces:
-                    props = interfaces['org.bluez.Device1']
-                    address = str(props.get('Address', ''))
-                    name = str(props.get('Name', 'Unknown'))
-                    
-                    if props.get('Paired', False):
-                        self.paired_devices.add(address)
-                        logger.info(f"📱 Already paired: {name} ({address})")
+            devices = self.client.objects.get_devices()
+            self.reconnect.seed(devices)
+            for path, props in devices.items():
+                address = str(props.get('Address', ''))
+                name = str(props.get('Name', 'Unknown'))
+                
+                if props.get('Paired', False):
+                    self.paired_devices.add(address)
+                    logger.info(f"📱 Already paired: {name} ({address})")
+                
+                if props.get('Connected', False):
+                    self.connected_devices.add(address)
+                    self.current_device_path = path
+                    self.current_device_name = name
+                    self.client.watch_device(path)
+                    logger.info(f"🟢 Already connected: {name} ({address})")
                     
-                    if props.get('Connected', False):
-                        self.connected_devices.add(address)
-                        self.current_device_path = path
-                        self.current_device_name = name
-                        logger.info(f"🟢 Already connected: {name} ({address})")
-                        
         except Exception as e:
             logger.error(f"Error scanning existing devices: {e}")
     
     def _on_properties_changed(self, interface: str, changed: Dict, invalidated: list, path: str):
         """Handle property changes from BlueZ client"""
         try:
+            if interface == 'org.bluez.Adapter1':
+                # Only subscribed while pairing: BlueZ ended discoverability (timeout)
+                if self.pairing_mode and 'Discoverable' in changed and not changed['Discoverable']:
+                    logger.info("👁️  Adapter no longer discoverable - leaving pairing mode")
+                    self.exit_pairing_mode()
+                return
+            
             if interface != 'org.bluez.Device1':
                 return
             
+            # Only pairing and connection changes matter (skip RSSI and similar);
+            # a connection in progress also waits for its services
+            connecting = path in self._connect_attempts
+            if ('Paired' not in changed and 'Connected' not in changed
+                    and not (connecting and ('UUIDs' in changed or 'ServicesResolved' in changed))):
+                return
+            
             # Debug logging
             logger.debug(f"🔍 D-Bus Property Change on {path}")
             logger.debug(f"   Changed properties: {changed}")
             if invalidated:
                 logger.debug(f"   Invalidated: {invalidated}")
             
-            # Get device info
+            # Get device info (object tree lookup - already includes this change)
             all_props = self.client.get_device_properties(path)
             if not all_props:
                 return
@@ -192,14 +275,18 @@ class BluetoothController:
                     # If in pairing mode, connect after a delay
                     if self.pairing_mode:
                         logger.info("⏳ Waiting 3s before connecting...")
-                        GLib.timeout_add(3000, self._connect_device, path, name, address)
+                        self.client.call_later(3.0, self._connect_device, path, name, address)
                         # Exit pairing mode
                         self.exit_pairing_mode()
             
             # Handle connection
             if 'Connected' in changed:
                 if changed['Connected']:
-                    if address not in self.connected_devices:
+                    if not self.reconnect.device_connected(path, address, name):
+                        # Lost a reconnect race
+                        logger.info(f"🔁 Dropping {name} - another device reconnected first")
+                        self.client.disconnect_device(path)
+                    elif address not in self.connected_devices:
                         # Disconnect previous device if one is connected
                         if self.current_device_path and self.current_device_path != path:
                             old_device_name = self.current_device_name or "Unknown"
@@ -212,11 +299,12 @@ class BluetoothController:
                         self.connected_devices.add(address)
                         self.current_device_path = path
                         self.current_device_name = name
+                        self.client.watch_device(path)
                         logger.info(f"🟢 DEVICE CONNECTED: {name} ({address})")
                         
                         # Update active player path for the new device
-                        # MediaPlayer path is device_path + "/player0"
-                        new_player_path = path + "/player0"
+                        # (player0 until BlueZ announces the MediaPlayer1 object)
+                        new_player_path = self.client.objects.get_player(path) or path + "/player0"
                         logger.info(f"🎵 Setting active player to: {new_player_path}")
                         self.client.set_active_player(new_player_path)
                         
@@ -229,15 +317,24 @@ class BluetoothController:
                         if self.current_device_path == path:
                             self.current_device_path = None
                             self.current_device_name = None
+                            self.client.unwatch_device()
                         logger.info(f"🔴 DEVICE DISCONNECTED: {name} ({address})")
                         
                         
                         # Trigger callback
                         if self.on_device_disconnected:
                             self.on_device_disconnected(name, address)
+            
+            # Advance a connection in progress
+            if connecting:
+                self._advance_connect(path, all_props)
                             
         except Exception as e:
             logger.error(f"Error handling property change: {e}")
+        
+        # The monitor shares this client, so it gets device changes through us
+        if self.monitor:
+            self.monitor._on_device_properties_changed(interface, changed, invalidated, path)
     
     def _trust_device(self, device_path: str):
         """Trust a device (enable auto-reconnect)"""
@@ -248,54 +345,134 @@ class BluetoothController:
             logger.info("✅ Device trusted (auto-reconnect enabled)")
     
     def _connect_device(self, device_path: str, name: str, address: str):
-        """Connect to a device and wait for audio profile"""
-        if not self.client:
+        """
+        Start connecting to a device (client timer callback).
+        
+        Never blocks the client's loop: Connect() is sent asynchronously and
+        the attempt advances on Connected/UUIDs/ServicesResolved signals, with
+        a client timer for the timeout.
+        """
+        if not self.client or device_path in self._connect_attempts:
             return False
         
-        try:
-            logger.info(f"🔌 Connecting to {name}...")
-            
-            # Check if already connected
-            props = self.client.get_device_properties(device_path)
-            if props and props.get('Connected', False):
-                logger.info(f"✅ Already connected to {name}")
-                return False
-            
-            # Connect
-            if not self.client.connect_device(device_path):
-                return False
-            
-            # Wait for audio profile
-            logger.info(f"⏳ Waiting for audio profile to establish...")
-            max_attempts = 10
-            for attempt in range(max_attempts):
-                time.sleep(1)
-                props = self.client.get_device_properties(device_path)
-                if not props:
-                    continue
-                
-                # Check for A2DP audio UUIDs
-                uuids = props.get('UUIDs', [])
-                audio_uuids = [
-                    '0000110b-0000-1000-8000-00805f9b34fb',  # A2DP Sink
-                    '0000110a-0000-1000-8000-00805f9b34fb',  # A2DP Source
-                ]
-                
-                if any(uuid.lower() in [str(u).lower() for u in uuids] for uuid in audio_uuids):
-                    logger.info(f"✅ Audio profile established!")
-                    logger.info(f"🎵 {name} ready for audio streaming")
-                    
-                    if self.on_stream_started:
-                        self.on_stream_started()
-                    
-                    return False
-            
-            logger.warning(f"⚠️  Audio profile didn't establish after {max_attempts}s")
-            
-        except Exception as e:
-            logger.error(f"❌ Error connecting to {name}: {e}")
+        attempt = _ConnectAttempt(device_path, name, address, started=time.monotonic())
+        self._connect_attempts[device_path] = attempt
+        attempt.timer_id = self.client.call_later(self.connect_timeout, self._on_connect_timeout, device_path)
         
-        return False
+        props = self.client.get_device_properties(device_path)
+        if props and props.get('Connected', False):
+            logger.info(f"✅ Already connected to {name}")
+            self._advance_connect(device_path, props)
+            return False
+        
+        logger.info(f"🔌 Connecting to {name}...")
+        self.client.connect_device_async(
+            device_path,
+            on_success=lambda: self._on_connect_reply(device_path),
+            on_error=lambda error: self._on_connect_error(device_path, error)
+        )
+        return False  # Don't reschedule
+    
+    def _on_connect_reply(self, device_path: str):
+        """Connect() returned - re-check the device (signals may have arrived first)."""
+        props = self.client.get_device_properties(device_path)
+        if props:
+            self._advance_connect(device_path, props)
+    
+    def _on_connect_error(self, device_path: str, error: Exception):
+        """Connect() failed."""
+        attempt = self._connect_attempts.get(device_path)
+        if not attempt:
+            return
+        error_name = error.get_dbus_name() if hasattr(error, 'get_dbus_name') else ''
+        if error_name and "AlreadyConnected" in error_name:
+            self._on_connect_reply(device_path)
+            return
+        logger.error(f"❌ Error connecting to {attempt.name}: {error}")
+        self._finish_connect(device_path, ConnectState.FAILED)
+    
+    def _advance_connect(self, device_path: str, props: Dict[str, Any]):
+        """Move a connection attempt forward based on current device properties."""
+        attempt = self._connect_attempts.get(device_path)
+        if not attempt:
+            return
+        
+        if attempt.state == ConnectState.CONNECTING and props.get('Connected', False):
+            attempt.state = ConnectState.CONNECTED
+            logger.info(f"⏳ {attempt.name} connected - waiting for audio profile...")
+        
+        if attempt.state == ConnectState.CONNECTED and self._has_audio_profile(props):
+            logger.info(f"✅ Audio profile established!")
+            logger.info(f"🎵 {attempt.name} ready for audio streaming")
+            self._finish_connect(device_path, ConnectState.READY)
+            if self.on_stream_started:
+                self.on_stream_started()
+    
+    def _has_audio_profile(self, props: Dict[str, Any]) -> bool:
+        """True if the device advertises an A2DP UUID."""
+        uuids = [str(u).lower() for u in props.get('UUIDs', [])]
+        return any(uuid in uuids for uuid in self.AUDIO_UUIDS)
+    
+    def _on_connect_timeout(self, device_path: str) -> bool:
+        """Client timer: the attempt did not complete in time."""
+        attempt = self._connect_attempts.get(device_path)
+        if attempt:
+            attempt.timer_id = None  # Fired - nothing to remove
+            if attempt.state == ConnectState.CONNECTED:
+                logger.warning(f"⚠️  Audio profile didn't establish after {self.connect_timeout}s")
+            else:
+                logger.warning(f"⚠️  {attempt.name} did not connect within {self.connect_timeout}s")
+            self._finish_connect(device_path, ConnectState.FAILED)
+        return False  # Don't reschedule
+    
+    def _finish_connect(self, device_path: str, state: ConnectState):
+        """End a connection attempt and cancel its timer."""
+        attempt = self._connect_attempts.pop(device_path, None)
+        if not attempt:
+            return
+        previous, attempt.state = attempt.state, state
+        if attempt.timer_id is not None:
+            self.client.cancel_call(attempt.timer_id)
+            attempt.timer_id = None
+        logger.debug(f"Connection attempt for {attempt.name} ended: {state.value} "
+                     f"after {time.monotonic() - attempt.started:.1f}s")
+        self.reconnect.attempt_finished(device_path, connected=previous != ConnectState.CONNECTING,
+                                        ready=state == ConnectState.READY)
+    
+    def _cancel_connect(self, device_path: str) -> bool:
+        """
+        Abandon a connection attempt (client timer callback).
+        
+        Disconnect() also cancels a Connect() that has not returned yet.
+        """
+        attempt = self._connect_attempts.get(device_path)
+        if attempt:
+            logger.debug(f"Cancelling connection attempt for {attempt.name}")
+            self._finish_connect(device_path, ConnectState.FAILED)
+        self.client.disconnect_device(device_path)
+        return False  # Don't reschedule
+    
+    def reconnect_recent(self) -> int:
+        """
+        Reconnect the most recently used trusted devices.
+        
+        Dials the top candidates at once; the first to connect is kept and
+        the others are cancelled. No-op while a device is connected.
+        
+        Returns:
+            Number of devices being dialled
+        """
+        if not self.running or not self.client:
+            return 0
+        return self.reconnect.start()
+    
+    def cancel_reconnect(self):
+        """Stop reconnect attempts in progress."""
+        self.reconnect.cancel()
+    
+    def get_reconnect_status(self) -> Dict[str, Any]:
+        """Recently used devices and reconnects in progress."""
+        return self.reconnect.get_status()
     
     def enter_pairing_mode(self, timeout_seconds: int = 0) -> bool:
         """
@@ -322,6 +499,7 @@ class BluetoothController:
             logger.info("=" * 60)
             
             self.pairing_mode = True
+            self.client.watch_adapter(True)
             
             # Make discoverable
             self.client.set_adapter_property('Discoverable', True)
@@ -330,7 +508,7 @@ class BluetoothController:
             if timeout_seconds > 0:
                 self.client.set_adapter_property('DiscoverableTimeout', timeout_seconds)
                 # Schedule exit from pairing mode
-                GLib.timeout_add(timeout_seconds * 1000, self.exit_pairing_mode)
+                self.client.call_later(timeout_seconds, self.exit_pairing_mode)
             else:
                 # Set a very long timeout (essentially infinite for our use case)
                 self.client.set_adapter_property('DiscoverableTimeout', 0)
@@ -361,6 +539,7 @@ class BluetoothController:
                 self.monitor.update_pairing_mode(False)
             
             if self.client:
+                self.client.watch_adapter(False)
                 self.client.set_adapter_property('Discoverable', False)
                 logger.info("👁️  Pairing mode ended - no longer discoverable")
             
@@ -401,18 +580,12 @@ class BluetoothController:
         
         devices = []
         try:
-            objects = self.client.get_managed_objects()
-            
-            for path, interfaces in objects.items():
-                if 'org.bluez.Device1' in interfaces:
-                    props = interfaces['org.bluez.Device1']
-                    
-                    if props.get('Paired', False):
-                        devices.append({
-                            'name': str(props.get('Name', 'Unknown')),
-                            'mac': str(props.get('Address', '')),
-                            'connected': props.get('Connected', False)
-                        })
+            for props in self.client.objects.get_devices(paired=True).values():
+                devices.append({
+                    'name': str(props.get('Name', 'Unknown')),
+                    'mac': str(props.get('Address', '')),
+                    'connected': bool(props.get('Connected', False))
+                })
         except Exception as e:
             logger.error(f"Error listing paired devices: {e}")
         
@@ -513,9 +686,7 @@ class BluetoothController:
         
         if self.client:
             self.client.unregister_agent()
-        
-        if self.mainloop:
-            self.mainloop.quit()
-            self.running = False
+            self.client.quit_mainloop()
+        self.running = False
         
         logger.info("✅ BluetoothController cleaned up")
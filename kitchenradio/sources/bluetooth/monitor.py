@@ -22,8 +22,6 @@ import threading
 import time
 from typing import Optional, Callable, Dict, Any, Set
 
-from .bluez_client import BlueZClient
-
 logger = logging.getLogger(__name__)
 
 
@@ -42,12 +40,12 @@ class BluetoothMonitor:
     - AVRCP state changes
     """
     
-    def __init__(self, client: BlueZClient, controller=None, display_controller=None):
+    def __init__(self, client, controller=None, display_controller=None):
         """
         Initialize monitor with BlueZ client.
         
         Args:
-            client: BlueZ D-Bus client instance
+            client: BlueZ D-Bus client instance (BlueZClient or AsyncBlueZClient)
             controller: BluetoothController instance (optional, for pairing_mode status)
             display_controller: DisplayController instance (optional)
         """
@@ -196,10 +194,10 @@ class BluetoothMonitor:
         the AVRCP connection.
         """
         try:
-            if interface != 'org.bluez.Device1':
+            if interface != 'org.bluez.Device1' or 'Connected' not in changed:
                 return
             
-            # Get device info
+            # Get device info (object tree lookup)
             props = self.client.get_device_properties(path)
             if not props:
                 return
@@ -326,20 +324,15 @@ class BluetoothMonitor:
         """
         try:
             logger.info("🔍 Scanning for already connected devices...")
-            objects = self.client.get_managed_objects()
             
-            for path, interfaces in objects.items():
-                if 'org.bluez.Device1' in interfaces:
-                    props = interfaces['org.bluez.Device1']
-                    
-                    if props.get('Connected', False):
-                        address = str(props.get('Address', ''))
-                        name = str(props.get('Name', 'Unknown'))
-                        
-                        logger.info(f"🟢 Found already connected device: {name} ({address})")
-                        
-                        # Handle as a new connection
-                        self._on_device_connected(path, name, address)
+            for path, props in self.client.objects.get_devices(connected=True).items():
+                address = str(props.get('Address', ''))
+                name = str(props.get('Name', 'Unknown'))
+                
+                logger.info(f"🟢 Found already connected device: {name} ({address})")
+                
+                # Handle as a new connection
+                self._on_device_connected(path, name, address)
                         
         except Exception as e:
             logger.error(f"Error scanning existing devices: {e}")
@@ -373,14 +366,15 @@ class BluetoothMonitor:
         Get current source information including pairing mode status.
         
         Returns:
-            Source info object with current pairing_mode state (copy to avoid reference issues)
+            Source info object with current pairing_mode state
         """
         # Update pairing_mode from controller if available
         if self.controller and hasattr(self.controller, 'pairing_mode'):
-            self.current_source_info.pairing_mode = self.controller.pairing_mode
+            if self.current_source_info.pairing_mode != self.controller.pairing_mode:
+                self.current_source_info = replace(self.current_source_info,
+                                                   pairing_mode=self.controller.pairing_mode)
         
-        # Return a copy to prevent external code from holding references to our internal state
-        return replace(self.current_source_info)
+        return self.current_source_info
     
     def update_pairing_mode(self, pairing_mode: bool):
         """
@@ -390,12 +384,11 @@ class BluetoothMonitor:
             pairing_mode: True when entering pairing mode, False when exiting
         """
         old_pairing = self.current_source_info.pairing_mode
-        self.current_source_info.pairing_mode = pairing_mode
+        self.current_source_info = replace(self.current_source_info, pairing_mode=pairing_mode)
         
         if old_pairing != pairing_mode:
             logger.info(f"📡 Pairing mode changed: {old_pairing} → {pairing_mode}")
-            # Pass a copy to prevent reference issues with cached values
-            self._trigger_callbacks('source_info_changed', source_info=replace(self.current_source_info))
+            self._trigger_callbacks('source_info_changed', source_info=self.current_source_info)
 
     def get_playback_state(self) -> PlaybackState:
         """
@@ -0,0 +1,208 @@
+"""
+BlueZ Object Tree - Local mirror of the BlueZ D-Bus object tree
+
+Seeded once from GetManagedObjects() and kept current from the
+InterfacesAdded, InterfacesRemoved and PropertiesChanged signals, so
+device, player and transport lookups never go back to D-Bus.
+"""
+
+import logging
+import threading
+from typing import Optional, Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+DEVICE_INTERFACE = 'org.bluez.Device1'
+MEDIA_PLAYER_INTERFACE = 'org.bluez.MediaPlayer1'
+TRANSPORT_INTERFACE = 'org.bluez.MediaTransport1'
+
+
+def device_path_of(path: str) -> Optional[str]:
+    """
+    Device path that owns an object path.
+
+    e.g. /org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF/player0
+         -> /org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF
+    """
+    if not path:
+        return None
+    parts = path.split('/')
+    for i, part in enumerate(parts):
+        if part.startswith('dev_'):
+            return '/'.join(parts[:i + 1])
+    return None
+
+
+class BlueZObjectTree:
+    """
+    Mirror of BlueZ objects (path -> interface -> properties).
+
+    Keeps indexes so common lookups are dictionary reads:
+    - device -> media player path
+    - device -> media transport path
+    - address -> device path
+
+    Signal handlers run on the GLib main loop thread while readers run on
+    other threads, so all access goes through one lock.
+    """
+
+    def __init__(self):
+        """Initialize an empty tree (call seed() with GetManagedObjects())."""
+        self._objects: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._player_by_device: Dict[str, str] = {}
+        self._transport_by_device: Dict[str, str] = {}
+        self._device_by_address: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def seed(self, managed_objects: Dict[str, Dict[str, Dict[str, Any]]]):
+        """
+        Replace the tree with a full GetManagedObjects() result.
+
+        Args:
+            managed_objects: Dict of path -> interface -> properties
+        """
+        with self._lock:
+            self._objects.clear()
+            self._player_by_device.clear()
+            self._transport_by_device.clear()
+            self._device_by_address.clear()
+            for path, interfaces in managed_objects.items():
+                self.interfaces_added(str(path), interfaces)
+        logger.debug(f"BlueZ object tree seeded with {len(self._objects)} objects")
+
+    def interfaces_added(self, path: str, interfaces: Dict[str, Dict[str, Any]]):
+        """Apply an InterfacesAdded signal."""
+        path = str(path)
+        with self._lock:
+            entry = self._objects.setdefault(path, {})
+            for interface, props in interfaces.items():
+                entry.setdefault(str(interface), {}).update(
+                    (str(name), value) for name, value in props.items())
+                self._index(path, str(interface))
+
+    def interfaces_removed(self, path: str, interfaces: List[str]):
+        """Apply an InterfacesRemoved signal."""
+        path = str(path)
+        with self._lock:
+            entry = self._objects.get(path)
+            if entry is None:
+                return
+            for interface in interfaces:
+                interface = str(interface)
+                props = entry.pop(interface, None)
+                self._unindex(path, interface, props)
+            if not entry:
+                del self._objects[path]
+
+    def properties_changed(self, interface: str, changed: Dict[str, Any],
+                           invalidated: List[str], path: str):
+        """Apply a PropertiesChanged signal."""
+        path, interface = str(path), str(interface)
+        with self._lock:
+            props = self._objects.setdefault(path, {}).setdefault(interface, {})
+            new_object = not props
+            props.update((str(name), value) for name, value in changed.items())
+            for name in invalidated:
+                props.pop(str(name), None)
+            if new_object or (interface == DEVICE_INTERFACE and 'Address' in changed):
+                self._index(path, interface)
+
+    def get_properties(self, path: str, interface: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of an object's properties for one interface.
+
+        Returns:
+            Properties dict or None if the object/interface is unknown
+        """
+        with self._lock:
+            props = self._objects.get(str(path), {}).get(interface)
+            return dict(props) if props is not None else None
+
+    def get_property(self, path: str, interface: str, name: str, default: Any = None) -> Any:
+        """Get a single property value."""
+        with self._lock:
+            return self._objects.get(str(path), {}).get(interface, {}).get(name, default)
+
+    def get_device(self, device_path: str) -> Optional[Dict[str, Any]]:
+        """Get Device1 properties of a device."""
+        return self.get_properties(device_path, DEVICE_INTERFACE)
+
+    def get_devices(self, connected: Optional[bool] = None,
+                    paired: Optional[bool] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get devices, optionally filtered by connection/pairing state.
+
+        Returns:
+            Dict of device path -> Device1 properties
+        """
+        with self._lock:
+            devices = {}
+            for path, interfaces in self._objects.items():
+                props = interfaces.get(DEVICE_INTERFACE)
+                if props is None:
+                    continue
+                if connected is not None and bool(props.get('Connected', False)) != connected:
+                    continue
+                if paired is not None and bool(props.get('Paired', False)) != paired:
+                    continue
+                devices[path] = dict(props)
+            return devices
+
+    def get_device_by_address(self, address: str) -> Optional[str]:
+        """Device path for a MAC address."""
+        with self._lock:
+            return self._device_by_address.get(str(address).upper())
+
+    def get_player(self, device_path: str) -> Optional[str]:
+        """MediaPlayer1 path of a device."""
+        with self._lock:
+            return self._player_by_device.get(str(device_path))
+
+    def get_transport(self, device_path: str) -> Optional[str]:
+        """MediaTransport1 path of a device."""
+        with self._lock:
+            return self._transport_by_device.get(str(device_path))
+
+    def get_transport_volume(self, device_path: str) -> Optional[int]:
+        """AVRCP volume (0-127) of a device's transport, if known."""
+        with self._lock:
+            transport = self._transport_by_device.get(str(device_path))
+            if transport is None:
+                return None
+            volume = self.get_property(transport, TRANSPORT_INTERFACE, 'Volume')
+            return int(volume) if volume is not None else None
+
+    def has_object(self, path: str) -> bool:
+        """True if the path is in the tree."""
+        with self._lock:
+            return str(path) in self._objects
+
+    def _index(self, path: str, interface: str):
+        """Add an object to the lookup indexes (caller holds the lock)."""
+        if interface == DEVICE_INTERFACE:
+            address = self._objects[path][interface].get('Address')
+            if address:
+                self._device_by_address[str(address).upper()] = path
+        elif interface == MEDIA_PLAYER_INTERFACE:
+            device = device_path_of(path)
+            if device:
+                self._player_by_device[device] = path
+        elif interface == TRANSPORT_INTERFACE:
+            device = device_path_of(path)
+            if device:
+                self._transport_by_device[device] = path
+
+    def _unindex(self, path: str, interface: str, props: Optional[Dict[str, Any]]):
+        """Remove an object from the lookup indexes (caller holds the lock)."""
+        if interface == DEVICE_INTERFACE:
+            address = props.get('Address') if props else None
+            if address and self._device_by_address.get(str(address).upper()) == path:
+                del self._device_by_address[str(address).upper()]
+        elif interface == MEDIA_PLAYER_INTERFACE:
+            device = device_path_of(path)
+            if device and self._player_by_device.get(device) == path:
+                del self._player_by_device[device]
+        elif interface == TRANSPORT_INTERFACE:
+            device = device_path_of(path)
+            if device and self._transport_by_device.get(device) == path:
+                del self._transport_by_device[device]
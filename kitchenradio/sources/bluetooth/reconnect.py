@@ -0,0 +1,224 @@
+"""
+Reconnect Manager - Reconnect recently used phones when Bluetooth is selected
+
+Keeps a most-recently-used list of trusted devices and, on request, starts
+Connect() to the top candidates at once. The first device to connect wins;
+the other attempts are cancelled. Devices that connected but never brought
+up A2DP are remembered and skipped next time.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class KnownDevice:
+    """A trusted device and what we know about its last connections."""
+    path: str
+    address: str
+    name: str
+    last_seen: float = 0.0        # time.time() of the last connection (0 = never seen by us)
+    audio: Optional[bool] = None  # Accepted A2DP on its last connection (None = unknown)
+
+
+class ReconnectManager:
+    """
+    MRU reconnect for BluetoothController.
+
+    Attempts run through the controller's connect state machine
+    (_connect_device/_finish_connect) on the client's loop thread; the
+    controller reports connections and finished attempts back with
+    device_connected() and attempt_finished().
+    """
+
+    def __init__(self, controller, max_candidates: int = 2):
+        """
+        Initialize reconnect manager.
+
+        Args:
+            controller: BluetoothController that owns the client and connect state machine
+            max_candidates: Number of devices tried at once
+        """
+        self.controller = controller
+        self.max_candidates = max_candidates
+
+        self._devices: Dict[str, KnownDevice] = {}  # address -> device
+        self._pending: Set[str] = set()  # device paths with an attempt in progress
+        self._losers: Set[str] = set()  # device paths whose attempt is being cancelled
+        self._started = 0.0
+        self._lock = threading.Lock()
+
+    def seed(self, devices: Dict[str, Dict[str, Any]]):
+        """
+        Learn trusted devices from BlueZ (object tree device list).
+
+        Devices connected right now count as just seen.
+        """
+        now = time.time()
+        with self._lock:
+            for path, props in devices.items():
+                if not (props.get('Paired', False) and props.get('Trusted', False)):
+                    continue
+                device = self._learn(path, props)
+                if props.get('Connected', False):
+                    device.last_seen = now
+
+    def get_candidates(self) -> List[KnownDevice]:
+        """
+        Devices to try, most recently seen first.
+
+        Only devices BlueZ still lists as paired and trusted; devices that
+        did not bring up A2DP last time are skipped.
+        """
+        devices = self.controller.client.objects.get_devices(paired=True)
+        with self._lock:
+            candidates = [self._learn(path, props) for path, props in devices.items()
+                          if props.get('Trusted', False) and not props.get('Blocked', False)]
+            candidates = [device for device in candidates if device.audio is not False]
+            candidates.sort(key=lambda device: device.last_seen, reverse=True)
+            return candidates[:self.max_candidates]
+
+    def start(self) -> int:
+        """
+        Start connecting to the top candidates (no-op if a device is connected).
+
+        Returns:
+            Number of attempts in progress
+        """
+        if self.controller.is_connected():
+            return 0
+
+        candidates = self.get_candidates()
+        with self._lock:
+            if self._pending:
+                return len(self._pending)
+            self._pending = {device.path for device in candidates}
+            self._losers = set()
+            self._started = time.monotonic()
+
+        if not candidates:
+            logger.info("🔁 No trusted devices to reconnect")
+            return 0
+
+        logger.info(f"🔁 Reconnecting to recent devices: {', '.join(device.name for device in candidates)}")
+        for device in candidates:
+            # Attempts belong to the client's loop thread
+            self.controller.client.call_later(0, self.controller._connect_device,
+                                              device.path, device.name, device.address)
+        return len(candidates)
+
+    def cancel(self):
+        """Cancel all attempts in progress (e.g. when switching away from Bluetooth)."""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            self._losers |= pending
+        for path in pending:
+            self._cancel_attempt(path)
+        if pending:
+            logger.info(f"🔁 Reconnect cancelled ({len(pending)} attempts)")
+
+    def device_connected(self, path: str, address: str, name: str) -> bool:
+        """
+        A device connected - update the MRU list and settle a reconnect race.
+
+        The first device to connect while attempts are running wins, whether
+        we dialled it or the phone reconnected by itself; the remaining
+        attempts are cancelled. A device is only rejected while a reconnect
+        is in progress and its own attempt is still being cancelled.
+
+        Returns:
+            False if the device lost the race and should be disconnected
+        """
+        with self._lock:
+            if self._pending and path in self._losers:
+                return False
+
+            device = self._devices.get(address)
+            if device is None:
+                device = self._devices[address] = KnownDevice(path, address, name)
+            device.path, device.name, device.last_seen = path, name, time.time()
+            if path not in self._pending and device.audio is False:
+                device.audio = None  # Connected by itself - give it another chance
+
+            if not self._pending:
+                return True
+
+            losers = self._pending - {path}
+            self._losers |= losers
+            self._pending &= {path}
+            elapsed = time.monotonic() - self._started
+
+        logger.info(f"🔁 {name} reconnected after {elapsed:.1f}s")
+        for loser in losers:
+            self._cancel_attempt(loser)
+        return True
+
+    def attempt_finished(self, path: str, connected: bool, ready: bool):
+        """
+        A connect attempt ended - remember whether the device accepted A2DP.
+
+        Args:
+            path: Device path
+            connected: The link came up
+            ready: The audio profile came up
+        """
+        with self._lock:
+            self._losers.discard(path)
+            if path not in self._pending:
+                return
+            self._pending.discard(path)
+            if connected:
+                for device in self._devices.values():
+                    if device.path == path:
+                        device.audio = ready
+                        if not ready:
+                            logger.info(f"🔁 {device.name} did not accept A2DP - skipping it next time")
+
+    def is_reconnecting(self) -> bool:
+        """True while attempts are in progress."""
+        return bool(self._pending)
+
+    def get_status(self) -> Dict[str, Any]:
+        """MRU list and attempts in progress (for diagnostics)."""
+        with self._lock:
+            devices = sorted(self._devices.values(), key=lambda device: device.last_seen, reverse=True)
+            return {
+                'reconnecting': sorted(self._pending),
+                'devices': [{
+                    'name': device.name,
+                    'address': device.address,
+                    'last_seen': device.last_seen or None,
+                    'audio': device.audio
+                } for device in devices]
+            }
+
+    def _learn(self, path: str, props: Dict[str, Any]) -> KnownDevice:
+        """Device entry for BlueZ properties (caller holds the lock)."""
+        address = str(props.get('Address', ''))
+        name = str(props.get('Alias', props.get('Name', 'Unknown')))
+        device = self._devices.get(address)
+        if device is None:
+            device = self._devices[address] = KnownDevice(path, address, name)
+        else:
+            device.path, device.name = path, name
+        if device.audio is None and props.get('UUIDs'):
+            device.audio = self.controller._has_audio_profile(props)
+        return device
+
+    def _cancel_attempt(self, path: str):
+        """Drop a losing attempt; Disconnect() also cancels a pending Connect()."""
+        self.controller.client.call_later(0, self._run_cancel, path)
+
+    def _run_cancel(self, path: str) -> bool:
+        """Cancel an attempt on the client's loop thread; the device no longer counts as a loser."""
+        try:
+            self.controller._cancel_connect(path)
+        finally:
+            with self._lock:
+                self._losers.discard(path)
+        return False  # Don't reschedule
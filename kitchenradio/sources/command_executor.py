@@ -0,0 +1,294 @@
+"""
+Command Executor - Serialized execution of SourceController commands
+
+State-changing commands (power, source selection, transport) run one at
+a time on a single worker thread, whichever thread submitted them (button
+polling, Flask requests, monitor callbacks). Volume changes bypass it -
+the volume engines apply them at once without blocking.
+
+- Queued commands run by priority: power, then source, then transport
+- A power command cancels the lower-priority commands queued before it
+- A newer command supersedes a queued one of the same group, or - for
+  repeatable commands like next/previous - coalesces once too many are queued
+- submit() returns a Future; call() waits for the result (and runs inline
+  when already on the worker thread, so commands can call each other)
+"""
+
+import heapq
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Future, CancelledError, InvalidStateError, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional, Callable, Dict, Any, List
+
+from .tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+class CommandPriority(IntEnum):
+    """Lower value runs first."""
+    POWER = 0
+    SOURCE = 1
+    TRANSPORT = 2
+
+
+class MergePolicy:
+    """What happens to queued commands of the same group when a new one arrives."""
+    QUEUE = 'queue'          # Keep them all (toggles - two presses must cancel out)
+    SUPERSEDE = 'supersede'  # Latest wins - queued ones get the new command's result (idempotent commands only)
+    BOUNDED = 'bounded'      # Keep up to max_queued, further ones share the newest queued result
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """How a command is scheduled."""
+    group: str
+    priority: CommandPriority
+    policy: str = MergePolicy.QUEUE
+    preempt: bool = False  # Cancel queued lower-priority commands
+
+
+class _QueuedCommand:
+    """One submitted command."""
+    __slots__ = ('name', 'spec', 'fn', 'args', 'kwargs', 'future', 'seq', 'queued_at', 'cancelled', 'trace')
+
+    def __init__(self, name: str, spec: CommandSpec, fn: Callable, args: tuple, kwargs: dict, seq: int):
+        self.name = name
+        self.spec = spec
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.seq = seq
+        self.queued_at = time.monotonic()
+        self.cancelled = False
+        self.trace = tracer.current()  # Input that caused the command (None when not tracing)
+
+    def __lt__(self, other: '_QueuedCommand') -> bool:
+        return (self.spec.priority, self.seq) < (other.spec.priority, other.seq)
+
+
+def _chain(source: Future, target: Future):
+    """Resolve target with source's outcome once source is done."""
+    def copy(done: Future):
+        if target.done():
+            return
+        try:
+            if done.cancelled():
+                target.cancel()
+            elif done.exception() is not None:
+                target.set_exception(done.exception())
+            else:
+                target.set_result(done.result())
+        except InvalidStateError:
+            pass  # Cancelled meanwhile
+    source.add_done_callback(copy)
+
+
+class CommandExecutor:
+    """
+    Single-writer executor with priorities and supersession.
+
+    The worker thread starts with the first submitted command.
+    """
+
+    def __init__(self, max_queued: int = 3, call_timeout: float = 30.0, name: str = 'source-commands'):
+        """
+        Initialize command executor.
+
+        Args:
+            max_queued: Max queued commands per BOUNDED group (e.g. next presses)
+            call_timeout: Max seconds call() waits for a result
+            name: Worker thread name
+        """
+        self.max_queued = max_queued
+        self.call_timeout = call_timeout
+        self.name = name
+
+        self._heap: List[_QueuedCommand] = []
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._running = True
+        self._thread: Optional[threading.Thread] = None
+        self._current: Optional[_QueuedCommand] = None
+
+        # Metrics
+        self.executed = 0
+        self.superseded = 0
+        self.coalesced = 0
+        self.preempted = 0
+        self.errors = 0
+        self.max_depth = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+    def on_worker_thread(self) -> bool:
+        """True when called from a running command."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, name: str, spec: CommandSpec, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a command and return immediately.
+
+        Args:
+            name: Command name (for logs and metrics)
+            spec: Scheduling of the command
+            fn: Callable to run on the worker thread
+
+        Returns:
+            Future with the command's result (cancelled if a power command preempted it)
+        """
+        with self._cond:
+            self._seq += 1
+            command = _QueuedCommand(name, spec, fn, args, kwargs, self._seq)
+
+            if not self._running:
+                command.future.cancel()
+                return command.future
+
+            queued = [c for c in self._heap if not c.cancelled]
+
+            if spec.preempt:
+                for other in queued:
+                    if other.spec.priority > spec.priority:
+                        other.cancelled = True
+                        other.future.cancel()
+                        self.preempted += 1
+                        logger.debug(f"⏩ {other.name} preempted by {name}")
+
+            same_group = [c for c in queued if not c.cancelled and c.spec.group == spec.group]
+            if spec.policy == MergePolicy.SUPERSEDE:
+                for other in same_group:
+                    other.cancelled = True
+                    _chain(command.future, other.future)
+                    self.superseded += 1
+                    logger.debug(f"⏩ {other.name} superseded by {name}")
+            elif spec.policy == MergePolicy.BOUNDED and len(same_group) >= self.max_queued:
+                newest = max(same_group, key=lambda c: c.seq)
+                _chain(newest.future, command.future)
+                self.coalesced += 1
+                logger.debug(f"⏩ {name} coalesced ({len(same_group)} already queued)")
+                return command.future
+
+            heapq.heappush(self._heap, command)
+            self.max_depth = max(self.max_depth, sum(1 for c in self._heap if not c.cancelled))
+            self._start_worker()
+            self._cond.notify()
+            return command.future
+
+    def call(self, name: str, spec: CommandSpec, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a command and wait for its result.
+
+        Runs inline on the worker thread (a command calling another) and once
+        the executor is stopped. Returns None if the command was preempted or
+        did not finish within call_timeout.
+        """
+        if self.on_worker_thread() or not self._running:
+            return fn(*args, **kwargs)
+
+        future = self.submit(name, spec, fn, *args, **kwargs)
+        try:
+            return future.result(timeout=self.call_timeout)
+        except CancelledError:
+            logger.info(f"⏩ {name} cancelled by a power command")
+            return None
+        except FutureTimeoutError:
+            logger.error(f"Command {name} did not finish within {self.call_timeout}s")
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, merges and latency."""
+        with self._cond:
+            executed = self.executed or 1
+            return {
+                'depth': sum(1 for c in self._heap if not c.cancelled),
+                'max_depth': self.max_depth,
+                'running': self._current.name if self._current else None,
+                'executed': self.executed,
+                'superseded': self.superseded,
+                'coalesced': self.coalesced,
+                'preempted': self.preempted,
+                'errors': self.errors,
+                'avg_wait_ms': round(self._wait_total / executed * 1000, 2),
+                'max_wait_ms': round(self._wait_max * 1000, 2),
+                'avg_run_ms': round(self._run_total / executed * 1000, 2),
+                'max_run_ms': round(self._run_max * 1000, 2),
+            }
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the worker (queued commands are cancelled)."""
+        with self._cond:
+            self._running = False
+            for command in self._heap:
+                command.future.cancel()
+            self._heap.clear()
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def _start_worker(self):
+        """Start the worker thread (caller holds the lock)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name=self.name)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._heap:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                command = heapq.heappop(self._heap)
+                if command.cancelled or not command.future.set_running_or_notify_cancel():
+                    continue
+                self._current = command
+
+            started = time.monotonic()
+            error = False
+            tracer.record(command.trace, 'queue', command.name, command.queued_at, started)
+            try:
+                with tracer.activate(command.trace), tracer.span('command', command.name, command.trace):
+                    result = command.fn(*command.args, **command.kwargs)
+                command.future.set_result(result)
+            except Exception as e:
+                error = True
+                logger.error(f"Error in command {command.name}: {e}")
+                command.future.set_exception(e)
+            finished = time.monotonic()
+
+            with self._cond:
+                self._current = None
+                self.executed += 1
+                self.errors += error
+                wait, run = started - command.queued_at, finished - started
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+                self._run_total += run
+                self._run_max = max(self._run_max, run)
+
+
+def command(group: str, priority: CommandPriority, policy: str = MergePolicy.QUEUE, preempt: bool = False):
+    """
+    Run a method through its object's CommandExecutor (self._commands).
+
+    Direct calls keep their signature and wait for the result; the
+    undecorated method and its CommandSpec stay reachable for submit().
+    """
+    spec = CommandSpec(group, priority, policy, preempt)
+
+    def decorate(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return self._commands.call(method.__name__, spec, method, self, *args, **kwargs)
+        wrapper.command_spec = spec
+        wrapper.command_method = method
+        return wrapper
+    return decorate
@@ -0,0 +1,309 @@
+"""
+Event Bus - Asynchronous delivery of SourceController callbacks
+
+Events are queued per subscriber and delivered from the subscriber's own
+thread, so emitters (monitor threads, the Librespot loop, the D-Bus loop)
+never wait for consumers and one slow subscriber never delays another.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Optional, Callable, Dict, Any, List, Tuple
+
+from .tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+# State events: only the latest value matters, so a queued one is replaced
+# by a newer one (which moves to the back of the queue)
+MERGEABLE_EVENTS = {
+    'state_changed',
+    'playback_state_changed',
+    'track_changed',
+    'source_info_changed',
+    'current_source_changed',
+    'available_sources_changed',
+    'volume_changed',
+}
+
+
+class _Entry:
+    """One queued delivery."""
+    __slots__ = ('key', 'kwargs', 'queued_at', 'trace')
+
+    def __init__(self, key: Optional[Tuple[str, str]], kwargs: Dict[str, Any]):
+        self.key = key
+        self.kwargs = kwargs
+        self.queued_at = time.monotonic()
+        self.trace = tracer.current()  # Input that caused the event (None when not tracing)
+
+
+class _Subscriber:
+    """
+    A callback with its own bounded queue and delivery thread.
+
+    - State events (MERGEABLE_EVENTS) replace a queued event of the same kind
+    - When the queue is full the oldest event is dropped (state events last)
+    - Legacy subscribers get per-field events instead of 'state_changed'
+    """
+
+    def __init__(self, event_name: str, callback: Callable, max_queue: int, legacy: bool = False):
+        self.event_name = event_name
+        self.callback = callback
+        self.legacy = legacy
+        self.name = getattr(callback, '__qualname__', repr(callback))
+        self.max_queue = max_queue
+
+        self._queue: deque = deque()
+        self._pending: Dict[Tuple[str, str], _Entry] = {}  # merge key -> queued entry
+        self._cond = threading.Condition()
+        self._running = True
+        self._busy = False
+
+        # Metrics
+        self.delivered = 0
+        self.merged = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"events-{self.name}")
+        self._thread.start()
+
+    def put(self, key: Optional[Tuple[str, str]], kwargs: Dict[str, Any]):
+        """Queue an event (never blocks on the callback)."""
+        entry = _Entry(key, kwargs)
+        with self._cond:
+            if not self._running:
+                return
+            if key is not None:
+                previous = self._pending.pop(key, None)
+                if previous is not None:
+                    self._queue.remove(previous)
+                    self.merged += 1
+                    if 'changed' in kwargs and 'changed' in previous.kwargs:
+                        # state_changed: keep the fields the replaced event reported
+                        entry.kwargs = dict(kwargs, changed=kwargs['changed'] | previous.kwargs['changed'])
+                    if entry.trace is None:
+                        entry.trace = previous.trace
+                self._pending[key] = entry
+            if len(self._queue) >= self.max_queue:
+                self._drop_oldest()
+            self._queue.append(entry)
+            self.max_depth = max(self.max_depth, len(self._queue))
+            self._cond.notify()
+
+    def _drop_oldest(self):
+        """
+        Make room in a full queue (caller holds the lock).
+
+        Queued state events hold the latest value of their kind, so the
+        oldest other event goes first.
+        """
+        victim = next((entry for entry in self._queue if entry.key is None), self._queue[0])
+        self._queue.remove(victim)
+        if victim.key is not None:
+            self._pending.pop(victim.key, None)
+        self.dropped += 1
+        logger.debug(f"Event queue of {self.name} full - dropped oldest event")
+
+    def stop(self, timeout: float = 1.0):
+        """Stop delivering (queued events are discarded)."""
+        with self._cond:
+            self._running = False
+            self._queue.clear()
+            self._pending.clear()
+            self._cond.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def wait_idle(self, timeout: float) -> bool:
+        """Wait until the queue is empty and no callback is running."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._running and (self._queue or self._busy):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            delivered = self.delivered or 1
+            return {
+                'event': self.event_name,
+                'depth': len(self._queue),
+                'max_depth': self.max_depth,
+                'delivered': self.delivered,
+                'merged': self.merged,
+                'dropped': self.dropped,
+                'errors': self.errors,
+                'avg_wait_ms': round(self._wait_total / delivered * 1000, 2),
+                'max_wait_ms': round(self._wait_max * 1000, 2),
+                'avg_run_ms': round(self._run_total / delivered * 1000, 2),
+                'max_run_ms': round(self._run_max * 1000, 2),
+            }
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                entry = self._queue.popleft()
+                if entry.key is not None:
+                    self._pending.pop(entry.key, None)
+                self._busy = True
+
+            started = time.monotonic()
+            error = False
+            tracer.record(entry.trace, 'deliver', self.name, entry.queued_at, started)
+            try:
+                with tracer.activate(entry.trace):
+                    self.callback(**entry.kwargs)
+            except Exception as e:
+                error = True
+                logger.error(f"Error in callback {self.name} for {self.event_name}: {e}")
+            finished = time.monotonic()
+
+            with self._cond:
+                self._busy = False
+                self.delivered += 1
+                self.errors += error
+                wait, run = started - entry.queued_at, finished - started
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+                self._run_total += run
+                self._run_max = max(self._run_max, run)
+                self._cond.notify_all()
+
+
+class EventBus:
+    """
+    Publish/subscribe with one queue and delivery thread per subscriber.
+
+    Callbacks are invoked like SourceController always did:
+    - subscribers of a named event get callback(event=sub_event, **kwargs),
+      or callback(**kwargs) when there is no sub event
+    - 'any' subscribers get callback(event_type=name, sub_event=sub_event, **kwargs)
+
+    An event published with a legacy expansion (e.g. 'state_changed') is
+    replaced by the expanded per-field events for subscribers that asked
+    for them; the expansion is computed once, and only if needed.
+    """
+
+    def __init__(self, max_queue: int = 64):
+        """
+        Initialize event bus.
+
+        Args:
+            max_queue: Max queued events per subscriber (oldest dropped when full)
+        """
+        self.max_queue = max_queue
+        self._subscribers: List[_Subscriber] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_name: str, callback: Callable, legacy: bool = False) -> bool:
+        """
+        Subscribe a callback to an event ('any' for all events).
+
+        Args:
+            event_name: Event to receive
+            callback: Callable invoked on the subscriber's delivery thread
+            legacy: Receive per-field events instead of 'state_changed'
+
+        Returns:
+            False if the callback was already subscribed to the event
+        """
+        with self._lock:
+            if any(sub.event_name == event_name and sub.callback == callback for sub in self._subscribers):
+                return False
+            self._subscribers.append(_Subscriber(event_name, callback, self.max_queue, legacy))
+            return True
+
+    def unsubscribe(self, event_name: str, callback: Callable) -> bool:
+        """
+        Remove a subscription and stop its delivery thread.
+
+        Returns:
+            True if the subscription existed
+        """
+        with self._lock:
+            for sub in self._subscribers:
+                if sub.event_name == event_name and sub.callback == callback:
+                    self._subscribers.remove(sub)
+                    break
+            else:
+                return False
+        sub.stop()
+        return True
+
+    def subscriber_count(self, event_name: str) -> int:
+        """Number of subscribers that receive an event (including 'any')."""
+        with self._lock:
+            return sum(1 for sub in self._subscribers if sub.event_name in (event_name, 'any'))
+
+    def publish(self, event_name: str, sub_event: Optional[str] = None,
+                legacy: Optional[Callable[[], List[Tuple[str, Dict[str, Any]]]]] = None, **kwargs):
+        """
+        Queue an event for its subscribers and return immediately.
+
+        Args:
+            event_name: Event name
+            sub_event: Sub event (passed to callbacks as event/sub_event)
+            legacy: Returns the (sub_event, kwargs) list delivered instead to legacy subscribers
+        """
+        with self._lock:
+            subscribers = [sub for sub in self._subscribers if sub.event_name in (event_name, 'any')]
+
+        expanded = None
+        for sub in subscribers:
+            if legacy is not None and sub.legacy:
+                if expanded is None:
+                    expanded = legacy()
+                for legacy_event, legacy_kwargs in expanded:
+                    self._deliver(sub, event_name, legacy_event, legacy_kwargs)
+            else:
+                self._deliver(sub, event_name, sub_event, kwargs)
+
+    @staticmethod
+    def _deliver(sub: _Subscriber, event_name: str, sub_event: Optional[str], kwargs: Dict[str, Any]):
+        """Queue one event for one subscriber with its calling convention."""
+        key = (event_name, sub_event) if sub_event in MERGEABLE_EVENTS else None
+        if sub.event_name == 'any':
+            call_kwargs = dict(kwargs, event_type=event_name)
+            if sub_event:
+                call_kwargs['sub_event'] = sub_event
+        elif sub_event:
+            call_kwargs = dict(kwargs, event=sub_event)
+        else:
+            call_kwargs = dict(kwargs)
+        sub.put(key, call_kwargs)
+
+    def wait_idle(self, timeout: float = 1.0) -> bool:
+        """Wait until every subscriber has handled its queued events."""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return all(sub.wait_idle(max(0.0, deadline - time.monotonic())) for sub in subscribers)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, drops, merges and latency per subscriber."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return {f"{sub.event_name}:{sub.name}": sub.get_stats() for sub in subscribers}
+
+    def stop(self):
+        """Stop all delivery threads."""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for sub in subscribers:
+            sub.stop()
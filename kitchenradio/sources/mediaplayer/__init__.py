@@ -10,11 +10,25 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
 from .client import KitchenRadioClient
+from .async_client import AsyncKitchenRadioClient, SyncKitchenRadioClient
 from .monitor import MPDMonitor
 from .controller import PlaybackController
+from .pool import MPDConnectionPool, PoolTimeout
+from .catalog import PlaylistCatalog, PlaylistEntry
+from .library import LibraryIndex, LibraryTrack
+from .queue import QueueMirror
 
 __all__ = [
     "KitchenRadioClient",
+    "AsyncKitchenRadioClient",
+    "SyncKitchenRadioClient",
     "MPDMonitor", 
-    "PlaybackController"
+    "PlaybackController",
+    "MPDConnectionPool",
+    "PoolTimeout",
+    "PlaylistCatalog",
+    "PlaylistEntry",
+    "LibraryIndex",
+    "LibraryTrack",
+    "QueueMirror"
 ]
@@ -0,0 +1,763 @@
+"""
+KitchenRadio Async Client - asyncio MPD client backend
+
+Provides the KitchenRadioClient API on top of asyncio:
+- AsyncMPDConnection: lean MPD protocol reader built on asyncio streams
+- AsyncKitchenRadioClient: coroutine API with a pool of connections, so
+  commands run concurrently on separate sockets, and idle subscriptions
+  exposed as async iterators
+- SyncKitchenRadioClient: blocking wrapper with exactly the
+  KitchenRadioClient API, so PlaybackController and SourceController can use
+  the asyncio backend unchanged
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import asynccontextmanager
+from typing import Optional, Callable, Dict, Any, List, Sequence, Tuple, AsyncIterator
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Keys that start a new object in list responses (playlistinfo, listallinfo, ...)
+OBJECT_DELIMITERS = {'file', 'directory', 'playlist'}
+
+# Commands whose response is a single object
+SINGLE_OBJECT_COMMANDS = {'status', 'currentsong', 'stats', 'replay_gain_status'}
+
+# Commands whose response is a list of objects
+OBJECT_LIST_COMMANDS = {'playlistinfo', 'plchanges', 'plchangesposid', 'listplaylists', 'listplaylistinfo',
+                        'listallinfo', 'lsinfo', 'find', 'search', 'list', 'playlistid'}
+
+# Seconds a stopped wait_for_changes() waits for the cancelled idle to send noidle and drain
+IDLE_CANCEL_TIMEOUT = 2.0
+
+
+class MPDCommandError(Exception):
+    """MPD answered a command with ACK."""
+
+
+class MPDConnectionError(Exception):
+    """The MPD connection is closed or broken."""
+
+
+def _quote(arg: Any) -> str:
+    """Quote a command argument for the MPD protocol."""
+    text = str(arg).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{text}"'
+
+
+def _format_command(command: str, args: Sequence[Any]) -> str:
+    parts = [command] + [_quote(arg) for arg in args]
+    return ' '.join(parts) + '\n'
+
+
+def _parse_object(pairs: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Collect key/value pairs into a dict (repeated keys become lists, like python-mpd2)."""
+    obj: Dict[str, Any] = {}
+    for key, value in pairs:
+        if key in obj:
+            if not isinstance(obj[key], list):
+                obj[key] = [obj[key]]
+            obj[key].append(value)
+        else:
+            obj[key] = value
+    return obj
+
+
+def _parse_objects(pairs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Split key/value pairs into objects at delimiter keys (file, directory, playlist)."""
+    objects: List[Dict[str, Any]] = []
+    current: List[Tuple[str, str]] = []
+    first_key = pairs[0][0] if pairs else None
+    for key, value in pairs:
+        if current and (key in OBJECT_DELIMITERS or key == first_key):
+            objects.append(_parse_object(current))
+            current = []
+        current.append((key, value))
+    if current:
+        objects.append(_parse_object(current))
+    return objects
+
+
+def _convert_result(command: str, pairs: List[Tuple[str, str]]) -> Any:
+    """Convert raw pairs to the python-mpd2 shaped result for a command."""
+    if command in SINGLE_OBJECT_COMMANDS:
+        return _parse_object(pairs)
+    if command in OBJECT_LIST_COMMANDS:
+        return _parse_objects(pairs)
+    if command == 'idle':
+        return [value for key, value in pairs if key == 'changed']
+    return None
+
+
+class AsyncMPDConnection:
+    """
+    Single MPD connection using asyncio streams.
+
+    Every exchange is cancellation-safe: if a command is cancelled or times
+    out halfway through its response the protocol state is unknown, so the
+    connection is closed and must be reopened.
+    """
+
+    def __init__(self, host: str, port: int, password: Optional[str] = None, timeout: float = 10):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self.server_version: Optional[str] = None
+        self.last_used = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def open(self):
+        """Open the connection and read the greeting. Raises on failure."""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout)
+        try:
+            greeting = await asyncio.wait_for(self._reader.readline(), self.timeout)
+            if not greeting.startswith(b'OK MPD '):
+                raise MPDConnectionError(f"Unexpected MPD greeting: {greeting!r}")
+            self.server_version = greeting[7:].decode('utf-8').strip()
+
+            if self.password:
+                await self.execute('password', self.password)
+        except BaseException:
+            self.close()
+            raise
+
+        self.last_used = time.monotonic()
+
+    def close(self):
+        """Close the socket (safe to call repeatedly)."""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+        self._reader = None
+        self._writer = None
+
+    async def execute(self, command: str, *args, timeout: Optional[float] = None) -> Any:
+        """
+        Run one command and return its parsed result.
+
+        Raises:
+            MPDCommandError: MPD answered with ACK
+            MPDConnectionError: Connection is closed or broke
+            asyncio.TimeoutError: No complete response within timeout
+        """
+        pairs = await self._exchange(_format_command(command, args), 1, timeout)
+        return _convert_result(command, pairs[0])
+
+    async def command_list(self, commands: Sequence[Tuple[Any, ...]],
+                           timeout: Optional[float] = None) -> List[Any]:
+        """
+        Run a command list in one write and parse all responses from one read.
+
+        Returns:
+            One result per command
+        """
+        payload = 'command_list_ok_begin\n'
+        payload += ''.join(_format_command(cmd[0], cmd[1:]) for cmd in commands)
+        payload += 'command_list_end\n'
+
+        responses = await self._exchange(payload, len(commands), timeout)
+        return [_convert_result(cmd[0], pairs) for cmd, pairs in zip(commands, responses)]
+
+    async def idle(self, subsystems: Sequence[str]) -> List[str]:
+        """
+        Wait in idle until one of the subsystems changes.
+
+        Cancelling the wait sends noidle and drains the answer, so the
+        connection stays usable afterwards.
+        """
+        self._ensure_open()
+        self._writer.write(_format_command('idle', subsystems).encode('utf-8'))
+        await self._writer.drain()
+
+        try:
+            pairs = await self._read_response()
+        except asyncio.CancelledError:
+            await asyncio.shield(self._cancel_idle())
+            raise
+        except BaseException:
+            self.close()
+            raise
+
+        self.last_used = time.monotonic()
+        return _convert_result('idle', pairs)
+
+    async def _cancel_idle(self):
+        """Leave idle mode after a cancelled wait (closes the connection on failure)."""
+        try:
+            self._writer.write(b'noidle\n')
+            await self._writer.drain()
+            await asyncio.wait_for(self._read_response(), self.timeout)
+        except BaseException:
+            self.close()
+
+    async def _exchange(self, payload: str, responses: int, timeout: Optional[float]) -> List[List[Tuple[str, str]]]:
+        """Write payload and read the given number of responses, closing on any interruption."""
+        self._ensure_open()
+        try:
+            return await asyncio.wait_for(self._write_and_read(payload, responses),
+                                          self.timeout if timeout is None else timeout)
+        except MPDCommandError:
+            # ACK ends the response cleanly - the connection is still in sync
+            raise
+        except BaseException:
+            # Timeout, cancellation or socket error mid-response: protocol state unknown
+            self.close()
+            raise
+
+    async def _write_and_read(self, payload: str, responses: int) -> List[List[Tuple[str, str]]]:
+        self._writer.write(payload.encode('utf-8'))
+        await self._writer.drain()
+
+        results: List[List[Tuple[str, str]]] = []
+        if responses == 1:
+            results.append(await self._read_response())
+        else:
+            current: List[Tuple[str, str]] = []
+            while True:
+                line = await self._read_line()
+                if line == 'list_OK':
+                    results.append(current)
+                    current = []
+                elif line == 'OK':
+                    break
+                elif line.startswith('ACK '):
+                    raise MPDCommandError(line[4:])
+                else:
+                    current.append(self._split_pair(line))
+
+        self.last_used = time.monotonic()
+        return results
+
+    async def _read_response(self) -> List[Tuple[str, str]]:
+        pairs: List[Tuple[str, str]] = []
+        while True:
+            line = await self._read_line()
+            if line == 'OK':
+                return pairs
+            if line.startswith('ACK '):
+                raise MPDCommandError(line[4:])
+            pairs.append(self._split_pair(line))
+
+    async def _read_line(self) -> str:
+        raw = await self._reader.readline()
+        if not raw:
+            raise MPDConnectionError("Connection closed by MPD")
+        return raw.decode('utf-8').rstrip('\n')
+
+    @staticmethod
+    def _split_pair(line: str) -> Tuple[str, str]:
+        # Keys are lowercased, like python-mpd2 does ('Title' -> 'title')
+        key, _, value = line.partition(': ')
+        return key.lower(), value
+
+    def _ensure_open(self):
+        if not self.is_open:
+            raise MPDConnectionError("Not connected")
+
+
+class AsyncKitchenRadioClient:
+    """
+    asyncio MPD client with KitchenRadio-specific functionality.
+
+    Commands check out one of pool_size connections, so independent commands
+    are in flight concurrently on separate sockets. Broken connections are
+    reopened on checkout and idle ones are pinged to keep them alive.
+    """
+
+    def __init__(self,
+                 host: str = 'localhost',
+                 port: int = 6600,
+                 password: Optional[str] = None,
+                 timeout: int = 10,
+                 pool_size: int = 2,
+                 checkout_timeout: float = 2.0,
+                 keepalive_interval: float = 30.0):
+        """
+        Initialize async client (no sockets are opened yet).
+
+        Args:
+            host: MPD server hostname
+            port: MPD server port
+            password: MPD password if required
+            timeout: Per-command timeout in seconds
+            pool_size: Number of pooled connections
+            checkout_timeout: Seconds a command waits for a free connection
+            keepalive_interval: Ping connections idle for this many seconds (0 disables)
+        """
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.pool_size = max(1, pool_size)
+        self.checkout_timeout = checkout_timeout
+        self.keepalive_interval = keepalive_interval
+        self._connected = False
+
+        self.callbacks = {}
+
+        self._connections = [AsyncMPDConnection(host, port, password, timeout) for _ in range(self.pool_size)]
+        self._free: Optional[asyncio.Queue] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    # Connection management
+    async def connect(self) -> bool:
+        """
+        Open the pooled connections.
+
+        Returns:
+            True if at least one connection is open
+        """
+        logger.info(f"Connecting to MPD at {self.host}:{self.port} (asyncio)")
+        if self._free is None:
+            self._free = asyncio.Queue()
+            for conn in self._connections:
+                self._free.put_nowait(conn)
+
+        results = await asyncio.gather(*(conn.open() for conn in self._connections if not conn.is_open),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Could not open MPD connection: {result}")
+
+        self._connected = any(conn.is_open for conn in self._connections)
+        if self._connected:
+            logger.info("Connected to MPD successfully")
+            if self.keepalive_interval > 0 and (self._keepalive_task is None or self._keepalive_task.done()):
+                self._keepalive_task = asyncio.get_running_loop().create_task(self._keepalive_loop())
+        else:
+            logger.error(f"Failed to connect to MPD at {self.host}:{self.port}")
+        return self._connected
+
+    async def disconnect(self):
+        """Close all connections."""
+        self._connected = False
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        for conn in self._connections:
+            conn.close()
+        logger.info("Disconnected from MPD")
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncIterator[AsyncMPDConnection]:
+        """
+        Check out a pooled connection (reopened if it was broken).
+
+        Raises:
+            asyncio.TimeoutError: No connection became free in time
+        """
+        if self._free is None:
+            raise MPDConnectionError("Not connected")
+
+        wait = self.checkout_timeout if timeout is None else timeout
+        conn = await asyncio.wait_for(self._free.get(), wait)
+        try:
+            if not conn.is_open:
+                await conn.open()
+            yield conn
+        finally:
+            self._free.put_nowait(conn)
+
+    async def _keepalive_loop(self):
+        """Ping connections that have been idle for keepalive_interval."""
+        while True:
+            await asyncio.sleep(max(1.0, self.keepalive_interval / 2))
+            for _ in range(self._free.qsize()):
+                conn = self._free.get_nowait()
+                try:
+                    if conn.is_open and time.monotonic() - conn.last_used >= self.keepalive_interval:
+                        await conn.execute('ping')
+                except Exception as e:
+                    logger.debug(f"MPD keepalive failed: {e}")
+                finally:
+                    self._free.put_nowait(conn)
+
+    # Callbacks
+    def add_callback(self, event: str, callback: Callable):
+        """Add callback for command events ('playback_command', ...)."""
+        self.callbacks.setdefault(event, []).append(callback)
+
+    def _trigger_callbacks(self, event: str, **kwargs):
+        for callback in self.callbacks.get(event, []):
+            try:
+                callback(**kwargs)
+            except Exception as e:
+                logger.error(f"Error in client callback for {event}: {e}")
+
+    def _handle_error(self, action: str, error: BaseException):
+        """Log a failed command; connection errors mark the client disconnected."""
+        logger.error(f"Error {action}: {error!r}")
+        if isinstance(error, (MPDConnectionError, OSError)) and not any(c.is_open for c in self._connections):
+            self._connected = False
+
+    # Raw commands
+    async def execute(self, command: str, *args) -> Any:
+        """Run a single command on a pooled connection (raises on error)."""
+        async with self.connection() as conn:
+            return await conn.execute(command, *args)
+
+    async def command_list(self, commands: Sequence[Tuple[Any, ...]]) -> Optional[List[Any]]:
+        """
+        Send several commands as one MPD command list.
+
+        Returns:
+            List with one result per command, or None on error
+        """
+        try:
+            async with self.connection() as conn:
+                return await conn.command_list(commands)
+        except Exception as e:
+            self._handle_error(f"executing command list {[c[0] for c in commands]}", e)
+            return None
+
+    async def _run(self, action: str, command: str, *args, default: Any = None) -> Any:
+        try:
+            return await self.execute(command, *args)
+        except Exception as e:
+            self._handle_error(action, e)
+            return default
+
+    async def _run_ok(self, action: str, command: str, *args) -> bool:
+        try:
+            await self.execute(command, *args)
+            return True
+        except Exception as e:
+            self._handle_error(action, e)
+            return False
+
+    # Idle
+    async def idle(self, subsystems: Sequence[str]) -> Optional[List[str]]:
+        """
+        Wait once for changes on a pooled connection.
+
+        Returns:
+            Changed subsystems, or None on error
+        """
+        try:
+            async with self.connection() as conn:
+                return await conn.idle(subsystems)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._handle_error("waiting for MPD changes", e)
+            return None
+
+    async def idle_events(self, subsystems: Sequence[str]) -> AsyncIterator[List[str]]:
+        """
+        Subscribe to idle notifications on a dedicated connection.
+
+        Usage:
+            async for changed in client.idle_events(['player', 'mixer']):
+                ...
+
+        The connection is reopened after errors; leaving the loop (or
+        cancelling the consumer) closes it.
+        """
+        conn = AsyncMPDConnection(self.host, self.port, self.password, self.timeout)
+        try:
+            while True:
+                try:
+                    if not conn.is_open:
+                        await conn.open()
+                    yield await conn.idle(subsystems)
+                except (MPDConnectionError, OSError, asyncio.TimeoutError) as e:
+                    logger.warning(f"MPD idle connection lost: {e!r}")
+                    conn.close()
+                    await asyncio.sleep(1.0)
+        finally:
+            conn.close()
+
+    # Playback control
+    async def play(self, songpos: Optional[int] = None) -> bool:
+        self._trigger_callbacks('playback_command', command='play', expected_state='play', songpos=songpos)
+        if songpos is not None:
+            return await self._run_ok("starting playback", 'play', songpos)
+        return await self._run_ok("starting playback", 'play')
+
+    async def pause(self, state: Optional[bool] = None) -> bool:
+        expected_state = 'pause' if (state is None or state) else 'play'
+        self._trigger_callbacks('playback_command', command='pause', expected_state=expected_state, pause_state=state)
+        if state is None:
+            return await self._run_ok("pausing", 'pause')
+        return await self._run_ok("pausing", 'pause', 1 if state else 0)
+
+    async def stop(self) -> bool:
+        self._trigger_callbacks('playback_command', command='stop', expected_state='stop')
+        return await self._run_ok("stopping", 'stop')
+
+    async def next(self) -> bool:
+        return await self._run_ok("skipping to next", 'next')
+
+    async def previous(self) -> bool:
+        return await self._run_ok("skipping to previous", 'previous')
+
+    # Volume
+    async def set_volume(self, volume: int) -> bool:
+        if not 0 <= volume <= 100:
+            logger.error("Error setting volume: Volume must be between 0 and 100")
+            return False
+        return await self._run_ok("setting volume", 'setvol', volume)
+
+    async def get_volume(self) -> Optional[int]:
+        status = await self._run("getting volume", 'status')
+        if status is None:
+            return None
+        try:
+            return int(status.get('volume', 0))
+        except (ValueError, TypeError):
+            return None
+
+    # Status and info
+    async def get_status(self) -> Dict[str, Any]:
+        return await self._run("getting status", 'status', default={})
+
+    async def get_current_song(self) -> Optional[Dict[str, Any]]:
+        return await self._run("getting current song", 'currentsong')
+
+    async def get_status_and_song(self) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        results = await self.command_list([('status',), ('currentsong',)])
+        if results is None or len(results) != 2:
+            return {}, None
+        return results[0] or {}, results[1] or {}
+
+    # Playlist management
+    async def clear_playlist(self) -> bool:
+        if not await self._run_ok("clearing playlist", 'clear'):
+            return False
+        self._trigger_callbacks('playlist_command', command='clear', playlist_name='')
+        return True
+
+    async def load_playlist(self, playlist: str) -> bool:
+        if not await self._run_ok("loading playlist", 'load', playlist):
+            return False
+        self._trigger_callbacks('playlist_command', command='load', playlist_name=playlist)
+        return True
+
+    async def add_to_playlist(self, uri: str) -> bool:
+        if not await self._run_ok("adding to playlist", 'add', uri):
+            return False
+        self._trigger_callbacks('playlist_command', command='load', playlist_name=uri)
+        return True
+
+    async def play_playlist(self, playlist: str) -> bool:
+        self._trigger_callbacks('playback_command', command='play', expected_state='play', songpos=None)
+        if await self.command_list([('clear',), ('load', playlist), ('play',)]) is None:
+            return False
+        self._trigger_callbacks('playlist_command', command='load', playlist_name=playlist)
+        return True
+
+    async def play_uri(self, uri: str) -> bool:
+        self._trigger_callbacks('playback_command', command='play', expected_state='play', songpos=None)
+        if await self.command_list([('clear',), ('add', uri), ('play',)]) is None:
+            return False
+        self._trigger_callbacks('playlist_command', command='load', playlist_name=uri)
+        return True
+
+    async def get_playlist(self) -> List[Dict[str, Any]]:
+        return await self._run("getting playlist", 'playlistinfo', default=[])
+
+    async def get_playlist_window(self, start: int, end: int) -> Optional[List[Dict[str, Any]]]:
+        return await self._run(f"getting playlist window {start}:{end}", 'playlistinfo', f"{start}:{end}")
+
+    async def get_playlist_changes(self, version: int) -> Optional[List[Dict[str, Any]]]:
+        return await self._run(f"getting playlist changes since version {version}", 'plchangesposid', version)
+
+    async def get_all_playlists(self) -> List[Dict[str, Any]]:
+        return await self._run("getting playlists", 'listplaylists', default=[])
+
+    # Music database
+    async def get_directory(self, path: str = '') -> Optional[List[Dict[str, Any]]]:
+        return await self._run(f"listing directory '{path}'", 'lsinfo', path)
+
+    async def list_all_info(self, path: str = '') -> Optional[List[Dict[str, Any]]]:
+        return await self._run(f"listing songs in '{path}'", 'listallinfo', path)
+
+    async def find_modified_since(self, since: str) -> Optional[List[Dict[str, Any]]]:
+        return await self._run(f"finding songs modified since {since}", 'find', 'modified-since', since)
+
+    async def list_files(self) -> Optional[List[str]]:
+        entries = await self._run("listing database files", 'list', 'file')
+        if entries is None:
+            return None
+        return [entry['file'] for entry in entries if 'file' in entry]
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return await self._run("getting stats", 'stats', default={})
+
+
+class _LoopThread:
+    """Event loop running in a daemon thread, shared by a client and its clones."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="mpd-asyncio")
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Schedule a coroutine and return a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+class SyncKitchenRadioClient:
+    """
+    Blocking wrapper around AsyncKitchenRadioClient.
+
+    Exposes the same API as KitchenRadioClient, so it can be used anywhere
+    the threaded client is used (PlaybackController, MPDMonitor).
+    """
+
+    # Method name -> value returned when the call fails or times out
+    _WRAPPED_METHODS = {
+        'play': False, 'pause': False, 'stop': False, 'next': False, 'previous': False,
+        'set_volume': False, 'get_volume': None,
+        'get_status': {}, 'get_current_song': None, 'get_status_and_song': ({}, None),
+        'command_list': None,
+        'clear_playlist': False, 'load_playlist': False, 'add_to_playlist': False,
+        'play_playlist': False, 'play_uri': False,
+        'get_playlist': [], 'get_all_playlists': [],
+        'get_playlist_window': None, 'get_playlist_changes': None,
+        'get_directory': None, 'list_all_info': None, 'find_modified_since': None,
+        'list_files': None, 'get_stats': {},
+    }
+
+    def __init__(self,
+                 host: str = 'localhost',
+                 port: int = 6600,
+                 password: Optional[str] = None,
+                 timeout: int = 10,
+                 pool_size: int = 2,
+                 checkout_timeout: float = 2.0,
+                 keepalive_interval: float = 30.0,
+                 loop_thread: Optional[_LoopThread] = None):
+        """
+        Initialize blocking asyncio-backed client.
+
+        Args:
+            host: MPD server hostname
+            port: MPD server port
+            password: MPD password if required
+            timeout: Per-command timeout in seconds
+            pool_size: Number of pooled connections
+            checkout_timeout: Seconds a command waits for a free connection
+            keepalive_interval: Ping connections idle for this many seconds (0 disables)
+            loop_thread: Event loop thread to share (clones reuse their parent's)
+        """
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.checkout_timeout = checkout_timeout
+        self.keepalive_interval = keepalive_interval
+
+        self._loop_thread = loop_thread or _LoopThread()
+        self.async_client = AsyncKitchenRadioClient(host, port, password, timeout,
+                                                    pool_size=pool_size,
+                                                    checkout_timeout=checkout_timeout,
+                                                    keepalive_interval=keepalive_interval)
+        # Shared so add_callback on the wrapper and the async client are equivalent
+        self.callbacks = self.async_client.callbacks
+
+        logger.info(f"KitchenRadio asyncio MPD client initialized for {host}:{port} ({pool_size} connections)")
+
+    def __getattr__(self, name: str):
+        if name in SyncKitchenRadioClient._WRAPPED_METHODS:
+            default = SyncKitchenRadioClient._WRAPPED_METHODS[name]
+            method = getattr(self.async_client, name)
+
+            def wrapper(*args, **kwargs):
+                return self._call(name, default, method(*args, **kwargs))
+            wrapper.__name__ = name
+            return wrapper
+        raise AttributeError(name)
+
+    def _call(self, name: str, default: Any, coro) -> Any:
+        """Run a coroutine on the loop and wait for it (bounded by checkout + command timeout)."""
+        future = self._loop_thread.submit(coro)
+        try:
+            return future.result(timeout=self.checkout_timeout + self.timeout + 1)
+        except Exception as e:
+            future.cancel()
+            logger.error(f"Error in {name}: {e!r}")
+            return default
+
+    def clone(self) -> 'SyncKitchenRadioClient':
+        """Create a client with one dedicated connection, sharing this client's event loop."""
+        return SyncKitchenRadioClient(self.host, self.port, self.password, self.timeout,
+                                      pool_size=1,
+                                      checkout_timeout=self.checkout_timeout,
+                                      keepalive_interval=self.keepalive_interval,
+                                      loop_thread=self._loop_thread)
+
+    def connect(self) -> bool:
+        return self._call('connect', False, self.async_client.connect())
+
+    def disconnect(self):
+        self._call('disconnect', None, self.async_client.disconnect())
+
+    def is_connected(self) -> bool:
+        return self.async_client.is_connected()
+
+    def add_callback(self, event: str, callback: Callable):
+        self.async_client.add_callback(event, callback)
+
+    def check_connection_error(self, error: Exception):
+        """Kept for API compatibility - the async client tracks connection state itself."""
+        self.async_client._handle_error("running command", error)
+
+    def wait_for_changes(self, subsystems: Sequence[str], stop_event: threading.Event,
+                         wake_interval: float = 0.5) -> Optional[List[str]]:
+        """
+        Block in MPD idle until one of the subsystems changes.
+
+        The idle coroutine is cancelled when stop_event is set, which sends
+        noidle and keeps the connection usable. Returns only once that has
+        finished (or IDLE_CANCEL_TIMEOUT passed), so a following disconnect()
+        does not race the drain.
+
+        Returns:
+            List of changed subsystems, empty list if stopped, None on error
+        """
+        idle_done = threading.Event()
+
+        async def idle():
+            try:
+                return await self.async_client.idle(subsystems)
+            finally:
+                idle_done.set()
+
+        future = self._loop_thread.submit(idle())
+        while not stop_event.is_set():
+            try:
+                return future.result(timeout=wake_interval)
+            except FutureTimeoutError:
+                continue
+            except Exception as e:
+                logger.error(f"Error waiting for MPD changes: {e!r}")
+                return None
+        # The future reports cancelled at once - the task still has to leave idle
+        future.cancel()
+        if not idle_done.wait(IDLE_CANCEL_TIMEOUT):
+            logger.warning("Timed out waiting for MPD idle to be cancelled")
+        return []
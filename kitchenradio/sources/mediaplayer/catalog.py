@@ -0,0 +1,127 @@
+"""
+Playlist Catalog - Cached list of MPD stored playlists
+"""
+
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PlaylistEntry:
+    """
+    Stored playlist with a stable id.
+    """
+    id: str
+    name: str
+
+
+def playlist_id(name: str) -> str:
+    """
+    Stable id for a playlist name.
+
+    Derived from the name, so ids survive refreshes, reordering and
+    playlists being added or removed around them.
+    """
+    return 'playlist_' + hashlib.sha1(name.encode('utf-8')).hexdigest()[:10]
+
+
+class PlaylistCatalog:
+    """
+    Cache of stored playlist names for menu navigation.
+
+    The catalog is loaded once and then only refreshed in the background,
+    when MPD reports a stored_playlist change (invalidate()) or the TTL
+    expires. Readers always get the cached entries immediately, so menu
+    navigation never waits for the network.
+    """
+
+    def __init__(self, client, ttl: float = 300.0):
+        """
+        Initialize catalog.
+
+        Args:
+            client: KitchenRadio client used to list playlists
+            ttl: Seconds before cached entries are refreshed (0 disables the TTL)
+        """
+        self.client = client
+        self.ttl = ttl
+
+        # Immutable snapshot, replaced atomically on refresh
+        self._entries: Tuple[PlaylistEntry, ...] = ()
+        self._names_by_id: Dict[str, str] = {}
+        self._loaded_at: Optional[float] = None
+        self.version = 0
+
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def get_entries(self) -> Tuple[PlaylistEntry, ...]:
+        """
+        Get cached playlists, sorted by name.
+
+        Only the very first call loads synchronously; afterwards an expired
+        catalog is returned as-is while a background refresh runs.
+
+        Returns:
+            Tuple of PlaylistEntry
+        """
+        if self._loaded_at is None:
+            self.refresh()
+        elif self.ttl > 0 and time.monotonic() - self._loaded_at > self.ttl:
+            self.refresh_async()
+        return self._entries
+
+    def get_names(self) -> List[str]:
+        """Get cached playlist names, sorted alphabetically."""
+        return [entry.name for entry in self.get_entries()]
+
+    def get_name(self, entry_id: str) -> Optional[str]:
+        """
+        Look up a playlist name by id (O(1), never touches the network).
+
+        Returns:
+            Playlist name or None if unknown
+        """
+        return self._names_by_id.get(entry_id)
+
+    def invalidate(self, **kwargs):
+        """Stored playlists changed - refresh in the background."""
+        logger.debug("Stored playlists changed, refreshing catalog")
+        self.refresh_async()
+
+    def refresh(self) -> bool:
+        """
+        Reload playlists from MPD (blocking).
+
+        Returns:
+            True if the catalog was reloaded
+        """
+        with self._lock:
+            playlists_data = self.client.get_all_playlists()
+            if not playlists_data and not self.client.is_connected():
+                # Keep the old catalog when MPD is unreachable
+                return False
+
+            names = sorted(playlist['playlist'] for playlist in playlists_data if 'playlist' in playlist)
+            entries = tuple(PlaylistEntry(playlist_id(name), name) for name in names)
+
+            self._names_by_id = {entry.id: entry.name for entry in entries}
+            self._entries = entries
+            self._loaded_at = time.monotonic()
+            self.version += 1
+
+        logger.info(f"📋 Playlist catalog loaded: {len(entries)} playlists")
+        return True
+
+    def refresh_async(self):
+        """Reload playlists in a background thread (no-op if one is running)."""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(target=self.refresh, daemon=True)
+        self._refresh_thread.start()
@@ -4,8 +4,10 @@ KitchenRadio Client - Main client class for MPD interaction
 
 import logging
 import mpd
+import select
 import threading
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Sequence, Tuple
+from .pool import MPDConnectionPool, is_connection_error
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -15,10 +17,13 @@ class KitchenRadioClient:
     """
     Thread-safe MPD client with KitchenRadio-specific functionality.
     
-    This client uses threading locks to ensure safe concurrent access from multiple threads:
-    - Command lock: Protects all MPD command operations
+    Commands run on a small pool of MPD connections to allow safe concurrent access:
+    - Each command checks out its own connection (with its own lock), so a slow
+      command never blocks an unrelated one
+    - Broken sockets are replaced on the next checkout, idle ones are kept alive
     - Connection lock: Protects connection state management
-    - Separate client_status for idle operations to avoid blocking regular commands
+    - The monitor uses a clone() of this client, so it never shares a socket
+      with interactive commands
     
     All public methods are thread-safe and can be called from multiple threads simultaneously.
     """
@@ -27,7 +32,10 @@ class KitchenRadioClient:
                  host: str = 'localhost',
                  port: int = 6600,  # MPD default port
                  password: Optional[str] = None,
-                 timeout: int = 10):
+                 timeout: int = 10,
+                 pool_size: int = 2,
+                 checkout_timeout: float = 2.0,
+                 keepalive_interval: float = 30.0):
         """
         Initialize KitchenRadio MPD client.
         
@@ -36,76 +44,81 @@ class KitchenRadioClient:
             port: MPD server port (default 6600)
             password: MPD password if required
             timeout: Connection timeout in seconds
+            pool_size: Number of pooled MPD connections
+            checkout_timeout: Seconds a command waits for a free connection
+            keepalive_interval: Ping connections idle for this many seconds (0 disables)
         """
         self.host = host
         self.port = port
         self.password = password
         self.timeout = timeout
+        self.checkout_timeout = checkout_timeout
+        self.keepalive_interval = keepalive_interval
         self._connected = False
         
         # Event callbacks for command events (notifying monitor of expected changes)
         self.callbacks = {}
         
-        # Thread safety locks
-        self._command_lock = threading.RLock()  # Reentrant lock for nested calls
+        # Thread safety lock for connection state
         self._connection_lock = threading.RLock()
         
-        # Create MPD client (single connection for polling)
-        self.client = mpd.MPDClient()
-        self.client.timeout = timeout
+        # Pool of MPD connections (each with its own lock)
+        self._pool = MPDConnectionPool(host, port, password, timeout,
+                                       size=pool_size,
+                                       checkout_timeout=checkout_timeout,
+                                       keepalive_interval=keepalive_interval)
         
-        logger.info(f"KitchenRadio MPD client initialized for {host}:{port}")
+        logger.info(f"KitchenRadio MPD client initialized for {host}:{port} ({pool_size} connections)")
+    
+    def clone(self) -> 'KitchenRadioClient':
+        """
+        Create a new client with the same connection settings.
+        
+        The clone owns a single dedicated socket, so it can block (e.g. in
+        idle) without holding up commands sent through this client.
+        
+        Returns:
+            New, not yet connected KitchenRadioClient
+        """
+        return KitchenRadioClient(self.host, self.port, self.password, self.timeout,
+                                  pool_size=1,
+                                  checkout_timeout=self.checkout_timeout,
+                                  keepalive_interval=self.keepalive_interval)
     
     def connect(self) -> bool:
         """
         Connect to MPD server (thread-safe).
         
+        Opens the pooled connections; connections that fail now are
+        retried on checkout.
+        
         Returns:
             True if connected successfully
         """
         with self._connection_lock:
-            try:
-                logger.info(f"Connecting to MPD at {self.host}:{self.port}")
-                self.client.connect(self.host, self.port)
-                
-                if self.password:
-                    self.client.password(self.password)
-                
+            logger.info(f"Connecting to MPD at {self.host}:{self.port}")
+            if self._pool.open():
                 self._connected = True
                 logger.info("Connected to MPD successfully")
                 return True
-                
-            except Exception as e:
-                logger.error(f"Failed to connect to MPD: {e}")
-                if(e.args and isinstance(e.args[0], str) and "Already connected" in e.args[0]):
-                    logger.error("Already Connected to MPD")
-                    return True
-                self._connected = False
-                return False
+            
+            logger.error(f"Failed to connect to MPD at {self.host}:{self.port}")
+            self._connected = False
+            return False
     
     def disconnect(self):
         """Disconnect from MPD server (thread-safe)."""
         with self._connection_lock:
-            if not self._connected:
-                logger.debug("Already disconnected from MPD")
-                return
-                
-            try:
+            if self._connected:
                 logger.info("Disconnecting from MPD")
+            else:
+                logger.debug("Already disconnected from MPD, closing remaining sockets")
+            
+            try:
                 self._connected = False  # Set this FIRST to prevent reconnect attempts
                 
-                # Close the client connection
-                try:
-                    self.client.close()
-                except Exception as e:
-                    logger.debug(f"Error closing MPD client: {e}")
-                
-                # Disconnect the client
-                try:
-                    self.client.disconnect()
-                except Exception as e:
-                    logger.debug(f"Error disconnecting MPD client: {e}")
-                    
+                # Always close the pool - it also stops the keepalive thread
+                self._pool.close()
                 logger.info("Disconnected from MPD successfully")
                 
             except Exception as e:
@@ -117,7 +130,7 @@ class KitchenRadioClient:
         Add callback for command events.
         
         Args:
-            event: Event name ('command_sent', 'volume_command', 'playback_command', etc.)
+            event: Event name ('command_sent', 'playback_command', etc.)
             callback: Callback function
         """
         if event not in self.callbacks:
@@ -135,206 +148,351 @@ class KitchenRadioClient:
                     logger.error(f"Error in client callback for {event}: {e}")
     
     def is_connected(self) -> bool:
-        """Check if connected to MPD server (thread-safe)."""
+        """
+        Check if connected to MPD server (thread-safe).
+        
+        True while connected (connect() succeeded, no disconnect()) and the
+        last pooled command reached MPD - a transient socket error clears
+        it until the pool's reopened socket works again.
+        """
         with self._connection_lock:
-            return self._connected
+            return self._connected and self._pool.healthy
     
     # Playback control methods
     def play(self, songpos: Optional[int] = None) -> bool:
         """Start playback from current or specified position (thread-safe)."""
-        with self._command_lock:
-            try:
+        try:
+            with self._pool.connection() as client:
                 # Emit event BEFORE sending command so monitor knows expected state
                 self._trigger_callbacks('playback_command', command='play', expected_state='play', songpos=songpos)
                 
                 if songpos is not None:
-                    self.client.play(songpos)
+                    client.play(songpos)
                 else:
-                    self.client.play()
+                    client.play()
                 return True
-            except Exception as e:
-                logger.error(f"Error starting playback: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error starting playback: {e}")
+            self.check_connection_error(e)
+            return False
     
     def pause(self, state: Optional[bool] = None) -> bool:
         """Pause or unpause playback (thread-safe)."""
-        with self._command_lock:
-            try:
+        try:
+            with self._pool.connection() as client:
                 # Emit event BEFORE sending command
                 expected_state = 'pause' if (state is None or state) else 'play'
                 self._trigger_callbacks('playback_command', command='pause', expected_state=expected_state, pause_state=state)
                 
                 if state is None:
-                    self.client.pause()
+                    client.pause()
                 else:
-                    self.client.pause(1 if state else 0)
+                    client.pause(1 if state else 0)
                 return True
-            except Exception as e:
-                logger.error(f"Error pausing: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error pausing: {e}")
+            self.check_connection_error(e)
+            return False
     
     def stop(self) -> bool:
         """Stop playback (thread-safe)."""
-        with self._command_lock:
-            try:
+        try:
+            with self._pool.connection() as client:
                 # Emit event BEFORE sending command
                 self._trigger_callbacks('playback_command', command='stop', expected_state='stop')
                 
-                self.client.stop()
+                client.stop()
                 return True
-            except Exception as e:
-                logger.error(f"Error stopping: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error stopping: {e}")
+            self.check_connection_error(e)
+            return False
     
     def next(self) -> bool:
         """Skip to next track (thread-safe)."""
-        with self._command_lock:
-            try:
-                self.client.next()
+        try:
+            with self._pool.connection() as client:
+                client.next()
                 return True
-            except Exception as e:
-                logger.error(f"Error skipping to next: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error skipping to next: {e}")
+            self.check_connection_error(e)
+            return False
     
     def previous(self) -> bool:
         """Skip to previous track (thread-safe)."""
-        with self._command_lock:
-            try:
-                self.client.previous()
+        try:
+            with self._pool.connection() as client:
+                client.previous()
                 return True
-            except Exception as e:
-                logger.error(f"Error skipping to previous: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error skipping to previous: {e}")
+            self.check_connection_error(e)
+            return False
     
     # Volume control
     def set_volume(self, volume: int) -> bool:
         """Set volume (0-100) (thread-safe)."""
-        with self._command_lock:
-            try:
+        try:
+            with self._pool.connection() as client:
                 if not 0 <= volume <= 100:
                     raise ValueError("Volume must be between 0 and 100")
                 
-                # Emit event BEFORE sending command so monitor knows expected volume
-                self._trigger_callbacks('volume_command', command='set_volume', expected_volume=volume)
-                
-                self.client.setvol(volume)
+                client.setvol(volume)
                 return True
-            except Exception as e:
-                logger.error(f"Error setting volume: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error setting volume: {e}")
+            self.check_connection_error(e)
+            return False
     
     def get_volume(self) -> Optional[int]:
         """Get current volume (thread-safe)."""
-        with self._command_lock:
-            try:
-                status = self.client.status()
+        try:
+            with self._pool.connection() as client:
+                status = client.status()
                 return int(status.get('volume', 0))
-            except Exception as e:
-                logger.error(f"Error getting volume: {e}")
-                self.check_connection_error(e)
-                return None
+        except Exception as e:
+            logger.error(f"Error getting volume: {e}")
+            self.check_connection_error(e)
+            return None
     
     # Status and info
     def get_status(self) -> Dict[str, Any]:
         """Get player status (thread-safe)."""
-        with self._command_lock:
-            try:
-                status = dict(self.client.status())
+        try:
+            with self._pool.connection() as client:
+                status = dict(client.status())
                 logger.debug(f"[MDP] Got status: {status}")
                 return status
-            except Exception as e:
-                logger.error(f"Error getting status: {e}")
-                self.check_connection_error(e)
-                return {}
+        except Exception as e:
+            logger.error(f"Error getting status: {e}")
+            self.check_connection_error(e)
+            return {}
+        
+    
+    def wait_for_changes(self, subsystems: Sequence[str], stop_event: threading.Event,
+                         wake_interval: float = 0.5) -> Optional[List[str]]:
+        """
+        Block in MPD idle until one of the subsystems changes (thread-safe).
+        
+        The connection is parked in idle with send_idle() and watched with
+        select(), so the stop event is honoured every wake_interval seconds.
+        When stopping, idle is cancelled with noidle so the connection stays
+        usable.
+        
+        Args:
+            subsystems: MPD idle subsystems to watch ('player', 'mixer', ...)
+            stop_event: Event that cancels the wait when set
+            wake_interval: Seconds between stop event checks
+            
+        Returns:
+            List of changed subsystems, empty list if stopped, None on error
+        """
+        try:
+            with self._pool.connection() as client:
+                client.send_idle(*subsystems)
+                while not stop_event.is_set():
+                    readable, _, _ = select.select([client], [], [], wake_interval)
+                    if readable:
+                        return list(client.fetch_idle())
+                
+                # Stopping - leave idle mode cleanly
+                client.noidle()
+                return []
+        except Exception as e:
+            logger.error(f"Error waiting for MPD changes: {e}")
+            self.check_connection_error(e)
+            return None
+    
+    # Command lists (batched round trips)
+    def command_list(self, commands: Sequence[Tuple[Any, ...]]) -> Optional[List[Any]]:
+        """
+        Send several commands as a single MPD command list (thread-safe).
+        
+        The commands are wrapped in command_list_ok_begin/command_list_end,
+        so MPD answers them all at once: one round trip instead of one per
+        command. MPD stops at the first failing command.
+        
+        Args:
+            commands: Tuples of (command_name, *args), e.g. [('clear',), ('load', 'Jazz')]
+            
+        Returns:
+            List with one result per command, or None on error
+        """
+        # Validate before entering command list mode so we never leave a half-sent list
+        for command in commands:
+            if not command or not hasattr(mpd.MPDClient, command[0]):
+                logger.error(f"Unknown MPD command in command list: {command}")
+                return None
         
+        try:
+            with self._pool.connection() as client:
+                client.command_list_ok_begin()
+                for command in commands:
+                    getattr(client, command[0])(*command[1:])
+                return list(client.command_list_end())
+        except Exception as e:
+            logger.error(f"Error executing command list {[c[0] for c in commands]}: {e}")
+            self.check_connection_error(e)
+            return None
+    
+    def get_status_and_song(self) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Get player status and current song in one round trip (thread-safe).
+        
+        Returns:
+            Tuple of (status dict, song dict); ({}, None) on error
+        """
+        results = self.command_list([('status',), ('currentsong',)])
+        if results is None or len(results) != 2:
+            return {}, None
+        status, song = results
+        return dict(status or {}), dict(song or {})
+    
+    def play_playlist(self, playlist: str) -> bool:
+        """
+        Replace the queue with a stored playlist and start playing (thread-safe).
+        
+        Sends clear, load and play as one command list.
+        
+        Args:
+            playlist: Stored playlist name
+            
+        Returns:
+            True if successful
+        """
+        self._trigger_callbacks('playback_command', command='play', expected_state='play', songpos=None)
+        if self.command_list([('clear',), ('load', playlist), ('play',)]) is None:
+            return False
+        
+        self._trigger_callbacks('playlist_command', command='load', playlist_name=playlist)
+        logger.info(f"🎵 Playlist '{playlist}' loaded and playing, notifying monitor")
+        return True
+    
+    def play_uri(self, uri: str) -> bool:
+        """
+        Replace the queue with a single URI and start playing (thread-safe).
+        
+        Sends clear, add and play as one command list.
+        
+        Args:
+            uri: URI to play (file or stream)
+            
+        Returns:
+            True if successful
+        """
+        self._trigger_callbacks('playback_command', command='play', expected_state='play', songpos=None)
+        if self.command_list([('clear',), ('add', uri), ('play',)]) is None:
+            return False
+        
+        #for streaming show the uri instead of the playlist name
+        self._trigger_callbacks('playlist_command', command='load', playlist_name=uri)
+        return True
     
     def check_connection_error(self, error: Exception):
-        """Check if error indicates a lost connection and update state (thread-safe)."""
-        with self._connection_lock:
-            if isinstance(error, (mpd.ConnectionError, mpd.CommandError)):
-                logger.warning("MPD connection lost")
-            try:
-                self.client.disconnect()
-            except:
-                logger.warning("Already Disconnected")
-
-            try:
-                self.client_status.disconnect()
-            except:
-                logger.warning("Already Disconnected")
-       
-            self._connected = False
+        """Log a lost connection (the pool tracks health for is_connected())."""
+        # MPD command errors (ACK) and pool checkout timeouts leave the connections intact;
+        # the pool has already discarded a broken socket and reopens it on next checkout
+        if is_connection_error(error):
+            logger.warning("MPD connection lost - reopening on next command")
     
     def get_current_song(self) -> Optional[Dict[str, Any]]:
         """Get current song info (thread-safe)."""
-        with self._command_lock:
-            try:
-                return dict(self.client.currentsong())
-            except Exception as e:
-                import traceback
-                logger.error(f"Error getting current song: {e}")
-                logger.error(f"Call stack:\n{''.join(traceback.format_stack())}")
-                self.check_connection_error(e)
-                return None
+        try:
+            with self._pool.connection() as client:
+                return dict(client.currentsong())
+        except Exception as e:
+            import traceback
+            logger.error(f"Error getting current song: {e}")
+            logger.error(f"Call stack:\n{''.join(traceback.format_stack())}")
+            self.check_connection_error(e)
+            return None
     
     # Playlist management
     def clear_playlist(self) -> bool:
         """Clear the current playlist (thread-safe)."""
-        with self._command_lock:
-            try:
-                self.client.clear()
+        try:
+            with self._pool.connection() as client:
+                client.clear()
                 # Trigger callback to notify monitor that playlist was cleared
                 self._trigger_callbacks('playlist_command', command='clear', playlist_name='')
                 logger.info("🎵 Playlist cleared, notifying monitor")
                 return True
-            except Exception as e:
-                logger.error(f"Error clearing playlist: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error clearing playlist: {e}")
+            self.check_connection_error(e)
+            return False
     
     def load_playlist(self, playlist: str) -> bool:
         """Load the playlist (thread-safe)."""
-        with self._command_lock:
-            try:
-                self.client.load(playlist)
+        try:
+            with self._pool.connection() as client:
+                client.load(playlist)
                 # Trigger callback to notify monitor of the loaded playlist
                 self._trigger_callbacks('playlist_command', command='load', playlist_name=playlist)
                 logger.info(f"🎵 Playlist '{playlist}' loaded, notifying monitor")
                 return True
-            except Exception as e:
-                logger.error(f"Error loading playlist: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error loading playlist: {e}")
+            self.check_connection_error(e)
+            return False
 
     def add_to_playlist(self, uri: str) -> bool:
         """Add URI to playlist (thread-safe)."""
-        with self._command_lock:
-            try:
-                self.client.add(uri)
+        try:
+            with self._pool.connection() as client:
+                client.add(uri)
                 #for streaming show the uri instead of the playlist name
                 playlist = uri
                 self._trigger_callbacks('playlist_command', command='load', playlist_name=playlist)
                 return True
-            except Exception as e:
-                logger.error(f"Error adding to playlist: {e}")
-                self.check_connection_error(e)
-                return False
+        except Exception as e:
+            logger.error(f"Error adding to playlist: {e}")
+            self.check_connection_error(e)
+            return False
     
     def get_playlist(self) -> List[Dict[str, Any]]:
         """Get current playlist (thread-safe)."""
-        with self._command_lock:
-            try:
-                return [dict(song) for song in self.client.playlistinfo()]
-            except Exception as e:
-                logger.error(f"Error getting playlist: {e}")
-                self.check_connection_error(e)
-                return []
+        try:
+            with self._pool.connection() as client:
+                return [dict(song) for song in client.playlistinfo()]
+        except Exception as e:
+            logger.error(f"Error getting playlist: {e}")
+            self.check_connection_error(e)
+            return []
+    
+    def get_playlist_window(self, start: int, end: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get queue entries start..end-1 with playlistinfo START:END (thread-safe).
+        
+        Returns:
+            List of song dicts (with 'pos' and 'id'), or None on error
+        """
+        try:
+            with self._pool.connection() as client:
+                return [dict(song) for song in client.playlistinfo(f"{start}:{end}")]
+        except Exception as e:
+            logger.error(f"Error getting playlist window {start}:{end}: {e}")
+            self.check_connection_error(e)
+            return None
+    
+    def get_playlist_changes(self, version: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get queue positions changed since a queue version with plchangesposid (thread-safe).
+        
+        Args:
+            version: Queue version ('playlist' in status) to diff against
+        
+        Returns:
+            List of {'cpos', 'id'} dicts, or None on error
+        """
+        try:
+            with self._pool.connection() as client:
+                return [dict(change) for change in client.plchangesposid(version)]
+        except Exception as e:
+            logger.error(f"Error getting playlist changes since version {version}: {e}")
+            self.check_connection_error(e)
+            return None
     
     def get_all_playlists(self) -> List[Dict[str, Any]]:
         """
@@ -344,10 +502,85 @@ class KitchenRadioClient:
             List of playlist dicts with 'playlist' and 'last-modified' keys
             Note: Controller layer strips metadata and returns just names
         """
-        with self._command_lock:
-            try:
-                return [dict(playlist) for playlist in self.client.listplaylists()]
-            except Exception as e:
-                logger.error(f"Error getting playlists: {e}")
-                self.check_connection_error(e)
-                return []
+        try:
+            with self._pool.connection() as client:
+                return [dict(playlist) for playlist in client.listplaylists()]
+        except Exception as e:
+            logger.error(f"Error getting playlists: {e}")
+            self.check_connection_error(e)
+            return []
+    
+    # Music database
+    def get_directory(self, path: str = '') -> Optional[List[Dict[str, Any]]]:
+        """
+        List one database directory (thread-safe).
+        
+        Returns:
+            List of entry dicts ('directory', 'file' or 'playlist' keyed), or None on error
+        """
+        try:
+            with self._pool.connection() as client:
+                return [dict(entry) for entry in client.lsinfo(path)]
+        except Exception as e:
+            logger.error(f"Error listing directory '{path}': {e}")
+            self.check_connection_error(e)
+            return None
+    
+    def list_all_info(self, path: str = '') -> Optional[List[Dict[str, Any]]]:
+        """
+        Get all songs (with tags) below a database directory (thread-safe).
+        
+        Returns:
+            List of entry dicts, or None on error
+        """
+        try:
+            with self._pool.connection() as client:
+                return [dict(entry) for entry in client.listallinfo(path)]
+        except Exception as e:
+            logger.error(f"Error listing songs in '{path}': {e}")
+            self.check_connection_error(e)
+            return None
+    
+    def find_modified_since(self, since: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get songs added or changed since a timestamp (thread-safe).
+        
+        Args:
+            since: ISO 8601 timestamp or UNIX time
+        
+        Returns:
+            List of song dicts, or None on error
+        """
+        try:
+            with self._pool.connection() as client:
+                return [dict(song) for song in client.find('modified-since', since)]
+        except Exception as e:
+            logger.error(f"Error finding songs modified since {since}: {e}")
+            self.check_connection_error(e)
+            return None
+    
+    def list_files(self) -> Optional[List[str]]:
+        """
+        Get the URI of every song in the database (thread-safe).
+        
+        Returns:
+            List of file URIs, or None on error
+        """
+        try:
+            with self._pool.connection() as client:
+                return [entry['file'] if isinstance(entry, dict) else entry
+                        for entry in client.list('file')]
+        except Exception as e:
+            logger.error(f"Error listing database files: {e}")
+            self.check_connection_error(e)
+            return None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get database statistics (thread-safe)."""
+        try:
+            with self._pool.connection() as client:
+                return dict(client.stats())
+        except Exception as e:
+            logger.error(f"Error getting stats: {e}")
+            self.check_connection_error(e)
+            return {}
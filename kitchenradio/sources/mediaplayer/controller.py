@@ -5,7 +5,11 @@ Playback Controller - Control MPD playback
 import logging
 from typing import Optional, List, Dict, Any
 from .client import KitchenRadioClient
+from .async_client import SyncKitchenRadioClient
 from .monitor import MPDMonitor
+from .catalog import PlaylistCatalog
+from .library import LibraryIndex
+from .queue import QueueMirror
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +19,14 @@ class PlaybackController:
     Control MPD playback operations.
     """
     
-    def __init__(self, host: str = "localhost", port: int = 6600, password: Optional[str] = None, timeout: int = 10):
+    def __init__(self, host: str = "localhost", port: int = 6600, password: Optional[str] = None, timeout: int = 10,
+                 backend: str = 'threaded',
+                 pool_size: int = 2, checkout_timeout: float = 2.0, keepalive_interval: float = 30.0,
+                 monitor_use_idle: bool = True, monitor_poll_interval: float = 0.5,
+                 monitor_standby_poll_interval: float = 5.0,
+                 playlist_cache_ttl: float = 300.0,
+                 library_check_interval: float = 60.0,
+                 queue_cache_size: int = 500):
         """
         Initialize controller with MPD connection details.
         
@@ -24,13 +35,49 @@ class PlaybackController:
             port: MPD port
             password: MPD password
             timeout: Connection timeout
-        """
-        self.client = KitchenRadioClient(host, port, password, timeout)
-        self.monitor = MPDMonitor(self.client)
+            backend: MPD client backend - 'threaded' or 'asyncio'
+            pool_size: Number of pooled MPD connections for commands
+            checkout_timeout: Seconds a command waits for a free connection
+            keepalive_interval: Ping idle connections after this many seconds
+            monitor_use_idle: Monitor MPD with idle notifications instead of polling
+            monitor_poll_interval: Monitor poll interval when polling
+            monitor_standby_poll_interval: Monitor poll interval when polling in standby
+            playlist_cache_ttl: Seconds before the stored playlist catalog is refreshed
+            library_check_interval: Min seconds between library update checks
+                                    while MPD idle events are not received
+            queue_cache_size: Max queue entries kept by the queue mirror
+        """
+        client_class = SyncKitchenRadioClient if backend == 'asyncio' else KitchenRadioClient
+        self.client = client_class(host, port, password, timeout,
+                                   pool_size=pool_size,
+                                   checkout_timeout=checkout_timeout,
+                                   keepalive_interval=keepalive_interval)
+        self.monitor = MPDMonitor(self.client, use_idle=monitor_use_idle, poll_interval=monitor_poll_interval,
+                                  standby_poll_interval=monitor_standby_poll_interval)
+        
+        # Stored playlists are cached for the menu and refreshed on MPD stored_playlist events
+        self.playlists = PlaylistCatalog(self.client, ttl=playlist_cache_ttl)
+        self.monitor.add_callback('stored_playlists_changed', self.playlists.invalidate)
+        
+        # Local search/browse index, updated incrementally on MPD database events
+        self.library = LibraryIndex(self.client, check_interval=library_check_interval)
+        self.monitor.add_callback('database_changed', self.library.invalidate)
+        
+        # Windowed queue view, patched from plchangesposid diffs
+        self.queue = QueueMirror(self.client, cache_size=queue_cache_size)
+        self.monitor.add_callback('queue_changed', self.queue.on_queue_changed)
+        self.monitor.add_callback('database_changed', self.queue.invalidate_songs)
 
     def connect(self) -> bool:
         """Connect to MPD server"""
-        return self.client.connect()
+        if not self.client.connect():
+            return False
+        
+        # Warm the playlist catalog so the first menu press doesn't wait for MPD
+        self.playlists.refresh_async()
+        # Build (or catch up) the library index in the background
+        self.library.update_async()
+        return True
     
     def play(self, uri: Optional[str] = None) -> bool:
         """
@@ -43,11 +90,8 @@ class PlaybackController:
             True if successful
         """
         if uri:
-            # Clear playlist and add new URI
-            if not self.client.clear_playlist():
-                return False
-            if not self.client.add_to_playlist(uri):
-                return False
+            # Clear playlist, add new URI and play in one round trip
+            return self.client.play_uri(uri)
         
         return self.client.play()
 
@@ -56,17 +100,14 @@ class PlaybackController:
         Start playback.
         
         Args:
-            uri: URI to play (if None, resume current)
+            playlist: Stored playlist to play (if None, resume current)
             
         Returns:
             True if successful
         """
         if playlist:
-            # Clear playlist and add new URI
-            if not self.client.clear_playlist():
-                return False
-            if not self.client.load_playlist(playlist):
-                return False
+            # Clear playlist, load stored playlist and play in one round trip
+            return self.client.play_playlist(playlist)
         
         return self.client.play()
     
@@ -250,17 +291,32 @@ class PlaybackController:
         """
         return self.client.get_playlist()
     
+    def get_queue_window(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Get queue entries start..end-1 without loading the whole queue.
+        
+        Returns:
+            List of song dicts (with 'pos' and 'id')
+        """
+        return self.queue.get_window(start, end)
+    
+    def get_queue_around_current(self, before: int = 2, after: int = 10) -> Dict[str, Any]:
+        """
+        Get the queue around the current song ("up next").
+        
+        Returns:
+            Dict with current_pos, length and songs
+        """
+        return self.queue.get_around_current(before, after)
+    
     def get_playlists(self) -> List[str]:
         """
-        Get all stored playlist names.
+        Get all stored playlist names (from the cached catalog).
         
         Returns:
-            List of playlist names (strings)
+            List of playlist names (strings), sorted alphabetically
         """
-        playlists_data = self.client.get_all_playlists()
-        # Extract just the playlist names from the metadata and sort alphabetically
-        names = [playlist.get('playlist', '') for playlist in playlists_data if 'playlist' in playlist]
-        return sorted(names)
+        return self.playlists.get_names()
     
 
     # def get_current_song(self) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,422 @@
+"""
+Library Index - Local search and browse index of the MPD music database
+"""
+
+import time
+import heapq
+import bisect
+import logging
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Set, Iterable, Any
+
+logger = logging.getLogger(__name__)
+
+# Placeholder names for songs without the tag
+UNKNOWN_ARTIST = "Unknown Artist"
+UNKNOWN_ALBUM = "Unknown Album"
+
+
+@dataclass(frozen=True)
+class LibraryTrack:
+    """
+    One song in the MPD database.
+    """
+    file: str
+    title: str
+    artist: str
+    album: str
+    album_artist: str
+    track: int = 0
+    disc: int = 0
+    last_modified: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            'file': self.file,
+            'title': self.title,
+            'artist': self.artist,
+            'album': self.album,
+            'album_artist': self.album_artist,
+            'track': self.track,
+        }
+
+
+def _tag(song: Dict[str, Any], key: str) -> str:
+    """Get a tag as a string (MPD repeats multi-value tags; use the first)."""
+    value = song.get(key, '')
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    return str(value).strip()
+
+
+def _number(value: str) -> int:
+    """Parse track/disc numbers like '3' or '3/12'."""
+    try:
+        return int(value.split('/')[0])
+    except (ValueError, AttributeError):
+        return 0
+
+
+def track_from_song(song: Dict[str, Any]) -> LibraryTrack:
+    """Build a LibraryTrack from an MPD song dict."""
+    file = song['file']
+    artist = _tag(song, 'artist') or UNKNOWN_ARTIST
+    return LibraryTrack(
+        file=file,
+        title=_tag(song, 'title') or file.rsplit('/', 1)[-1],
+        artist=artist,
+        album=_tag(song, 'album') or UNKNOWN_ALBUM,
+        album_artist=_tag(song, 'albumartist') or artist,
+        track=_number(_tag(song, 'track')),
+        disc=_number(_tag(song, 'disc')),
+        last_modified=_tag(song, 'last-modified'),
+    )
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search tokens with accents removed.
+
+    'Beyoncé - Halo (Live)' -> ['beyonce', 'halo', 'live']
+    """
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(ch if ch.isalnum() else ' ' for ch in text if not unicodedata.combining(ch))
+    return text.split()
+
+
+class LibraryIndex:
+    """
+    In-memory index of the MPD database for search and browse.
+
+    - Inverted index: token -> file URIs, with a sorted token list so every
+      query word matches as a prefix via bisect ('beat' finds 'beatles')
+    - Browse maps: album artist -> albums -> file URIs
+    - Built once with listallinfo (per top-level directory, so a large
+      library never exceeds MPD's output buffer), then updated incrementally
+      on MPD 'database' changes: only songs modified since the newest known
+      song are fetched; the file list (to detect removals) is only read
+      when MPD's song count does not add up
+
+    Queries never touch the network.
+    """
+
+    def __init__(self, client, check_interval: float = 60.0):
+        """
+        Initialize library index.
+
+        Args:
+            client: KitchenRadio client used to read the database
+            check_interval: Min seconds between database update checks made
+                            by check_for_updates_async() (0 disables them)
+        """
+        self.client = client
+        self.check_interval = check_interval
+
+        self._tracks: Dict[str, LibraryTrack] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._tokens: List[str] = []  # Sorted keys of _postings
+        self._albums: Dict[str, Dict[str, Set[str]]] = {}  # album artist -> album -> files
+        self._sort_keys: Dict[str, tuple] = {}  # file -> precomputed result order
+
+        self._newest_modified = ""
+        self._db_update: Optional[str] = None
+        self._loaded = False
+        self._last_check = 0.0
+        self.version = 0
+
+        self._lock = threading.RLock()
+        self._update_lock = threading.Lock()
+        self._update_thread: Optional[threading.Thread] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once the first full build finished."""
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 50) -> List[LibraryTrack]:
+        """
+        Find tracks matching every word of the query (prefix match on
+        title, artist, album and file name).
+
+        Args:
+            query: Free text query
+            limit: Max number of results
+
+        Returns:
+            Matching tracks sorted by artist, album and track number
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+
+        with self._lock:
+            matches: Optional[Set[str]] = None
+            # Rarest words first keeps the intersections small
+            for files in sorted((self._prefix_matches(word) for word in set(words)), key=len):
+                matches = files if matches is None else matches & files
+                if not matches:
+                    return []
+            # Short prefixes can match most of the library - only order what is returned
+            files = heapq.nsmallest(limit, matches, key=self._sort_keys.__getitem__)
+            return [self._tracks[file] for file in files]
+
+    def get_artists(self) -> List[str]:
+        """Get album artists, sorted alphabetically."""
+        with self._lock:
+            return sorted(self._albums, key=str.casefold)
+
+    def get_albums(self, artist: str) -> List[str]:
+        """Get albums of an album artist, sorted alphabetically."""
+        with self._lock:
+            return sorted(self._albums.get(artist, {}), key=str.casefold)
+
+    def get_tracks(self, artist: str, album: str) -> List[LibraryTrack]:
+        """Get tracks of an album in disc/track order."""
+        with self._lock:
+            files = self._albums.get(artist, {}).get(album, set())
+            tracks = [self._tracks[file] for file in files]
+        tracks.sort(key=self._sort_key)
+        return tracks
+
+    def get_track(self, file: str) -> Optional[LibraryTrack]:
+        """Look up a track by file URI."""
+        return self._tracks.get(file)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index statistics (for diagnostics)."""
+        with self._lock:
+            return {
+                'loaded': self._loaded,
+                'tracks': len(self._tracks),
+                'artists': len(self._albums),
+                'tokens': len(self._tokens),
+                'version': self.version,
+            }
+
+    def _prefix_matches(self, prefix: str) -> Set[str]:
+        """Union of the postings of every token starting with prefix (caller holds the lock)."""
+        i = bisect.bisect_left(self._tokens, prefix)
+        j = i
+        while j < len(self._tokens) and self._tokens[j].startswith(prefix):
+            j += 1
+        if j - i == 1:
+            # Single token - its posting set is only read, never modified
+            return self._postings[self._tokens[i]]
+        files: Set[str] = set()
+        for token in self._tokens[i:j]:
+            files |= self._postings[token]
+        return files
+
+    @staticmethod
+    def _sort_key(track: LibraryTrack):
+        return (track.album_artist.casefold(), track.album.casefold(), track.disc, track.track,
+                track.title.casefold())
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def invalidate(self, **kwargs):
+        """MPD database changed - update the index in the background."""
+        logger.debug("MPD database changed, updating library index")
+        self.update_async()
+
+    def update_async(self):
+        """Update (or build) the index in a background thread (no-op if one is running)."""
+        if self._update_thread and self._update_thread.is_alive():
+            return
+        self._update_thread = threading.Thread(target=self.update, daemon=True, name="mpd-library")
+        self._update_thread.start()
+
+    def check_for_updates_async(self):
+        """
+        Update the index if MPD's database changed since the last update.
+
+        For when idle events are not received (MPD source inactive, polling
+        monitor). Costs one small 'stats' round trip, at most once per
+        check_interval.
+        """
+        if self.check_interval <= 0 or time.monotonic() - self._last_check < self.check_interval:
+            return
+        self._last_check = time.monotonic()
+
+        def check():
+            stats = self.client.get_stats()
+            if stats and stats.get('db_update') != self._db_update:
+                self.update()
+        threading.Thread(target=check, daemon=True, name="mpd-library-check").start()
+
+    def update(self) -> bool:
+        """
+        Bring the index up to date (blocking).
+
+        Builds the full index on first use, otherwise applies only the
+        songs that were added, changed or removed.
+
+        Returns:
+            True if the index is up to date
+        """
+        with self._update_lock:
+            self._last_check = time.monotonic()
+            stats = self.client.get_stats()
+            db_update = stats.get('db_update')
+            if not self._loaded:
+                updated = self._build()
+            else:
+                songs = stats.get('songs')
+                updated = self._update_incremental(int(songs) if songs is not None else None)
+            if updated:
+                self._db_update = db_update
+            return updated
+
+    def _build(self) -> bool:
+        """Full build from listallinfo, one top-level directory at a time."""
+        start = time.monotonic()
+
+        root = self.client.get_directory('')
+        if root is None:
+            logger.warning("Library index build failed - keeping previous index")
+            return False
+
+        songs: List[Dict[str, Any]] = []
+        for entry in root:
+            if 'directory' in entry:
+                entries = self.client.list_all_info(entry['directory'])
+                if entries is None:
+                    logger.warning("Library index build failed - keeping previous index")
+                    return False
+                songs.extend(e for e in entries if 'file' in e)
+            elif 'file' in entry:
+                songs.append(entry)
+
+        if not songs and not self.client.is_connected():
+            return False
+
+        with self._lock:
+            self._tracks.clear()
+            self._sort_keys.clear()
+            self._postings.clear()
+            self._tokens = []
+            self._albums.clear()
+            self._newest_modified = ""
+            self._add_tracks(track_from_song(song) for song in songs)
+            self._tokens = sorted(self._postings)
+            self._loaded = True
+            self.version += 1
+
+        logger.info(f"📚 Library index built: {len(self._tracks)} tracks, {len(self._albums)} artists "
+                    f"in {time.monotonic() - start:.1f}s")
+        return True
+
+    def _update_incremental(self, song_count: Optional[int] = None) -> bool:
+        """
+        Apply songs changed since the newest indexed song and drop removed ones.
+
+        Args:
+            song_count: Songs in MPD's database ('stats'); when the index plus
+                        the changed songs add up to it, nothing was removed and
+                        the full file list is not read
+        """
+        start = time.monotonic()
+
+        changed = self.client.find_modified_since(self._newest_modified or '0')
+        if changed is None:
+            logger.warning("Library index update failed - keeping previous index")
+            return False
+
+        known = set(self._tracks).union(song['file'] for song in changed if 'file' in song)
+        if song_count is not None and len(known) == song_count:
+            current = known
+        else:
+            # Songs were removed, or added with an old mtime - compare file lists
+            files = self.client.list_files()
+            if files is None:
+                logger.warning("Library index update failed - keeping previous index")
+                return False
+            current = set(files)
+
+        # New files with an old mtime (copied with preserved timestamps) are not
+        # 'modified since' - read their directories instead
+        directories = {file.rsplit('/', 1)[0] if '/' in file else '' for file in current - known}
+        for directory in directories:
+            # The root is listed non-recursively - listallinfo '' would be the whole library
+            entries = self.client.list_all_info(directory) if directory else self.client.get_directory('')
+            if entries is None:
+                logger.warning("Library index update failed - keeping previous index")
+                return False
+            changed.extend(entry for entry in entries if 'file' in entry and entry['file'] not in known)
+
+        with self._lock:
+            removed = [file for file in self._tracks if file not in current]
+            for file in removed:
+                self._remove_track(file)
+
+            # modified-since is inclusive, so songs at the newest timestamp come back unchanged
+            changed_tracks = [track for track in (track_from_song(song) for song in changed if 'file' in song)
+                              if self._tracks.get(track.file) != track]
+            for track in changed_tracks:
+                if track.file in self._tracks:
+                    self._remove_track(track.file)
+            self._add_tracks(changed_tracks, insort=True)
+            if removed or changed_tracks:
+                self.version += 1
+
+        logger.info(f"📚 Library index updated: {len(changed_tracks)} added/changed, {len(removed)} removed "
+                    f"({len(self._tracks)} tracks, {time.monotonic() - start:.2f}s)")
+        return True
+
+    def _add_tracks(self, tracks: Iterable[LibraryTrack], insort: bool = False):
+        """Index tracks (caller holds the lock; insort keeps _tokens sorted for small updates)."""
+        for track in tracks:
+            self._tracks[track.file] = track
+            self._sort_keys[track.file] = self._sort_key(track)
+            self._albums.setdefault(track.album_artist, {}).setdefault(track.album, set()).add(track.file)
+            for token in self._track_tokens(track):
+                files = self._postings.get(token)
+                if files is None:
+                    files = self._postings[token] = set()
+                    if insort:
+                        bisect.insort(self._tokens, token)
+                files.add(track.file)
+            if track.last_modified > self._newest_modified:
+                self._newest_modified = track.last_modified
+
+    def _remove_track(self, file: str):
+        """Drop a track from every structure (caller holds the lock)."""
+        track = self._tracks.pop(file)
+        del self._sort_keys[file]
+
+        albums = self._albums.get(track.album_artist, {})
+        album_files = albums.get(track.album)
+        if album_files is not None:
+            album_files.discard(file)
+            if not album_files:
+                del albums[track.album]
+                if not albums:
+                    del self._albums[track.album_artist]
+
+        for token in self._track_tokens(track):
+            files = self._postings.get(token)
+            if files is None:
+                continue
+            files.discard(file)
+            if not files:
+                del self._postings[token]
+                i = bisect.bisect_left(self._tokens, token)
+                if i < len(self._tokens) and self._tokens[i] == token:
+                    del self._tokens[i]
+
+    @staticmethod
+    def _track_tokens(track: LibraryTrack) -> Set[str]:
+        file_name = track.file.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+        return set(tokenize(f"{track.title} {track.artist} {track.album_artist} {track.album} {file_name}"))
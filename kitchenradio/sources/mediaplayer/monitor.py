@@ -2,33 +2,77 @@
 Now Playing Monitor - Track monitoring functionality for MPD
 """
 
-import time
 import logging
 import threading
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List
 from .client import KitchenRadioClient
 from kitchenradio.sources.source_model import PlaybackStatus, TrackInfo, SourceInfo, PlaybackState
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# MPD idle subsystems the monitor reacts to
+IDLE_SUBSYSTEMS = ('player', 'mixer', 'playlist', 'options', 'stored_playlist', 'database')
+
+# Subsystems that can change the current song (others only affect status)
+TRACK_SUBSYSTEMS = {'player', 'playlist'}
+
+# Number of parsed TrackInfo objects kept, keyed by (songid, file)
+TRACK_CACHE_SIZE = 32
+
+# Consecutive idle failures (with a working connection) before falling back to polling
+MAX_IDLE_FAILURES = 3
+
 class MPDMonitor:
     """
     Monitor now playing tracks and MPD status changes.
+    
+    By default the monitor parks a dedicated MPD connection in the idle
+    command and only refreshes the subsystems MPD reports as changed.
+    Polling is kept as a fallback for servers where idle does not work.
     """
     
-    def __init__(self, client: KitchenRadioClient):
+    def __init__(self, client: KitchenRadioClient, use_idle: bool = True, poll_interval: float = 0.5,
+                 standby_poll_interval: float = 5.0):
         """
         Initialize monitor with KitchenRadio client.
         
         Args:
-            client: KitchenRadio client instance
+            client: KitchenRadio client instance (used for command events)
+            use_idle: Use MPD idle notifications instead of polling
+            poll_interval: Seconds between polls when polling
+            standby_poll_interval: Seconds between polls in standby (MPD not the active source)
         """
         self.client = client
         self.callbacks = {}
         
+        # Dedicated connection for monitoring, so waiting in idle (or polling)
+        # never contends with interactive commands on the client's socket
+        self._monitor_client = client.clone()
+        self.use_idle = use_idle
+        self.poll_interval = poll_interval
+        self.standby_poll_interval = standby_poll_interval
+        self._idle_failures = 0
+        
+        # Standby: keep state warm while another source is active (slower polling)
+        self.standby = False
+        self._wake_event = threading.Event()
+        
+        # Last seen MPD status fields - currentsong is only fetched when the
+        # song id or queue version changes, status is only parsed when
+        # state or volume changes
+        self._last_songid: Optional[str] = None
+        self._last_queue_version: Optional[str] = None
+        self._last_state_str: Optional[str] = None
+        self._last_volume_str: Optional[str] = None
+        self._is_stream = False
+        
+        # Small LRU of parsed tracks, keyed by (songid, file)
+        self._track_cache: 'OrderedDict[tuple, TrackInfo]' = OrderedDict()
+        
         self.current_track: Optional[TrackInfo] = None
         self.current_status: PlaybackState = PlaybackState()
         self.current_source_info: SourceInfo = SourceInfo(device_name="MPD")
@@ -37,16 +81,10 @@ class MPDMonitor:
         self._monitor_thread = None
         self._stop_event = threading.Event()
         
-        # Track expected volume from commands (set by client events)
-        self.expected_volume = None
-        self.expected_volume_timestamp = None
-        self.expected_value_timeout = 2.0  # Expire expected volume after 2 seconds
-        
         # Track current playlist name (cached from load/clear events)
         self.current_playlist: str = ""
         
         # Subscribe to client command events
-        self.client.add_callback('volume_command', self._on_volume_command)
         self.client.add_callback('playback_command', self._on_playback_command)
         self.client.add_callback('playlist_command', self._on_playlist_command)
         logger.debug("Monitor subscribed to client command events")
@@ -64,20 +102,6 @@ class MPDMonitor:
         self.callbacks[event].append(callback)
         logger.debug(f"Added callback for {event}")
     
-    def _on_volume_command(self, command: str, expected_volume: int, **kwargs):
-        """
-        Handle volume command from client.
-        Notifies monitor of expected volume BEFORE MPD status updates.
-        """
-        logger.info(f"📢 Client sent volume command: {command}, expected volume: {expected_volume}")
-        self.expected_volume = expected_volume
-        self.expected_volume_timestamp = time.time()
-        
-        # Update current status immediately
-        if self.current_status:
-            self.current_status.volume = expected_volume
-            self._trigger_callbacks('playback_state_changed', playback_state=self.get_playback_state())
-    
     def _on_playback_command(self, command: str, expected_state: str, **kwargs):
         """
         Handle playback command from client.
@@ -97,23 +121,10 @@ class MPDMonitor:
             self.current_playlist = ""
             logger.info(f"📋 Playlist cleared - cache cleared in monitor")
         
-        # Update current track with new playlist info if track exists
-        if self.current_track:
-            self.current_track.playlist = self.current_playlist
-            self._trigger_callbacks('track_info_changed', track_info=self.current_track)
-    
-    def _is_expected_volume_valid(self) -> bool:
-        """Check if expected volume is still valid (not expired)."""
-        if self.expected_volume is None or self.expected_volume_timestamp is None:
-            return False
-        return (time.time() - self.expected_volume_timestamp) < self.expected_value_timeout
-    
-    def _clear_expired_expected_values(self):
-        """Clear expected volume if it has expired."""
-        if self.expected_volume is not None and not self._is_expected_volume_valid():
-            logger.debug(f"⏱️ Expected volume expired: {self.expected_volume}")
-            self.expected_volume = None
-            self.expected_volume_timestamp = None
+        # Publish the current track with the new playlist info if track exists
+        if self.current_track and self.current_track.playlist != self.current_playlist:
+            self.current_track = replace(self.current_track, playlist=self.current_playlist)
+            self._trigger_callbacks('track_changed', track_info=self.current_track)
     
     def _trigger_callbacks(self, event: str, **kwargs):
         """Trigger callbacks for event."""
@@ -155,6 +166,33 @@ class MPDMonitor:
             playlist=self.current_playlist  # Include cached playlist name
         )
 
+    def _get_cached_track_info(self, song: Optional[Dict]) -> TrackInfo:
+        """
+        Parse MPD song info, reusing parsed TrackInfo objects where possible.
+        
+        Streams are never cached - their title changes under the same song id.
+        """
+        file = song.get('file', '') if song else ''
+        self._is_stream = '://' in file
+        if not song or self._is_stream:
+            return self._parse_track_info(song)
+        
+        key = (song.get('id'), file)
+        track = self._track_cache.get(key)
+        if track is None:
+            track = self._parse_track_info(song)
+            self._track_cache[key] = track
+            if len(self._track_cache) > TRACK_CACHE_SIZE:
+                self._track_cache.popitem(last=False)
+        else:
+            self._track_cache.move_to_end(key)
+            if track.playlist != self.current_playlist:
+                # Same song loaded from another playlist
+                track = replace(track, playlist=self.current_playlist)
+                self._track_cache[key] = track
+        
+        return track
+    
     def _parse_playback_status(self, status: Dict[str, Any]) -> PlaybackState:
         """Parse MPD status into PlaybackState"""
         if not status:
@@ -175,114 +213,191 @@ class MPDMonitor:
         except (ValueError, TypeError):
             pass
             
-        # Handle expected volume override for immediate UI feedback
-        if self._is_expected_volume_valid():
-            volume = self.expected_volume
-            
         return PlaybackState(status=playback_status, volume=volume)
     
-    def _check_for_changes(self):
-        """Check for status and song changes."""
+    def _check_for_changes(self, player_changed: bool = True, force_track: bool = False):
+        """
+        Check for status and song changes.
+        
+        A steady-state check is a single status round trip: currentsong is
+        only fetched when the song id or queue version changed.
+        
+        Args:
+            player_changed: Player state may have changed (streams can change
+                            title without a new song id)
+            force_track: Always fetch the current song (initial sync, reconnect)
+        """
         try:
-            # Get current status and song
-            status_data = self.client.get_status()
-            song_data = self.client.get_current_song()
-            
-            # Parse new state from actual MPD data (without expected value overrides for comparison)
-            state_str = status_data.get('state', 'stop') if status_data else 'stop'
-            mpd_status = PlaybackStatus.STOPPED
-            if state_str == 'play':
-                mpd_status = PlaybackStatus.PLAYING
-            elif state_str == 'pause':
-                mpd_status = PlaybackStatus.PAUSED
-            
-            mpd_volume = 0
-            try:
-                mpd_volume = int(status_data.get('volume', 0)) if status_data else 0
-            except (ValueError, TypeError):
-                pass
+            if force_track:
+                # Status and song in one command list round trip
+                status_data, song_data = self._monitor_client.get_status_and_song()
+                self._check_status_changes(status_data)
+                self._song_changed(status_data)
+                self._check_track_changes(song_data)
+                return
             
-            # Check for playback state change (compare against actual MPD state)
-            status_changed = self.current_status.status != mpd_status
-            volume_changed = self.current_status.volume != mpd_volume
+            status_data = self._monitor_client.get_status()
+            self._check_status_changes(status_data)
             
-            if status_changed or volume_changed:
-                # Parse track info for logging
-                # new_track = self._parse_track_info(song_data)
-                
-                # # Log changes with full track details
-                # if status_changed:
-                #     track_display = f"{new_track.artist} - {new_track.title}" if new_track and new_track.title != 'Unknown' else "No track"
-                #     album_display = f" [{new_track.album}]" if new_track and new_track.album else ""
-                                
-                # Update current status with actual MPD values
-                self.current_status = PlaybackState(status=mpd_status, volume=mpd_volume)
-                logger.info(f"🎵 [MPD] Playback state changed: {self.current_status}")
-                self._trigger_callbacks('playback_state_changed', playback_state=self.get_playback_state())
-                
-            # Check for track change
-            new_track = self._parse_track_info(song_data)
-            
-            # Check if track actually changed by comparing key fields
-            # Handle None vs TrackInfo comparison properly
-            track_changed = False
-            
-            if self.current_track is None and new_track is not None:
-                track_changed = True
-                logger.debug(f"[MPD] Track change: None → {new_track.title}")
-            elif self.current_track is not None and new_track is None:
-                track_changed = True
-                logger.debug(f"[MPD] Track change: {self.current_track.title} → None")
-            elif self.current_track != new_track:
-                # Both are TrackInfo objects - check if they're different
-                track_changed = True
-                logger.debug(f"[MPD] Track objects differ: {self.current_track.title} vs {new_track.title}")
-            
-            if track_changed:
-                logger.info(f"🎵 [MPD] Track changed: {self.current_track.title if self.current_track else 'None'} → {new_track.title if new_track else 'None'}")
-                self.current_track = new_track
-                self._trigger_callbacks('track_changed', track_info=self.get_track_info())
-                logger.debug(f"[MPD] Emitted track_changed callback with track: {new_track.title if new_track else 'None'}")
-            # else:
-            #     logger.debug(f"[MPD] Track unchanged: {new_track.title if new_track else 'None'}")
-            
-            # Clear expected volume if it matches actual MPD volume
-            if self._is_expected_volume_valid():
-                mpd_volume = int(status_data.get('volume', 0)) if status_data.get('volume') else 0
-                if mpd_volume == self.expected_volume:
-                    self.expected_volume = None  # Matched, clear expected value
-                    logger.debug(f"✅ Expected volume matched MPD volume: {mpd_volume}")
-            
-            self._clear_expired_expected_values()
+            # Streams update their title in place, so refetch on every player change
+            if self._song_changed(status_data) or (player_changed and self._is_stream):
+                song_data = self._monitor_client.get_current_song()
+                self._check_track_changes(song_data)
                 
         except Exception as e:
             logger.error(f"Error checking for changes: {e}", exc_info=True)
     
-    def _monitor_loop(self):
-        """Main monitoring loop - uses polling instead of idle."""
-        logger.info("Starting MPD monitoring loop (polling mode)")
+    def _song_changed(self, status_data: Dict[str, Any]) -> bool:
+        """
+        Track song id and queue version from status.
         
-        poll_interval = 0.5  # Poll every 500ms
+        Returns:
+            True if either changed since the last status
+        """
+        songid = status_data.get('songid') if status_data else None
+        queue_version = status_data.get('playlist') if status_data else None
+        
+        if songid == self._last_songid and queue_version == self._last_queue_version:
+            return False
+        
+        queue_changed = queue_version != self._last_queue_version
+        self._last_songid = songid
+        self._last_queue_version = queue_version
+        
+        if queue_changed and queue_version is not None:
+            self._trigger_callbacks('queue_changed', version=queue_version,
+                                    length=status_data.get('playlistlength'))
+        return True
+    
+    def _check_status_changes(self, status_data: Dict[str, Any]):
+        """Compare MPD status against the cached playback state."""
+        state_raw = status_data.get('state') if status_data else None
+        volume_raw = status_data.get('volume') if status_data else None
+        
+        # Nothing to parse if state and volume are unchanged
+        if state_raw == self._last_state_str and volume_raw == self._last_volume_str:
+            return
+        self._last_state_str = state_raw
+        self._last_volume_str = volume_raw
+        
+        # Parse new state from actual MPD data
+        state_str = status_data.get('state', 'stop') if status_data else 'stop'
+        mpd_status = PlaybackStatus.STOPPED
+        if state_str == 'play':
+            mpd_status = PlaybackStatus.PLAYING
+        elif state_str == 'pause':
+            mpd_status = PlaybackStatus.PAUSED
+        
+        mpd_volume = 0
+        try:
+            mpd_volume = int(status_data.get('volume', 0)) if status_data else 0
+        except (ValueError, TypeError):
+            pass
+        
+        # Check for playback state change (compare against actual MPD state)
+        status_changed = self.current_status.status != mpd_status
+        volume_changed = self.current_status.volume != mpd_volume
+        
+        if status_changed or volume_changed:
+            # Update current status with actual MPD values
+            self.current_status = PlaybackState(status=mpd_status, volume=mpd_volume)
+            logger.info(f"🎵 [MPD] Playback state changed: {self.current_status}")
+            self._trigger_callbacks('playback_state_changed', playback_state=self.get_playback_state())
+    
+    def _check_track_changes(self, song_data: Optional[Dict[str, Any]]):
+        """Compare MPD current song against the cached track."""
+        new_track = self._get_cached_track_info(song_data)
+        if new_track is self.current_track:
+            return
+        
+        # Check if track actually changed by comparing key fields
+        # Handle None vs TrackInfo comparison properly
+        track_changed = False
+        
+        if self.current_track is None and new_track is not None:
+            track_changed = True
+            logger.debug(f"[MPD] Track change: None → {new_track.title}")
+        elif self.current_track is not None and new_track is None:
+            track_changed = True
+            logger.debug(f"[MPD] Track change: {self.current_track.title} → None")
+        elif self.current_track != new_track:
+            # Both are TrackInfo objects - check if they're different
+            track_changed = True
+            logger.debug(f"[MPD] Track objects differ: {self.current_track.title} vs {new_track.title}")
+        
+        if track_changed:
+            logger.info(f"🎵 [MPD] Track changed: {self.current_track.title if self.current_track else 'None'} → {new_track.title if new_track else 'None'}")
+            self.current_track = new_track
+            self._trigger_callbacks('track_changed', track_info=self.get_track_info())
+            logger.debug(f"[MPD] Emitted track_changed callback with track: {new_track.title if new_track else 'None'}")
+    
+    def _handle_idle_changes(self, changed: List[str]):
+        """
+        Refresh only the state affected by the changed idle subsystems.
+        
+        Args:
+            changed: Subsystem names reported by MPD idle
+        """
+        logger.debug(f"[MPD] Idle reported changes: {changed}")
+        changed_set = set(changed)
+        
+        if changed_set & {'player', 'mixer', 'playlist', 'options'}:
+            self._check_for_changes(player_changed=bool(changed_set & TRACK_SUBSYSTEMS))
+        
+        if 'stored_playlist' in changed_set:
+            self._trigger_callbacks('stored_playlists_changed')
+        if 'database' in changed_set:
+            self._trigger_callbacks('database_changed')
+    
+    def _wait_for_idle_changes(self):
+        """Wait for one batch of idle changes and apply it."""
+        changed = self._monitor_client.wait_for_changes(IDLE_SUBSYSTEMS, self._stop_event)
+        
+        if changed is None:
+            # Lost connections are handled by the loop; only count idle failing on a live connection
+            if not self._monitor_client.is_connected():
+                return
+            self._idle_failures += 1
+            if self._idle_failures >= MAX_IDLE_FAILURES:
+                logger.warning(f"MPD idle failed {self._idle_failures} times, falling back to polling")
+                self.use_idle = False
+            return
+        
+        self._idle_failures = 0
+        if changed:
+            self._handle_idle_changes(changed)
+    
+    def _monitor_loop(self):
+        """Main monitoring loop - waits in MPD idle, or polls as a fallback."""
+        logger.info(f"Starting MPD monitoring loop ({'idle' if self.use_idle else 'polling'} mode)")
         
         while not self._stop_event.is_set():
             try:
-                if self.client.is_connected():
-                    # Check for changes by comparing current state
-                    self._check_for_changes()
-                    
-                    # Wait before next poll (with interruptible sleep)
-                    self._stop_event.wait(poll_interval)
+                if self._monitor_client.is_connected():
+                    if self.use_idle:
+                        self._wait_for_idle_changes()
+                    else:
+                        # Check for changes by comparing current state
+                        self._check_for_changes()
+                        
+                        # Wait before next poll (interrupted by stop or leaving standby)
+                        self._wake_event.wait(self.standby_poll_interval if self.standby else self.poll_interval)
+                        self._wake_event.clear()
                 else:
                     # Don't try to reconnect if we're shutting down
                     if not self._stop_event.is_set():
                         logger.warning("MPD connection lost, try to reconnect")
-                        if not self.client.connect():
+                        if not self._monitor_client.connect():
                             self._stop_event.wait(5.0)  # Wait longer before retry if failed
+                        else:
+                            # Changes may have been missed while disconnected
+                            self._check_for_changes(force_track=True)
                         
             except Exception as e:
                 logger.error(f"Error in monitor loop: {e}")
                 self._stop_event.wait(1.0)  # Avoid tight loop on error
         
+        self._monitor_client.disconnect()
         logger.info("MPD monitoring loop stopped")
     
     def start_monitoring(self):
@@ -293,14 +408,19 @@ class MPDMonitor:
         
         logger.info("Starting MPD monitoring")
         
-        # Initialize current status
-        status = self.client.get_status()
-        self.current_status = self._parse_playback_status(status)
-        song_data = self.client.get_current_song()
-        self.current_track = self._parse_track_info(song_data)
-        
-        logger.info(f"[MPD] Initial state - Status: {self.current_status.status.value}, Track: {self.current_track.title if self.current_track else 'None'}")
-        logger.debug(f"[MPD] Raw song data: {song_data}")
+        # Open the dedicated monitor connection (the loop retries if this fails)
+        self._idle_failures = 0
+        if self._monitor_client.connect():
+            # Initialize current status
+            status, song_data = self._monitor_client.get_status_and_song()
+            self.current_status = self._parse_playback_status(status)
+            self._song_changed(status)
+            self._last_state_str = status.get('state')
+            self._last_volume_str = status.get('volume')
+            self.current_track = self._get_cached_track_info(song_data)
+            
+            logger.info(f"[MPD] Initial state - Status: {self.current_status.status.value}, Track: {self.current_track.title if self.current_track else 'None'}")
+            logger.debug(f"[MPD] Raw song data: {song_data}")
         
         # Start monitoring thread
         self._stop_event.clear()
@@ -315,6 +435,7 @@ class MPDMonitor:
         
         self.is_monitoring = False
         self._stop_event.set()
+        self._wake_event.set()
         
         if self._monitor_thread and self._monitor_thread.is_alive():
             logger.debug("Waiting for MPD monitor thread to exit...")
@@ -324,6 +445,21 @@ class MPDMonitor:
             else:
                 logger.debug("MPD monitor thread exited successfully")
     
+    def set_standby(self, standby: bool):
+        """
+        Enter or leave standby.
+        
+        In standby the monitor keeps running so its state is current when
+        MPD becomes the active source again; only polling slows down (idle
+        notifications cost nothing while waiting).
+        """
+        if standby == self.standby:
+            return
+        self.standby = standby
+        logger.debug(f"MPD monitor {'in standby' if standby else 'active'}")
+        if not standby:
+            self._wake_event.set()  # Poll now rather than after the standby interval
+    
     def get_track_info(self) -> Optional[TrackInfo]:
         """
         Get currently playing track info.
@@ -0,0 +1,264 @@
+"""
+MPD Connection Pool - Fixed set of health-checked MPD connections
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, List, Iterator
+
+import mpd
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection became free within the checkout timeout."""
+
+
+def is_connection_error(error: Exception) -> bool:
+    """
+    Check if an error means the socket is unusable.
+
+    MPD command errors (ACK responses) leave the connection intact; socket
+    errors and protocol desyncs do not.
+    """
+    return isinstance(error, (mpd.ConnectionError, mpd.ProtocolError, OSError, EOFError))
+
+
+class PooledConnection:
+    """
+    One MPD socket in the pool, guarded by its own lock.
+    """
+
+    def __init__(self, index: int, host: str, port: int, password: Optional[str], timeout: int):
+        self.index = index
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+
+        self.lock = threading.Lock()
+        self.client: Optional[mpd.MPDClient] = None
+        self.last_used = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self.client is not None
+
+    def open(self):
+        """Open the socket (caller holds the lock). Raises on failure."""
+        client = mpd.MPDClient()
+        client.timeout = self.timeout
+        client.connect(self.host, self.port)
+        try:
+            if self.password:
+                client.password(self.password)
+        except Exception:
+            self._close_client(client)
+            raise
+
+        self.client = client
+        self.last_used = time.monotonic()
+        logger.debug(f"MPD pool connection #{self.index} opened")
+
+    def discard(self):
+        """Close the socket so it is replaced on next checkout (caller holds the lock)."""
+        if self.client is not None:
+            self._close_client(self.client)
+            self.client = None
+            logger.debug(f"MPD pool connection #{self.index} discarded")
+
+    @staticmethod
+    def _close_client(client: mpd.MPDClient):
+        try:
+            client.close()
+        except Exception:
+            pass
+        try:
+            client.disconnect()
+        except Exception:
+            pass
+
+
+class MPDConnectionPool:
+    """
+    Fixed-size pool of MPD connections.
+
+    - Each connection has its own lock, so independent callers never share a socket
+    - Checkout waits at most checkout_timeout for a free connection
+    - Broken sockets are discarded and reopened on the next checkout
+    - healthy tells whether the last checkout reached MPD, so a transient
+      socket error is forgotten as soon as a reopened socket works
+    - A keepalive thread pings connections that have been idle for a while,
+      so MPD's connection_timeout never closes them under us
+    """
+
+    def __init__(self,
+                 host: str,
+                 port: int,
+                 password: Optional[str] = None,
+                 timeout: int = 10,
+                 size: int = 2,
+                 checkout_timeout: float = 2.0,
+                 keepalive_interval: float = 30.0):
+        """
+        Initialize connection pool (no sockets are opened yet).
+
+        Args:
+            host: MPD server hostname
+            port: MPD server port
+            password: MPD password if required
+            timeout: Socket timeout in seconds
+            size: Number of connections
+            checkout_timeout: Default seconds to wait for a free connection
+            keepalive_interval: Ping connections idle for this many seconds (0 disables)
+        """
+        self.size = max(1, size)
+        self.checkout_timeout = checkout_timeout
+        self.keepalive_interval = keepalive_interval
+
+        self._connections: List[PooledConnection] = [
+            PooledConnection(i, host, port, password, timeout) for i in range(self.size)
+        ]
+        self._available = threading.BoundedSemaphore(self.size)
+        self.healthy = False  # Last checkout (or open) reached MPD
+
+        self._keepalive_thread = None
+        self._stop_event = threading.Event()
+
+    def open(self) -> bool:
+        """
+        Open all pooled connections and start the keepalive thread.
+
+        Returns:
+            True if at least one connection is open
+        """
+        for conn in self._connections:
+            with conn.lock:
+                if conn.is_open:
+                    continue
+                try:
+                    conn.open()
+                except Exception as e:
+                    logger.warning(f"Could not open MPD pool connection #{conn.index}: {e}")
+
+        opened = sum(1 for conn in self._connections if conn.is_open)
+        self.healthy = opened > 0
+        if opened:
+            self._start_keepalive()
+        return opened > 0
+
+    def close(self):
+        """Stop the keepalive thread and close all connections."""
+        self._stop_event.set()
+        if self._keepalive_thread and self._keepalive_thread.is_alive():
+            self._keepalive_thread.join(timeout=1.0)
+        self._keepalive_thread = None
+        self.healthy = False
+
+        for conn in self._connections:
+            with conn.lock:
+                conn.discard()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[mpd.MPDClient]:
+        """
+        Check out a connection for the duration of the with-block.
+
+        Connections that were discarded are reopened on checkout. If the block
+        raises a connection error, the socket is discarded before release.
+
+        Args:
+            timeout: Seconds to wait for a free connection (default: checkout_timeout)
+
+        Yields:
+            Connected mpd.MPDClient
+
+        Raises:
+            PoolTimeout: No connection became free in time
+        """
+        wait = self.checkout_timeout if timeout is None else timeout
+        if not self._available.acquire(timeout=wait):
+            raise PoolTimeout(f"No free MPD connection within {wait:.1f}s")
+
+        try:
+            conn = self._acquire_free_connection()
+            try:
+                if not conn.is_open:
+                    try:
+                        conn.open()
+                    except Exception:
+                        self.healthy = False
+                        raise
+                try:
+                    yield conn.client
+                except Exception as e:
+                    # MPD command errors (ACK) still mean the socket works
+                    self.healthy = not is_connection_error(e)
+                    if not self.healthy:
+                        conn.discard()
+                    raise
+                else:
+                    self.healthy = True
+                finally:
+                    conn.last_used = time.monotonic()
+            finally:
+                conn.lock.release()
+        finally:
+            self._available.release()
+
+    def _acquire_free_connection(self) -> PooledConnection:
+        """Lock a free connection (a semaphore slot guarantees one exists)."""
+        # Prefer open connections so we don't reconnect while a healthy socket is idle
+        for want_open in (True, False):
+            for conn in self._connections:
+                if conn.is_open == want_open and conn.lock.acquire(blocking=False):
+                    return conn
+        # Raced with the keepalive thread - wait for any connection
+        conn = self._connections[0]
+        conn.lock.acquire()
+        return conn
+
+    def _start_keepalive(self):
+        if self.keepalive_interval <= 0:
+            return
+        if self._keepalive_thread and self._keepalive_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._keepalive_thread = threading.Thread(target=self._keepalive_loop, daemon=True)
+        self._keepalive_thread.start()
+
+    def _keepalive_loop(self):
+        """Ping idle connections; replace the ones that fail."""
+        check_interval = max(1.0, self.keepalive_interval / 2)
+
+        while not self._stop_event.wait(check_interval):
+            for conn in self._connections:
+                if self._stop_event.is_set():
+                    break
+                # Never wait for a connection - busy ones are obviously alive
+                if not self._available.acquire(blocking=False):
+                    break
+                try:
+                    if not conn.lock.acquire(blocking=False):
+                        continue
+                    try:
+                        self._ping(conn)
+                    finally:
+                        conn.lock.release()
+                finally:
+                    self._available.release()
+
+    def _ping(self, conn: PooledConnection):
+        """Ping (or reopen) one connection (caller holds the lock)."""
+        try:
+            if not conn.is_open:
+                conn.open()
+            elif time.monotonic() - conn.last_used >= self.keepalive_interval:
+                conn.client.ping()
+                conn.last_used = time.monotonic()
+        except Exception as e:
+            logger.debug(f"MPD pool connection #{conn.index} failed keepalive: {e}")
+            conn.discard()
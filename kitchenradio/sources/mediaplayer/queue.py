@@ -0,0 +1,198 @@
+"""
+Queue Mirror - Windowed, incrementally synced view of the MPD queue
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any
+
+logger = logging.getLogger(__name__)
+
+
+def _int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class QueueMirror:
+    """
+    Client-side mirror of the MPD queue that never loads the whole queue.
+
+    - Positions are mirrored sparsely (position -> song id) and patched
+      from 'plchangesposid <version>' diffs keyed on the status 'playlist'
+      version, so a change costs only the changed positions
+    - Song info is cached by song id (ids are stable while a song stays in
+      the queue) and fetched with 'playlistinfo START:END' for just the
+      window that is being read
+    - Syncing is lazy: queue change notifications only record the new
+      version, the next read brings the mirror up to date
+    - Both maps are bounded; forgotten positions are re-learned from the
+      windows that are read
+    """
+
+    def __init__(self, client, cache_size: int = 500):
+        """
+        Initialize queue mirror.
+
+        Args:
+            client: KitchenRadio client used to read the queue
+            cache_size: Max number of song infos kept in memory
+        """
+        self.client = client
+        self.cache_size = cache_size
+        self.max_positions = cache_size * 4
+
+        self.version: Optional[int] = None  # Queue version the mirror is synced to
+        self.reported_version: Optional[int] = None  # Latest version the monitor reported
+        self.length = 0
+        self._ids: "OrderedDict[int, str]" = OrderedDict()  # position -> song id (known positions, LRU)
+        self._songs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # song id -> song (LRU)
+
+        self._lock = threading.RLock()
+
+    def get_window(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Get queue entries start..end-1 (clamped to the queue length).
+
+        Syncs the mirror first (one status round trip, plus a diff if the
+        queue changed) and fetches only songs that are not cached.
+
+        Returns:
+            Song dicts with 'pos' and 'id'
+        """
+        return self._get_window(start, end)
+
+    def _get_window(self, start: int, end: int, status: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            if not self.sync(status):
+                return []
+            start = max(0, start)
+            end = min(end, self.length)
+            if start >= end:
+                return []
+
+            songs = self._window_from_cache(start, end)
+            if songs is None:
+                songs = self._fetch_window(start, end) or []
+            return songs
+
+    def get_around_current(self, before: int = 2, after: int = 10) -> Dict[str, Any]:
+        """
+        Get the queue around the current song ("up next").
+
+        Returns:
+            Dict with current position, queue length and songs
+        """
+        status = self.client.get_status()
+        if not status:
+            return {'current_pos': None, 'length': 0, 'songs': []}
+
+        current = _int(status.get('song'), -1)
+        center = max(current, 0)
+        with self._lock:
+            songs = self._get_window(center - before, center + after + 1, status)
+            return {
+                'current_pos': current if current >= 0 else None,
+                'length': self.length,
+                'songs': songs
+            }
+
+    def on_queue_changed(self, version: Any = None, length: Any = None, **kwargs):
+        """
+        Monitor reported a new queue version.
+
+        Runs on the monitor thread, so it only records the version - the
+        diff is fetched by the next read (sync() on get_window).
+        """
+        if version is not None:
+            self.reported_version = _int(version)
+
+    def invalidate_songs(self, **kwargs):
+        """Drop cached song info (tags may have changed in the database)."""
+        with self._lock:
+            self._songs.clear()
+
+    def sync(self, status: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Bring the mirror up to the current queue version.
+
+        Args:
+            status: MPD status to sync to (fetched if not given)
+
+        Returns:
+            True if the mirror is in sync
+        """
+        with self._lock:
+            if status is None:
+                status = self.client.get_status()
+            if not status or 'playlist' not in status:
+                return False
+
+            version = _int(status['playlist'])
+            length = _int(status.get('playlistlength'))
+            if version == self.version:
+                return True
+
+            if self.version is None:
+                # First use: positions are learned lazily from the windows that are read
+                self._ids.clear()
+            else:
+                changes = self.client.get_playlist_changes(self.version)
+                if changes is None:
+                    return False
+                if len(changes) > self.max_positions:
+                    # Most of the queue changed (e.g. shuffle) - re-learn positions from windows
+                    self._ids.clear()
+                else:
+                    for change in changes:
+                        self._remember(_int(change.get('cpos')), str(change.get('id')))
+
+            # Positions past the end were removed
+            for pos in [pos for pos in self._ids if pos >= length]:
+                del self._ids[pos]
+
+            logger.debug(f"Queue mirror synced: version {self.version} → {version}, {length} entries")
+            self.version = version
+            self.length = length
+            return True
+
+    def _window_from_cache(self, start: int, end: int) -> Optional[List[Dict[str, Any]]]:
+        """Window built from cached positions and songs, or None if anything is missing."""
+        songs = []
+        for pos in range(start, end):
+            song_id = self._ids.get(pos)
+            song = self._songs.get(song_id) if song_id is not None else None
+            if song is None:
+                return None
+            self._ids.move_to_end(pos)
+            self._songs.move_to_end(song_id)
+            songs.append(dict(song, pos=str(pos)))
+        return songs
+
+    def _fetch_window(self, start: int, end: int) -> Optional[List[Dict[str, Any]]]:
+        """Fetch one window with playlistinfo START:END and cache it."""
+        songs = self.client.get_playlist_window(start, end)
+        if songs is None:
+            return None
+
+        for song in songs:
+            pos, song_id = _int(song.get('pos'), -1), song.get('id')
+            if pos < 0 or song_id is None:
+                continue
+            self._remember(pos, str(song_id))
+            self._songs[str(song_id)] = song
+            self._songs.move_to_end(str(song_id))
+
+        while len(self._songs) > self.cache_size:
+            self._songs.popitem(last=False)
+        return songs
+
+    def _remember(self, pos: int, song_id: str):
+        """Record a position's song id (caller holds the lock), forgetting the least recently used."""
+        self._ids[pos] = song_id
+        self._ids.move_to_end(pos)
+        while len(self._ids) > self.max_positions:
+            self._ids.popitem(last=False)
@@ -1,19 +1,28 @@
 import logging
 from tkinter import S
 import traceback
+import threading
 import time
+from concurrent.futures import Future
+from dataclasses import replace
 from typing import Optional, Dict, Any, Callable
 from enum import Enum
 
 # Import configuration
 from kitchenradio import config
-from kitchenradio.sources.source_model import TrackInfo, SourceInfo, PlaybackState, PlaybackStatus, SourceType
+from kitchenradio.sources.source_model import TrackInfo, SourceInfo, PlaybackState, PlaybackStatus, SourceType, RadioState
 
 # Import backends
 
 from kitchenradio.sources.mediaplayer import PlaybackController as MPDController
 from kitchenradio.sources.spotify import LibrespotController
 from kitchenradio.sources.bluetooth import BluetoothController, BluetoothMonitor
+from kitchenradio.sources.volume_engine import VolumeEngine
+from kitchenradio.sources.backend_supervisor import BackendSupervisor
+from kitchenradio.sources.event_bus import EventBus
+from kitchenradio.sources.state_store import StateStore
+from kitchenradio.sources.command_executor import CommandExecutor, CommandPriority, MergePolicy, command
+from kitchenradio.sources.tracing import tracer
 
 
 class SourceController:
@@ -26,6 +35,16 @@ class SourceController:
     API for playback control, volume management, and source switching.
     """
     
+    # Backends brought up by initialize()
+    _BACKENDS = (SourceType.MPD, SourceType.LIBRESPOT, SourceType.BLUETOOTH)
+    
+    # Monitor events that update a RadioState field -> field
+    _STATE_EVENTS = {
+        'playback_state_changed': 'playback_state',
+        'track_changed': 'track_info',
+        'source_info_changed': 'source_info',
+    }
+    
     def __init__(self, config_dict: Dict[str, Any] = None):
         """
         Initialize SourceController with configuration.
@@ -57,6 +76,23 @@ class SourceController:
         self.bluetooth_monitor = None
         self.bluetooth_connected = False
         
+        # Backend bring-up: startup threads, then background retries
+        self._startup_threads: Dict[SourceType, threading.Thread] = {}
+        self._supervisor = BackendSupervisor(
+            initial_delay=self.config.get('reconnect_delay', config.AUTO_RECONNECT_DELAY),
+            max_delay=self.config.get('reconnect_max_delay', config.RECONNECT_MAX_DELAY),
+            jitter=self.config.get('reconnect_jitter', config.RECONNECT_JITTER),
+            max_attempts=self.config.get('max_reconnect_attempts', config.MAX_RECONNECT_ATTEMPTS)
+        )
+        self._monitoring_started = False
+        self._monitored_sources = set()
+        self._monitoring_lock = threading.Lock()
+        
+        # Optimistic volume control, one engine per source (created on first use).
+        # Engines are thread-safe and never block, so volume calls bypass the command executor.
+        self._volume_engines: Dict[SourceType, VolumeEngine] = {}
+        self._volume_engines_lock = threading.Lock()
+        
         # Current active source
         self.source = SourceType.NONE
         self.previous_source = SourceType.NONE
@@ -64,8 +100,25 @@ class SourceController:
         # Power state
         self.powered_on = False
         
-        # Callbacks storage
-        self._callbacks = {}
+        # Callbacks, delivered asynchronously with a queue per subscriber
+        self._events = EventBus(max_queue=self.config.get('event_queue_size', config.EVENT_QUEUE_SIZE))
+        
+        # Versioned state snapshots - read by display, web and outputs (see _publish_state)
+        self.state_store = StateStore()
+        self._state_lock = threading.Lock()
+        
+        # State-changing commands run one at a time on a single worker thread
+        self._commands = CommandExecutor(
+            max_queued=self.config.get('command_max_queued', config.COMMAND_MAX_QUEUED),
+            call_timeout=self.config.get('command_timeout', config.COMMAND_TIMEOUT)
+        )
+        
+        # Input-to-display latency traces (shared tracer, no-op when disabled)
+        tracer.configure(
+            enabled=self.config.get('trace_enabled', config.TRACE_ENABLED),
+            capacity=self.config.get('trace_buffer_size', config.TRACE_BUFFER_SIZE),
+            linger=self.config.get('trace_linger', config.TRACE_LINGER)
+        )
         
         self.logger.info("SourceController initialized")
     
@@ -77,21 +130,58 @@ class SourceController:
             'mpd_port': config.MPD_PORT,
             'mpd_password': config.MPD_PASSWORD,
             'mpd_timeout': config.MPD_TIMEOUT,
+            'mpd_client_backend': config.MPD_CLIENT_BACKEND,
+            'mpd_pool_size': config.MPD_CONNECTION_POOL_SIZE,
+            'mpd_pool_checkout_timeout': config.MPD_POOL_CHECKOUT_TIMEOUT,
+            'mpd_keepalive_interval': config.MPD_KEEPALIVE_INTERVAL,
             'mpd_default_volume': config.MPD_DEFAULT_VOLUME,
+            'mpd_monitor_use_idle': config.MPD_MONITOR_USE_IDLE,
+            'mpd_monitor_poll_interval': config.MPD_MONITOR_POLL_INTERVAL,
+            'mpd_monitor_standby_poll_interval': config.MPD_MONITOR_STANDBY_POLL_INTERVAL,
+            'mpd_playlist_cache_ttl': config.MPD_PLAYLIST_CACHE_TTL,
+            'mpd_library_check_interval': config.MPD_LIBRARY_CHECK_INTERVAL,
+            'mpd_library_search_limit': config.MPD_LIBRARY_SEARCH_LIMIT,
+            'mpd_queue_cache_size': config.MPD_QUEUE_CACHE_SIZE,
+            'mpd_queue_page_size': config.MPD_QUEUE_PAGE_SIZE,
             
             # Librespot settings
             'librespot_host': config.LIBRESPOT_HOST,
             'librespot_port': config.LIBRESPOT_PORT,
-            'librespot_timeout': config.MPD_TIMEOUT,
+            'librespot_timeout': config.LIBRESPOT_HTTP_READ_TIMEOUT,
+            'librespot_http_pool_size': config.LIBRESPOT_HTTP_POOL_SIZE,
+            'librespot_http_connect_timeout': config.LIBRESPOT_HTTP_CONNECT_TIMEOUT,
+            'librespot_http_command_timeout': config.LIBRESPOT_HTTP_COMMAND_TIMEOUT,
             'librespot_default_volume': config.LIBRESPOT_DEFAULT_VOLUME,
+            'librespot_status_resync_interval': config.LIBRESPOT_STATUS_RESYNC_INTERVAL,
+            'librespot_status_standby_resync_interval': config.LIBRESPOT_STATUS_STANDBY_RESYNC_INTERVAL,
             
             # Bluetooth settings
             'bluetooth_default_volume': config.BLUETOOTH_DEFAULT_VOLUME,
             'bluetooth_pairing_timeout': config.BLUETOOTH_PAIRING_TIMEOUT,
+            'bluetooth_signal_coalesce_window': config.BLUETOOTH_SIGNAL_COALESCE_WINDOW,
+            'bluetooth_connect_timeout': config.BLUETOOTH_CONNECT_TIMEOUT,
+            'bluetooth_client_backend': config.BLUETOOTH_CLIENT_BACKEND,
+            'bluetooth_bus_address': config.BLUETOOTH_BUS_ADDRESS,
+            'bluetooth_auto_reconnect': config.BLUETOOTH_AUTO_RECONNECT,
+            'bluetooth_reconnect_candidates': config.BLUETOOTH_RECONNECT_CANDIDATES,
             
             # General settings
             'default_volume': config.MPD_DEFAULT_VOLUME,
             'default_source': config.DEFAULT_SOURCE,
+            'volume_settle_time': config.VOLUME_SETTLE_TIME,
+            
+            # Backend bring-up
+            'backend_startup_deadline': config.BACKEND_STARTUP_DEADLINE,
+            'event_queue_size': config.EVENT_QUEUE_SIZE,
+            'command_max_queued': config.COMMAND_MAX_QUEUED,
+            'command_timeout': config.COMMAND_TIMEOUT,
+            'trace_enabled': config.TRACE_ENABLED,
+            'trace_buffer_size': config.TRACE_BUFFER_SIZE,
+            'trace_linger': config.TRACE_LINGER,
+            'reconnect_delay': config.AUTO_RECONNECT_DELAY,
+            'reconnect_max_delay': config.RECONNECT_MAX_DELAY,
+            'reconnect_jitter': config.RECONNECT_JITTER,
+            'max_reconnect_attempts': config.MAX_RECONNECT_ATTEMPTS,
             'power_on_at_startup': config.POWER_ON_AT_STARTUP,
         }
     
@@ -101,73 +191,214 @@ class SourceController:
     
     def initialize(self) -> bool:
         """
-        Initialize all backends.
+        Initialize all backends concurrently.
+        
+        Waits at most backend_startup_deadline seconds. Backends that are not
+        up by then keep connecting in the background; backends that fail are
+        handed to the supervisor, which retries them with backoff.
+        'available_sources_changed' is emitted whenever a backend comes up.
         
         Returns:
             True always - controller can operate even if backends unavailable
         """
         self.logger.info("Initializing backends...")
+        deadline = self.config.get('backend_startup_deadline', config.BACKEND_STARTUP_DEADLINE)
         
-        mpd_success = self._initialize_mpd()
-        librespot_success = self._initialize_librespot()
-        bluetooth_success = self._initialize_bluetooth()
+        for source in self._BACKENDS:
+            thread = threading.Thread(target=self._startup_backend, args=(source,),
+                                      daemon=True, name=f"init-{source.value}")
+            self._startup_threads[source] = thread
+            thread.start()
         
-        if not mpd_success and not librespot_success and not bluetooth_success:
-            self.logger.warning("[!] No backends available - starting in offline mode")
+        end_time = time.monotonic() + deadline
+        for thread in self._startup_threads.values():
+            thread.join(timeout=max(0.0, end_time - time.monotonic()))
+        
+        if not self.get_available_sources():
+            self.logger.warning("[!] No backends available yet - starting in offline mode")
         
         # Log backend status
-        if mpd_success:
-            self.logger.info("[OK] MPD backend available")
-        else:
-            self.logger.warning("[X] MPD backend unavailable")
-            
-        if librespot_success:
-            self.logger.info("[OK] Librespot backend available")
-        else:
-            self.logger.warning("[X] Librespot backend unavailable")
+        for source_name, status in self.get_backend_status().items():
+            if status == 'connected':
+                self.logger.info(f"[OK] {source_name} backend available")
+            elif status == 'connecting':
+                self.logger.warning(f"[..] {source_name} backend still connecting")
+            else:
+                self.logger.warning(f"[X] {source_name} backend unavailable")
         
-        if bluetooth_success:
-            self.logger.info("[OK] Bluetooth backend available")
+        return True
+    
+    def get_backend_status(self) -> Dict[str, str]:
+        """
+        Get connection status per backend.
+        
+        Returns:
+            Dict of source name to 'connected', 'connecting' or 'unavailable'
+        """
+        status = {}
+        for source in self._BACKENDS:
+            startup_thread = self._startup_threads.get(source)
+            if self._is_backend_connected(source):
+                status[source.value] = 'connected'
+            elif self._supervisor.is_watching(source.value) or (startup_thread and startup_thread.is_alive()):
+                status[source.value] = 'connecting'
+            else:
+                status[source.value] = 'unavailable'
+        return status
+    
+    def reconnect_backends(self) -> Dict[str, str]:
+        """
+        Retry all unavailable backends now instead of waiting for the backoff.
+        
+        Returns:
+            Backend status after scheduling the retries
+        """
+        for source, status in zip(self._BACKENDS, self.get_backend_status().values()):
+            if status == 'unavailable':
+                # Supervisor gave up on this one - start over
+                self._watch_backend(source)
+        self._supervisor.retry_now()
+        return self.get_backend_status()
+    
+    def get_http_stats(self) -> Dict[str, Any]:
+        """
+        Get HTTP latency counters of the HTTP-based backends.
+        
+        Returns:
+            Dict of source name to per-endpoint latency stats
+        """
+        stats = {}
+        if self.librespot_controller:
+            stats[SourceType.LIBRESPOT.value] = self.librespot_controller.get_http_stats()
+        return stats
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get event connection metrics of the backends that push events.
+        
+        Returns:
+            Dict of source name to connection stats
+        """
+        stats = {}
+        if self.librespot_controller:
+            stats[SourceType.LIBRESPOT.value] = self.librespot_controller.get_connection_stats()
+        if self.bluetooth_controller:
+            stats[SourceType.BLUETOOTH.value] = self.bluetooth_controller.get_reconnect_status()
+        return stats
+    
+    def cleanup(self):
+        """Stop background reconnects, commands, callback delivery and backend event loops."""
+        self._supervisor.stop()
+        self._commands.stop()
+        self._events.stop()
+        if self.librespot_controller:
+            try:
+                self.librespot_controller.disconnect()
+            except Exception as e:
+                self.logger.error(f"Error disconnecting Librespot: {e}")
+    
+    def _is_backend_connected(self, source: SourceType) -> bool:
+        if source == SourceType.MPD:
+            return self.mpd_connected
+        if source == SourceType.LIBRESPOT:
+            return self.librespot_connected
+        if source == SourceType.BLUETOOTH:
+            return self.bluetooth_connected
+        return False
+    
+    def _connect_backend(self, source: SourceType) -> bool:
+        """Single connect attempt for a backend."""
+        if source == SourceType.MPD:
+            return self._initialize_mpd()
+        if source == SourceType.LIBRESPOT:
+            return self._initialize_librespot()
+        if source == SourceType.BLUETOOTH:
+            return self._initialize_bluetooth()
+        return False
+    
+    def _startup_backend(self, source: SourceType):
+        """First connect attempt (runs in a startup thread)."""
+        if self._connect_backend(source):
+            self._on_backend_connected(source)
         else:
-            self.logger.warning("[X] Bluetooth backend unavailable")
+            self._watch_backend(source)
+    
+    def _watch_backend(self, source: SourceType):
+        """Hand a backend to the supervisor for background retries."""
+        self._supervisor.watch(source.value,
+                               lambda: self._connect_backend(source),
+                               lambda: self._on_backend_connected(source))
+    
+    def _on_backend_connected(self, source: SourceType):
+        """A backend came up (at startup or later) - start monitoring and announce it."""
+        if self._monitoring_started:
+            self._start_backend_monitoring(source)
         
-        return True
+        self._publish_state(available_sources=tuple(s.value for s in self.get_available_sources()))
+        
+        # The source was selected while its backend was still connecting
+        if self.source == source:
+            self._activate_monitor(source)
+            self._trigger_source_update()
     
     def _initialize_mpd(self) -> bool:
-        """Initialize MPD backend"""
-        self.logger.info("Initializing MPD backend with retries...")
-        max_retries = 5
-        for attempt in range(max_retries):
-            try:
+        """Initialize MPD backend (single attempt - retries are handled by the supervisor)"""
+        self.logger.info("Initializing MPD backend...")
+        
+        try:
+            if self.mpd_controller is None:
                 self.mpd_controller = MPDController(
                     host=self.config.get('mpd_host', config.MPD_HOST),
                     port=self.config.get('mpd_port', config.MPD_PORT),
                     password=self.config.get('mpd_password', config.MPD_PASSWORD),
-                    timeout=self.config.get('mpd_timeout', config.MPD_TIMEOUT)
+                    timeout=self.config.get('mpd_timeout', config.MPD_TIMEOUT),
+                    backend=self.config.get('mpd_client_backend', config.MPD_CLIENT_BACKEND),
+                    pool_size=self.config.get('mpd_pool_size', config.MPD_CONNECTION_POOL_SIZE),
+                    checkout_timeout=self.config.get('mpd_pool_checkout_timeout', config.MPD_POOL_CHECKOUT_TIMEOUT),
+                    keepalive_interval=self.config.get('mpd_keepalive_interval', config.MPD_KEEPALIVE_INTERVAL),
+                    monitor_use_idle=self.config.get('mpd_monitor_use_idle', config.MPD_MONITOR_USE_IDLE),
+                    monitor_poll_interval=self.config.get('mpd_monitor_poll_interval', config.MPD_MONITOR_POLL_INTERVAL),
+                    monitor_standby_poll_interval=self.config.get('mpd_monitor_standby_poll_interval',
+                                                                  config.MPD_MONITOR_STANDBY_POLL_INTERVAL),
+                    playlist_cache_ttl=self.config.get('mpd_playlist_cache_ttl', config.MPD_PLAYLIST_CACHE_TTL),
+                    library_check_interval=self.config.get('mpd_library_check_interval', config.MPD_LIBRARY_CHECK_INTERVAL),
+                    queue_cache_size=self.config.get('mpd_queue_cache_size', config.MPD_QUEUE_CACHE_SIZE)
                 )
-                if self.mpd_controller.connect():
-                    self.mpd_client = self.mpd_controller.client
-                    self.mpd_monitor = self.mpd_controller.monitor
-                    self.mpd_connected = True
-                    self.logger.info(f"MPD backend initialized - {self.config['mpd_host']}:{self.config['mpd_port']}")
-                    return True
-                else:
-                    self.logger.warning(f"Failed to connect to MPD (attempt {attempt+1}/{max_retries})")
-            except Exception as e:
-                self.logger.warning(f"MPD initialization failed (attempt {attempt+1}/{max_retries}): {e}")
-            time.sleep(10)  # Wait 10 seconds before retrying
-        return False
+            
+            if not self.mpd_controller.connect():
+                self.logger.warning("Failed to connect to MPD")
+                return False
+            
+            self.mpd_client = self.mpd_controller.client
+            self.mpd_monitor = self.mpd_controller.monitor
+            self.mpd_connected = True
+            self.logger.info(f"MPD backend initialized - {self.config['mpd_host']}:{self.config['mpd_port']}")
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"MPD initialization failed: {e}")
+            return False
     
     def _initialize_librespot(self) -> bool:
         """Initialize librespot backend"""
         self.logger.info("Initializing librespot backend...")
         
         try:
-            self.librespot_controller = LibrespotController(
-                host=self.config.get('librespot_host', config.LIBRESPOT_HOST),
-                port=self.config.get('librespot_port', config.LIBRESPOT_PORT),
-                timeout=self.config.get('librespot_timeout', config.MPD_TIMEOUT)
-            )
+            if self.librespot_controller is None:
+                self.librespot_controller = LibrespotController(
+                    host=self.config.get('librespot_host', config.LIBRESPOT_HOST),
+                    port=self.config.get('librespot_port', config.LIBRESPOT_PORT),
+                    timeout=self.config.get('librespot_timeout', config.LIBRESPOT_HTTP_READ_TIMEOUT),
+                    status_resync_interval=self.config.get('librespot_status_resync_interval',
+                                                           config.LIBRESPOT_STATUS_RESYNC_INTERVAL),
+                    status_standby_resync_interval=self.config.get('librespot_status_standby_resync_interval',
+                                                                   config.LIBRESPOT_STATUS_STANDBY_RESYNC_INTERVAL),
+                    http_pool_size=self.config.get('librespot_http_pool_size', config.LIBRESPOT_HTTP_POOL_SIZE),
+                    http_connect_timeout=self.config.get('librespot_http_connect_timeout',
+                                                         config.LIBRESPOT_HTTP_CONNECT_TIMEOUT),
+                    http_command_timeout=self.config.get('librespot_http_command_timeout',
+                                                         config.LIBRESPOT_HTTP_COMMAND_TIMEOUT)
+                )
             
             if not self.librespot_controller.connect():
                 self.logger.warning("Failed to connect to librespot")
@@ -197,15 +428,25 @@ class SourceController:
         #     return False
         
         try:
-            self.bluetooth_controller = BluetoothController()
+            self.bluetooth_controller = BluetoothController(
+                signal_coalesce_window=self.config.get('bluetooth_signal_coalesce_window',
+                                                       config.BLUETOOTH_SIGNAL_COALESCE_WINDOW),
+                connect_timeout=self.config.get('bluetooth_connect_timeout', config.BLUETOOTH_CONNECT_TIMEOUT),
+                backend=self.config.get('bluetooth_client_backend', config.BLUETOOTH_CLIENT_BACKEND),
+                bus_address=self.config.get('bluetooth_bus_address', config.BLUETOOTH_BUS_ADDRESS),
+                reconnect_candidates=self.config.get('bluetooth_reconnect_candidates',
+                                                     config.BLUETOOTH_RECONNECT_CANDIDATES)
+            )
             self.bluetooth_monitor = self.bluetooth_controller.monitor
             
             # Register callbacks for device connection events
             self.bluetooth_controller.on_device_connected = self._on_bluetooth_device_connected
             self.bluetooth_controller.on_device_disconnected = self._on_bluetooth_device_disconnected
             
-            # Give it time to initialize
-            time.sleep(0.5)
+            # The controller waited for its client setup - make sure it succeeded
+            if not self.bluetooth_controller.wait_ready(timeout=0):
+                self.bluetooth_controller.cleanup()
+                raise RuntimeError("Bluetooth client setup did not complete")
             
             self.bluetooth_connected = True
             self.logger.info("Bluetooth backend initialized")
@@ -213,6 +454,8 @@ class SourceController:
             
         except Exception as e:
             self.logger.warning(f"Bluetooth initialization failed: {e}")
+            self.bluetooth_controller = None
+            self.bluetooth_monitor = None
             return False
     
     def _on_bluetooth_device_connected(self, name: str, address: str):
@@ -274,6 +517,7 @@ class SourceController:
             sources.append(SourceType.BLUETOOTH)
         return sources
     
+    @command('source', CommandPriority.SOURCE, MergePolicy.SUPERSEDE)
     def set_source(self, source: SourceType) -> bool:
         """
         Switch to specified source.
@@ -302,12 +546,15 @@ class SourceController:
         # Store previous source
         previous_source = self.source
         
-        # Stop current source if different
-        if self.source and self.source != source and self.source != SourceType.NONE:
-            self._stop_source(self.source)
-        
-        # Set new source
+        # Set new source - its monitor was kept warm in standby, so the
+        # new source's state is published right away
         self.source = source
+        self._activate_monitor(source)
+        self._trigger_source_update()
+        
+        # Stop previous source if different (its monitor goes to standby)
+        if previous_source and previous_source != source and previous_source != SourceType.NONE:
+            self._stop_source(previous_source)
         
         # Handle source-specific logic
         if source == SourceType.BLUETOOTH:
@@ -321,12 +568,13 @@ class SourceController:
                     if previous_source == SourceType.BLUETOOTH:
                         self.logger.info(f"BT button pressed while already on BT - entering pairing mode")
                         self.bluetooth_controller.enter_pairing_mode(timeout_seconds=60)
+                    elif (self.config.get('bluetooth_auto_reconnect', config.BLUETOOTH_AUTO_RECONNECT)
+                          and self.bluetooth_controller.reconnect_recent()):
+                        self.logger.info(f"✅ Source set to {source.value} - reconnecting recent device")
                     else:
                         self.logger.info(f"✅ Source set to {source.value} - showing disconnected state")
-        else:
+        elif source in (SourceType.MPD, SourceType.LIBRESPOT):
             # MPD or Librespot - check if connected
-            play_started = False
-            
             if source == SourceType.MPD and not self.mpd_connected:
                 self.logger.warning(f"Source set to {source.value} but backend is not connected")
             elif source == SourceType.LIBRESPOT and not self.librespot_connected:
@@ -334,30 +582,10 @@ class SourceController:
             else:
                 self.logger.info(f"✅ Active source set to: {source.value}")
                 
-                # Start MPD monitoring if switching to MPD source
-                if source == SourceType.MPD and self.mpd_monitor and not self.mpd_monitor.is_monitoring:
-                    self.logger.info("Starting MPD monitoring for track info")
-                    self.mpd_monitor.start_monitoring()
-                
-            # Auto-play when switching sources
-        play_started = False
-        try:
-            if source == SourceType.MPD:
-                # Always start playing when MPD source is selected
-                self.logger.info(f"Auto-starting playback on {source.value}")
-                play_started = self.play()
-            elif source == SourceType.LIBRESPOT:
+                # Auto-play when switching sources - queued, the monitor
+                # publishes the new playback state when it lands
                 self.logger.info(f"Auto-starting playback on {source.value}")
-                play_started = self.play()
-        except Exception as e:
-            self.logger.warning(f"Could not auto-start playback on {source.value}: {e}")
-        
-        # Trigger update for the new source
-        # If we just started playing, add a small delay to let monitor fetch track info
-        if play_started:
-            time.sleep(0.2)
-        
-        self._trigger_source_update()
+                self.submit('play')
         
         return True
     
@@ -380,12 +608,14 @@ class SourceController:
         try:
             if source == SourceType.MPD and self.mpd_connected and self.mpd_controller:
                 self.mpd_controller.stop()
-                self.mpd_monitor.stop_monitoring()
+                self.mpd_monitor.set_standby(True)
                 self.logger.info("🛑 Stopped MPD playback")
             elif source == SourceType.LIBRESPOT and self.librespot_connected and self.librespot_controller:
                 self.librespot_controller.stop()
+                self.librespot_monitor.set_standby(True)
                 self.logger.info("🛑 Stopped Spotify playback")
             elif source == SourceType.BLUETOOTH and self.bluetooth_connected and self.bluetooth_controller:
+                self.bluetooth_controller.cancel_reconnect()
                 if self.bluetooth_controller.pairing_mode:
                     self.logger.info("Exiting Bluetooth pairing mode (switching sources)")
                     self.bluetooth_controller.exit_pairing_mode()
@@ -395,6 +625,19 @@ class SourceController:
         except Exception as e:
             self.logger.warning(f"Error stopping {source.value}: {e}")
     
+    def _activate_monitor(self, source: SourceType):
+        """Take a source's monitor out of standby (starting it if it never ran)."""
+        try:
+            if source == SourceType.MPD and self.mpd_connected and self.mpd_monitor:
+                self.mpd_monitor.set_standby(False)
+                if not self.mpd_monitor.is_monitoring:
+                    self.logger.info("Starting MPD monitoring for track info")
+                    self.mpd_monitor.start_monitoring()
+            elif source == SourceType.LIBRESPOT and self.librespot_connected and self.librespot_monitor:
+                self.librespot_monitor.set_standby(False)
+        except Exception as e:
+            self.logger.warning(f"Error activating {source.value} monitor: {e}")
+    
     def _get_active_controller(self):
         """
         Get controller for currently active source.
@@ -415,6 +658,7 @@ class SourceController:
     # Playback Control
     # =========================================================================
     
+    @command('transport', CommandPriority.TRANSPORT, MergePolicy.SUPERSEDE)
     def play(self) -> bool:
         """Start playback on active source"""
         controller, source_name, is_connected = self._get_active_controller()
@@ -428,7 +672,8 @@ class SourceController:
             return False
         
         try:
-            result = controller.play()
+            with tracer.span('backend', source_name):
+                result = controller.play()
             if result:
                 self.logger.info(f"▶️ [{source_name}] Playing")
             return result
@@ -436,6 +681,7 @@ class SourceController:
             self.logger.error(f"Error in play command: {e}\n{traceback.format_exc()}")
             return False
     
+    @command('transport', CommandPriority.TRANSPORT, MergePolicy.SUPERSEDE)
     def pause(self) -> bool:
         """Pause playback on active source"""
         controller, source_name, is_connected = self._get_active_controller()
@@ -449,7 +695,8 @@ class SourceController:
             return False
         
         try:
-            result = controller.pause()
+            with tracer.span('backend', source_name):
+                result = controller.pause()
             if result:
                 self.logger.info(f"⏸️ [{source_name}] Paused")
             return result
@@ -457,6 +704,7 @@ class SourceController:
             self.logger.error(f"Error in pause command: {e}\n{traceback.format_exc()}")
             return False
     
+    @command('transport', CommandPriority.TRANSPORT, MergePolicy.SUPERSEDE)
     def stop(self) -> bool:
         """Stop playback on active source"""
         controller, source_name, is_connected = self._get_active_controller()
@@ -470,7 +718,8 @@ class SourceController:
             return False
         
         try:
-            result = controller.stop()
+            with tracer.span('backend', source_name):
+                result = controller.stop()
             if result:
                 self.logger.info(f"⏹️ [{source_name}] Stopped")
             return result
@@ -478,6 +727,7 @@ class SourceController:
             self.logger.error(f"Error in stop command: {e}\n{traceback.format_exc()}")
             return False
     
+    @command('transport', CommandPriority.TRANSPORT, MergePolicy.QUEUE)
     def play_pause(self) -> bool:
         """Toggle play/pause on active source"""
         controller, source_name, is_connected = self._get_active_controller()
@@ -491,7 +741,8 @@ class SourceController:
             return False
         
         try:
-            result = controller.playpause()
+            with tracer.span('backend', source_name):
+                result = controller.playpause()
             if result:
                 self.logger.info(f"⏯️ [{source_name}] Play/Pause toggled")
             return result
@@ -499,6 +750,7 @@ class SourceController:
             self.logger.error(f"Error in play/pause command: {e}\n{traceback.format_exc()}")
             return False
     
+    @command('next', CommandPriority.TRANSPORT, MergePolicy.BOUNDED)
     def next(self) -> bool:
         """Skip to next track on active source"""
         controller, source_name, is_connected = self._get_active_controller()
@@ -516,7 +768,8 @@ class SourceController:
             return False
         
         try:
-            result = controller.next()
+            with tracer.span('backend', source_name):
+                result = controller.next()
             if result:
                 self.logger.info(f"⏭️ [{source_name}] Next track")
             return result
@@ -524,6 +777,7 @@ class SourceController:
             self.logger.error(f"Error in next command: {e}\n{traceback.format_exc()}")
             return False
     
+    @command('previous', CommandPriority.TRANSPORT, MergePolicy.BOUNDED)
     def previous(self) -> bool:
         """Skip to previous track on active source"""
         controller, source_name, is_connected = self._get_active_controller()
@@ -541,7 +795,8 @@ class SourceController:
             return False
         
         try:
-            result = controller.previous()
+            with tracer.span('backend', source_name):
+                result = controller.previous()
             if result:
                 self.logger.info(f"⏮️ [{source_name}] Previous track")
             return result
@@ -554,25 +809,16 @@ class SourceController:
     # =========================================================================
     
     def get_volume(self) -> Optional[int]:
-        """Get current volume level from active source"""
-        controller, source_name, is_connected = self._get_active_controller()
-        
-        if not controller or not is_connected:
+        """Get current volume level from active source (local target, no round trip)"""
+        engine = self._get_volume_engine(self.source)
+        if not engine:
             return None
         
-        if self.source == SourceType.NONE:
-            return None
+        if engine.target is not None:
+            return engine.target
         
-        # Special handling for Bluetooth volume via controller
-        if self.source == SourceType.BLUETOOTH and self.bluetooth_controller:
-            try:
-                return self.bluetooth_controller.get_volume()
-            except Exception as e:
-                self.logger.error(f"Error getting Bluetooth volume: {e}")
-                return None
-
         try:
-            return controller.get_volume()
+            return self._read_backend_volume(self.source)
         except Exception as e:
             self.logger.error(f"Error getting volume: {e}\n{traceback.format_exc()}")
             return None
@@ -597,87 +843,117 @@ class SourceController:
             self.logger.error(f"Invalid volume: {volume}. Must be 0-100")
             return False
         
-        # Special handling for Bluetooth volume via controller
-        if self.source == SourceType.BLUETOOTH and self.bluetooth_controller:
-            try:
-                return self.bluetooth_controller.set_volume(volume)
-            except Exception as e:
-                self.logger.error(f"Error setting Bluetooth volume: {e}")
-                return False
-
-        try:
-            result = controller.set_volume(volume)
-            if result:
-                self.logger.info(f"🔊 [{source_name}] Volume set to {volume}%")
-            return result
-        except Exception as e:
-            self.logger.error(f"Error setting volume: {e}")
+        engine = self._get_volume_engine(self.source)
+        if not engine:
             return False
+        
+        engine.set(volume)
+        self.logger.info(f"🔊 [{source_name}] Volume set to {volume}%")
+        return True
     
     def volume_up(self, step: int = 5) -> Optional[int]:
         """Increase volume by step"""
-        controller, source_name, is_connected = self._get_active_controller()
-        
-        if not controller or not is_connected:
-            return None
-        
-        if self.source == SourceType.NONE:
-            return None
-        
-        # Special handling for Bluetooth volume via controller
-        if self.source == SourceType.BLUETOOTH and self.bluetooth_controller:
-            try:
-                if self.bluetooth_controller.volume_up(step):
-                    # Return new volume if possible
-                    return self.bluetooth_controller.get_volume()
-                return None
-            except Exception as e:
-                self.logger.error(f"Error increasing Bluetooth volume: {e}")
-                return None
-
-        try:
-            new_volume = controller.volume_up(step)
-            if new_volume is not None:
-                self.logger.info(f"🔊 [{source_name}] Volume up to {new_volume}%")
-            return new_volume
-        except Exception as e:
-            self.logger.error(f"Error increasing volume: {e}")
-            return None
+        return self._step_volume(step)
     
     def volume_down(self, step: int = 5) -> Optional[int]:
         """Decrease volume by step"""
+        return self._step_volume(-step)
+    
+    def _step_volume(self, delta: int) -> Optional[int]:
+        """
+        Apply a volume step to the active source's volume engine.
+        
+        Runs on the caller's thread, not the command executor: every press
+        counts and never waits behind a source switch. The new target is
+        returned (and shown) immediately; the engine writes it to the
+        backend in the background.
+        """
         controller, source_name, is_connected = self._get_active_controller()
         
         if not controller or not is_connected:
             return None
         
-        if self.source == SourceType.NONE:
+        engine = self._get_volume_engine(self.source)
+        if not engine:
             return None
         
-        # Special handling for Bluetooth volume via controller
-        if self.source == SourceType.BLUETOOTH and self.bluetooth_controller:
-            try:
-                if self.bluetooth_controller.volume_down(step):
-                    # Return new volume if possible
-                    return self.bluetooth_controller.get_volume()
-                return None
-            except Exception as e:
-                self.logger.error(f"Error decreasing Bluetooth volume: {e}")
-                return None
-
-        try:
-            new_volume = controller.volume_down(step)
-            if new_volume is not None:
-                self.logger.info(f"🔊 [{source_name}] Volume down to {new_volume}%")
-            return new_volume
-        except Exception as e:
-            self.logger.error(f"Error decreasing volume: {e}")
+        new_volume = engine.step(delta)
+        if new_volume is not None:
+            direction = "up" if delta > 0 else "down"
+            self.logger.info(f"🔊 [{source_name}] Volume {direction} to {new_volume}%")
+        return new_volume
+    
+    def _get_volume_engine(self, source: SourceType) -> Optional[VolumeEngine]:
+        """
+        Get (or create) the volume engine for a source.
+        
+        Returns:
+            VolumeEngine or None if the source has no volume control
+        """
+        engine = self._volume_engines.get(source)
+        if engine:
+            return engine
+        
+        with self._volume_engines_lock:
+            engine = self._volume_engines.get(source)
+            if engine is None:
+                engine = self._create_volume_engine(source)
+                if engine:
+                    self._volume_engines[source] = engine
+            return engine
+    
+    def _create_volume_engine(self, source: SourceType) -> Optional[VolumeEngine]:
+        """New volume engine for a source (None if it has no volume control)"""
+        settle_time = self.config.get('volume_settle_time', config.VOLUME_SETTLE_TIME)
+        
+        if source == SourceType.MPD and self.mpd_controller:
+            write_fn, max_volume = self.mpd_controller.set_volume, 100
+        elif source == SourceType.LIBRESPOT and self.librespot_controller:
+            write_fn, max_volume = self.librespot_controller.set_volume, 100
+        elif source == SourceType.BLUETOOTH and self.bluetooth_controller:
+            # AVRCP absolute volume range
+            write_fn, max_volume = self.bluetooth_controller.set_volume, 127
+        else:
             return None
+        
+        engine = VolumeEngine(
+            name=source.value,
+            write_fn=write_fn,
+            read_fn=lambda: self._read_backend_volume(source),
+            max_volume=max_volume,
+            settle_time=settle_time,
+            on_change=lambda volume: self._on_volume_target_changed(source, volume)
+        )
+        return engine
+    
+    def _read_backend_volume(self, source: SourceType) -> Optional[int]:
+        """Read a source's volume, preferring the monitor's cached value."""
+        if source == SourceType.MPD and self.mpd_controller:
+            if self.mpd_monitor and self.mpd_monitor.current_status.volume is not None:
+                return self.mpd_monitor.current_status.volume
+            return self.mpd_controller.get_volume()
+        if source == SourceType.LIBRESPOT and self.librespot_controller:
+            if self.librespot_monitor and self.librespot_monitor.current_status.volume is not None:
+                return self.librespot_monitor.current_status.volume
+            return self.librespot_controller.get_volume()
+        if source == SourceType.BLUETOOTH and self.bluetooth_controller:
+            if self.bluetooth_monitor and self.bluetooth_monitor.current_volume is not None:
+                return self.bluetooth_monitor.current_volume
+            return self.bluetooth_controller.get_volume()
+        return None
+    
+    def _on_volume_target_changed(self, source: SourceType, volume: int):
+        """Show a locally changed volume target right away."""
+        if self.source != source:
+            return
+        playback_state = self.get_playback_state()
+        self._publish_state(playback_state=PlaybackState(status=playback_state.status, volume=volume))
     
     # =========================================================================
     # Power Management
     # =========================================================================
     
+    @command('power', CommandPriority.POWER, MergePolicy.SUPERSEDE, preempt=True)
     def power_on(self, trigger_source: 'SourceType' = None) -> bool:
         """Power on - restore source and start playback. If trigger_source is provided, use it as initial source."""
         if self.powered_on:
@@ -701,23 +977,26 @@ class SourceController:
                 source_to_use = available[0]
                 self.logger.info(f"Selecting first available source: {source_to_use.value}")
 
-        # Set source and auto-start playback
+        # Set source and auto-start playback (set_source already queues play for MPD/Librespot)
         if source_to_use:
             self.set_source(source_to_use)
-            try:
-                self.logger.info("Auto-starting playback on power on")
-                self.play()
-            except Exception as e:
-                self.logger.warning(f"Could not auto-start playback on power on: {e}")
+            if source_to_use == SourceType.BLUETOOTH:
+                try:
+                    self.logger.info("Auto-starting playback on power on")
+                    self.play()
+                except Exception as e:
+                    self.logger.warning(f"Could not auto-start playback on power on: {e}")
         else:
             # No sources available, but still allow power on (useful for testing/development)
             self.logger.warning("No sources available for power on - powering on with no source")
             self.source = SourceType.NONE
         
         # Always emit power changed callback
+        self._publish_state(powered_on=True)
         self._emit_callback('client_changed', 'power_changed', powered_on=True)
         return True
     
+    @command('power', CommandPriority.POWER, MergePolicy.SUPERSEDE, preempt=True)
     def power_off(self) -> bool:
         """Power off - save source and stop playback"""
         if not self.powered_on:
@@ -740,10 +1019,12 @@ class SourceController:
         self.source = SourceType.NONE
         self.powered_on = False
         
+        self._publish_state(powered_on=False)
         self._emit_callback('client_changed', 'power_changed', powered_on=False)
         self.logger.info("[OK] Powered off")
         return True
     
+    @command('power', CommandPriority.POWER, MergePolicy.QUEUE, preempt=True)
     def power(self) -> bool:
         """Toggle power state"""
         if not self.powered_on:
@@ -765,14 +1046,25 @@ class SourceController:
         Returns:
             Playback state object
         """
+        playback_state = None
         if self.source == SourceType.MPD and self.mpd_connected and self.mpd_monitor:
-            return self.mpd_monitor.get_playback_state(force_refresh=force_refresh)
+            playback_state = self.mpd_monitor.get_playback_state(force_refresh=force_refresh)
         elif self.source == SourceType.LIBRESPOT and self.librespot_connected and self.librespot_monitor:
-            return self.librespot_monitor.get_playback_state(force_refresh=force_refresh)
+            playback_state = self.librespot_monitor.get_playback_state(force_refresh=force_refresh)
         elif self.source == SourceType.BLUETOOTH and self.bluetooth_connected and self.bluetooth_monitor:
-            return self.bluetooth_monitor.get_playback_state()
+            playback_state = self.bluetooth_monitor.get_playback_state()
         
-        return PlaybackState(status=PlaybackStatus.STOPPED, volume=0)
+        if playback_state is None:
+            return PlaybackState(status=PlaybackStatus.STOPPED, volume=0)
+        return self._overlay_volume_target(self.source, playback_state)
+    
+    def _overlay_volume_target(self, source: SourceType, playback_state: PlaybackState) -> PlaybackState:
+        """Show the local volume target while our own volume writes are settling."""
+        engine = self._volume_engines.get(source)
+        if (engine and engine.is_settling and engine.target is not None
+                and isinstance(playback_state, PlaybackState) and playback_state.volume != engine.target):
+            return PlaybackState(status=playback_state.status, volume=engine.target)
+        return playback_state
 
     def get_track_info(self) -> Optional[TrackInfo]:
         """
@@ -814,8 +1106,7 @@ class SourceController:
             info = monitor.get_source_info()
             # Enrich with source type enum and power state
             if isinstance(info, SourceInfo):
-                info.source = self.source
-                info.power = self.powered_on
+                info = replace(info, source=self.source, power=self.powered_on)
             return info
         
         return SourceInfo(source=SourceType.NONE, device_name="Unknown", power=self.powered_on)
@@ -833,17 +1124,18 @@ class SourceController:
         # For MPD, get playlists as menu options
         if self.source == SourceType.MPD and self.mpd_connected and self.mpd_controller:
             try:
-                playlists = self.mpd_controller.get_playlists()
+                # Cached catalog - menu navigation never waits for MPD
+                playlists = self.mpd_controller.playlists.get_entries()
                 if playlists:
                     options = [
                         {
-                            'id': f'playlist_{i}',
-                            'label': playlist,
+                            'id': playlist.id,
+                            'label': playlist.name,
                             'type': 'playlist',
                             'action': 'load_playlist',
-                            'playlist_name': playlist
+                            'playlist_name': playlist.name
                         }
-                        for i, playlist in enumerate(playlists)
+                        for playlist in playlists
                     ]
                     return {
                         'has_menu': True,
@@ -860,6 +1152,7 @@ class SourceController:
             'options': []
         }
     
+    @command('menu', CommandPriority.TRANSPORT)
     def execute_menu_action(self, action: str, option_id: str = None) -> Dict[str, Any]:
         """
         Execute a menu action for the current source.
@@ -873,26 +1166,22 @@ class SourceController:
         """
         try:
             if action == 'load_playlist':
-                # Extract playlist name from the current menu options
-                menu_options = self.get_menu_options()
-                if menu_options.get('has_menu', False):
-                    options = menu_options.get('options', [])
-                    selected = next((opt for opt in options if opt['id'] == option_id), None)
-                    if selected:
-                        playlist_name = selected.get('playlist_name')
-                        if playlist_name and self.source == SourceType.MPD and self.mpd_controller:
-                            # Load and play the playlist
-                            success = self.mpd_controller.play_playlist(playlist_name)
-                            if success:
-                                return {
-                                    'status': 'success',
-                                    'message': f'Playing: {playlist_name}'
-                                }
-                            else:
-                                return {
-                                    'status': 'error',
-                                    'message': f'Failed to load playlist'
-                                }
+                # Map the option id back to a playlist name (cached lookup)
+                if self.source == SourceType.MPD and self.mpd_controller:
+                    playlist_name = self.mpd_controller.playlists.get_name(option_id)
+                    if playlist_name:
+                        # Load and play the playlist
+                        success = self.mpd_controller.play_playlist(playlist_name)
+                        if success:
+                            return {
+                                'status': 'success',
+                                'message': f'Playing: {playlist_name}'
+                            }
+                        else:
+                            return {
+                                'status': 'error',
+                                'message': f'Failed to load playlist'
+                            }
             
             return {
                 'status': 'error',
@@ -906,8 +1195,126 @@ class SourceController:
                 'message': f'Error: {str(e)}'
             }
     
+    # =========================================================================
+    # Music Library (MPD)
+    # =========================================================================
+    
+    def search_library(self, query: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Search the MPD library (answered from the local index).
+        
+        Args:
+            query: Free text; every word must prefix-match title, artist, album or file name
+            limit: Max number of results (default: mpd_library_search_limit)
+        
+        Returns:
+            Dict with results (track dicts), count and whether the index is loaded
+        """
+        library = self._get_library()
+        if not library:
+            return {'query': query, 'results': [], 'count': 0, 'indexed': False}
+        
+        if limit is None:
+            limit = self.config.get('mpd_library_search_limit', config.MPD_LIBRARY_SEARCH_LIMIT)
+        
+        start = time.perf_counter()
+        tracks = library.search(query, limit=limit)
+        self.logger.debug(f"📚 Library search '{query}': {len(tracks)} results in "
+                          f"{(time.perf_counter() - start) * 1000:.1f}ms")
+        return {
+            'query': query,
+            'results': [track.to_dict() for track in tracks],
+            'count': len(tracks),
+            'indexed': library.is_loaded
+        }
+    
+    def browse_library(self, artist: Optional[str] = None, album: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Browse the MPD library: artists, an artist's albums, or an album's tracks.
+        
+        Args:
+            artist: Album artist to list albums for
+            album: Album to list tracks for (requires artist)
+        
+        Returns:
+            Dict with the level ('artists', 'albums' or 'tracks') and its items
+        """
+        library = self._get_library()
+        if not library:
+            return {'type': 'artists', 'items': [], 'indexed': False}
+        
+        if artist and album:
+            items = [track.to_dict() for track in library.get_tracks(artist, album)]
+            return {'type': 'tracks', 'artist': artist, 'album': album, 'items': items, 'indexed': library.is_loaded}
+        if artist:
+            return {'type': 'albums', 'artist': artist, 'items': library.get_albums(artist), 'indexed': library.is_loaded}
+        return {'type': 'artists', 'items': library.get_artists(), 'indexed': library.is_loaded}
+    
+    @command('library', CommandPriority.TRANSPORT, MergePolicy.SUPERSEDE)
+    def play_library_track(self, file: str) -> bool:
+        """
+        Play a library track on MPD (switches to MPD if another source is active).
+        
+        Args:
+            file: Track file URI (from search/browse results)
+        
+        Returns:
+            True if successful
+        """
+        if not self.mpd_connected or not self.mpd_controller:
+            self.logger.warning("MPD not connected - cannot play library track")
+            return False
+        
+        if self.source != SourceType.MPD:
+            self.set_source(SourceType.MPD)
+        
+        result = self.mpd_controller.play(file)
+        if result:
+            self.logger.info(f"▶️ [MPD] Playing library track: {file}")
+        return result
+    
+    def get_queue(self, start: int = 0, count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get one page of the MPD queue.
+        
+        Args:
+            start: First queue position
+            count: Number of entries (default: mpd_queue_page_size)
+        
+        Returns:
+            Dict with start, length (whole queue) and songs
+        """
+        if not self.mpd_connected or not self.mpd_controller:
+            return {'start': start, 'length': 0, 'songs': []}
+        
+        if count is None:
+            count = self.config.get('mpd_queue_page_size', config.MPD_QUEUE_PAGE_SIZE)
+        songs = self.mpd_controller.get_queue_window(start, start + count)
+        return {'start': start, 'length': self.mpd_controller.queue.length, 'songs': songs}
+    
+    def get_queue_around_current(self, before: int = 2, after: int = 10) -> Dict[str, Any]:
+        """
+        Get the MPD queue around the current song ("up next").
+        
+        Returns:
+            Dict with current_pos, length and songs
+        """
+        if not self.mpd_connected or not self.mpd_controller:
+            return {'current_pos': None, 'length': 0, 'songs': []}
+        return self.mpd_controller.get_queue_around_current(before, after)
+    
+    def _get_library(self):
+        """Get the MPD library index (None if MPD is unavailable)."""
+        if not self.mpd_connected or not self.mpd_controller:
+            return None
+        library = self.mpd_controller.library
+        # Database events are only received while MPD is monitored
+        if not (self.mpd_monitor and self.mpd_monitor.is_monitoring):
+            library.check_for_updates_async()
+        return library
+    
     def _trigger_source_update(self):
-        """Fetch current state from active monitor and trigger callbacks"""
+        """Fetch current state from active monitor and publish it as one snapshot"""
         # Get monitor (not controller) for state queries
         monitor = None
         is_connected = False
@@ -928,29 +1335,26 @@ class SourceController:
 
         if monitor and is_connected:
             try:
-                playback_state = monitor.get_playback_state()
+                playback_state = self._overlay_volume_target(self.source, monitor.get_playback_state())
                 track_info = monitor.get_track_info()
                 source_info = monitor.get_source_info()
                 if isinstance(source_info, SourceInfo):
-                    source_info.source = self.source
-                    source_info.power = self.powered_on
+                    source_info = replace(source_info, source=self.source, power=self.powered_on)
                 elif isinstance(source_info, dict):
                     source_info['source'] = self.source.value
                     source_info['power'] = self.powered_on
             except Exception as e:
                 self.logger.error(f"Error fetching state for update: {e}")
 
-        # Emit generic change events
-        self._emit_callback('client_changed', 'playback_state_changed', playback_state=playback_state)
-        self._emit_callback('client_changed', 'track_changed', track_info=track_info)
-        self._emit_callback('client_changed', 'source_info_changed', source_info=source_info)
-
-        # Emit current source and available sources
         current_source = self.get_current_source()
-        self._emit_callback('client_changed', 'current_source_changed', current_source=current_source.value if current_source else 'none')
-
-        available_sources = [s.value for s in self.get_available_sources()]
-        self._emit_callback('client_changed', 'available_sources_changed', available_sources=available_sources)
+        self._publish_state(
+            playback_state=playback_state,
+            track_info=track_info,
+            source_info=source_info,
+            current_source=current_source.value if current_source else 'none',
+            available_sources=tuple(s.value for s in self.get_available_sources()),
+            powered_on=self.powered_on
+        )
 
     def _handle_monitor_event(self, source_type: SourceType, event_name: str, **kwargs):
         """Handle events from any monitor"""
@@ -972,85 +1376,166 @@ class SourceController:
              if is_playing:
                  if self.source != SourceType.LIBRESPOT:
                      self.logger.info("Auto-switching to Spotify")
-                     self.set_source(SourceType.LIBRESPOT)
-                     # set_source triggers update, so we can return or continue. 
-                     # If we continue, we might send duplicate events, but that's usually fine.
+                     self.submit('set_source', SourceType.LIBRESPOT)
+                     # Queued, not awaited - monitor threads never wait for a switch.
+                     # set_source publishes the new state once it has run.
         
         # Bluetooth: Auto-switch when device connects (but stay on Bluetooth when disconnected)
         if source_type == SourceType.BLUETOOTH and event_name == 'device_connected':
             self.logger.debug(f"🔵 Bluetooth device_connected event detected")
             if self.source != SourceType.BLUETOOTH:
                 self.logger.info("🔵 Auto-switching to Bluetooth (device connected)")
-                self.set_source(SourceType.BLUETOOTH)
+                self.submit('set_source', SourceType.BLUETOOTH)
             else:
                 self.logger.debug(f"🔵 Already on Bluetooth source, no switch needed")
         
+        # Reconcile reported volume with the local target (our own writes may still be landing)
+        if event_name == 'playback_state_changed':
+            playback_state = kwargs.get('playback_state')
+            engine = self._volume_engines.get(source_type)
+            if engine and isinstance(playback_state, PlaybackState):
+                volume = engine.reconcile(playback_state.volume)
+                if volume is not None and volume != playback_state.volume:
+                    # Don't mutate the monitor's cached state
+                    kwargs['playback_state'] = PlaybackState(status=playback_state.status, volume=volume)
+        
+        # New Bluetooth device - its volume is unrelated to the previous one
+        if source_type == SourceType.BLUETOOTH and event_name == 'device_connected':
+            self._volume_engines.pop(SourceType.BLUETOOTH, None)
+        
         # 2. Forwarding logic - only if active source
         if self.source == source_type:
-            # Forward all events through unified client_changed callback
+            # State fields go out as a snapshot, other events through unified client_changed callback
             self.logger.debug(f"✅ FORWARDING {source_type.value} event '{event_name}' to client_changed callbacks (active source matches)")
-            self._emit_callback('client_changed', event_name, **kwargs)
+            state_field = self._STATE_EVENTS.get(event_name)
+            # Monitor threads carry no trace - attribute the event to the input that likely caused it
+            trace = tracer.current() or tracer.recent()
+            tracer.mark(trace, 'monitor', f"{source_type.value}:{event_name}")
+            with tracer.activate(trace):
+                if state_field and state_field in kwargs:
+                    self._publish_state(**{state_field: kwargs[state_field]})
+                else:
+                    self._emit_callback('client_changed', event_name, **kwargs)
         else:
             self.logger.debug(f"⏸️ NOT forwarding {source_type.value} event '{event_name}' (not active source: current={self.source.value if self.source else 'none'})")
 
+    # =========================================================================
+    # Commands
+    # =========================================================================
+
+    def submit(self, command_name: str, *args, **kwargs) -> Future:
+        """
+        Queue a command without waiting for it.
+        
+        Commands run one at a time in priority order (power, source, then
+        transport); a queued command of the same kind may be
+        superseded or coalesced, its future then gets the newer result.
+        
+        Args:
+            command_name: Name of a command method (e.g. 'next', 'set_source')
+            
+        Returns:
+            Future with the method's return value (cancelled if a power command preempted it)
+        """
+        method = getattr(type(self), command_name, None)
+        spec = getattr(method, 'command_spec', None)
+        if spec is None:
+            raise ValueError(f"Unknown command: {command_name}")
+        return self._commands.submit(command_name, spec, method.command_method, self, *args, **kwargs)
+
+    def get_command_stats(self) -> Dict[str, Any]:
+        """
+        Get command executor metrics.
+        
+        Returns:
+            Dict with queue depth, superseded/coalesced/preempted counts and latency
+        """
+        return self._commands.get_stats()
+
+    def get_trace_stats(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get input-to-display latency traces.
+        
+        Args:
+            limit: Max number of traces returned (newest first)
+            
+        Returns:
+            Dict with enabled flag, recent traces and per-stage latency histograms
+        """
+        return {
+            'enabled': tracer.enabled,
+            'traces': tracer.get_traces(limit),
+            'histograms': tracer.get_histograms()
+        }
+
     # =========================================================================
     # Event System
     # =========================================================================
 
-    def add_callback(self, event_name: str, callback: Callable):
-        """Add a callback for an event"""
-        if event_name not in self._callbacks:
-            self._callbacks[event_name] = []
+    def add_callback(self, event_name: str, callback: Callable, legacy_events: bool = False):
+        """
+        Add a callback for an event.
         
-        if callback not in self._callbacks[event_name]:
-            self._callbacks[event_name].append(callback)
+        Callbacks run on their own delivery thread (see EventBus), never on
+        the thread that emitted the event.
+        
+        State changes arrive as one 'state_changed' event with the new
+        RadioState (state) and a StateField mask (changed). With
+        legacy_events the callback gets the per-field events instead
+        (playback_state_changed, track_changed, source_info_changed,
+        current_source_changed, available_sources_changed).
+        """
+        if self._events.subscribe(event_name, callback, legacy=legacy_events):
             self.logger.debug(f"Added callback for event: {event_name}")
 
     def remove_callback(self, event_name: str, callback: Callable):
         """Remove a callback for an event"""
-        if event_name in self._callbacks and callback in self._callbacks[event_name]:
-            self._callbacks[event_name].remove(callback)
+        if self._events.unsubscribe(event_name, callback):
             self.logger.debug(f"Removed callback for event: {event_name}")
 
     def _emit_callback(self, event_name: str, sub_event: str = None, **kwargs):
-        """Emit an event to registered callbacks"""
-        # Debug: Show what we're emitting
+        """Queue an event for registered callbacks (returns without waiting for them)"""
         event_desc = f"{event_name}" + (f"/{sub_event}" if sub_event else "")
-        callback_count = len(self._callbacks.get(event_name, [])) + len(self._callbacks.get('any', []))
-        self.logger.debug(f"📤 Emitting callback: {event_desc}, {callback_count} registered callbacks")
+        self.logger.debug(f"📤 Emitting callback: {event_desc}, "
+                          f"{self._events.subscriber_count(event_name)} registered callbacks")
+        self._events.publish(event_name, sub_event, **kwargs)
+
+    def _publish_state(self, **changes):
+        """
+        Replace fields of the state snapshot and publish it if anything changed.
         
-        # 1. Specific event callbacks
-        if event_name in self._callbacks:
-            for callback in self._callbacks[event_name]:
-                try:
-                    if sub_event:
-                        # If sub_event provided, pass it (useful for 'client_changed')
-                        self.logger.debug(f"  → Calling specific callback with sub_event={sub_event}")
-                        callback(event=sub_event, **kwargs)
-                    else:
-                        self.logger.debug(f"  → Calling specific callback")
-                        callback(**kwargs)
-                except Exception as e:
-                    self.logger.error(f"Error in callback for {event_name}: {e}")
+        Subscribers get one 'state_changed' event per update instead of one
+        event per field; legacy per-field events are derived from it only
+        for subscribers registered with legacy_events.
+        """
+        # Held across publish so events leave in version order
+        with self._state_lock:
+            state, changed = self.state_store.update(**changes)
+            if not changed:
+                return
+            self.logger.debug(f"📤 State v{state.version} changed: {changed!r}")
+            self._events.publish('client_changed', 'state_changed',
+                                 legacy=lambda: state.legacy_events(changed),
+                                 state=state, changed=changed)
+
+    def get_state_snapshot(self) -> RadioState:
+        """
+        Get the current state snapshot.
         
-        # 2. 'any' event callbacks (catch-all)
-        if 'any' in self._callbacks:
-            for callback in self._callbacks['any']:
-                try:
-                    # Pass the event name as 'event' kwarg
-                    full_kwargs = kwargs.copy()
-                    full_kwargs['event_type'] = event_name
-                    if sub_event:
-                        full_kwargs['sub_event'] = sub_event
-                    
-                    callback(**full_kwargs)
-                except Exception as e:
-                    self.logger.error(f"Error in 'any' callback: {e}")
+        Returns:
+            Immutable RadioState (all fields from the same version)
+        """
+        return self.state_store.get_snapshot()
+
+    def get_event_stats(self) -> Dict[str, Any]:
+        """
+        Get callback delivery metrics.
+        
+        Returns:
+            Dict of subscriber to queue depth, drops, merges and latency
+        """
+        return self._events.get_stats()
 
-    # =========================================================================
-    # Monitoring
-    # =========================================================================
-    
     def start_monitoring(self, mpd_state_callback=None, librespot_state_callback=None, on_client_changed=None, on_spotify_track_started=None, bluetooth_callbacks=None):
         """
         Start monitoring for all connected backends.
@@ -1066,16 +1551,16 @@ class SourceController:
         # All legacy callbacks are mapped to 'client_changed' for consistency
         
         if mpd_state_callback:
-            self.add_callback('client_changed', mpd_state_callback)
+            self.add_callback('client_changed', mpd_state_callback, legacy_events=True)
             
         if librespot_state_callback:
-            self.add_callback('client_changed', librespot_state_callback)
+            self.add_callback('client_changed', librespot_state_callback, legacy_events=True)
             
         if on_client_changed:
-            self.add_callback('client_changed', on_client_changed)
+            self.add_callback('client_changed', on_client_changed, legacy_events=True)
             
         if on_spotify_track_started:
-            self.add_callback('client_changed', on_spotify_track_started)
+            self.add_callback('client_changed', on_spotify_track_started, legacy_events=True)
             
         if bluetooth_callbacks:
             # DEPRECATED: bluetooth_callbacks dict is now handled through unified client_changed callback
@@ -1087,24 +1572,39 @@ class SourceController:
                 for event_name, callback in bluetooth_callbacks.items():
                     if callback:
                         # Register as client_changed callback
-                        self.add_callback('client_changed', callback)
+                        self.add_callback('client_changed', callback, legacy_events=True)
         
         self.logger.info("Starting monitoring for all backends...")
         
+        # Backends that come up later start monitoring from _on_backend_connected
+        self._monitoring_started = True
+        for source in self._BACKENDS:
+            if self._is_backend_connected(source):
+                self._start_backend_monitoring(source)
+    
+    def _start_backend_monitoring(self, source: SourceType):
+        """Register for a backend's monitor events (once per backend)."""
+        with self._monitoring_lock:
+            if source in self._monitored_sources:
+                return
+            self._monitored_sources.add(source)
+        
         # Start MPD monitoring
-        if self.mpd_connected and self.mpd_monitor:
+        if source == SourceType.MPD and self.mpd_monitor:
             # Register SourceController to receive monitor events
             # Monitor passes event='event_name' as kwarg, so extract it
             def mpd_callback(**kwargs):
                 event_name = kwargs.pop('event', 'unknown')
                 self._handle_monitor_event(SourceType.MPD, event_name, **kwargs)
             self.mpd_monitor.add_callback('any', mpd_callback)
-            # only monitor when source = MPD to reduce load
-            # self.mpd_monitor.start_monitoring()
+            # Monitor all the time - in standby while another source is active
+            self.mpd_monitor.set_standby(self.source != SourceType.MPD)
+            if not self.mpd_monitor.is_monitoring:
+                self.mpd_monitor.start_monitoring()
             self.logger.info("✅ MPD monitoring started")
             
         # Start Librespot monitoring
-        if self.librespot_connected and self.librespot_monitor:
+        elif source == SourceType.LIBRESPOT and self.librespot_monitor:
             # Register SourceController to receive monitor events
             # Monitor passes event='event_name' as kwarg, so extract it
             def librespot_callback(**kwargs):
@@ -1112,11 +1612,12 @@ class SourceController:
                 self.logger.debug(f"📢 Librespot monitor event: {event_name}, kwargs: {list(kwargs.keys())}")
                 self._handle_monitor_event(SourceType.LIBRESPOT, event_name, **kwargs)
             self.librespot_monitor.add_callback('any', librespot_callback)
+            self.librespot_monitor.set_standby(self.source != SourceType.LIBRESPOT)
             self.librespot_monitor.start_monitoring()
             self.logger.info("✅ Librespot monitoring started")
             
         # Start Bluetooth monitoring
-        if self.bluetooth_connected and self.bluetooth_monitor:
+        elif source == SourceType.BLUETOOTH and self.bluetooth_monitor:
             # Register SourceController to receive monitor events
             # Monitor passes event='event_name' as kwarg, so extract it
             def bluetooth_callback(**kwargs):
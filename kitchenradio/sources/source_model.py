@@ -7,8 +7,8 @@ playback information, and track metadata across different audio sources
 """
 
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional, Dict, Any
+from enum import Enum, IntFlag
+from typing import Optional, Dict, Any, List, Tuple
 
 
 class SourceType(Enum):
@@ -30,12 +30,13 @@ class PlaybackStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True)
 class TrackInfo:
     """
     Track metadata information.
     
-    Represents metadata for a single track.
+    Represents metadata for a single track. Immutable - RadioState
+    snapshots share it; use dataclasses.replace() for a changed copy.
     """
     title: str = "Unknown"
     artist: str = "Unknown"
@@ -73,10 +74,10 @@ class TrackInfo:
         return f"{minutes}:{seconds:02d}"
 
 
-@dataclass
+@dataclass(frozen=True)
 class SourceInfo:
     """
-    Source device information.
+    Source device information (immutable, see TrackInfo).
     """
     source: SourceType = SourceType.NONE
     device_name: str = "Unknown"
@@ -96,12 +97,12 @@ class SourceInfo:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlaybackState:
     """
     Current playback state.
     
-    Tracks playback status and volume.
+    Tracks playback status and volume (immutable, see TrackInfo).
     """
     status: PlaybackStatus = PlaybackStatus.UNKNOWN
     volume: Optional[int] = None
@@ -112,3 +113,76 @@ class PlaybackState:
             'status': self.status.value,
             'volume': self.volume
         }
+
+
+class StateField(IntFlag):
+    """Fields of a RadioState - used as a bitmask of what changed"""
+    NONE = 0
+    PLAYBACK = 1
+    TRACK = 2
+    SOURCE_INFO = 4
+    CURRENT_SOURCE = 8
+    AVAILABLE_SOURCES = 16
+    POWER = 32
+    ALL = 63
+
+
+# RadioState attribute -> (field flag, legacy per-field event or None)
+_STATE_FIELDS = {
+    'playback_state': (StateField.PLAYBACK, 'playback_state_changed'),
+    'track_info': (StateField.TRACK, 'track_changed'),
+    'source_info': (StateField.SOURCE_INFO, 'source_info_changed'),
+    'current_source': (StateField.CURRENT_SOURCE, 'current_source_changed'),
+    'available_sources': (StateField.AVAILABLE_SOURCES, 'available_sources_changed'),
+    'powered_on': (StateField.POWER, None),  # Announced by its own power_changed event
+}
+
+
+@dataclass(frozen=True)
+class RadioState:
+    """
+    Snapshot of everything the UI shows.
+    
+    Published whole with the 'state_changed' event; a new snapshot is
+    created for every change, so a received one can be kept and read
+    without copying. version is assigned by the StateStore and not
+    compared.
+    """
+    playback_state: PlaybackState = field(default_factory=lambda: PlaybackState(status=PlaybackStatus.STOPPED, volume=0))
+    track_info: Optional[TrackInfo] = None
+    source_info: SourceInfo = field(default_factory=SourceInfo)
+    current_source: str = 'none'
+    available_sources: Tuple[str, ...] = ()
+    powered_on: bool = False
+    version: int = field(default=0, compare=False)
+    
+    def diff(self, previous: Optional['RadioState']) -> StateField:
+        """Fields that differ from a previous snapshot (all of them if there is none)"""
+        if previous is None:
+            return StateField.ALL
+        changed = StateField.NONE
+        for name, (flag, _) in _STATE_FIELDS.items():
+            if getattr(self, name) != getattr(previous, name):
+                changed |= flag
+        return changed
+    
+    def changed_fields(self, changed: StateField) -> Dict[str, Any]:
+        """Values of the changed fields, keyed like the legacy event arguments"""
+        values = {}
+        for name, (flag, _) in _STATE_FIELDS.items():
+            if changed & flag:
+                value = getattr(self, name)
+                values[name] = list(value) if name == 'available_sources' else value
+        return values
+    
+    def legacy_events(self, changed: StateField) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Per-field events equivalent to a state change.
+        
+        Returns:
+            List of (event name, kwargs), e.g. ('track_changed', {'track_info': ...})
+        """
+        values = self.changed_fields(changed)
+        return [(event, {name: values[name]})
+                for name, (flag, event) in _STATE_FIELDS.items()
+                if event and name in values]
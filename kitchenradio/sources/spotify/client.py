@@ -2,13 +2,16 @@
 KitchenRadio LibreSpot Client - Main client class for go-librespot interaction
 """
 
+import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import json
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any, Callable
 import websockets
 import asyncio, threading
-import asyncio
 
 logger = logging.getLogger(__name__)
 # logger.setLevel(logging.DEBUG)
@@ -22,18 +25,26 @@ class KitchenRadioLibrespotClient:
     def __init__(self, 
                  host: str = 'localhost',
                  port: int = 3678,
-                 timeout: int = 10):
+                 timeout: int = 10,
+                 pool_size: int = 4,
+                 connect_timeout: float = 2.0,
+                 command_timeout: float = 3.0):
         """
         Initialize KitchenRadio go-librespot client.
         
         Args:
             host: go-librespot server hostname
             port: go-librespot server port (default 3678)
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds for status/info requests
+            pool_size: Max keep-alive connections kept to go-librespot
+            connect_timeout: TCP connect timeout in seconds
+            command_timeout: Read timeout in seconds for player commands (POST/PUT)
         """
         self.host = host
         self.port = port
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.command_timeout = command_timeout
         self._connected = False
         self._was_connected = False  # Track previous connection state for disconnection detection
         self.websocket = None
@@ -43,6 +54,37 @@ class KitchenRadioLibrespotClient:
         self.base_url = f"http://{host}:{port}"
         self.wsurl = f"ws://{host}:{port}/events"
         
+        # One keep-alive session for the client's lifetime (no new TCP connection per press)
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self._session.mount("http://", adapter)
+        
+        # Event loop shared by the WebSocket and the command lanes (started lazily)
+        self._ws_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws_thread: Optional[threading.Thread] = None
+        self._ws_future = None
+        self._loop_lock = threading.Lock()
+        
+        # WebSocket connection metrics
+        self._ws_state = 'disconnected'  # disconnected, connecting, connected
+        self._ws_connects = 0
+        self._ws_connected_since: Optional[float] = None
+        self._ws_connected_total = 0.0
+        self._ws_messages = 0
+        self._ws_message_times = deque(maxlen=1000)  # For the message rate
+        self._ws_last_error: Optional[str] = None
+        
+        # Command lanes: commands on one lane run in order; the blocking
+        # request itself runs on the HTTP executor so the loop stays free
+        self._http_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="librespot-http")
+        self._lane_locks: Dict[str, asyncio.Lock] = {}
+        self._lane_seq: Dict[str, int] = {}
+        
+        # Per-endpoint latency counters ("METHOD /endpoint" -> stats)
+        self._latency_stats: Dict[str, Dict[str, float]] = {}
+        self._stats_lock = threading.Lock()
+        
         logger.info(f"KitchenRadio LibreSpot client initialized for {self.base_url}")
     
     def _handle_disconnection(self):
@@ -73,18 +115,28 @@ class KitchenRadioLibrespotClient:
             Response data or None if error
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = {"Content-Type": "application/json"}
+        stats_key = f"{method} /{endpoint.lstrip('/')}"
         
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers, timeout=self.timeout)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, data=json.dumps(data), timeout=self.timeout)
-            elif method == "PUT":
-                response = requests.put(url, headers=headers, data=json.dumps(data), timeout=self.timeout)
+                timeout = (self.connect_timeout, self.timeout)
+            elif method in ("POST", "PUT"):
+                timeout = (self.connect_timeout, self.command_timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
+            start = time.monotonic()
+            try:
+                response = self._session.request(
+                    method, url,
+                    data=json.dumps(data) if method != "GET" else None,
+                    timeout=timeout
+                )
+            except requests.exceptions.RequestException:
+                self._record_latency(stats_key, time.monotonic() - start, error=True)
+                raise
+            self._record_latency(stats_key, time.monotonic() - start, error=not response.ok)
+            
             response.raise_for_status()
             
             # If we got a successful response, mark as connected
@@ -137,8 +189,6 @@ class KitchenRadioLibrespotClient:
         Returns:
             True if server is responding (even with empty data)
         """
-        import time
-        
         try:
             logger.info(f"Testing connection to go-librespot at {self.base_url}")
             
@@ -147,10 +197,12 @@ class KitchenRadioLibrespotClient:
                 try:
                     # Simple GET request to test if server is responding
                     # We don't care about the response data - just that we can reach it
-                    response = requests.get(
+                    start = time.monotonic()
+                    response = self._session.get(
                         f"{self.base_url}/status",
-                        timeout=self.timeout
+                        timeout=(self.connect_timeout, self.timeout)
                     )
+                    self._record_latency("GET /status", time.monotonic() - start)
                     
                     # Server responded! Even 204 No Content or empty response is fine
                     if response.status_code in [200, 204]:
@@ -158,14 +210,10 @@ class KitchenRadioLibrespotClient:
                         self._was_connected = True
                         logger.info(f"✅ go-librespot server is responding (status: {response.status_code})")
                         
-                        # Start WebSocket connection
-                        loop = asyncio.new_event_loop()
-                        t = threading.Thread(target=loop.run_forever, daemon=True)
-                        t.start()
-                        # store for later shutdown if needed
-                        self._ws_thread = t
-                        self._ws_loop = loop
-                        asyncio.run_coroutine_threadsafe(self.connect_ws(), loop)
+                        # Start WebSocket connection (once - it reconnects by itself)
+                        loop = self._ensure_loop()
+                        if self._ws_future is None or self._ws_future.done():
+                            self._ws_future = asyncio.run_coroutine_threadsafe(self.connect_ws(), loop)
                         return True
                     else:
                         logger.warning(f"Unexpected status code: {response.status_code}")
@@ -187,6 +235,95 @@ class KitchenRadioLibrespotClient:
             self._connected = False
             return False
         
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the shared event loop thread if it is not running."""
+        with self._loop_lock:
+            if self._ws_loop is None:
+                loop = asyncio.new_event_loop()
+                t = threading.Thread(target=loop.run_forever, daemon=True, name="librespot-loop")
+                t.start()
+                self._ws_thread = t
+                self._ws_loop = loop
+            return self._ws_loop
+
+    def send_command(self, endpoint: str, data: Optional[Dict] = None, method: str = "POST",
+                     lane: Optional[str] = None, supersede: bool = False) -> Future:
+        """
+        Queue an HTTP command without blocking the caller.
+        
+        Commands on the same lane (default: the endpoint) are sent one at a
+        time, in the order they were queued. With supersede=True a command
+        that is still waiting for its lane is dropped (its future is
+        cancelled) once a newer superseding command is queued on that lane;
+        other commands on the lane never cause a drop.
+        
+        Args:
+            endpoint: API endpoint
+            data: Request data
+            method: HTTP method (POST or PUT)
+            lane: Ordering lane (defaults to the endpoint)
+            supersede: Latest command on the lane wins
+        
+        Returns:
+            Future resolving to the response data (None on error)
+        """
+        lane = lane or endpoint
+        seq = 0
+        if supersede:
+            # Only superseding commands are counted - a toggle queued behind a
+            # play must not drop it
+            with self._loop_lock:
+                seq = self._lane_seq.get(lane, 0) + 1
+                self._lane_seq[lane] = seq
+        
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_command(lane, seq, supersede, endpoint, method, data), loop)
+        future.add_done_callback(lambda f: self._on_command_done(f, method, endpoint))
+        return future
+
+    async def _run_command(self, lane: str, seq: int, supersede: bool,
+                           endpoint: str, method: str, data: Optional[Dict]):
+        """Wait for the lane, then send the request on the HTTP executor."""
+        lock = self._lane_locks.get(lane)
+        if lock is None:
+            lock = self._lane_locks[lane] = asyncio.Lock()
+        
+        async with lock:
+            if supersede:
+                with self._loop_lock:
+                    latest = self._lane_seq.get(lane)
+                if latest != seq:
+                    logger.debug(f"[Librespot] {method} {endpoint} superseded by a newer command")
+                    raise asyncio.CancelledError()
+            
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._http_executor, self._send_request, endpoint, method, data)
+
+    def _wait_command(self, future: Future) -> bool:
+        """
+        Wait for a queued command (callers that need the outcome).
+        
+        Returns:
+            False if the request failed or timed out; True if it succeeded
+            or a newer superseding command replaced it before it was sent
+        """
+        try:
+            return future.result(timeout=self.connect_timeout + self.command_timeout + 1.0) is not None
+        except CancelledError:
+            return True
+        except Exception:
+            return False
+
+    def _on_command_done(self, future: Future, method: str, endpoint: str):
+        """Log failed commands (callers may ignore the future)."""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.error(f"Error sending {method} {endpoint}: {future.exception()}")
+        elif future.result() is None:
+            logger.warning(f"[Librespot] {method} {endpoint} failed")
+
     async def connect_ws(self):
         """Connect to WebSocket and automatically reconnect if connection drops"""
         reconnect_delay = 2.0
@@ -195,31 +332,88 @@ class KitchenRadioLibrespotClient:
         while True:  # Auto-reconnect loop
             try:
                 logger.info(f"Connecting to go-librespot WebSocket at {self.wsurl}")
+                self._ws_state = 'connecting'
 
                 async with websockets.connect(self.wsurl) as websocket:
                     self.websocket = websocket
-                    logger.info("Connected successfully  {self.wsurl}!")
+                    reconnected = self._ws_connects > 0
+                    self._ws_connects += 1
+                    self._ws_state = 'connected'
+                    self._ws_connected_since = time.monotonic()
+                    logger.info(f"Connected successfully {self.wsurl}"
+                                f"{' (reconnect ' + str(self._ws_connects - 1) + ')' if reconnected else ''}")
                     reconnect_delay = 2.0  # Reset delay on successful connection
                     
+                    # Events may have been missed while disconnected - take one
+                    # /status snapshot before reading messages so it is applied
+                    # ahead of any event that follows it
+                    loop = asyncio.get_running_loop()
+                    status = await loop.run_in_executor(self._http_executor, self.get_status)
+                    self._trigger_callbacks('ws_connected', data=status, reconnected=reconnected)
+                    
                     # Listen for messages
                     async for message in websocket:
                         await self.handle_message(message)
                     
+            except asyncio.CancelledError:
+                # disconnect() is shutting the loop down
+                self._ws_closed(None)
+                raise
             except websockets.exceptions.ConnectionClosed:
+                self._ws_closed("connection closed")
                 logger.info("WebSocket connection closed - reconnecting...")
                 await asyncio.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 1.5, max_reconnect_delay)  # Exponential backoff
             except websockets.exceptions.InvalidURI:
+                self._ws_closed("invalid URI")
                 logger.error(f"Invalid WebSocket URI: {self.wsurl}")
                 break  # Don't retry on invalid URI
             except ConnectionRefusedError:
+                self._ws_closed("connection refused")
                 logger.warning(f"Connection refused to {self.wsurl}. Server may be restarting, retrying in {reconnect_delay}s...")
                 await asyncio.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 1.5, max_reconnect_delay)
             except Exception as e:
+                self._ws_closed(str(e))
                 logger.warning(f"WebSocket error: {e}, reconnecting in {reconnect_delay}s...")
                 await asyncio.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 1.5, max_reconnect_delay)
+            else:
+                self._ws_closed("server closed the connection")
+                logger.info(f"WebSocket closed by server - reconnecting in {reconnect_delay}s...")
+                await asyncio.sleep(reconnect_delay)
+
+    def _ws_closed(self, reason: Optional[str]):
+        """Update connection metrics after the WebSocket went away."""
+        if self._ws_connected_since is not None:
+            self._ws_connected_total += time.monotonic() - self._ws_connected_since
+            self._ws_connected_since = None
+        self._ws_state = 'disconnected'
+        self.websocket = None
+        if reason:
+            self._ws_last_error = reason
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get WebSocket connection metrics.
+        
+        Returns:
+            Dict with state, connect/reconnect counts, time connected,
+            message count and message rate over the last minute
+        """
+        now = time.monotonic()
+        connected_for = now - self._ws_connected_since if self._ws_connected_since is not None else 0.0
+        recent = sum(1 for t in list(self._ws_message_times) if now - t <= 60.0)
+        return {
+            'state': self._ws_state,
+            'connects': self._ws_connects,
+            'reconnects': max(0, self._ws_connects - 1),
+            'connected_for_s': round(connected_for, 1),
+            'total_connected_s': round(self._ws_connected_total + connected_for, 1),
+            'messages': self._ws_messages,
+            'messages_per_min': recent,
+            'last_error': self._ws_last_error
+        }
 
     def add_callback(self, event: str, callback: Callable):
         """
@@ -255,12 +449,13 @@ class KitchenRadioLibrespotClient:
     async def handle_message(self, message):
         """Handle incoming WebSocket messages"""
         try:
+            self._ws_messages += 1
+            self._ws_message_times.append(time.monotonic())
+            
             data = json.loads(message)
             message_type = data.get('type', 'unknown')
             logger.debug(f"[Spotify WebSocket] {message_type}")
             
-
-            
             if message_type == 'active':
                 self._trigger_callbacks('active', data=data)
                 return
@@ -287,24 +482,101 @@ class KitchenRadioLibrespotClient:
             logger.error(f"Error handling message: {e}")
     
     
+    def _record_latency(self, key: str, seconds: float, error: bool = False):
+        """Add one request to the per-endpoint latency counters."""
+        ms = seconds * 1000.0
+        with self._stats_lock:
+            stats = self._latency_stats.get(key)
+            if stats is None:
+                stats = self._latency_stats[key] = {
+                    'count': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'last_ms': 0.0
+                }
+            stats['count'] += 1
+            stats['total_ms'] += ms
+            stats['max_ms'] = max(stats['max_ms'], ms)
+            stats['last_ms'] = ms
+            if error:
+                stats['errors'] += 1
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get HTTP latency counters per endpoint.
+        
+        Returns:
+            Dict of "METHOD /endpoint" to count, errors, avg_ms, max_ms and last_ms
+        """
+        with self._stats_lock:
+            return {
+                key: {
+                    'count': int(stats['count']),
+                    'errors': int(stats['errors']),
+                    'avg_ms': round(stats['total_ms'] / stats['count'], 1) if stats['count'] else 0.0,
+                    'max_ms': round(stats['max_ms'], 1),
+                    'last_ms': round(stats['last_ms'], 1)
+                }
+                for key, stats in self._latency_stats.items()
+            }
+
+    def reset_latency_stats(self):
+        """Clear the HTTP latency counters."""
+        with self._stats_lock:
+            self._latency_stats.clear()
+
     def disconnect(self):
-        """Disconnect from go-librespot server."""
+        """Disconnect from go-librespot server and stop the WebSocket loop."""
         logger.info("Disconnecting from go-librespot")
         self._connected = False
+        self._stop_loop()
+        # Drop pooled connections; the session is reused on the next request
+        self._session.close()
+
+    def _stop_loop(self, timeout: float = 2.0):
+        """Cancel the WebSocket and queued commands, then stop the loop thread."""
+        with self._loop_lock:
+            loop, thread = self._ws_loop, self._ws_thread
+            self._ws_loop = self._ws_thread = self._ws_future = None
+        if loop is None:
+            return
+        if thread is threading.current_thread():
+            logger.warning("disconnect() called from the event loop - loop left running")
+            return
+        
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_tasks(), loop).result(timeout=timeout)
+        except Exception as e:
+            logger.warning(f"Error cancelling librespot tasks: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread:
+            thread.join(timeout=timeout)
+        if not loop.is_running():
+            loop.close()
+        # Lane locks belong to the old loop
+        self._lane_locks.clear()
+        logger.debug("Librespot event loop stopped")
+
+    async def _cancel_tasks(self):
+        """Cancel every task on the loop except this one and wait for them."""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     def is_connected(self) -> bool:
         """Check if connected to go-librespot server."""
         return self._connected
     
     # Playback control methods
+    # play() reports whether the request succeeded (it waits on the playback
+    # lane); the /player/* commands answer 204 without a body, so their
+    # methods only queue the request and return True, as they always did.
     def play(self) -> bool:
         """Start playback."""
         try:
-            result = self._send_request("/playback", method="POST", data={"play": True})
-            if result is not None:
-                logger.info("Started playback")
-                return True
-            return False
+            future = self.send_command("/playback", data={"play": True}, lane="playback", supersede=True)
+            if not self._wait_command(future):
+                return False
+            logger.info("Started playback")
+            return True
         except Exception as e:
             logger.error(f"Error starting playback: {e}")
             return False
@@ -312,7 +584,7 @@ class KitchenRadioLibrespotClient:
     def pause(self) -> bool:
         """Pause playback."""
         try:
-            result = self._send_request("/player/pause", method="POST", data={"play": False})
+            self.send_command("/player/pause", data={"play": False}, lane="playback", supersede=True)
 
             logger.info("Paused playback")
             return True
@@ -324,7 +596,7 @@ class KitchenRadioLibrespotClient:
     def stop(self) -> bool:
         """Pause playback."""
         try:
-            result = self._send_request("/player/pause", method="POST", data={"play": False})
+            self.send_command("/player/pause", data={"play": False}, lane="playback", supersede=True)
 
             logger.info("Paused playback")
             return True
@@ -336,7 +608,8 @@ class KitchenRadioLibrespotClient:
     def playpause(self) -> bool:
         """playpause playback."""
         try:
-            result = self._send_request("/player/playpause", method="POST", data={"play": False})
+            # Toggles depend on the previous one - ordered, never superseded
+            self.send_command("/player/playpause", data={"play": False}, lane="playback")
 
             logger.info("playpause playback")
             return True
@@ -349,7 +622,7 @@ class KitchenRadioLibrespotClient:
     def resume(self) -> bool:
         """Pause playback."""
         try:
-            result = self._send_request("/player/resume", method="POST", data={"play": False})
+            self.send_command("/player/resume", data={"play": False}, lane="playback", supersede=True)
 
             logger.info("resume playback")
             return True
@@ -361,11 +634,8 @@ class KitchenRadioLibrespotClient:
     def next_track(self) -> bool:
         """Skip to next track."""
         try:
-            result = self._send_request("/player/next", method="POST")
-            # if result is not None:
-            #     logger.info("Skipped to next track")
-            #     return True
-            # return False
+            # Every press counts - queued in order on the skip lane, caller doesn't wait
+            self.send_command("/player/next", lane="skip")
             logger.info("Skipped to next track")
             return True
         except Exception as e:
@@ -376,11 +646,7 @@ class KitchenRadioLibrespotClient:
     def previous_track(self) -> bool:
         """Skip to previous track."""
         try:
-            result = self._send_request("/player/prev", method="POST")
-            # if result is not None:
-            #     logger.info("Skipped to previous track")
-            #     return True
-            # return False
+            self.send_command("/player/prev", lane="skip")
             logger.info("Skipped to previous track")
             return True
         except Exception as e:
@@ -394,11 +660,12 @@ class KitchenRadioLibrespotClient:
             if not 0 <= volume <= 100:
                 raise ValueError("Volume must be between 0 and 100")
             
-            result = self._send_request("/player/volume", method="POST", data={"volume": volume})
-          #  if result is not None:
+            # Called from the volume engine's writer thread, which wants the outcome
+            future = self.send_command("/player/volume", data={"volume": volume}, supersede=True)
+            if not self._wait_command(future):
+                return False
             logger.info(f"Set volume to {volume}%")
             return True
-           # return False
         except Exception as e:
             logger.error(f"Error setting volume: {e}")
             return False
@@ -457,7 +724,7 @@ class KitchenRadioLibrespotClient:
     def set_shuffle(self, enabled: bool) -> bool:
         """Set shuffle mode."""
         try:
-            result = self._send_request("/player/shuffle", method="POST", data={"shuffle": enabled})
+            self.send_command("/player/shuffle", data={"shuffle": enabled}, supersede=True)
             logger.info(f"Set shuffle to {enabled}")
             return True
         except Exception as e:
@@ -478,7 +745,7 @@ class KitchenRadioLibrespotClient:
     def set_repeat(self, mode: str) -> bool:
         """Set repeat mode (off, track, context)."""
         try:
-            result = self._send_request("/player/repeat", method="POST", data={"repeat": mode})
+            self.send_command("/player/repeat", data={"repeat": mode}, supersede=True)
             logger.info(f"Set repeat to {mode}")
             return True
         except Exception as e:
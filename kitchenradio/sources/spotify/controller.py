@@ -15,17 +15,31 @@ class LibrespotController:
     Control go-librespot playback operations.
     """
     
-    def __init__(self, host: str = "localhost", port: int = 24879, timeout: int = 10):
+    def __init__(self, host: str = "localhost", port: int = 24879, timeout: int = 10,
+                 status_resync_interval: float = 30.0,
+                 status_standby_resync_interval: float = 120.0,
+                 http_pool_size: int = 4,
+                 http_connect_timeout: float = 2.0,
+                 http_command_timeout: float = 3.0):
         """
         Initialize controller with Librespot connection details.
         
         Args:
             host: Librespot host
             port: Librespot port
-            timeout: Connection timeout
-        """
-        self.client = KitchenRadioLibrespotClient(host, port, timeout)
-        self.monitor = LibrespotMonitor(self.client)
+            timeout: Read timeout for status/info requests
+            status_resync_interval: Seconds between safety /status resyncs in the monitor
+            status_standby_resync_interval: Seconds between resyncs while the monitor is in standby
+            http_pool_size: Max keep-alive HTTP connections
+            http_connect_timeout: TCP connect timeout
+            http_command_timeout: Read timeout for player commands
+        """
+        self.client = KitchenRadioLibrespotClient(host, port, timeout,
+                                                  pool_size=http_pool_size,
+                                                  connect_timeout=http_connect_timeout,
+                                                  command_timeout=http_command_timeout)
+        self.monitor = LibrespotMonitor(self.client, resync_interval=status_resync_interval,
+                                        standby_resync_interval=status_standby_resync_interval)
         
         # Callbacks for device connection/disconnection
         self.on_device_connected: Optional[callable] = None
@@ -54,6 +68,29 @@ class LibrespotController:
         """Connect to Librespot"""
         return self.client.connect()
     
+    def disconnect(self):
+        """Stop monitoring and shut down the client's WebSocket loop."""
+        self.monitor.stop_monitoring()
+        self.client.disconnect()
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get WebSocket connection metrics (reconnects, time connected, message rate).
+        
+        Returns:
+            Connection stats dict
+        """
+        return self.client.get_connection_stats()
+    
+    def get_http_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get HTTP latency counters per go-librespot endpoint.
+        
+        Returns:
+            Dict of "METHOD /endpoint" to count, errors, avg_ms, max_ms and last_ms
+        """
+        return self.client.get_latency_stats()
+    
     def play(self) -> bool:
         """
         Start/resume playback.
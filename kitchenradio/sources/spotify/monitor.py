@@ -3,6 +3,7 @@ LibreSpot Monitor - Track monitoring functionality for go-librespot
 """
 
 import time
+import queue
 import logging
 import threading
 from dataclasses import dataclass, field
@@ -17,16 +18,27 @@ logger = logging.getLogger(__name__)
 class LibrespotMonitor:
     """
     Monitor now playing tracks and go-librespot status changes.
+
+    WebSocket event payloads (metadata, playing/paused/stopped, volume) are
+    applied directly to the cached state. The full HTTP /status is only
+    fetched on start, when the connection or WebSocket comes back, when a
+    new session becomes active, and on a slow safety interval.
     """
     
-    def __init__(self, client: KitchenRadioLibrespotClient):
+    def __init__(self, client: KitchenRadioLibrespotClient, resync_interval: float = 30.0,
+                 standby_resync_interval: float = 120.0):
         """
         Initialize monitor with KitchenRadio librespot client.
         
         Args:
             client: KitchenRadio librespot client instance
+            resync_interval: Seconds between safety /status resyncs
+            standby_resync_interval: Seconds between resyncs in standby (Spotify not the active source)
         """
         self.client = client
+        self.resync_interval = resync_interval
+        self.standby_resync_interval = standby_resync_interval
+        self.standby = False
         self.callbacks = {}
         
         self.current_track: Optional[TrackInfo] = None
@@ -37,7 +49,9 @@ class LibrespotMonitor:
         self.is_monitoring = False
         self._monitor_thread = None
         self._stop_event = threading.Event()
-        self._wake_event = threading.Event()
+        self._events: "queue.Queue[tuple]" = queue.Queue()
+        self._last_resync = 0.0
+        self._client_callback_registered = False
         
     def add_callback(self, event: str, callback: Callable):
         """
@@ -52,12 +66,13 @@ class LibrespotMonitor:
         self.callbacks[event].append(callback)
         logger.debug(f"Added callback for {event}")
 
-    def _on_client_changed(self, **kwargs):
-        """Handle WebSocket events from Spotify client"""
-        try:
-            self._wake_event.set()
-        except Exception as e:
-            logger.error(f"Error setting wake event: {e}")
+    def _on_client_changed(self, event: str = None, data: Optional[Dict[str, Any]] = None, **kwargs):
+        """Hand client events (with their payload) to the monitor thread."""
+        self._events.put((event, data))
+
+    def request_resync(self):
+        """Ask the monitor thread for a full /status resync."""
+        self._events.put(('resync', None))
 
     def _trigger_callbacks(self, event: str, **kwargs):
         """Trigger callbacks for event."""
@@ -139,91 +154,159 @@ class LibrespotMonitor:
             else:
                 status = PlaybackStatus.STOPPED
         
-        # Try to get volume
-        volume = status_data.get('volume')
+        # Volume is part of /status; keep the last known value if it is missing
+        volume = self._scale_volume(status_data.get('volume'), status_data.get('volume_steps'))
         if volume is None:
-             try:
-                 volume = self.client.get_volume()
-             except:
-                 pass
+            volume = self.current_status.volume
         
         return PlaybackState(status=status, volume=volume)
 
-    def _check_for_changes(self):
-        """Check for status and track changes. Only emit events when state or track changes."""
+    @staticmethod
+    def _scale_volume(value: Any, steps: Any = None) -> Optional[int]:
+        """Convert a go-librespot volume (0..steps) to 0-100."""
         try:
-            status = self.client.get_status()
-            if not status or not isinstance(status, dict):
-                logger.debug("[Spotify] No status data received")
-                return
-            
-            # Check for playback state change
-            new_state = self._parse_playback_status(status)
-            logger.debug(f"[Spotify] Status check - Current: {self.current_status.status.value}, New: {new_state.status.value}, Vol: {self.current_status.volume}→{new_state.volume}")
-            
- 
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        try:
+            steps = int(steps)
+        except (TypeError, ValueError):
+            steps = 100
+        if steps <= 0 or steps == 100:
+            return value
+        return round(value * 100 / steps)
 
+    def _update_playback_state(self, new_state: PlaybackState):
+        """Store a new playback state and emit an event if status or volume changed."""
+        if not self._state_differs(new_state):
+            return
+        self.current_status = new_state
+        self._emit_playback_state_changed()
 
+    def _update_track(self, new_track: Optional[TrackInfo]):
+        """Store a new track and emit an event if it changed."""
+        if self.current_track == new_track:
+            return
+        old_track, self.current_track = self.current_track, new_track
+        self._emit_track_changed(old_track)
 
-            # Compare states (status and volume)
-            status_changed = self.current_status.status != new_state.status
-            volume_changed = self.current_status.volume != new_state.volume
-            
-            if status_changed or volume_changed:
-                # Parse track info for logging
-                # new_track = self._parse_track_info(status)
-                
-                # # If status changed (enum)
-                # if status_changed:
-                #     track_display = f"{new_track.artist} - {new_track.title}" if new_track and new_track.title != 'Unknown' else "No track"
-                #     album_display = f" [{new_track.album}]" if new_track and new_track.album else ""
- 
-                self.current_status = new_state
-                logger.info(f"🔊 [Spotify] Playback State changed: {self.current_status}")
-                self._trigger_callbacks('playback_state_changed', playback_state=self.get_playback_state())
-
-            # Check for track change
-            new_track = self._parse_track_info(status)
-            
-            if self.current_track != new_track:
-                # Format old and new track with full details
-                old_display = f"{self.current_track.artist} - {self.current_track.title} [{self.current_track.album}]" if self.current_track and self.current_track.title != 'Unknown' else 'None'
-                new_display = f"{new_track.artist} - {new_track.title} [{new_track.album}]" if new_track and new_track.title != 'Unknown' else 'None'
-                logger.info(f"🎵 [Spotify] Track changed: {old_display} → {new_display}")
-                self.current_track = new_track
-                self._trigger_callbacks('track_changed', track_info=self.get_track_info())
+    def _apply_snapshot(self, status: Dict[str, Any]):
+        """
+        Apply a full /status snapshot.
+
+        State and track are both stored before any event is emitted, so
+        callbacks never see the new track with the old state (or vice versa).
+        """
+        new_state = self._parse_playback_status(status)
+        new_track = self._parse_track_info(status)
+        logger.debug(f"[Spotify] Status snapshot - Current: {self.current_status.status.value}, New: {new_state.status.value}, Vol: {self.current_status.volume}→{new_state.volume}")
 
+        state_changed = self._state_differs(new_state)
+        old_track = self.current_track
+        track_changed = old_track != new_track
+        self.current_status, self.current_track = new_state, new_track
+
+        if track_changed:
+            self._emit_track_changed(old_track)
+        if state_changed:
+            self._emit_playback_state_changed()
+
+    def _state_differs(self, new_state: PlaybackState) -> bool:
+        return (self.current_status.status != new_state.status
+                or self.current_status.volume != new_state.volume)
 
-            # device  = status.get('device_name', {})
-            # device_changed = self.current_source_info.device_name != device
+    def _emit_playback_state_changed(self):
+        logger.info(f"🔊 [Spotify] Playback State changed: {self.current_status}")
+        self._trigger_callbacks('playback_state_changed', playback_state=self.get_playback_state())
 
-            # if device_changed:
-            #     old_device = self.current_source_info.device_name
-            #     self.current_source_info.device_name = device
-            #     logger.info(f"📱 [Spotify] Source device changed: {old_device} → {device}")
-            #     self._trigger_callbacks('source_info_changed', source_info=self.get_source_info())
+    def _emit_track_changed(self, old_track: Optional[TrackInfo]):
+        new_track = self.current_track
+        old_display = f"{old_track.artist} - {old_track.title} [{old_track.album}]" if old_track and old_track.title != 'Unknown' else 'None'
+        new_display = f"{new_track.artist} - {new_track.title} [{new_track.album}]" if new_track and new_track.title != 'Unknown' else 'None'
+        logger.info(f"🎵 [Spotify] Track changed: {old_display} → {new_display}")
+        self._trigger_callbacks('track_changed', track_info=self.get_track_info())
 
+    def _apply_event(self, event: str, data: Optional[Dict[str, Any]]):
+        """
+        Apply one client event to the cached state.
+
+        WebSocket messages arrive as {'type': ..., 'data': {...}}; events
+        without a usable payload fall back to a /status resync.
+        """
+        if event == 'ws_connected':
+            # WebSocket (re)connected - the client took a /status snapshot for us
+            if isinstance(data, dict) and data:
+                self._last_resync = time.monotonic()
+                self._apply_snapshot(data)
+            else:
+                self._resync()
+            return
+
+        message_type = data.get('type', event) if isinstance(data, dict) else event
+        payload = data.get('data') if isinstance(data, dict) else None
+        if not isinstance(payload, dict):
+            payload = {}
+
+        if message_type == 'metadata':
+            if payload:
+                self._update_track(self._parse_track_info({'track': payload}))
+            else:
+                self._resync()
+        elif message_type == 'playing':
+            self._update_playback_state(PlaybackState(status=PlaybackStatus.PLAYING, volume=self.current_status.volume))
+        elif message_type == 'paused':
+            self._update_playback_state(PlaybackState(status=PlaybackStatus.PAUSED, volume=self.current_status.volume))
+        elif message_type in ('stopped', 'not_playing', 'inactive'):
+            self._update_playback_state(PlaybackState(status=PlaybackStatus.STOPPED, volume=self.current_status.volume))
+        elif message_type == 'volume':
+            volume = self._scale_volume(payload.get('value'), payload.get('max'))
+            if volume is None:
+                self._resync()
+            else:
+                self._update_playback_state(PlaybackState(status=self.current_status.status, volume=volume))
+        elif message_type in ('active', 'resync', 'connection_restored'):
+            # New session or reconnect - events may have been missed
+            self._resync()
+        else:
+            # seek, will_play, shuffle/repeat and volume commands don't change the cached state
+            logger.debug(f"[Spotify] Ignoring event '{message_type}'")
+
+    def _resync(self):
+        """Fetch the full /status and emit events for anything that differs."""
+        self._last_resync = time.monotonic()
+        try:
+            status = self.client.get_status()
+            if not status or not isinstance(status, dict):
+                logger.debug("[Spotify] No status data received")
+                return
+            self._apply_snapshot(status)
 
         except Exception as e:
-            logger.error(f"Error checking for changes: {e}", exc_info=True)
+            logger.error(f"Error resyncing status: {e}", exc_info=True)
     
     def _monitor_loop(self):
         """Main monitoring loop."""
         logger.info("Starting go-librespot monitoring loop")
         
         while not self._stop_event.is_set():
-            # Always check for changes - the client will handle reconnection internally
-            self._check_for_changes()
-                
+            interval = self.standby_resync_interval if self.standby else self.resync_interval
+            timeout = self._last_resync + interval - time.monotonic()
+            if timeout <= 0:
+                # Safety net in case a WebSocket event was lost
+                self._resync()
+                continue
+
             try:
-                # Wait either for wake_event (set by callback) or timeout
-                self._wake_event.wait(timeout=10)
-                # Clear wake flag so next wait will block again until next callback
-                self._wake_event.clear()
+                event, data = self._events.get(timeout=timeout)
+            except queue.Empty:
+                continue
+
+            if event == 'stop':
+                break
+            try:
+                self._apply_event(event, data)
             except Exception as e:
-                logger.error(f"[Spotify] Exception in monitor loop wait: {e}")
-                # Fallback to small sleep if wait fails for any reason
-                time.sleep(1.0)
+                logger.error(f"[Spotify] Error applying event '{event}': {e}", exc_info=True)
         
         logger.info("go-librespot monitoring loop stopped")
     
@@ -244,6 +327,7 @@ class LibrespotMonitor:
             self.client.connect()
         
         # Initialize current status
+        self._last_resync = time.monotonic()
         status = self.client.get_status()
         self.current_status = self._parse_playback_status(status)
         self.current_track = self._parse_track_info(status)
@@ -251,12 +335,18 @@ class LibrespotMonitor:
         logger.info(f"[Spotify] Initial state - Status: {self.current_status.status.value}, Track: {self.current_track.title if self.current_track else 'None'}")
         logger.debug(f"[Spotify] Raw status data: {status}")
         
+        # Drop events left over from a previous run
+        while not self._events.empty():
+            self._events.get_nowait()
+        
         # Start monitoring thread
         self._stop_event.clear()
         self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
 
-        self.client.add_callback('any', self._on_client_changed)
+        if not self._client_callback_registered:
+            self.client.add_callback('any', self._on_client_changed)
+            self._client_callback_registered = True
 
         self.is_monitoring = True
     
@@ -266,6 +356,7 @@ class LibrespotMonitor:
         
         self.is_monitoring = False
         self._stop_event.set()
+        self._events.put(('stop', None))
         
         if self._monitor_thread and self._monitor_thread.is_alive():
             logger.debug("Waiting for librespot monitor thread to exit...")
@@ -275,6 +366,20 @@ class LibrespotMonitor:
             else:
                 logger.debug("Librespot monitor thread exited successfully")
     
+    def set_standby(self, standby: bool):
+        """
+        Enter or leave standby.
+        
+        In standby WebSocket events are still applied, so state stays
+        current for a fast switch back; only the safety resync slows down.
+        """
+        if standby == self.standby:
+            return
+        self.standby = standby
+        logger.debug(f"Librespot monitor {'in standby' if standby else 'active'}")
+        if not standby and time.monotonic() - self._last_resync > self.resync_interval:
+            self.request_resync()
+    
     def get_track_info(self) -> Optional[TrackInfo]:
         """
         Get current track information.
@@ -0,0 +1,103 @@
+"""
+State Store - Versioned RadioState snapshots
+
+The current RadioState is replaced whole on every change and tagged with
+a monotonically increasing version. Readers take one snapshot and read
+all fields from it, so they never see a new source with an old track,
+and the read path takes no lock (a single attribute read).
+"""
+
+import threading
+from collections import deque
+from dataclasses import replace
+from typing import Optional, Tuple
+
+from kitchenradio.sources.source_model import RadioState, StateField
+
+
+class StateStore:
+    """
+    Holder of the current RadioState.
+
+    Writers go through update(); readers use get_snapshot(), changed_since()
+    and wait_for_version().
+    """
+
+    def __init__(self, history: int = 64):
+        """
+        Initialize state store.
+
+        Args:
+            history: Number of recent changes kept for changed_since()
+        """
+        self._snapshot = RadioState()
+        self._changes: deque = deque(maxlen=history)  # (version, changed fields)
+        self._cond = threading.Condition()
+
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot (0 = nothing published yet)."""
+        return self._snapshot.version
+
+    def get_snapshot(self) -> RadioState:
+        """Current snapshot (immutable - keep it as long as needed)."""
+        return self._snapshot
+
+    def changed_since(self, version: int) -> StateField:
+        """
+        Fields that changed after a version.
+
+        Returns:
+            StateField mask (NONE if nothing changed, ALL if the version is
+            older than the kept history)
+        """
+        snapshot = self._snapshot
+        if snapshot.version == version:
+            return StateField.NONE
+        changes = list(self._changes)
+        if not changes or changes[0][0] > version + 1:
+            return StateField.ALL
+        changed = StateField.NONE
+        for change_version, fields in changes:
+            if version < change_version <= snapshot.version:
+                changed |= fields
+        return changed
+
+    def wait_for_version(self, version: int, timeout: Optional[float] = None) -> Optional[RadioState]:
+        """
+        Wait until the store reaches a version.
+
+        Args:
+            version: Version to wait for (e.g. last seen version + 1)
+            timeout: Max seconds to wait (None = forever)
+
+        Returns:
+            Current snapshot, or None on timeout
+        """
+        snapshot = self._snapshot
+        if snapshot.version >= version:
+            return snapshot
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._snapshot.version >= version, timeout):
+                return None
+            return self._snapshot
+
+    def update(self, **changes) -> Tuple[RadioState, StateField]:
+        """
+        Replace fields of the current snapshot.
+
+        Returns:
+            (snapshot, changed fields) - the unchanged snapshot and NONE if
+            the values were already current
+        """
+        with self._cond:
+            previous = self._snapshot
+            snapshot = replace(previous, **changes)
+            changed = snapshot.diff(previous)
+            if not changed:
+                return previous, StateField.NONE
+            snapshot = replace(snapshot, version=previous.version + 1)
+            self._changes.append((snapshot.version, changed))
+            self._snapshot = snapshot
+            self._cond.notify_all()
+        return snapshot, changed
@@ -0,0 +1,263 @@
+"""
+Tracing - Input-to-display latency traces
+
+A trace starts at an input (button press, web request) and follows the
+work it causes: the queued command, backend calls, monitor events,
+callback delivery and the rendered display frame. The trace travels with
+the work - the command executor and the event bus carry it to their
+threads - and each step records a span (stage, detail, offset, duration).
+
+Finished traces go into a fixed-size ring buffer; per-stage latency
+histograms are kept across all traces. With tracing disabled start()
+returns None and every other call is a no-op on a None trace.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List
+
+# Histogram bucket upper bounds (ms); the last bucket is open-ended
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+
+
+class Trace:
+    """One input and the spans of the work it caused."""
+    __slots__ = ('trace_id', 'name', 'started', 'started_wall', 'spans', 'finished', 'complete')
+
+    def __init__(self, trace_id: int, name: str, started: float):
+        self.trace_id = trace_id
+        self.name = name
+        self.started = started
+        self.started_wall = time.time() - (time.monotonic() - started)
+        self.spans: List[tuple] = []  # (stage, detail, start offset s, duration s)
+        self.finished: Optional[float] = None
+        self.complete = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        total = (self.finished or time.monotonic()) - self.started
+        return {
+            'id': self.trace_id,
+            'name': self.name,
+            'started': round(self.started_wall, 3),
+            'total_ms': round(total * 1000, 2),
+            'complete': self.complete,
+            'spans': [{
+                'stage': stage,
+                'detail': detail,
+                'offset_ms': round(offset * 1000, 2),
+                'duration_ms': round(duration * 1000, 2)
+            } for stage, detail, offset, duration in self.spans]
+        }
+
+
+class _Histogram:
+    """Latency counts per bucket."""
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        for i, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if ms <= bound:
+                break
+        else:
+            i = len(HISTOGRAM_BUCKETS_MS)
+        self.counts[i] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 2) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 2),
+            'buckets': dict(zip(labels, self.counts))
+        }
+
+
+class Tracer:
+    """
+    Trace registry with a per-thread current trace.
+
+    Work that continues on another thread captures current() and runs
+    under activate(trace). Traces that are not finished explicitly (no
+    frame rendered) are closed as incomplete after the linger time.
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 256, linger: float = 2.0):
+        """
+        Initialize tracer.
+
+        Args:
+            enabled: Record traces
+            capacity: Finished traces kept in the ring buffer
+            linger: Seconds an unfinished trace accepts follow-up events
+                    (e.g. the monitor event caused by a command)
+        """
+        self.enabled = enabled
+        self.linger = linger
+        self._finished: deque = deque(maxlen=capacity)
+        self._open: Dict[int, Trace] = {}
+        self._histograms: Dict[str, _Histogram] = {}
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def configure(self, enabled: Optional[bool] = None, capacity: Optional[int] = None,
+                  linger: Optional[float] = None):
+        """Change settings (the ring buffer keeps its newest traces)."""
+        with self._lock:
+            if enabled is not None:
+                self.enabled = enabled
+            if capacity is not None and capacity != self._finished.maxlen:
+                self._finished = deque(self._finished, maxlen=capacity)
+            if linger is not None:
+                self.linger = linger
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def start(self, name: str, started: Optional[float] = None) -> Optional[Trace]:
+        """
+        Start a trace for an input.
+
+        Args:
+            name: Input name (e.g. 'button:next')
+            started: time.monotonic() of the input if it happened earlier
+
+        Returns:
+            Trace, or None when tracing is disabled
+        """
+        if not self.enabled:
+            return None
+        trace = Trace(next(self._ids), name, started if started is not None else time.monotonic())
+        with self._lock:
+            self._expire()
+            self._open[trace.trace_id] = trace
+        return trace
+
+    def current(self) -> Optional[Trace]:
+        """Trace of the work running on this thread."""
+        return getattr(self._local, 'trace', None)
+
+    def recent(self) -> Optional[Trace]:
+        """
+        Newest unfinished trace still within its linger time.
+
+        Used for events that arrive on backend threads without a trace,
+        like the monitor event that reports the effect of a command.
+        """
+        if not self._open:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            for trace in reversed(list(self._open.values())):
+                if now - trace.started <= self.linger:
+                    return trace
+        return None
+
+    @contextmanager
+    def activate(self, trace: Optional[Trace]):
+        """Make trace the current trace of this thread for a block."""
+        if trace is None:
+            yield None
+            return
+        previous = getattr(self._local, 'trace', None)
+        self._local.trace = trace
+        try:
+            yield trace
+        finally:
+            self._local.trace = previous
+
+    @contextmanager
+    def span(self, stage: str, detail: str = '', trace: Optional[Trace] = None):
+        """Record the duration of a block in the current (or given) trace."""
+        trace = trace or self.current()
+        if trace is None:
+            yield
+            return
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(trace, stage, detail, started, time.monotonic())
+
+    def record(self, trace: Optional[Trace], stage: str, detail: str, started: float, ended: float):
+        """Add a span with explicit times (e.g. time spent queued)."""
+        if trace is None or trace.finished is not None:
+            return
+        trace.spans.append((stage, detail, started - trace.started, ended - started))
+
+    def mark(self, trace: Optional[Trace], stage: str, detail: str = ''):
+        """
+        Record a stage that ends now and began where the previous span ended
+        (e.g. the wait for a monitor to report a command's effect).
+        """
+        if trace is None:
+            return
+        previous_end = max((offset + duration for _, _, offset, duration in trace.spans), default=0.0)
+        self.record(trace, stage, detail, trace.started + previous_end, time.monotonic())
+
+    def finish(self, trace: Optional[Trace], complete: bool = True):
+        """Close a trace and move it into the ring buffer."""
+        if trace is None:
+            return
+        with self._lock:
+            if self._open.pop(trace.trace_id, None) is None:
+                return
+            self._close(trace, time.monotonic(), complete)
+
+    def _close(self, trace: Trace, finished: float, complete: bool):
+        """Add a trace to the buffer and histograms (caller holds the lock)."""
+        trace.finished = finished
+        trace.complete = complete
+        self._finished.append(trace)
+        for stage, _, _, duration in trace.spans:
+            self._histograms.setdefault(stage, _Histogram()).add(duration * 1000)
+        if complete:
+            self._histograms.setdefault('total', _Histogram()).add((finished - trace.started) * 1000)
+
+    def _expire(self):
+        """Close traces past their linger time as incomplete (caller holds the lock)."""
+        now = time.monotonic()
+        for trace_id, trace in list(self._open.items()):
+            if now - trace.started > self.linger:
+                del self._open[trace_id]
+                self._close(trace, trace.started + self.linger, complete=False)
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    def get_traces(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Finished traces, newest first."""
+        with self._lock:
+            self._expire()
+            traces = list(self._finished)
+        traces.reverse()
+        return [trace.to_dict() for trace in traces[:limit]]
+
+    def get_histograms(self) -> Dict[str, Dict[str, Any]]:
+        """Latency histogram per stage ('total' = input to rendered frame)."""
+        with self._lock:
+            self._expire()
+            return {stage: histogram.to_dict() for stage, histogram in self._histograms.items()}
+
+    def reset(self):
+        """Drop finished traces and histograms."""
+        with self._lock:
+            self._finished.clear()
+            self._histograms.clear()
+
+
+# Shared by the SourceController, its command executor and event bus, and the interfaces
+tracer = Tracer()
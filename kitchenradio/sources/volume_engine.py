@@ -0,0 +1,234 @@
+"""
+Volume Engine - Optimistic, coalescing volume control per source
+
+Volume presses update a local target immediately; a writer thread sends
+the target to the backend with at most one write in flight (latest wins).
+Volume reported by the backend is reconciled with the target once our own
+writes have settled.
+"""
+
+import time
+import logging
+import threading
+from typing import Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class VolumeEngine:
+    """
+    Authoritative local volume target for one backend.
+
+    - step()/set() return the new target instantly (no backend round trip)
+    - Writes are coalesced: while one write is in flight, newer targets
+      replace each other and only the latest is sent next
+    - reconcile() adopts backend-reported volume once no write is pending
+      and the settle time after the last write has passed
+    """
+
+    def __init__(self,
+                 name: str,
+                 write_fn: Callable[[int], bool],
+                 read_fn: Callable[[], Optional[int]],
+                 max_volume: int = 100,
+                 settle_time: float = 1.0,
+                 on_change: Optional[Callable[[int], None]] = None):
+        """
+        Initialize volume engine.
+
+        Args:
+            name: Source name (for logging)
+            write_fn: Sends a volume to the backend, returns True on success
+            read_fn: Reads the current volume (used once to seed the target)
+            max_volume: Highest volume the backend accepts (100, or 127 for AVRCP)
+            settle_time: Seconds after the last write during which reported
+                         volumes different from the target are ignored
+            on_change: Called with the new target whenever it changes locally
+        """
+        self.name = name
+        self.max_volume = max_volume
+        self.settle_time = settle_time
+        self.on_change = on_change
+
+        self._write_fn = write_fn
+        self._read_fn = read_fn
+
+        self._target: Optional[int] = None
+        self._confirmed: Optional[int] = None  # Last volume reported by the backend
+        self._confirmed_time = 0.0
+        self._pending: Optional[int] = None    # Next value to write (latest wins)
+        self._in_flight = False
+        self._last_write_time = 0.0
+
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+
+    @property
+    def target(self) -> Optional[int]:
+        """Current local target (None until seeded)."""
+        return self._target
+
+    @property
+    def is_settling(self) -> bool:
+        """True while a write is pending, in flight, or within the settle time."""
+        return (self._pending is not None or self._in_flight
+                or time.monotonic() - self._last_write_time < self.settle_time)
+
+    def step(self, delta: int) -> Optional[int]:
+        """
+        Change volume relative to the current target.
+
+        Args:
+            delta: Volume change (negative to decrease)
+
+        Returns:
+            New target, or None if the current volume is unknown
+        """
+        if self._target is None and not self._seed():
+            return None
+        with self._lock:
+            volume = self._apply(self._target + delta)
+        self._notify(volume)
+        return volume
+
+    def set(self, volume: int) -> int:
+        """
+        Set an absolute volume.
+
+        Returns:
+            New target (clamped to 0..max_volume)
+        """
+        with self._lock:
+            volume = self._apply(volume)
+        self._notify(volume)
+        return volume
+
+    def reconcile(self, reported: Optional[int]) -> Optional[int]:
+        """
+        Reconcile a backend-reported volume with the local target.
+
+        Args:
+            reported: Volume reported by the backend (None if unknown)
+
+        Returns:
+            Volume the UI should show
+        """
+        if reported is None:
+            return self._target
+
+        with self._lock:
+            self._confirmed = reported
+            self._confirmed_time = time.monotonic()
+            if self._target is not None and self.is_settling:
+                # Our own writes are still landing - keep showing the target
+                return self._target
+            if self._target != reported:
+                logger.debug(f"🔊 [{self.name}] Volume changed externally: {self._target} → {reported}")
+            self._target = reported
+            return reported
+
+    def _seed(self) -> bool:
+        """Seed the target from the backend (first press only)."""
+        try:
+            volume = self._read_fn()
+        except Exception as e:
+            logger.error(f"🔊 [{self.name}] Error reading volume: {e}")
+            return False
+        if volume is None:
+            return False
+        with self._lock:
+            if self._target is None:
+                self._target = self._confirmed = volume
+        return True
+
+    def _apply(self, volume: int) -> int:
+        """Set target and schedule a write (caller holds the lock)."""
+        volume = max(0, min(self.max_volume, int(volume)))
+        self._target = volume
+        self._pending = volume
+        self._ensure_writer()
+        self._wake_event.set()
+        return volume
+
+    def _notify(self, volume: int):
+        """Report a locally changed target (called without the lock held)."""
+        if self.on_change:
+            try:
+                self.on_change(volume)
+            except Exception as e:
+                logger.error(f"🔊 [{self.name}] Error in volume change callback: {e}")
+
+    def _ensure_writer(self):
+        """Start the writer thread if it is not running (caller holds the lock)."""
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True,
+                                                   name=f"volume-{self.name}")
+            self._writer_thread.start()
+
+    def _writer_loop(self):
+        """
+        Send the latest pending target, one write at a time.
+
+        The thread exits once writes have settled and nothing is pending;
+        the next step()/set() starts a new one.
+        """
+        while True:
+            self._wake_event.wait()
+            self._wake_event.clear()
+
+            while True:
+                with self._lock:
+                    volume = self._pending
+                    self._pending = None
+                    self._in_flight = volume is not None
+                if volume is None:
+                    break
+
+                try:
+                    success = self._write_fn(volume)
+                except Exception as e:
+                    logger.error(f"🔊 [{self.name}] Error writing volume {volume}: {e}")
+                    success = False
+
+                revert_to = None
+                with self._lock:
+                    self._in_flight = False
+                    self._last_write_time = time.monotonic()
+                    if not success and self._pending is None and self._confirmed is not None:
+                        # Nothing newer queued - fall back to the last known backend volume
+                        self._target = revert_to = self._confirmed
+
+                if revert_to is not None:
+                    logger.warning(f"🔊 [{self.name}] Volume write failed, reverting to {revert_to}")
+                    self._notify(revert_to)
+
+            # Quiet for the settle time - adopt the backend volume if it disagrees
+            if self._wake_event.wait(self.settle_time):
+                continue
+
+            with self._lock:
+                if self._pending is not None:
+                    continue
+                self._writer_thread = None
+                volume = self._settle()
+            if volume is not None:
+                self._notify(volume)
+            return
+
+    def _settle(self) -> Optional[int]:
+        """
+        Adopt the last reported backend volume once our writes have landed
+        (caller holds the lock).
+
+        Returns:
+            New target if it changed, None otherwise
+        """
+        if (self._confirmed is None or self._confirmed == self._target
+                or self._confirmed_time < self._last_write_time):
+            # In agreement, or no report since our last write
+            return None
+        logger.debug(f"🔊 [{self.name}] Volume settled at backend value {self._confirmed} "
+                     f"(target was {self._target})")
+        self._target = self._confirmed
+        return self._target
@@ -0,0 +1,50 @@
+"""
+Shared helpers for tests that coordinate with worker threads.
+"""
+
+import threading
+import time
+from typing import Callable
+
+# Upper bound for every wait in the tests - only reached when a test fails
+TIMEOUT = 2.0
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = TIMEOUT) -> bool:
+    """Poll until predicate() is true; False if it is still false after timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class Gate:
+    """
+    Holds threads that pass through it while closed.
+
+    Tests close the gate, wait until a worker has entered it, queue more
+    work behind the held worker, then open the gate.
+    """
+
+    def __init__(self, closed: bool = False):
+        self.entered = threading.Event()
+        self._open = threading.Event()
+        if not closed:
+            self._open.set()
+
+    def close(self):
+        self.entered.clear()
+        self._open.clear()
+
+    def open(self):
+        self._open.set()
+
+    def enter(self):
+        """Called by the worker: record the visit, then wait until the gate is open."""
+        self.entered.set()
+        self._open.wait(TIMEOUT)
+
+    def wait_entered(self, timeout: float = TIMEOUT) -> bool:
+        return self.entered.wait(timeout)
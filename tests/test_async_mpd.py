@@ -0,0 +1,193 @@
+"""
+Tests for the asyncio MPD backend: response parsing, command lists, error
+handling of a single connection, and idle cancellation.
+
+AsyncMPDConnection runs on an in-memory StreamReader and a writer that
+records what was sent; the SyncKitchenRadioClient test talks to a small
+fake MPD server on localhost.
+"""
+
+import asyncio
+import threading
+import unittest
+
+from kitchenradio.sources.mediaplayer.async_client import (
+    AsyncMPDConnection, MPDCommandError, MPDConnectionError, SyncKitchenRadioClient,
+    _convert_result, _format_command, _parse_object, _parse_objects
+)
+from tests.helpers import TIMEOUT
+
+
+class FakeWriter:
+    """StreamWriter stand-in that records written commands."""
+
+    def __init__(self):
+        self.data = b''
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def is_closing(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class ParserTest(unittest.TestCase):
+
+    def test_format_command_quotes_arguments(self):
+        self.assertEqual(_format_command('status', []), 'status\n')
+        self.assertEqual(_format_command('find', ['title', 'Say "hi" \\o/']),
+                         'find "title" "Say \\"hi\\" \\\\o/"\n')
+
+    def test_repeated_keys_become_lists(self):
+        self.assertEqual(_parse_object([('file', 'a.mp3'), ('artist', 'A'), ('artist', 'B')]),
+                         {'file': 'a.mp3', 'artist': ['A', 'B']})
+
+    def test_objects_split_at_delimiter_keys(self):
+        pairs = [('directory', 'Music'), ('last-modified', 'x'),
+                 ('file', 'a.mp3'), ('title', 'A'),
+                 ('playlist', 'Mix')]
+        self.assertEqual(_parse_objects(pairs), [
+            {'directory': 'Music', 'last-modified': 'x'},
+            {'file': 'a.mp3', 'title': 'A'},
+            {'playlist': 'Mix'},
+        ])
+
+    def test_objects_split_at_repeated_first_key(self):
+        pairs = [('cpos', '0'), ('id', '10'), ('cpos', '1'), ('id', '11')]
+        self.assertEqual(_parse_objects(pairs), [{'cpos': '0', 'id': '10'}, {'cpos': '1', 'id': '11'}])
+        self.assertEqual(_parse_objects([]), [])
+
+    def test_result_shape_per_command(self):
+        self.assertEqual(_convert_result('status', [('volume', '50')]), {'volume': '50'})
+        self.assertEqual(_convert_result('playlistinfo', [('file', 'a'), ('file', 'b')]),
+                         [{'file': 'a'}, {'file': 'b'}])
+        self.assertEqual(_convert_result('idle', [('changed', 'player'), ('changed', 'mixer')]),
+                         ['player', 'mixer'])
+        self.assertIsNone(_convert_result('play', []))
+
+
+class AsyncMPDConnectionTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.conn = AsyncMPDConnection('localhost', 6600, timeout=TIMEOUT)
+        self.reader = asyncio.StreamReader()
+        self.writer = FakeWriter()
+        self.conn._reader, self.conn._writer = self.reader, self.writer
+
+    async def test_execute_parses_response(self):
+        self.reader.feed_data(b'Volume: 50\nstate: play\nOK\n')
+        self.assertEqual(await self.conn.execute('status'), {'volume': '50', 'state': 'play'})
+        self.assertEqual(self.writer.data, b'status\n')
+
+    async def test_command_list_splits_responses(self):
+        self.reader.feed_data(b'volume: 50\nlist_OK\nlist_OK\nfile: a.mp3\nlist_OK\nOK\n')
+        results = await self.conn.command_list([('status',), ('play', 0), ('playlistinfo',)])
+        self.assertEqual(results, [{'volume': '50'}, None, [{'file': 'a.mp3'}]])
+        self.assertEqual(self.writer.data, b'command_list_ok_begin\nstatus\nplay "0"\n'
+                                           b'playlistinfo\ncommand_list_end\n')
+
+    async def test_ack_keeps_connection_open(self):
+        self.reader.feed_data(b'ACK [50@0] {play} No such song\n')
+        with self.assertRaises(MPDCommandError):
+            await self.conn.execute('play', 99)
+        self.assertTrue(self.conn.is_open)
+
+    async def test_connection_lost_mid_response_closes(self):
+        self.reader.feed_data(b'volume: 50\n')
+        self.reader.feed_eof()
+        with self.assertRaises(MPDConnectionError):
+            await self.conn.execute('status')
+        self.assertFalse(self.conn.is_open)
+
+    async def test_timeout_closes_connection(self):
+        self.reader.feed_data(b'volume: 50\n')
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.conn.execute('status', timeout=0.01)
+        self.assertFalse(self.conn.is_open)
+        with self.assertRaises(MPDConnectionError):
+            await self.conn.execute('status')
+
+    async def test_idle_returns_changed_subsystems(self):
+        self.reader.feed_data(b'changed: player\nchanged: mixer\nOK\n')
+        self.assertEqual(await self.conn.idle(['player', 'mixer']), ['player', 'mixer'])
+        self.assertEqual(self.writer.data, b'idle "player" "mixer"\n')
+
+    async def test_cancelled_idle_sends_noidle_and_stays_usable(self):
+        task = asyncio.create_task(self.conn.idle(['player']))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0)
+        self.reader.feed_data(b'OK\n')  # Answer to noidle
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertTrue(self.writer.data.endswith(b'noidle\n'))
+        self.assertTrue(self.conn.is_open)
+        self.reader.feed_data(b'OK\n')
+        self.assertIsNone(await self.conn.execute('play'))
+
+
+class FakeMPDServer:
+    """MPD server on localhost that answers noidle only after a delay."""
+
+    def __init__(self, noidle_delay: float = 0.2):
+        self.noidle_delay = noidle_delay
+        self.noidle_answered = threading.Event()
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(asyncio.start_server(self._handle, '127.0.0.1', 0))
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.server.close)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(TIMEOUT)
+
+    async def _handle(self, reader, writer):
+        writer.write(b'OK MPD 0.23.5\n')
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if line.startswith(b'idle'):
+                continue  # Nothing changes - answered by noidle
+            if line == b'noidle\n':
+                await asyncio.sleep(self.noidle_delay)
+                writer.write(b'OK\n')
+                await writer.drain()
+                self.noidle_answered.set()
+                continue
+            writer.write(b'OK\n')
+            await writer.drain()
+        writer.close()
+
+
+class SyncWaitForChangesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeMPDServer()
+        self.addCleanup(self.server.stop)
+        self.client = SyncKitchenRadioClient('127.0.0.1', self.server.port, timeout=TIMEOUT,
+                                             pool_size=1, keepalive_interval=0)
+        self.addCleanup(self.client.disconnect)
+        self.assertTrue(self.client.connect())
+
+    def test_stop_waits_for_noidle_answer(self):
+        stop_event = threading.Event()
+        threading.Timer(0.05, stop_event.set).start()
+
+        self.assertEqual(self.client.wait_for_changes(['player'], stop_event, wake_interval=0.01), [])
+        # Returning earlier would let disconnect() race the drain on the same stream
+        self.assertTrue(self.server.noidle_answered.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
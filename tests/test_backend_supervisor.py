@@ -0,0 +1,112 @@
+"""
+Tests for BackendSupervisor backoff, jitter, retries and giving up.
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+from kitchenradio.sources import backend_supervisor
+from kitchenradio.sources.backend_supervisor import BackendSupervisor
+from tests.helpers import TIMEOUT, wait_until
+
+
+class FlakyBackend:
+    """Connect function that fails a number of times before it succeeds."""
+
+    def __init__(self, failures: int = 0, error: Exception = None):
+        self.failures = failures
+        self.error = error
+        self.attempts = 0
+        self.connected = threading.Event()
+
+    def connect(self) -> bool:
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            if self.error is not None:
+                raise self.error
+            return False
+        return True
+
+    def on_connected(self):
+        self.connected.set()
+
+
+class BackendSupervisorTest(unittest.TestCase):
+
+    def supervisor(self, **kwargs):
+        kwargs.setdefault('initial_delay', 0.0)
+        supervisor = BackendSupervisor(**kwargs)
+        self.addCleanup(supervisor.stop)
+        return supervisor
+
+    def test_delay_doubles_up_to_max(self):
+        supervisor = BackendSupervisor(initial_delay=5.0, max_delay=60.0, jitter=0.0)
+        self.assertEqual([supervisor._delay(attempts) for attempts in range(6)],
+                         [5.0, 10.0, 20.0, 40.0, 60.0, 60.0])
+
+    def test_delay_jitter_stays_within_bounds(self):
+        supervisor = BackendSupervisor(initial_delay=10.0, max_delay=60.0, jitter=0.2)
+        with mock.patch.object(backend_supervisor.random, 'uniform', side_effect=lambda a, b: b):
+            self.assertAlmostEqual(supervisor._delay(0), 12.0)
+        with mock.patch.object(backend_supervisor.random, 'uniform', side_effect=lambda a, b: a):
+            self.assertAlmostEqual(supervisor._delay(0), 8.0)
+            self.assertAlmostEqual(supervisor._delay(10), 48.0)
+
+    def test_retries_until_connected(self):
+        supervisor = self.supervisor()
+        backend = FlakyBackend(failures=2)
+        supervisor.watch('mpd', backend.connect, backend.on_connected)
+
+        self.assertTrue(backend.connected.wait(TIMEOUT))
+        self.assertEqual(backend.attempts, 3)
+        self.assertTrue(wait_until(lambda: not supervisor.is_watching('mpd')))
+
+    def test_exception_counts_as_failed_attempt(self):
+        supervisor = self.supervisor()
+        backend = FlakyBackend(failures=1, error=OSError('No route to host'))
+        supervisor.watch('librespot', backend.connect, backend.on_connected)
+
+        self.assertTrue(backend.connected.wait(TIMEOUT))
+        self.assertEqual(backend.attempts, 2)
+
+    def test_gives_up_after_max_attempts(self):
+        supervisor = self.supervisor(max_attempts=3)
+        backend = FlakyBackend(failures=100)
+        supervisor.watch('mpd', backend.connect, backend.on_connected)
+
+        self.assertTrue(wait_until(lambda: not supervisor.is_watching('mpd')))
+        self.assertEqual(backend.attempts, 3)
+        self.assertFalse(backend.connected.is_set())
+
+    def test_watch_twice_is_noop(self):
+        supervisor = self.supervisor(initial_delay=60.0)
+        first, second = FlakyBackend(), FlakyBackend()
+        supervisor.watch('mpd', first.connect, first.on_connected)
+        supervisor.watch('mpd', second.connect, second.on_connected)
+
+        supervisor.retry_now('mpd')
+        self.assertTrue(first.connected.wait(TIMEOUT))
+        self.assertEqual(second.attempts, 0)
+
+    def test_retry_now_skips_the_wait(self):
+        supervisor = self.supervisor(initial_delay=60.0)
+        backend = FlakyBackend()
+        supervisor.watch('bluetooth', backend.connect, backend.on_connected)
+        self.assertEqual(backend.attempts, 0)
+        self.assertGreater(supervisor.get_status()['bluetooth']['next_attempt_in'], 0)
+
+        supervisor.retry_now()
+        self.assertTrue(backend.connected.wait(TIMEOUT))
+
+    def test_stop_ends_retries(self):
+        supervisor = self.supervisor(initial_delay=60.0)
+        backend = FlakyBackend()
+        supervisor.watch('mpd', backend.connect, backend.on_connected)
+        supervisor.stop()
+        supervisor.retry_now()
+        self.assertFalse(backend.connected.wait(0.05))
+
+
+if __name__ == '__main__':
+    unittest.main()
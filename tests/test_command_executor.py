@@ -0,0 +1,156 @@
+"""
+Tests for CommandExecutor scheduling: priorities, supersede, bounded
+coalescing, preemption and toggles.
+
+Each test holds the worker in a blocking command, queues the commands
+under test behind it, then releases the worker.
+"""
+
+import unittest
+from concurrent.futures import CancelledError
+
+from kitchenradio.sources.command_executor import (
+    CommandExecutor, CommandPriority, CommandSpec, MergePolicy, command
+)
+from tests.helpers import TIMEOUT, Gate
+
+TRANSPORT = CommandSpec('transport', CommandPriority.TRANSPORT, MergePolicy.SUPERSEDE)
+TOGGLE = CommandSpec('transport', CommandPriority.TRANSPORT, MergePolicy.QUEUE)
+NEXT = CommandSpec('next', CommandPriority.TRANSPORT, MergePolicy.BOUNDED)
+SOURCE = CommandSpec('source', CommandPriority.SOURCE, MergePolicy.SUPERSEDE)
+POWER = CommandSpec('power', CommandPriority.POWER, MergePolicy.SUPERSEDE, preempt=True)
+
+
+class CommandExecutorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = CommandExecutor(max_queued=3)
+        self.ran = []
+        self.gate = Gate(closed=True)
+
+    def tearDown(self):
+        self.gate.open()
+        self.executor.stop()
+
+    def hold_worker(self):
+        """Occupy the worker until the gate opens."""
+        future = self.executor.submit('block', CommandSpec('block', CommandPriority.POWER), self.gate.enter)
+        self.assertTrue(self.gate.wait_entered())
+        return future
+
+    def submit(self, name, spec, result=True):
+        def run():
+            self.ran.append(name)
+            return result
+        return self.executor.submit(name, spec, run)
+
+    def drain(self, *futures):
+        self.gate.open()
+        for future in futures:
+            try:
+                future.result(TIMEOUT)
+            except CancelledError:
+                pass
+
+    def test_runs_in_priority_order(self):
+        self.hold_worker()
+        futures = [self.submit('next', NEXT), self.submit('source', SOURCE)]
+        self.drain(*futures)
+        self.assertEqual(self.ran, ['source', 'next'])
+
+    def test_same_priority_runs_in_submit_order(self):
+        self.hold_worker()
+        futures = [self.submit('next', NEXT), self.submit('toggle', TOGGLE)]
+        self.drain(*futures)
+        self.assertEqual(self.ran, ['next', 'toggle'])
+
+    def test_supersede_runs_latest_and_shares_result(self):
+        self.hold_worker()
+        play = self.submit('play', TRANSPORT, result='played')
+        pause = self.submit('pause', TRANSPORT, result='paused')
+        self.drain(play, pause)
+        self.assertEqual(self.ran, ['pause'])
+        self.assertEqual(play.result(TIMEOUT), 'paused')
+        self.assertEqual(self.executor.get_stats()['superseded'], 1)
+
+    def test_toggles_are_never_superseded(self):
+        self.hold_worker()
+        first = self.submit('toggle', TOGGLE)
+        second = self.submit('toggle', TOGGLE)
+        self.drain(first, second)
+        # Two presses cancel out - both must run
+        self.assertEqual(self.ran, ['toggle', 'toggle'])
+
+    def test_idempotent_command_supersedes_queued_toggle(self):
+        self.hold_worker()
+        toggle = self.submit('toggle', TOGGLE)
+        play = self.submit('play', TRANSPORT)
+        self.drain(toggle, play)
+        self.assertEqual(self.ran, ['play'])
+
+    def test_bounded_coalesces_beyond_max_queued(self):
+        self.hold_worker()
+        futures = [self.submit(f'next{i}', NEXT, result=i) for i in range(5)]
+        self.drain(*futures)
+        self.assertEqual(self.ran, ['next0', 'next1', 'next2'])
+        self.assertEqual([future.result(TIMEOUT) for future in futures], [0, 1, 2, 2, 2])
+        self.assertEqual(self.executor.get_stats()['coalesced'], 2)
+
+    def test_preempt_cancels_lower_priority(self):
+        self.hold_worker()
+        next_future = self.submit('next', NEXT)
+        source = self.submit('source', SOURCE)
+        power = self.submit('power', POWER)
+        self.drain(power)
+        self.assertTrue(next_future.cancelled())
+        self.assertTrue(source.cancelled())
+        self.assertEqual(self.ran, ['power'])
+        self.assertEqual(self.executor.get_stats()['preempted'], 2)
+
+    def test_power_toggles_queue_behind_each_other(self):
+        toggle = CommandSpec('power', CommandPriority.POWER, MergePolicy.QUEUE, preempt=True)
+        self.hold_worker()
+        first = self.submit('power', toggle)
+        second = self.submit('power', toggle)
+        self.drain(first, second)
+        self.assertEqual(self.ran, ['power', 'power'])
+
+    def test_preempt_keeps_commands_queued_after_it(self):
+        self.hold_worker()
+        power = self.submit('power', POWER)
+        next_future = self.submit('next', NEXT)
+        self.drain(power, next_future)
+        self.assertEqual(self.ran, ['power', 'next'])
+
+    def test_error_is_set_on_future(self):
+        def fail():
+            raise ValueError('boom')
+        future = self.executor.submit('fail', TRANSPORT, fail)
+        with self.assertRaises(ValueError):
+            future.result(TIMEOUT)
+        self.assertEqual(self.executor.get_stats()['errors'], 1)
+
+    def test_submit_after_stop_is_cancelled(self):
+        self.executor.stop()
+        self.assertTrue(self.submit('play', TRANSPORT).cancelled())
+
+    def test_decorated_call_runs_inline_on_worker(self):
+        executor = self.executor
+
+        class Radio:
+            _commands = executor
+
+            @command('outer', CommandPriority.SOURCE)
+            def outer(self):
+                # Would deadlock if the nested call were queued behind this one
+                return self.inner() + 1
+
+            @command('inner', CommandPriority.TRANSPORT)
+            def inner(self):
+                return executor.on_worker_thread() and 1
+
+        self.assertEqual(Radio().outer(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Tests for EventBus delivery: calling conventions, merging of state
+events, drop order of full queues and legacy expansion.
+
+Tests that check queue contents hold the subscriber's delivery thread in
+its first callback, publish behind it, then release it.
+"""
+
+import unittest
+
+from kitchenradio.sources.event_bus import EventBus
+from tests.helpers import TIMEOUT, Gate
+
+
+class Recorder:
+    """Callback that records its calls and can hold its delivery thread."""
+
+    def __init__(self, hold: bool = False):
+        self.calls = []
+        self.gate = Gate(closed=hold)
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        self.gate.enter()
+
+
+class EventBusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = EventBus(max_queue=3)
+
+    def tearDown(self):
+        self.bus.stop()
+
+    def subscribe_held(self, event_name='client_changed', **kwargs):
+        """Subscribe a recorder and park its thread in a first 'hold' event."""
+        recorder = Recorder(hold=True)
+        self.bus.subscribe(event_name, recorder, **kwargs)
+        self.bus.publish(event_name, 'hold')
+        self.assertTrue(recorder.gate.wait_entered())
+        return recorder
+
+    def finish(self, recorder):
+        recorder.gate.open()
+        self.assertTrue(self.bus.wait_idle(TIMEOUT))
+        return recorder.calls[1:]  # Without the 'hold' event
+
+    def test_calling_conventions(self):
+        named, anything, plain = Recorder(), Recorder(), Recorder()
+        self.bus.subscribe('client_changed', named)
+        self.bus.subscribe('any', anything)
+        self.bus.subscribe('power_changed', plain)
+
+        self.bus.publish('client_changed', 'track_changed', track_info='t')
+        self.bus.publish('power_changed', powered_on=True)
+        self.assertTrue(self.bus.wait_idle(TIMEOUT))
+
+        self.assertEqual(named.calls, [{'event': 'track_changed', 'track_info': 't'}])
+        self.assertEqual(plain.calls, [{'powered_on': True}])
+        self.assertEqual(anything.calls, [
+            {'event_type': 'client_changed', 'sub_event': 'track_changed', 'track_info': 't'},
+            {'event_type': 'power_changed', 'powered_on': True},
+        ])
+
+    def test_duplicate_subscribe_is_rejected(self):
+        recorder = Recorder()
+        self.assertTrue(self.bus.subscribe('client_changed', recorder))
+        self.assertFalse(self.bus.subscribe('client_changed', recorder))
+        self.assertEqual(self.bus.subscriber_count('client_changed'), 1)
+        self.assertTrue(self.bus.unsubscribe('client_changed', recorder))
+        self.assertFalse(self.bus.unsubscribe('client_changed', recorder))
+
+    def test_state_events_merge_and_move_to_back(self):
+        recorder = self.subscribe_held()
+        self.bus.publish('client_changed', 'track_changed', track_info='a')
+        self.bus.publish('client_changed', 'device_connected', name='phone')
+        self.bus.publish('client_changed', 'track_changed', track_info='b')
+
+        calls = self.finish(recorder)
+        self.assertEqual(calls, [
+            {'event': 'device_connected', 'name': 'phone'},
+            {'event': 'track_changed', 'track_info': 'b'},
+        ])
+
+    def test_state_changed_merge_keeps_both_masks(self):
+        recorder = self.subscribe_held()
+        self.bus.publish('client_changed', 'state_changed', state='s1', changed=1)
+        self.bus.publish('client_changed', 'state_changed', state='s2', changed=4)
+
+        calls = self.finish(recorder)
+        self.assertEqual(calls, [{'event': 'state_changed', 'state': 's2', 'changed': 5}])
+
+    def test_full_queue_drops_oldest_non_state_event(self):
+        recorder = self.subscribe_held()
+        self.bus.publish('client_changed', 'track_changed', track_info='t')
+        self.bus.publish('client_changed', 'message', n=1)
+        self.bus.publish('client_changed', 'message', n=2)
+        self.bus.publish('client_changed', 'message', n=3)  # Queue full - drops n=1
+
+        calls = self.finish(recorder)
+        self.assertEqual([call.get('n', call.get('track_info')) for call in calls], ['t', 2, 3])
+        stats = next(iter(self.bus.get_stats().values()))
+        self.assertEqual(stats['dropped'], 1)
+
+    def test_full_queue_of_state_events_drops_oldest(self):
+        recorder = self.subscribe_held()
+        for event in ('playback_state_changed', 'track_changed', 'source_info_changed',
+                      'current_source_changed'):
+            self.bus.publish('client_changed', event, value=event)
+
+        calls = self.finish(recorder)
+        self.assertEqual([call['event'] for call in calls],
+                         ['track_changed', 'source_info_changed', 'current_source_changed'])
+
+    def test_slow_subscriber_does_not_delay_others(self):
+        slow = self.subscribe_held()
+        fast = Recorder()
+        self.bus.subscribe('client_changed', fast)
+        self.bus.publish('client_changed', 'track_changed', track_info='t')
+
+        self.assertTrue(fast.gate.wait_entered())
+        self.assertEqual(fast.calls, [{'event': 'track_changed', 'track_info': 't'}])
+        self.finish(slow)
+
+    def test_legacy_expansion_computed_once_for_legacy_subscribers(self):
+        modern, legacy_a, legacy_b = Recorder(), Recorder(), Recorder()
+        self.bus.subscribe('client_changed', modern)
+        self.bus.subscribe('client_changed', legacy_a, legacy=True)
+        self.bus.subscribe('client_changed', legacy_b, legacy=True)
+
+        expansions = []
+
+        def expand():
+            expansions.append(1)
+            return [('track_changed', {'track_info': 't'}), ('playback_state_changed', {'playback_state': 'p'})]
+
+        self.bus.publish('client_changed', 'state_changed', legacy=expand, state='s', changed=3)
+        self.assertTrue(self.bus.wait_idle(TIMEOUT))
+
+        self.assertEqual(len(expansions), 1)
+        self.assertEqual(modern.calls, [{'event': 'state_changed', 'state': 's', 'changed': 3}])
+        for recorder in (legacy_a, legacy_b):
+            self.assertEqual(recorder.calls, [
+                {'event': 'track_changed', 'track_info': 't'},
+                {'event': 'playback_state_changed', 'playback_state': 'p'},
+            ])
+
+    def test_legacy_expansion_skipped_without_legacy_subscribers(self):
+        self.bus.subscribe('client_changed', Recorder())
+
+        def expand():
+            raise AssertionError("expansion must not be computed")
+
+        self.bus.publish('client_changed', 'state_changed', legacy=expand, state='s', changed=1)
+        self.assertTrue(self.bus.wait_idle(TIMEOUT))
+
+    def test_callback_error_does_not_stop_delivery(self):
+        calls = []
+
+        def flaky(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise RuntimeError('boom')
+
+        self.bus.subscribe('power_changed', flaky)
+        self.bus.publish('power_changed', powered_on=True)
+        self.bus.publish('power_changed', powered_on=False)
+        self.assertTrue(self.bus.wait_idle(TIMEOUT))
+        self.assertEqual(len(calls), 2)
+        stats = next(iter(self.bus.get_stats().values()))
+        self.assertEqual(stats['errors'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Tests for LibraryIndex: tokenizing, prefix search, browse order, and the
+full and incremental updates against a fake MPD database.
+"""
+
+import unittest
+
+from kitchenradio.sources.mediaplayer.library import LibraryIndex, tokenize, track_from_song
+
+
+def song(file, title, artist, album, track='1', modified='2024-01-01T00:00:00Z', **tags):
+    return dict({'file': file, 'title': title, 'artist': artist, 'album': album,
+                 'track': track, 'last-modified': modified}, **tags)
+
+
+class FakeDatabase:
+    """KitchenRadioClient stand-in serving songs from a dict; records database reads."""
+
+    def __init__(self, songs):
+        self.songs = {entry['file']: entry for entry in songs}
+        self.db_update = 1
+        self.calls = []
+        self.failing = set()
+
+    def _call(self, name):
+        self.calls.append(name)
+        return name not in self.failing
+
+    def is_connected(self):
+        return True
+
+    def get_stats(self):
+        self._call('stats')
+        return {'db_update': str(self.db_update), 'songs': str(len(self.songs))}
+
+    def get_directory(self, path):
+        if not self._call('lsinfo'):
+            return None
+        directories = sorted({file.split('/')[0] for file in self.songs if '/' in file})
+        files = [dict(entry) for file, entry in self.songs.items() if '/' not in file]
+        return [{'directory': directory} for directory in directories] + files
+
+    def list_all_info(self, path):
+        if not self._call('listallinfo'):
+            return None
+        return [dict(entry) for file, entry in self.songs.items() if file.startswith(path + '/')]
+
+    def find_modified_since(self, since):
+        if not self._call('find'):
+            return None
+        return [dict(entry) for entry in self.songs.values() if entry['last-modified'] >= since]
+
+    def list_files(self):
+        if not self._call('list'):
+            return None
+        return list(self.songs)
+
+    def add(self, entry):
+        self.songs[entry['file']] = entry
+        self.db_update += 1
+
+    def remove(self, file):
+        del self.songs[file]
+        self.db_update += 1
+
+
+def titles(tracks):
+    return [track.title for track in tracks]
+
+
+class TokenizeTest(unittest.TestCase):
+
+    def test_folds_case_and_accents(self):
+        self.assertEqual(tokenize('Beyoncé - Halo (Live)'), ['beyonce', 'halo', 'live'])
+        self.assertEqual(tokenize("Sigur Rós / Hoppípolla"), ['sigur', 'ros', 'hoppipolla'])
+        self.assertEqual(tokenize(' -- '), [])
+
+    def test_track_from_song_defaults(self):
+        track = track_from_song({'file': 'Misc/intro.flac', 'track': '3/12', 'artist': ['A', 'B']})
+        self.assertEqual(track.title, 'intro.flac')
+        self.assertEqual(track.artist, 'A')
+        self.assertEqual(track.album_artist, 'A')
+        self.assertEqual(track.album, 'Unknown Album')
+        self.assertEqual(track.track, 3)
+
+
+class LibraryIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.db = FakeDatabase([
+            song('Beatles/Abbey Road/01.flac', 'Come Together', 'The Beatles', 'Abbey Road', '1'),
+            song('Beatles/Abbey Road/02.flac', 'Something', 'The Beatles', 'Abbey Road', '2'),
+            song('Beatles/Help/01.flac', 'Help!', 'The Beatles', 'Help!', '1'),
+            song('Beck/Odelay/01.flac', 'Devils Haircut', 'Beck', 'Odelay', '1'),
+            song('loose.mp3', 'Loose Track', 'Various', 'Singles', '1'),
+        ])
+        self.index = LibraryIndex(self.db, check_interval=0)
+        self.assertTrue(self.index.update())
+        self.db.calls.clear()
+
+    def test_build_indexes_every_directory_and_root_files(self):
+        self.assertTrue(self.index.is_loaded)
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.version, 1)
+
+    def test_search_matches_word_prefixes(self):
+        self.assertEqual(titles(self.index.search('beat')), ['Come Together', 'Something', 'Help!'])
+        self.assertEqual(titles(self.index.search('be')),
+                         ['Devils Haircut', 'Come Together', 'Something', 'Help!'])
+        self.assertEqual(self.db.calls, [])
+
+    def test_search_requires_every_word(self):
+        self.assertEqual(titles(self.index.search('beatles some')), ['Something'])
+        self.assertEqual(self.index.search('beatles odelay'), [])
+        self.assertEqual(self.index.search('  '), [])
+
+    def test_search_limit_keeps_result_order(self):
+        self.assertEqual(titles(self.index.search('beatles', limit=2)), ['Come Together', 'Something'])
+
+    def test_browse(self):
+        self.assertEqual(self.index.get_artists(), ['Beck', 'The Beatles', 'Various'])
+        self.assertEqual(self.index.get_albums('The Beatles'), ['Abbey Road', 'Help!'])
+        self.assertEqual(titles(self.index.get_tracks('The Beatles', 'Abbey Road')),
+                         ['Come Together', 'Something'])
+
+    def test_incremental_add(self):
+        self.db.add(song('Beck/Odelay/02.flac', 'Hotwax', 'Beck', 'Odelay', '2',
+                         modified='2024-02-01T00:00:00Z'))
+        self.assertTrue(self.index.update())
+
+        self.assertEqual(titles(self.index.search('hotw')), ['Hotwax'])
+        self.assertEqual(titles(self.index.get_tracks('Beck', 'Odelay')), ['Devils Haircut', 'Hotwax'])
+        self.assertEqual(self.index.version, 2)
+        self.assertNotIn('listallinfo', self.db.calls)
+
+    def test_incremental_remove_drops_tokens(self):
+        tokens = self.index.get_stats()['tokens']
+        self.db.remove('Beck/Odelay/01.flac')
+        self.assertTrue(self.index.update())
+
+        self.assertEqual(self.index.search('haircut'), [])
+        self.assertEqual(self.index.get_artists(), ['The Beatles', 'Various'])
+        self.assertLess(self.index.get_stats()['tokens'], tokens)
+
+    def test_incremental_retag_replaces_track(self):
+        self.db.add(song('Beatles/Help/01.flac', 'Help', 'The Beatles', 'Help! (Remaster)', '1',
+                         modified='2024-03-01T00:00:00Z'))
+        self.assertTrue(self.index.update())
+
+        self.assertEqual(self.index.get_albums('The Beatles'), ['Abbey Road', 'Help! (Remaster)'])
+        self.assertEqual(len(self.index.search('remaster')), 1)
+        self.assertEqual(len(self.index), 5)
+
+    def test_new_file_with_old_mtime_is_found(self):
+        self.db.add(song('Beck/Odelay/03.flac', 'Lord Only Knows', 'Beck', 'Odelay', '3',
+                         modified='2000-01-01T00:00:00Z'))
+        self.assertTrue(self.index.update())
+
+        self.assertEqual(titles(self.index.search('lord')), ['Lord Only Knows'])
+        self.assertIn('listallinfo', self.db.calls)
+
+    def test_unchanged_update_keeps_version(self):
+        self.assertTrue(self.index.update())
+        self.assertEqual(self.index.version, 1)
+
+    def test_failed_update_keeps_index(self):
+        self.db.remove('Beck/Odelay/01.flac')
+        self.db.failing.add('find')
+        self.assertFalse(self.index.update())
+        self.assertEqual(len(self.index), 5)
+
+        self.db.failing.clear()
+        self.assertTrue(self.index.update())
+        self.assertEqual(len(self.index), 4)
+
+    def test_additions_do_not_read_file_list(self):
+        self.db.add(song('Beck/Odelay/02.flac', 'Hotwax', 'Beck', 'Odelay', '2',
+                         modified='2024-02-01T00:00:00Z'))
+        self.assertTrue(self.index.update())
+        self.assertEqual(self.db.calls, ['stats', 'find'])
+
+    def test_removal_reads_file_list(self):
+        self.db.remove('loose.mp3')
+        self.assertTrue(self.index.update())
+        self.assertIn('list', self.db.calls)
+        self.assertEqual(self.index.search('loose'), [])
+
+    def test_failed_root_listing_aborts_build(self):
+        index = LibraryIndex(self.db, check_interval=0)
+        self.db.failing.add('lsinfo')
+        self.assertFalse(index.update())
+        self.assertFalse(index.is_loaded)
+
+        # Same db_update as the failed attempt - the build must still happen
+        self.db.failing.clear()
+        self.assertTrue(index.update())
+        self.assertEqual(len(index), 5)
+
+    def test_failed_root_listing_fails_incremental_update(self):
+        self.db.add(song('intro.mp3', 'Intro', 'Various', 'Singles', '1', modified='2000-01-01T00:00:00Z'))
+        self.db.failing.add('lsinfo')
+        self.assertFalse(self.index.update())
+
+        self.db.failing.clear()
+        self.assertTrue(self.index.update())
+        self.assertEqual(titles(self.index.search('intro')), ['Intro'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+"""
+Tests for MPDConnectionPool checkout, discard/reopen and health tracking,
+and for the connection state KitchenRadioClient derives from it.
+
+mpd.MPDClient is replaced by a fake that counts the sockets it opens.
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+import mpd
+
+from kitchenradio.sources.mediaplayer import pool as pool_module
+from kitchenradio.sources.mediaplayer.client import KitchenRadioClient
+from kitchenradio.sources.mediaplayer.pool import MPDConnectionPool, PoolTimeout, is_connection_error
+from tests.helpers import Gate
+
+
+class FakeMPDClient:
+    """Stand-in for mpd.MPDClient; the class keeps track of opened sockets."""
+    opened = []
+    refuse = False
+    fail_next = None  # Exception raised by the next status()
+
+    def __init__(self):
+        self.timeout = None
+        self.closed = False
+
+    def status(self):
+        error, FakeMPDClient.fail_next = FakeMPDClient.fail_next, None
+        if error is not None:
+            raise error
+        return {'state': 'play'}
+
+    def connect(self, host, port):
+        if FakeMPDClient.refuse:
+            raise ConnectionRefusedError(111, 'Connection refused')
+        FakeMPDClient.opened.append(self)
+
+    def password(self, password):
+        pass
+
+    def ping(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def disconnect(self):
+        self.closed = True
+
+
+class FakeMPDTestCase(unittest.TestCase):
+
+    def setUp(self):
+        FakeMPDClient.opened = []
+        FakeMPDClient.refuse = False
+        FakeMPDClient.fail_next = None
+        patcher = mock.patch.object(pool_module.mpd, 'MPDClient', FakeMPDClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class MPDConnectionPoolTest(FakeMPDTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.pool = self.make_pool()
+
+    def make_pool(self, size=2):
+        pool = MPDConnectionPool('localhost', 6600, size=size, checkout_timeout=0.05,
+                                 keepalive_interval=0)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_open_connects_every_slot(self):
+        self.assertTrue(self.pool.open())
+        self.assertEqual(len(FakeMPDClient.opened), 2)
+
+    def test_open_fails_when_mpd_is_down(self):
+        FakeMPDClient.refuse = True
+        self.assertFalse(self.pool.open())
+
+    def test_concurrent_checkouts_get_separate_sockets(self):
+        self.pool.open()
+        with self.pool.connection() as first, self.pool.connection() as second:
+            self.assertIsNot(first, second)
+
+    def test_checkout_times_out_when_all_connections_are_busy(self):
+        self.pool.open()
+        gates = [Gate(closed=True), Gate(closed=True)]
+        holders = []
+
+        def hold(gate):
+            with self.pool.connection():
+                gate.enter()
+
+        for gate in gates:
+            holder = threading.Thread(target=hold, args=(gate,))
+            holder.start()
+            holders.append(holder)
+            self.assertTrue(gate.wait_entered())
+
+        with self.assertRaises(PoolTimeout):
+            with self.pool.connection():
+                pass
+        for gate in gates:
+            gate.open()
+        for holder in holders:
+            holder.join()
+        with self.pool.connection() as client:
+            self.assertIn(client, FakeMPDClient.opened)
+
+    def test_connection_error_discards_and_reopens(self):
+        self.pool = self.make_pool(size=1)
+        self.pool.open()
+        with self.assertRaises(mpd.ConnectionError):
+            with self.pool.connection() as broken:
+                raise mpd.ConnectionError('Connection lost')
+        self.assertTrue(broken.closed)
+
+        with self.pool.connection() as client:
+            self.assertIsNot(client, broken)
+        self.assertEqual(len(FakeMPDClient.opened), 2)
+
+    def test_command_error_keeps_socket(self):
+        self.pool = self.make_pool(size=1)
+        self.pool.open()
+        with self.assertRaises(mpd.CommandError):
+            with self.pool.connection() as first:
+                raise mpd.CommandError('[50@0] {play} No such song')
+
+        with self.pool.connection() as client:
+            self.assertIs(client, first)
+        self.assertFalse(first.closed)
+
+    def test_checkout_opens_lazily(self):
+        with self.pool.connection() as client:
+            self.assertEqual(FakeMPDClient.opened, [client])
+
+    def test_healthy_after_reopened_socket_works(self):
+        self.pool = self.make_pool(size=1)
+        self.assertFalse(self.pool.healthy)
+        self.pool.open()
+        self.assertTrue(self.pool.healthy)
+
+        with self.assertRaises(BrokenPipeError):
+            with self.pool.connection():
+                raise BrokenPipeError(32, 'Broken pipe')
+        self.assertFalse(self.pool.healthy)
+
+        # One transient error must not stick - the next checkout reopens and works
+        with self.pool.connection():
+            pass
+        self.assertTrue(self.pool.healthy)
+
+    def test_command_error_keeps_pool_healthy(self):
+        self.pool.open()
+        with self.assertRaises(mpd.CommandError):
+            with self.pool.connection():
+                raise mpd.CommandError('[50@0] {play} No such song')
+        self.assertTrue(self.pool.healthy)
+
+    def test_unhealthy_while_reopen_fails(self):
+        self.pool = self.make_pool(size=1)
+        self.pool.open()
+        with self.assertRaises(mpd.ConnectionError):
+            with self.pool.connection():
+                raise mpd.ConnectionError('Connection lost')
+
+        FakeMPDClient.refuse = True
+        with self.assertRaises(ConnectionRefusedError):
+            with self.pool.connection():
+                pass
+        self.assertFalse(self.pool.healthy)
+
+        self.pool.close()
+        self.assertFalse(self.pool.healthy)
+
+    def test_is_connection_error(self):
+        self.assertTrue(is_connection_error(mpd.ConnectionError()))
+        self.assertTrue(is_connection_error(BrokenPipeError()))
+        self.assertFalse(is_connection_error(mpd.CommandError('ACK')))
+
+
+class KitchenRadioClientConnectionTest(FakeMPDTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client = KitchenRadioClient(pool_size=1, keepalive_interval=0)
+        self.addCleanup(self.client.disconnect)
+
+    def test_connected_again_after_transient_socket_error(self):
+        self.assertTrue(self.client.connect())
+        self.assertTrue(self.client.is_connected())
+
+        FakeMPDClient.fail_next = mpd.ConnectionError('Connection lost')
+        self.assertEqual(self.client.get_status(), {})
+        self.assertFalse(self.client.is_connected())
+
+        self.assertEqual(self.client.get_status(), {'state': 'play'})
+        self.assertTrue(self.client.is_connected())
+
+    def test_command_error_does_not_disconnect(self):
+        self.client.connect()
+        FakeMPDClient.fail_next = mpd.CommandError('[5@0] {status} unknown command')
+        self.assertEqual(self.client.get_status(), {})
+        self.assertTrue(self.client.is_connected())
+
+    def test_disconnect_stays_disconnected(self):
+        self.client.connect()
+        self.client.disconnect()
+        self.assertFalse(self.client.is_connected())
+
+
+if __name__ == '__main__':
+    unittest.main()
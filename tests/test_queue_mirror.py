@@ -0,0 +1,147 @@
+"""
+Tests for QueueMirror: windowed reads, plchangesposid patching and the
+song and position caches, against a fake MPD queue.
+"""
+
+import unittest
+
+from kitchenradio.sources.mediaplayer.queue import QueueMirror
+
+
+class FakeQueue:
+    """KitchenRadioClient stand-in holding a queue of song ids; records queue reads."""
+
+    def __init__(self, length):
+        self.ids = [str(100 + i) for i in range(length)]
+        self.version = 1
+        self.history = {1: list(self.ids)}
+        self.current = 0
+        self.calls = []
+
+    def get_status(self):
+        self.calls.append('status')
+        return {'playlist': str(self.version), 'playlistlength': str(len(self.ids)),
+                'song': str(self.current)}
+
+    def get_playlist_window(self, start, end):
+        self.calls.append(f'playlistinfo {start}:{end}')
+        return [{'pos': str(pos), 'id': song_id, 'title': f'Song {song_id}'}
+                for pos, song_id in enumerate(self.ids) if start <= pos < end]
+
+    def get_playlist_changes(self, version):
+        self.calls.append(f'plchangesposid {version}')
+        old = self.history[version]
+        return [{'cpos': str(pos), 'id': song_id} for pos, song_id in enumerate(self.ids)
+                if pos >= len(old) or old[pos] != song_id]
+
+    def change(self, ids):
+        self.ids = ids
+        self.version += 1
+        self.history[self.version] = list(ids)
+
+
+def ids(songs):
+    return [song['id'] for song in songs]
+
+
+class QueueMirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.queue = FakeQueue(100)
+        self.mirror = QueueMirror(self.queue, cache_size=20)
+
+    def test_reads_only_the_window(self):
+        songs = self.mirror.get_window(10, 13)
+        self.assertEqual(ids(songs), ['110', '111', '112'])
+        self.assertEqual([song['pos'] for song in songs], ['10', '11', '12'])
+        self.assertEqual(self.queue.calls, ['status', 'playlistinfo 10:13'])
+
+    def test_cached_window_costs_one_status(self):
+        self.mirror.get_window(10, 13)
+        self.queue.calls.clear()
+        self.assertEqual(ids(self.mirror.get_window(10, 13)), ['110', '111', '112'])
+        self.assertEqual(self.queue.calls, ['status'])
+
+    def test_window_is_clamped_to_queue(self):
+        self.assertEqual(ids(self.mirror.get_window(98, 120)), ['198', '199'])
+        self.assertEqual(self.mirror.get_window(150, 160), [])
+        self.assertEqual(self.mirror.length, 100)
+
+    def test_change_is_patched_from_diff(self):
+        self.mirror.get_window(0, 5)
+        moved = list(self.queue.ids)
+        moved[1], moved[3] = moved[3], moved[1]
+        self.queue.change(moved)
+        self.queue.calls.clear()
+
+        self.assertEqual(ids(self.mirror.get_window(0, 5)), ['100', '103', '102', '101', '104'])
+        # Both songs are still cached by id - only the positions came from the diff
+        self.assertEqual(self.queue.calls, ['status', 'plchangesposid 1'])
+        self.assertEqual(self.mirror.version, 2)
+
+    def test_new_song_is_fetched(self):
+        self.mirror.get_window(0, 3)
+        self.queue.change(['100', '999', '102'] + self.queue.ids[3:])
+        self.queue.calls.clear()
+
+        self.assertEqual(ids(self.mirror.get_window(0, 3)), ['100', '999', '102'])
+        self.assertIn('playlistinfo 0:3', self.queue.calls)
+
+    def test_removed_positions_are_dropped(self):
+        self.mirror.get_window(95, 100)
+        self.queue.change(self.queue.ids[:96])
+
+        self.assertEqual(ids(self.mirror.get_window(94, 100)), ['194', '195'])
+        self.assertEqual(self.mirror.length, 96)
+
+    def test_song_cache_is_bounded(self):
+        self.mirror.get_window(0, 30)
+        self.assertLessEqual(len(self.mirror._songs), 20)
+        self.queue.calls.clear()
+
+        # The oldest songs were evicted and are fetched again
+        self.mirror.get_window(0, 2)
+        self.assertEqual(self.queue.calls, ['status', 'playlistinfo 0:2'])
+
+    def test_invalidate_songs_refetches(self):
+        self.mirror.get_window(0, 2)
+        self.mirror.invalidate_songs()
+        self.queue.calls.clear()
+        self.mirror.get_window(0, 2)
+        self.assertEqual(self.queue.calls, ['status', 'playlistinfo 0:2'])
+
+    def test_around_current(self):
+        self.queue.current = 50
+        result = self.mirror.get_around_current(before=1, after=2)
+        self.assertEqual(result['current_pos'], 50)
+        self.assertEqual(result['length'], 100)
+        self.assertEqual(ids(result['songs']), ['149', '150', '151', '152'])
+
+    def test_queue_changed_event_does_no_io(self):
+        self.mirror.on_queue_changed(version=7, length=100)
+        self.assertEqual(self.queue.calls, [])
+        self.assertEqual(self.mirror.reported_version, 7)
+
+    def test_known_positions_are_bounded(self):
+        mirror = QueueMirror(self.queue, cache_size=5)
+        for start in range(0, 100, 5):
+            mirror.get_window(start, start + 5)
+        self.assertLessEqual(len(mirror._ids), mirror.max_positions)
+        self.assertEqual(ids(mirror.get_window(0, 3)), ['100', '101', '102'])
+
+    def test_large_diff_relearns_positions(self):
+        mirror = QueueMirror(self.queue, cache_size=5)
+        mirror.get_window(0, 5)
+        self.queue.change(list(reversed(self.queue.ids)))
+
+        self.assertEqual(ids(mirror.get_window(0, 3)), ['199', '198', '197'])
+        self.assertLessEqual(len(mirror._ids), mirror.max_positions)
+
+    def test_failed_status_returns_nothing(self):
+        self.queue.get_status = lambda: {}
+        self.assertEqual(self.mirror.get_window(0, 5), [])
+        self.assertEqual(self.mirror.get_around_current()['songs'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Tests for ReconnectManager race and cancel handling.
+
+The fake controller queues call_later() callbacks; tests run them
+explicitly to play the part of the client's loop thread.
+"""
+
+import unittest
+
+from kitchenradio.sources.bluetooth.reconnect import ReconnectManager
+
+PHONE_A = '/org/bluez/hci0/dev_AA'
+PHONE_B = '/org/bluez/hci0/dev_BB'
+
+
+class FakeObjects:
+    def __init__(self, devices):
+        self.devices = devices
+
+    def get_devices(self, paired=False):
+        return dict(self.devices)
+
+
+class FakeClient:
+    def __init__(self, devices):
+        self.objects = FakeObjects(devices)
+        self.calls = []
+
+    def call_later(self, delay, fn, *args):
+        self.calls.append((fn, args))
+
+    def run_pending(self):
+        calls, self.calls = self.calls, []
+        for fn, args in calls:
+            fn(*args)
+
+
+class FakeController:
+    def __init__(self, devices):
+        self.client = FakeClient(devices)
+        self.connected = False
+        self.dialled = []
+        self.cancelled = []
+
+    def is_connected(self):
+        return self.connected
+
+    def _connect_device(self, path, name, address):
+        self.dialled.append(path)
+
+    def _cancel_connect(self, path):
+        self.cancelled.append(path)
+        return False
+
+    def _has_audio_profile(self, props):
+        return True
+
+
+def trusted(address, name):
+    return {'Address': address, 'Alias': name, 'Paired': True, 'Trusted': True}
+
+
+class ReconnectManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.controller = FakeController({
+            PHONE_A: trusted('AA', 'Phone A'),
+            PHONE_B: trusted('BB', 'Phone B'),
+        })
+        self.manager = ReconnectManager(self.controller, max_candidates=2)
+
+    def test_start_dials_all_candidates(self):
+        self.assertEqual(self.manager.start(), 2)
+        self.controller.client.run_pending()
+        self.assertCountEqual(self.controller.dialled, [PHONE_A, PHONE_B])
+        self.assertTrue(self.manager.is_reconnecting())
+
+    def test_start_is_noop_when_connected(self):
+        self.controller.connected = True
+        self.assertEqual(self.manager.start(), 0)
+        self.assertEqual(self.controller.client.calls, [])
+
+    def test_first_device_wins_and_loser_is_cancelled(self):
+        self.manager.start()
+        self.controller.client.run_pending()
+
+        self.assertTrue(self.manager.device_connected(PHONE_A, 'AA', 'Phone A'))
+        # Phone B's attempt is still being cancelled - it lost the race
+        self.assertFalse(self.manager.device_connected(PHONE_B, 'BB', 'Phone B'))
+
+        self.controller.client.run_pending()
+        self.assertEqual(self.controller.cancelled, [PHONE_B])
+
+    def test_loser_accepted_once_race_is_over(self):
+        self.manager.start()
+        self.controller.client.run_pending()
+        self.manager.device_connected(PHONE_A, 'AA', 'Phone A')
+        self.controller.client.run_pending()  # Cancels phone B
+        self.manager.attempt_finished(PHONE_A, connected=True, ready=True)
+
+        self.assertFalse(self.manager.is_reconnecting())
+        # Phone B connecting by itself later is not rejected
+        self.assertTrue(self.manager.device_connected(PHONE_B, 'BB', 'Phone B'))
+
+    def test_loser_accepted_after_its_cancel_ran(self):
+        self.manager.start()
+        self.controller.client.run_pending()
+        self.manager.device_connected(PHONE_A, 'AA', 'Phone A')
+        self.controller.client.run_pending()  # Cancels phone B, winner still pending
+
+        self.assertTrue(self.manager.is_reconnecting())
+        self.assertTrue(self.manager.device_connected(PHONE_B, 'BB', 'Phone B'))
+
+    def test_cancel_does_not_reject_later_connects(self):
+        self.manager.start()
+        self.controller.client.run_pending()
+        self.manager.cancel()
+
+        self.assertFalse(self.manager.is_reconnecting())
+        self.assertTrue(self.manager.device_connected(PHONE_A, 'AA', 'Phone A'))
+        self.controller.client.run_pending()
+        self.assertCountEqual(self.controller.cancelled, [PHONE_A, PHONE_B])
+        self.assertTrue(self.manager.device_connected(PHONE_B, 'BB', 'Phone B'))
+
+    def test_device_without_audio_is_skipped_next_time(self):
+        self.manager.start()
+        self.controller.client.run_pending()
+        self.manager.attempt_finished(PHONE_A, connected=True, ready=False)
+        self.manager.attempt_finished(PHONE_B, connected=False, ready=False)
+
+        candidates = [device.path for device in self.manager.get_candidates()]
+        self.assertEqual(candidates, [PHONE_B])
+
+    def test_candidates_most_recent_first(self):
+        self.manager.device_connected(PHONE_B, 'BB', 'Phone B')
+        candidates = [device.path for device in self.manager.get_candidates()]
+        self.assertEqual(candidates[0], PHONE_B)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for StateStore versioning: update(), changed_since() and
+wait_for_version().
+"""
+
+import threading
+import unittest
+from dataclasses import FrozenInstanceError
+
+from kitchenradio.sources.source_model import (
+    PlaybackState, PlaybackStatus, StateField, TrackInfo
+)
+from kitchenradio.sources.state_store import StateStore
+from tests.helpers import TIMEOUT
+
+
+class StateStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = StateStore(history=4)
+
+    def test_update_bumps_version_and_reports_fields(self):
+        snapshot, changed = self.store.update(
+            playback_state=PlaybackState(status=PlaybackStatus.PLAYING),
+            track_info=TrackInfo(title='Song'))
+        self.assertEqual(snapshot.version, 1)
+        self.assertEqual(self.store.version, 1)
+        self.assertEqual(changed, StateField.PLAYBACK | StateField.TRACK)
+        self.assertIs(self.store.get_snapshot(), snapshot)
+
+    def test_update_without_change_keeps_version(self):
+        first, _ = self.store.update(track_info=TrackInfo(title='Song'))
+        snapshot, changed = self.store.update(track_info=TrackInfo(title='Song'))
+        self.assertEqual(changed, StateField.NONE)
+        self.assertIs(snapshot, first)
+        self.assertEqual(self.store.version, 1)
+
+    def test_snapshots_are_immutable(self):
+        snapshot, _ = self.store.update(current_source='mpd', track_info=TrackInfo(title='Song'))
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.current_source = 'bluetooth'
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.track_info.title = 'Other'
+        self.store.update(current_source='bluetooth')
+        self.assertEqual(snapshot.current_source, 'mpd')
+
+    def test_changed_since_current_version_is_none(self):
+        self.store.update(powered_on=True)
+        self.assertEqual(self.store.changed_since(self.store.version), StateField.NONE)
+
+    def test_changed_since_combines_later_changes(self):
+        self.store.update(powered_on=True)
+        version = self.store.version
+        self.store.update(track_info=TrackInfo(title='A'))
+        self.store.update(current_source='mpd')
+        self.assertEqual(self.store.changed_since(version),
+                         StateField.TRACK | StateField.CURRENT_SOURCE)
+
+    def test_changed_since_beyond_history_is_all(self):
+        for i in range(6):
+            self.store.update(track_info=TrackInfo(title=str(i)))
+        self.assertEqual(self.store.changed_since(0), StateField.ALL)
+        self.assertEqual(self.store.changed_since(self.store.version - 1), StateField.TRACK)
+
+    def test_wait_for_reached_version_returns_at_once(self):
+        snapshot, _ = self.store.update(powered_on=True)
+        self.assertIs(self.store.wait_for_version(1, timeout=0), snapshot)
+
+    def test_wait_for_version_times_out(self):
+        self.assertIsNone(self.store.wait_for_version(1, timeout=0.01))
+
+    def test_wait_for_version_wakes_on_update(self):
+        results = []
+        waiting = threading.Thread(
+            target=lambda: results.append(self.store.wait_for_version(1, timeout=TIMEOUT)))
+        waiting.start()
+        snapshot, _ = self.store.update(powered_on=True)
+        waiting.join(TIMEOUT)
+        self.assertEqual(results, [snapshot])
+
+
+if __name__ == '__main__':
+    unittest.main()
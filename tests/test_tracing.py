@@ -0,0 +1,157 @@
+"""
+Tests for Tracer recording and reporting, and for trace propagation
+through the command executor and event bus.
+"""
+
+import time
+import unittest
+
+from kitchenradio.sources.command_executor import CommandExecutor, CommandPriority, CommandSpec
+from kitchenradio.sources.event_bus import EventBus
+from kitchenradio.sources.tracing import Tracer, tracer
+from tests.helpers import TIMEOUT
+
+
+class TracerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tracer = Tracer(enabled=True, capacity=3, linger=60.0)
+
+    def test_disabled_tracer_records_nothing(self):
+        disabled = Tracer()
+        trace = disabled.start('button:next')
+        self.assertIsNone(trace)
+        with disabled.activate(trace), disabled.span('command'):
+            disabled.mark(trace, 'monitor')
+        disabled.finish(trace)
+        self.assertEqual(disabled.get_traces(), [])
+        self.assertEqual(disabled.get_histograms(), {})
+
+    def test_spans_are_recorded_in_order(self):
+        trace = self.tracer.start('button:next')
+        with self.tracer.activate(trace):
+            self.assertIs(self.tracer.current(), trace)
+            with self.tracer.span('command', 'next'):
+                pass
+        self.assertIsNone(self.tracer.current())
+        self.tracer.mark(trace, 'monitor', 'player')
+        self.tracer.finish(trace)
+
+        [result] = self.tracer.get_traces()
+        self.assertEqual(result['name'], 'button:next')
+        self.assertTrue(result['complete'])
+        self.assertEqual([(span['stage'], span['detail']) for span in result['spans']],
+                         [('command', 'next'), ('monitor', 'player')])
+
+    def test_mark_starts_where_previous_span_ended(self):
+        started = time.monotonic() - 0.5
+        trace = self.tracer.start('web:play', started=started)
+        self.tracer.record(trace, 'queue', 'play', started, started + 0.1)
+        self.tracer.mark(trace, 'monitor')
+        self.tracer.finish(trace)
+
+        queue, monitor = self.tracer.get_traces()[0]['spans']
+        self.assertAlmostEqual(monitor['offset_ms'], queue['offset_ms'] + queue['duration_ms'], delta=0.1)
+        self.assertGreaterEqual(monitor['duration_ms'], 400)
+
+    def test_finished_trace_ignores_late_spans(self):
+        trace = self.tracer.start('button:next')
+        self.tracer.finish(trace)
+        self.tracer.mark(trace, 'monitor')
+        self.tracer.finish(trace)
+        self.assertEqual(len(self.tracer.get_traces()), 1)
+        self.assertEqual(self.tracer.get_traces()[0]['spans'], [])
+
+    def test_unfinished_trace_expires_incomplete(self):
+        self.tracer.configure(linger=0.1)
+        trace = self.tracer.start('button:next', started=time.monotonic() - 1.0)
+        self.assertIsNone(self.tracer.recent())
+
+        [result] = self.tracer.get_traces()
+        self.assertEqual(result['id'], trace.trace_id)
+        self.assertFalse(result['complete'])
+        self.assertEqual(result['total_ms'], 100.0)
+        self.assertNotIn('total', self.tracer.get_histograms())
+
+    def test_recent_returns_newest_open_trace(self):
+        self.tracer.start('button:next')
+        newest = self.tracer.start('button:previous')
+        self.assertIs(self.tracer.recent(), newest)
+
+    def test_ring_buffer_keeps_newest_traces(self):
+        for i in range(5):
+            self.tracer.finish(self.tracer.start(f'input{i}'))
+        self.assertEqual([trace['name'] for trace in self.tracer.get_traces()],
+                         ['input4', 'input3', 'input2'])
+        self.assertEqual([trace['name'] for trace in self.tracer.get_traces(limit=1)], ['input4'])
+
+        self.tracer.configure(capacity=2)
+        self.assertEqual([trace['name'] for trace in self.tracer.get_traces()], ['input4', 'input3'])
+
+    def test_histograms_per_stage_and_total(self):
+        started = time.monotonic() - 1.0
+        trace = self.tracer.start('button:next', started=started)
+        self.tracer.record(trace, 'queue', 'next', started, started + 0.003)
+        self.tracer.record(trace, 'command', 'next', started + 0.003, started + 0.5)
+        self.tracer.finish(trace)
+
+        histograms = self.tracer.get_histograms()
+        self.assertEqual(histograms['queue']['count'], 1)
+        self.assertEqual(histograms['queue']['buckets']['<=5ms'], 1)
+        self.assertEqual(histograms['command']['buckets']['<=500ms'], 1)
+        self.assertEqual(histograms['total']['count'], 1)
+        self.assertGreaterEqual(histograms['total']['max_ms'], 1000)
+
+        self.tracer.reset()
+        self.assertEqual(self.tracer.get_histograms(), {})
+        self.assertEqual(self.tracer.get_traces(), [])
+
+
+class TracePropagationTest(unittest.TestCase):
+    """The shared tracer follows work onto executor and event bus threads."""
+
+    def setUp(self):
+        tracer.configure(enabled=True)
+        tracer.reset()
+
+    def tearDown(self):
+        tracer.configure(enabled=False)
+        tracer.reset()
+
+    def test_trace_follows_command_and_event(self):
+        executor = CommandExecutor()
+        bus = EventBus()
+        self.addCleanup(executor.stop)
+        self.addCleanup(bus.stop)
+        seen = {}
+
+        def on_event(**kwargs):
+            seen['event'] = tracer.current()
+
+        def run():
+            seen['command'] = tracer.current()
+            bus.publish('power_changed', powered_on=True)
+            return True
+
+        bus.subscribe('power_changed', on_event)
+        trace = tracer.start('button:power')
+        with tracer.activate(trace):
+            future = executor.submit('power', CommandSpec('power', CommandPriority.POWER), run)
+        self.assertTrue(future.result(TIMEOUT))
+        self.assertTrue(bus.wait_idle(TIMEOUT))
+        tracer.finish(trace)
+
+        self.assertIs(seen['command'], trace)
+        self.assertIs(seen['event'], trace)
+        stages = [span['stage'] for span in tracer.get_traces()[0]['spans']]
+        self.assertEqual(sorted(stages), ['command', 'deliver', 'queue'])
+
+    def test_untraced_work_has_no_trace(self):
+        executor = CommandExecutor()
+        self.addCleanup(executor.stop)
+        future = executor.submit('power', CommandSpec('power', CommandPriority.POWER), tracer.current)
+        self.assertIsNone(future.result(TIMEOUT))
+
+
+if __name__ == '__main__':
+    unittest.main()
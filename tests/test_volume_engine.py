@@ -0,0 +1,143 @@
+"""
+Tests for VolumeEngine: seeding and clamping, coalesced writes, reverting
+failed writes and reconciling reported volume.
+
+The fake backend can hold a write in flight so that tests can queue newer
+targets behind it.
+"""
+
+import threading
+import unittest
+
+from kitchenradio.sources.volume_engine import VolumeEngine
+from tests.helpers import TIMEOUT, Gate, wait_until
+
+
+class FakeBackend:
+    """Volume backend that records writes and can hold or fail them."""
+
+    def __init__(self, volume=50):
+        self.volume = volume
+        self.reads = 0
+        self.writes = []
+        self.failing = set()
+        self.gate = Gate()
+        self.changes = []
+        self.changed = threading.Condition()
+
+    def read(self):
+        self.reads += 1
+        return self.volume
+
+    def write(self, volume):
+        self.writes.append(volume)
+        self.gate.enter()
+        if volume in self.failing:
+            return False
+        self.volume = volume
+        return True
+
+    def on_change(self, volume):
+        with self.changed:
+            self.changes.append(volume)
+            self.changed.notify_all()
+
+    def wait_changes(self, count):
+        with self.changed:
+            return self.changed.wait_for(lambda: len(self.changes) >= count, TIMEOUT)
+
+
+class VolumeEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = FakeBackend()
+
+    def engine(self, **kwargs):
+        kwargs.setdefault('settle_time', 60.0)
+        return VolumeEngine('test', self.backend.write, self.backend.read,
+                            on_change=self.backend.on_change, **kwargs)
+
+    def test_step_seeds_once_and_clamps(self):
+        self.backend.volume = 98
+        engine = self.engine()
+        self.assertEqual(engine.step(5), 100)
+        self.assertEqual(engine.step(-200), 0)
+        self.assertEqual(self.backend.reads, 1)
+
+    def test_step_with_unknown_volume(self):
+        self.backend.volume = None
+        engine = self.engine()
+        self.assertIsNone(engine.step(5))
+        self.assertIsNone(engine.target)
+        self.assertEqual(self.backend.writes, [])
+
+    def test_set_clamps_to_max_volume(self):
+        engine = self.engine(max_volume=127)
+        self.assertEqual(engine.set(200), 127)
+        self.assertEqual(engine.set(-3), 0)
+
+    def test_every_step_counts(self):
+        engine = self.engine()
+        for _ in range(5):
+            engine.step(1)
+        self.assertEqual(engine.target, 55)
+        self.assertEqual(self.backend.changes, [51, 52, 53, 54, 55])
+
+    def test_writes_coalesce_to_latest(self):
+        engine = self.engine()
+        self.backend.gate.close()
+        engine.step(1)
+        self.assertTrue(self.backend.gate.wait_entered())
+        engine.step(1)
+        engine.step(1)
+        engine.step(1)
+        self.backend.gate.open()
+
+        self.assertTrue(wait_until(lambda: self.backend.volume == 54))
+        self.assertEqual(self.backend.writes, [51, 54])
+
+    def test_failed_write_reverts_to_backend_volume(self):
+        engine = self.engine()
+        self.backend.failing.add(55)
+        engine.step(5)
+        self.assertTrue(self.backend.wait_changes(2))
+        self.assertEqual(self.backend.changes, [55, 50])
+        self.assertEqual(engine.target, 50)
+
+    def test_failed_write_with_newer_target_does_not_revert(self):
+        engine = self.engine()
+        self.backend.failing.add(51)
+        self.backend.gate.close()
+        engine.step(1)
+        self.assertTrue(self.backend.gate.wait_entered())
+        engine.step(2)
+        self.backend.gate.open()
+
+        self.assertTrue(wait_until(lambda: self.backend.volume == 53))
+        self.assertEqual(engine.target, 53)
+        self.assertEqual(self.backend.changes, [51, 53])
+
+    def test_reconcile_keeps_target_while_settling(self):
+        engine = self.engine()
+        engine.set(40)
+        self.assertTrue(engine.is_settling)
+        self.assertEqual(engine.reconcile(10), 40)
+        self.assertEqual(engine.target, 40)
+
+    def test_reconcile_adopts_reported_volume_once_settled(self):
+        engine = self.engine(settle_time=0.01)
+        engine.set(40)
+        self.assertTrue(wait_until(lambda: not engine.is_settling))
+        self.assertEqual(engine.reconcile(10), 10)
+        self.assertEqual(engine.target, 10)
+
+    def test_reconcile_before_first_press(self):
+        engine = self.engine()
+        self.assertIsNone(engine.reconcile(None))
+        self.assertEqual(engine.reconcile(30), 30)
+        self.assertEqual(engine.step(1), 31)
+        self.assertEqual(self.backend.reads, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()